@@ -0,0 +1,98 @@
+"""
+Management command: profile_startup
+===================================
+Measure what a fresh worker pays before it can serve a request.
+
+Boots the app in a clean child interpreter under ``python -X importtime`` —
+settings, app registry, ``core.wsgi``, every urlconf — and reports:
+
+  * wall time and peak RSS of the cold start (best of ``--runs``)
+  * the slowest imports by cumulative time (a module and everything it
+    pulled in), and the top-level packages by self time
+  * with ``--warm``, the extra time and RSS of ``core.warmup.warm()``, i.e.
+    what the master pays once in GUNICORN_PRELOAD mode instead of each worker
+
+  python manage.py profile_startup
+  python manage.py profile_startup --top 30 --runs 3 --warm
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_CHILD = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+import core.wsgi
+from django.urls import get_resolver
+get_resolver().url_patterns
+result = {"boot": time.perf_counter() - started, "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+if "--warm" in sys.argv:
+    from core.warmup import warm
+    warm(freeze=False)
+    result["warm"] = time.perf_counter() - started - result["boot"]
+    result["warm_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps(result))
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """``[(module, depth, self_us, cumulative_us)]`` from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:  # the header line
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, self_us, cumulative_us))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Report cold-start time, RSS and per-module import time of a worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20, help="Modules to list.")
+        parser.add_argument("--runs", type=int, default=1, help="Boot this many times and keep the fastest.")
+        parser.add_argument("--warm", action="store_true", help="Also time the pre-fork warm-up.")
+
+    def _boot(self, warm: bool):
+        args = [sys.executable, "-X", "importtime", "-c", _CHILD] + (["--warm"] if warm else [])
+        proc = subprocess.run(
+            args, capture_output=True, text=True, cwd=settings.BASE_DIR,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        )
+        if proc.returncode:
+            raise CommandError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Boot failed.")
+        return json.loads(proc.stdout.strip().splitlines()[-1]), parse_importtime(proc.stderr)
+
+    def handle(self, *args, **options):
+        runs = [self._boot(options["warm"]) for _ in range(max(1, options["runs"]))]
+        result, imports = min(runs, key=lambda run: run[0]["boot"])
+        top = options["top"]
+
+        self.stdout.write(f"Cold start: {result['boot'] * 1000:.0f} ms, peak RSS {result['rss_kb'] / 1024:.1f} MB")
+        if "warm" in result:
+            self.stdout.write(
+                f"Warm-up:    +{result['warm'] * 1000:.0f} ms, peak RSS {result['warm_rss_kb'] / 1024:.1f} MB"
+            )
+
+        self.stdout.write(f"\nSlowest imports (cumulative, {len(imports)} modules):")
+        for name, depth, _, cumulative in sorted(imports, key=lambda row: -row[3])[:top]:
+            self.stdout.write(f"  {cumulative / 1000:>8.1f} ms  {'  ' * min(depth, 4)}{name}")
+
+        packages = defaultdict(int)
+        for name, _, self_us, _ in imports:
+            packages[name.split(".")[0]] += self_us
+        self.stdout.write("\nBy top-level package (self time):")
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f"  {self_us / 1000:>8.1f} ms  {package}")
@@ -0,0 +1,37 @@
+"""
+Management command: refresh_platform_stats
+==========================================
+Recompute the admin dashboard stats snapshot (core/stats.py) and, when it
+is due, the cached SMSPortal credit balance.
+
+Run every minute via cron:
+  * * * * *  python manage.py refresh_platform_stats
+"""
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.stats import SMS_CREDITS_KEY, SMS_CREDITS_TTL, refresh_platform_stats, refresh_sms_credits
+
+
+class Command(BaseCommand):
+    help = "Refresh the cached admin dashboard statistics."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sms", action="store_true",
+            help="Also re-check the SMS credit balance even if the cached value is fresh.",
+        )
+
+    def handle(self, *args, **options):
+        snapshot = refresh_platform_stats()
+        self.stdout.write(f"Stats snapshot computed at {snapshot['computed_at']:%H:%M:%S}.")
+
+        sms = cache.get(SMS_CREDITS_KEY)
+        if options["sms"] or sms is None or (
+            (timezone.now() - sms["fetched_at"]).total_seconds() > SMS_CREDITS_TTL
+        ):
+            sms = refresh_sms_credits()
+            self.stdout.write(f"SMS credits: {sms.get('credits')}")
+
+        self.stdout.write(self.style.SUCCESS("Platform stats refreshed."))
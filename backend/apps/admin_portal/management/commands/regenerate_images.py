@@ -0,0 +1,62 @@
+"""
+Management command: regenerate_images
+=====================================
+Write the resized variants (core/images.py) of every avatar, creator cover,
+blog cover and image post, on a pool of ``--processes`` worker processes.
+
+Variants that already exist are kept unless ``--force`` is given — use it
+after changing VARIANTS or FORMATS. Uploads get their variants on their own;
+this is for backfills and format changes.
+
+  python manage.py regenerate_images
+  python manage.py regenerate_images --force --processes 8
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core import images
+
+
+def originals() -> list:
+    """Every stored original named by a watched image field, once each."""
+    names = set()
+    for label, field, filters in images.SOURCES:
+        names.update(
+            apps.get_model(label).objects.filter(**filters).exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+            .values_list(field, flat=True)
+        )
+    return sorted(name for name in names if not images.is_variant(name))
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP/JPEG variants of every uploaded image."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+        parser.add_argument("--force", action="store_true", help="Rewrite variants that already exist.")
+
+    def handle(self, *args, **options):
+        names = originals()
+        connections.close_all()
+        generated = failed = 0
+        # Fresh interpreters: nothing (DB sockets, the log queue thread) is inherited from this one
+        with ProcessPoolExecutor(
+            max_workers=max(1, options["processes"]),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as pool:
+            work = partial(images.generate_quietly, force=options["force"])
+            for name, widths, error in pool.map(work, names, chunksize=8):
+                if widths is None:
+                    failed += 1
+                    self.stderr.write(f"  {name}: {error}")
+                else:
+                    generated += 1
+        self.stdout.write(self.style.SUCCESS(f"Variants written for {generated} image(s), {failed} failed."))
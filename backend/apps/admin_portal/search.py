@@ -0,0 +1,77 @@
+"""
+Search for the admin portal list views.
+
+When the term looks like an identifier (a Paystack reference, an email
+address or a creator slug) an exact-match probe runs first against a
+unique / b-tree index; if it hits, only those rows are listed. Otherwise the
+term becomes one combined OR of ``icontains`` conditions in a single query. On Postgres these are
+served by the pg_trgm GIN indexes created in the users / tips / creators
+migrations (BitmapOr across the indexes, no sequential scan). Related-table
+matches are expressed as ``id IN (subquery)`` so the planner can use the
+other table's trigram index instead of joining first.
+"""
+import re
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models import Q
+
+from apps.creators.models import CreatorProfile
+from apps.users.models import User
+
+# TJ-<id>-<hex> from payments.paystack.generate_reference, or any Paystack
+# style token: no spaces, at least one digit, 10+ chars
+_REFERENCE_RE = re.compile(r"^(TJ-[\w-]+|(?=.*\d)[\w-]{10,})$")
+_SLUG_RE = re.compile(r"^[-a-z0-9_]+$")
+
+
+def _is_email(term: str) -> bool:
+    try:
+        validate_email(term)
+    except ValidationError:
+        return False
+    return True
+
+
+def _first_match(qs, exact: Q | None, fuzzy: Q):
+    """``qs`` narrowed to exact matches if there are any, else to fuzzy matches."""
+    if exact is not None:
+        narrowed = qs.filter(exact)
+        if narrowed.exists():
+            return narrowed
+    return qs.filter(fuzzy)
+
+
+def search_users(qs, term: str):
+    exact = Q(email__iexact=term) if _is_email(term) else None
+    fuzzy = (
+        Q(email__icontains=term)
+        | Q(username__icontains=term)
+        | Q(first_name__icontains=term)
+        | Q(last_name__icontains=term)
+    )
+    return _first_match(qs, exact, fuzzy)
+
+
+def search_tips(qs, term: str):
+    if _REFERENCE_RE.match(term):
+        exact = Q(paystack_reference=term)
+    elif _is_email(term):
+        exact = Q(tipper_email__iexact=term)
+    else:
+        exact = None
+    creators = CreatorProfile.objects.filter(display_name__icontains=term).values("id")
+    fuzzy = Q(tipper_email__icontains=term) | Q(tipper_name__icontains=term) | Q(creator_id__in=creators)
+    return _first_match(qs, exact, fuzzy)
+
+
+def search_creators(qs, term: str):
+    if _is_email(term):
+        exact = Q(user_id__in=User.objects.filter(email__iexact=term).values("id"))
+    elif _SLUG_RE.match(term):
+        exact = Q(slug=term)
+    else:
+        exact = None
+    users = User.objects.filter(email__icontains=term).values("id")
+    fuzzy = Q(display_name__icontains=term) | Q(slug__icontains=term) | Q(user_id__in=users)
+    return _first_match(qs, exact, fuzzy)
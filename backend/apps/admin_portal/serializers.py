@@ -61,7 +61,7 @@ class AdminCreatorSerializer(serializers.ModelSerializer):
         ]
 
     def get_total_tips(self, obj):
-        return float(obj.total_tips)
+        return float(obj.completed_tip_total)
 
 
 class AdminEnterpriseDocumentSerializer(serializers.ModelSerializer):
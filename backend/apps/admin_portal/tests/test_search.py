@@ -0,0 +1,48 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.creators.models import CreatorProfile
+from apps.tips.models import Tip
+from apps.tips.signals import tip_completed
+from apps.users.models import User
+
+
+class AdminSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        admin = User.objects.create_user(
+            username="staff", email="staff@example.com", password="pass1234", role="admin"
+        )
+        self.client.force_authenticate(admin)
+        user = User.objects.create_user(
+            username="sipho", email="sipho@example.com", password="pass1234", role="creator"
+        )
+        self.creator = CreatorProfile.objects.create(user=user, display_name="Sipho Sings", slug="sipho-sings")
+        for i in range(3):
+            tip = Tip.objects.create(
+                creator=self.creator, amount=10, status=Tip.Status.COMPLETED,
+                tipper_email=f"fan{i}@example.com", paystack_reference=f"TJ-{i}-abcdef12",
+            )
+            tip_completed.send(sender=Tip, tip=tip)
+
+    def test_reference_fast_path(self):
+        res = self.client.get(reverse("admin-tips"), {"search": "TJ-1-abcdef12"})
+        self.assertEqual([t["paystack_reference"] for t in res.data], ["TJ-1-abcdef12"])
+
+    def test_combined_fuzzy_search_with_cursor(self):
+        res = self.client.get(reverse("admin-tips"), {"search": "sipho", "page_size": 2})
+        self.assertEqual(len(res.data), 2)
+        self.assertIn('rel="next"', res["Link"])
+        next_url = res["Link"].split(">")[0].lstrip("<")
+        self.assertEqual(len(self.client.get(next_url).data), 1)
+
+    def test_creator_list_uses_stored_totals(self):
+        res = self.client.get(reverse("admin-creators"), {"search": "sipho@example.com"})
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]["total_tips"], 30.0)
+
+        user = User.objects.create_user(username="quiet", email="quiet@example.com", password="pass1234")
+        CreatorProfile.objects.create(user=user, display_name="Quiet", slug="quiet")
+        res = self.client.get(reverse("admin-creators"))
+        self.assertEqual([c["slug"] for c in res.data][:2], ["sipho-sings", "quiet"])
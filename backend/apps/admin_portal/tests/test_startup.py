@@ -0,0 +1,26 @@
+import sys
+
+from django.test import SimpleTestCase
+
+from apps.admin_portal.management.commands.profile_startup import parse_importtime
+from core.warmup import warm
+
+
+class StartupTests(SimpleTestCase):
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     scipy._lib\n"
+            "import time:      5000 |      90000 |   apps.creators.recommendations\n"
+            "noise\n"
+        )
+        self.assertEqual(parse_importtime(stderr), [
+            ("scipy._lib", 2, 120, 120),
+            ("apps.creators.recommendations", 1, 5000, 90000),
+        ])
+
+    def test_warm_builds_shared_state(self):
+        summary = warm(freeze=False)
+        self.assertGreater(summary["urlpatterns"], 0)
+        self.assertGreater(summary["models"], 0)
+        self.assertIn("apps.creators.views", sys.modules)
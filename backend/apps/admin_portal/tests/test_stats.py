@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+
+
+class AdminStatsSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        admin = User.objects.create_user(
+            username="stats", email="stats@example.com", password="pass1234", role="admin"
+        )
+        self.client.force_authenticate(admin)
+
+    def test_stats_are_served_from_snapshot(self):
+        res = self.client.get(reverse("admin-stats"))
+        self.assertEqual(res.data["total_users"], User.objects.count())
+        self.assertIn("computed_at", res.data)
+        # Repeat reads only authenticate; the counts come from the snapshot
+        with self.assertNumQueries(0):
+            again = self.client.get(reverse("admin-stats"))
+        self.assertEqual(again.data["computed_at"], res.data["computed_at"])
@@ -3,6 +3,7 @@ from django.urls import path
 from .views import (
     AdminBlogDetailView,
     AdminBlogListCreateView,
+    AdminCacheStatsView,
     AdminCreatorListView,
     AdminEnterpriseApproveView,
     AdminEnterpriseListView,
@@ -11,6 +12,7 @@ from .views import (
     AdminJobListCreateView,
     AdminKycApproveView,
     AdminKycDeclineView,
+    AdminRateLimitStatsView,
     AdminStatsView,
     AdminTipListView,
     AdminUserDetailView,
@@ -19,6 +21,8 @@ from .views import (
 
 urlpatterns = [
     path("stats/",                          AdminStatsView.as_view(),             name="admin-stats"),
+    path("cache/",                          AdminCacheStatsView.as_view(),        name="admin-cache-stats"),
+    path("rate-limits/",                    AdminRateLimitStatsView.as_view(),    name="admin-rate-limit-stats"),
     path("users/",                          AdminUserListView.as_view(),          name="admin-users"),
     path("users/<int:pk>/",                 AdminUserDetailView.as_view(),        name="admin-user-detail"),
     path("tips/",                           AdminTipListView.as_view(),           name="admin-tips"),
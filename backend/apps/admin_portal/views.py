@@ -1,7 +1,5 @@
-from django.db.models import Sum
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
-from rest_framework import status
+from rest_framework import generics, status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -12,8 +10,11 @@ from apps.creators.models import CreatorKycDocument, CreatorProfile
 from apps.enterprise.models import Enterprise
 from apps.tips.models import Tip
 from apps.users.models import User
+from core.pagination import HeaderKeysetPagination
+from core.stats import get_platform_stats
 
 from .permissions import IsAdminUser
+from .search import search_creators, search_tips, search_users
 from .serializers import (
     AdminBlogSerializer,
     AdminCreatorSerializer,
@@ -26,42 +27,88 @@ from .serializers import (
 # ── Platform stats ─────────────────────────────────────────────────────────────
 
 class AdminStatsView(APIView):
+    """Dashboard counters from the shared stats snapshot (core/stats.py)."""
+
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        today = timezone.now().date()
-        month_start = today.replace(day=1)
-        completed = Tip.objects.filter(status="completed")
+        snapshot = get_platform_stats()
+        stats = snapshot["stats"]
         return Response({
-            "total_users": User.objects.count(),
-            "total_creators": User.objects.filter(role="creator").count(),
-            "total_fans": User.objects.filter(role="fan").count(),
-            "total_enterprises": User.objects.filter(role="enterprise").count(),
-            "total_tips": completed.count(),
-            "total_volume": float(completed.aggregate(v=Sum("amount"))["v"] or 0),
-            "tips_today": completed.filter(created_at__date=today).count(),
-            "tips_this_month": completed.filter(created_at__date__gte=month_start).count(),
-            "pending_kyc": CreatorProfile.objects.filter(kyc_status="pending").count(),
-            "pending_enterprises": Enterprise.objects.filter(
-                approval_status=Enterprise.ApprovalStatus.PENDING).count(),
-            "published_blogs": BlogPost.objects.filter(is_published=True).count(),
+            "total_users": stats["users_total"],
+            "total_creators": stats["users_creators"],
+            "total_fans": stats["users_fans"],
+            "total_enterprises": stats["users_enterprises"],
+            "total_tips": stats["tips_total"],
+            "total_volume": float(stats["tips_value"]),
+            "tips_today": stats["tips_today"],
+            "tips_this_month": stats["tips_this_month"],
+            "pending_kyc": stats["creators_pending_kyc"],
+            "pending_enterprises": stats["enterprises_pending"],
+            "published_blogs": stats["blogs_published"],
+            "computed_at": snapshot["computed_at"],
         })
 
 
-# ── Users ──────────────────────────────────────────────────────────────────────
+class AdminCacheStatsView(APIView):
+    """Hit / miss counters for the public-read cache (this worker process)."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        from apps.creators.cache import public_reads
+
+        return Response(public_reads.stats())
+
+
+class AdminRateLimitStatsView(APIView):
+    """How often each rate limit (core/ratelimit.py) rejected a request, across workers."""
 
-class AdminUserListView(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        qs = User.objects.all().order_by("-date_joined")
-        role = request.query_params.get("role")
-        search = request.query_params.get("search", "").strip()
+        from core.ratelimit import fired_counts
+
+        return Response(fired_counts())
+
+
+# ── List pagination ────────────────────────────────────────────────────────────
+
+class AdminListPagination(HeaderKeysetPagination):
+    """First page matches the old hard caps; ``Link: rel="next"`` pages past them."""
+
+    page_size = 200
+
+
+class AdminUserPagination(AdminListPagination):
+    ordering = ("-date_joined", "-id")
+
+
+class AdminTipPagination(AdminListPagination):
+    page_size = 500
+
+
+class AdminCreatorPagination(AdminListPagination):
+    # Highest earners first, on the denormalised counter (creators/signals.py)
+    ordering = ("-completed_tip_total", "-id")
+
+
+# ── Users ──────────────────────────────────────────────────────────────────────
+
+class AdminUserListView(generics.ListAPIView):
+    permission_classes = [IsAdminUser]
+    serializer_class = AdminUserSerializer
+    pagination_class = AdminUserPagination
+
+    def get_queryset(self):
+        qs = User.objects.all()
+        role = self.request.query_params.get("role")
+        search = self.request.query_params.get("search", "").strip()
         if role:
             qs = qs.filter(role=role)
         if search:
-            qs = qs.filter(email__icontains=search)
-        return Response(AdminUserSerializer(qs[:200], many=True).data)
+            qs = search_users(qs, search)
+        return qs
 
 
 class AdminUserDetailView(APIView):
@@ -79,45 +126,38 @@ class AdminUserDetailView(APIView):
 
 # ── Tips ───────────────────────────────────────────────────────────────────────
 
-class AdminTipListView(APIView):
+class AdminTipListView(generics.ListAPIView):
     permission_classes = [IsAdminUser]
+    serializer_class = AdminTipSerializer
+    pagination_class = AdminTipPagination
 
-    def get(self, request):
-        qs = (
-            Tip.objects.select_related("creator", "tipper")
-            .order_by("-created_at")
-        )
-        tip_status = request.query_params.get("status")
-        search = request.query_params.get("search", "").strip()
+    def get_queryset(self):
+        qs = Tip.objects.select_related("creator")
+        tip_status = self.request.query_params.get("status")
+        search = self.request.query_params.get("search", "").strip()
         if tip_status:
             qs = qs.filter(status=tip_status)
         if search:
-            qs = qs.filter(tipper_email__icontains=search) | qs.filter(
-                creator__display_name__icontains=search
-            )
-        return Response(AdminTipSerializer(qs[:500], many=True).data)
+            qs = search_tips(qs, search)
+        return qs
 
 
 # ── Creators ───────────────────────────────────────────────────────────────────
 
-class AdminCreatorListView(APIView):
+class AdminCreatorListView(generics.ListAPIView):
     permission_classes = [IsAdminUser]
+    serializer_class = AdminCreatorSerializer
+    pagination_class = AdminCreatorPagination
 
-    def get(self, request):
-        qs = (
-            CreatorProfile.objects.select_related("user")
-            .prefetch_related("kyc_documents")
-            .order_by("-created_at")
-        )
-        kyc = request.query_params.get("kyc_status")
-        search = request.query_params.get("search", "").strip()
+    def get_queryset(self):
+        qs = CreatorProfile.objects.select_related("user").prefetch_related("kyc_documents")
+        kyc = self.request.query_params.get("kyc_status")
+        search = self.request.query_params.get("search", "").strip()
         if kyc:
             qs = qs.filter(kyc_status=kyc)
         if search:
-            qs = qs.filter(display_name__icontains=search) | qs.filter(
-                user__email__icontains=search
-            )
-        return Response(AdminCreatorSerializer(qs[:200], many=True).data)
+            qs = search_creators(qs, search)
+        return qs
 
 
 class AdminKycApproveView(APIView):
@@ -0,0 +1,348 @@
+"""
+Batch cohort-retention and fan lifetime-value job.
+
+    Tip (completed) ──chunks of CHUNK_SIZE──► NumPy group-by
+        ──► FanActivity  (one row per creator × fan: first month, active
+                          months, lifetime cents)
+        ──► CreatorCohortReport for every creator touched by the run
+
+A fan's cohort is the month of their first tip to that creator. The matrix
+row for a cohort counts how many of its fans tipped again 0, 1, …,
+MAX_OFFSET months later. LTV is each fan's lifetime total with that creator,
+summarised as percentiles plus a histogram over fixed edges (so enterprise
+roll-ups can add histograms together).
+
+Incremental runs only read tips with ``id`` above the ``cohorts`` watermark.
+Tips are created pending and complete later, so the watermark never moves
+past the oldest tip that is still pending and younger than PENDING_GRACE.
+Refunds after a tip was counted are only reflected by ``--full``.
+The watermark moves in the same transaction as each chunk's merge, so a run
+that dies partway resumes after the last merged chunk instead of counting it
+twice; ``cohorts:reports`` trails it until the reports are rebuilt, so the
+next run also rebuilds the reports of creators the dead run merged.
+numpy is imported by the functions that need it, so it is only loaded when
+a job runs or a report is rendered.
+
+    python manage.py build_cohorts          # incremental (cron, nightly)
+    python manage.py build_cohorts --full   # rebuild from scratch
+"""
+
+import datetime
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CreatorCohortReport, FanActivity, JobWatermark
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WATERMARK = "cohorts"
+REPORTS_WATERMARK = "cohorts:reports"
+CHUNK_SIZE = 50_000
+MAX_OFFSET = 12            # retention columns: month 0 … month 12
+MAX_COHORTS = 24           # most recent cohorts kept per report
+PENDING_GRACE = datetime.timedelta(hours=24)
+LTV_EDGES_CENTS = [0, 2_000, 5_000, 10_000, 20_000, 50_000, 100_000, 250_000, 500_000, 1_000_000]
+_KEY_BATCH = 500
+
+
+def fan_key(tipper_id, tipper_email) -> str | None:
+    if tipper_id:
+        return f"u:{tipper_id}"
+    if tipper_email:
+        return "e:" + hashlib.sha1(tipper_email.strip().lower().encode()).hexdigest()[:32]
+    return None  # anonymous — cannot be followed across tips
+
+
+def month_index(dt) -> int:
+    local = timezone.localtime(dt)
+    return local.year * 12 + local.month - 1
+
+
+def month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+# ── Extract ───────────────────────────────────────────────────────────────────
+
+def _safe_high_watermark() -> int:
+    """Highest tip id that can be processed without skipping a still-pending tip."""
+    from apps.tips.models import Tip
+
+    high = Tip.objects.order_by("-id").values_list("id", flat=True).first() or 0
+    oldest_pending = (
+        Tip.objects.filter(status=Tip.Status.PENDING, created_at__gte=timezone.now() - PENDING_GRACE)
+        .order_by("id").values_list("id", flat=True).first()
+    )
+    return min(high, oldest_pending - 1) if oldest_pending else high
+
+
+def stream_tips(after_id: int, up_to_id: int, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield completed tips as ``(last_id, (creator_ids, fan_keys, months, cents))``
+    array chunks; the arrays are ``None`` when a chunk held only anonymous tips.
+    """
+    import numpy as np
+
+    from apps.tips.models import Tip
+
+    last = after_id
+    while True:
+        rows = list(
+            Tip.objects.filter(status=Tip.Status.COMPLETED, id__gt=last, id__lte=up_to_id)
+            .order_by("id")
+            .values_list("id", "creator_id", "tipper_id", "tipper_email", "created_at", "amount")[:chunk_size]
+        )
+        if not rows:
+            return
+        last = rows[-1][0]
+        keyed = [(r[1], fan_key(r[2], r[3]), month_index(r[4]), int(r[5] * 100)) for r in rows]
+        keyed = [r for r in keyed if r[1] is not None]
+        if not keyed:
+            yield last, None
+            continue
+        creators, keys, months, cents = zip(*keyed)
+        yield last, (
+            np.asarray(creators, dtype=np.int64),
+            np.asarray(keys, dtype=object),
+            np.asarray(months, dtype=np.int64),
+            np.asarray(cents, dtype=np.int64),
+        )
+
+
+# ── Transform: chunk → per (creator, fan) deltas ──────────────────────────────
+
+def aggregate_chunk(creators, keys, months, cents) -> dict:
+    """
+    Group a chunk by (creator, fan) with array ops.
+
+    Returns ``{(creator_id, fan_key): (first_month, months_set, cents, count)}``.
+    """
+    import numpy as np
+
+    fan_codes, fan_index = np.unique(keys, return_inverse=True)
+    pairs = np.stack([creators, fan_index.astype(np.int64)], axis=1)
+    pair_keys, pair_index = np.unique(pairs, axis=0, return_inverse=True)
+    pair_index = pair_index.ravel()
+    n = len(pair_keys)
+
+    totals = np.bincount(pair_index, weights=cents, minlength=n).astype(np.int64)
+    counts = np.bincount(pair_index, minlength=n)
+    first = np.full(n, np.iinfo(np.int64).max)
+    np.minimum.at(first, pair_index, months)
+
+    # Distinct (pair, month) combinations → active month sets
+    pm = np.unique(np.stack([pair_index, months], axis=1), axis=0)
+    splits = np.flatnonzero(np.diff(pm[:, 0])) + 1
+    month_groups = np.split(pm[:, 1], splits)
+    group_pairs = pm[np.r_[0, splits], 0] if len(pm) else []
+
+    out = {}
+    for pair, group in zip(group_pairs, month_groups):
+        creator_id, code = pair_keys[pair]
+        out[(int(creator_id), fan_codes[code])] = (
+            int(first[pair]), set(group.tolist()), int(totals[pair]), int(counts[pair]),
+        )
+    return out
+
+
+# ── Load: merge deltas into FanActivity ───────────────────────────────────────
+
+def merge_activity(deltas: dict) -> set:
+    """Upsert FanActivity rows; returns the creator ids touched."""
+    by_creator: dict = {}
+    for (creator_id, key), delta in deltas.items():
+        by_creator.setdefault(creator_id, {})[key] = delta
+
+    for creator_id, fans in by_creator.items():
+        keys = list(fans)
+        existing = {}
+        for i in range(0, len(keys), _KEY_BATCH):
+            for row in FanActivity.objects.filter(creator_id=creator_id, fan_key__in=keys[i:i + _KEY_BATCH]):
+                existing[row.fan_key] = row
+
+        to_update, to_create = [], []
+        for key, (first, months, cents, count) in fans.items():
+            row = existing.get(key)
+            if row is None:
+                to_create.append(FanActivity(
+                    creator_id=creator_id, fan_key=key, first_month=first,
+                    active_months=sorted(months), total_cents=cents, tip_count=count,
+                ))
+                continue
+            row.first_month = min(row.first_month, first)
+            row.active_months = sorted(set(row.active_months) | months)
+            row.total_cents += cents
+            row.tip_count += count
+            to_update.append(row)
+
+        FanActivity.objects.bulk_create(to_create, batch_size=1000)
+        FanActivity.objects.bulk_update(
+            to_update, ["first_month", "active_months", "total_cents", "tip_count"], batch_size=1000
+        )
+    return set(by_creator)
+
+
+# ── Reports ───────────────────────────────────────────────────────────────────
+
+def cohort_matrix(first_months: "np.ndarray", fan_idx: "np.ndarray", active_months: "np.ndarray"):
+    """
+    ``(cohort_months, sizes, matrix)`` where ``matrix[c, k]`` is the number of
+    fans from cohort ``c`` who tipped ``k`` months after their first tip.
+    """
+    import numpy as np
+
+    cohorts, cohort_of_fan = np.unique(first_months, return_inverse=True)
+    sizes = np.bincount(cohort_of_fan, minlength=len(cohorts))
+    offsets = active_months - first_months[fan_idx]
+    keep = (offsets >= 0) & (offsets <= MAX_OFFSET)
+    matrix = np.zeros((len(cohorts), MAX_OFFSET + 1), dtype=np.int64)
+    np.add.at(matrix, (cohort_of_fan[fan_idx[keep]], offsets[keep]), 1)
+    return cohorts, sizes, matrix
+
+
+def ltv_summary(total_cents: "np.ndarray") -> dict:
+    import numpy as np
+
+    if not len(total_cents):
+        return {"fans": 0, "total": "0.00", "mean": "0.00", "percentiles": {}, "histogram": {}}
+    edges = np.asarray(LTV_EDGES_CENTS + [max(int(total_cents.max()) + 1, LTV_EDGES_CENTS[-1] + 1)])
+    counts, _ = np.histogram(total_cents, bins=edges)
+    pct = np.percentile(total_cents, [25, 50, 75, 90, 99])
+    return {
+        "fans": int(len(total_cents)),
+        "total": f"{total_cents.sum() / 100:.2f}",
+        "mean": f"{total_cents.mean() / 100:.2f}",
+        "percentiles": {f"p{p}": f"{v / 100:.2f}" for p, v in zip((25, 50, 75, 90, 99), pct)},
+        # Last bucket is open-ended ("1000000+" cents)
+        "histogram": {"edges": LTV_EDGES_CENTS, "counts": counts.tolist()},
+    }
+
+
+def build_report(creator_id: int) -> CreatorCohortReport:
+    import numpy as np
+
+    rows = list(
+        FanActivity.objects.filter(creator_id=creator_id)
+        .values_list("first_month", "active_months", "total_cents")
+    )
+    first = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    totals = np.fromiter((r[2] for r in rows), dtype=np.int64, count=len(rows))
+    lengths = np.fromiter((len(r[1]) for r in rows), dtype=np.int64, count=len(rows))
+    fan_idx = np.repeat(np.arange(len(rows)), lengths)
+    active = np.fromiter((m for r in rows for m in r[1]), dtype=np.int64, count=int(lengths.sum()))
+
+    cohorts, sizes, matrix = cohort_matrix(first, fan_idx, active)
+    recent = slice(max(0, len(cohorts) - MAX_COHORTS), len(cohorts))
+    report, _ = CreatorCohortReport.objects.update_or_create(
+        creator_id=creator_id,
+        defaults={
+            "cohorts": [
+                {"month": month_label(int(c)), "size": int(s), "active": m.tolist()}
+                for c, s, m in zip(cohorts[recent], sizes[recent], matrix[recent])
+            ],
+            "ltv": ltv_summary(totals),
+        },
+    )
+    return report
+
+
+def report_payload(reports) -> dict:
+    """
+    API shape for one or more reports (an enterprise sums its creators').
+
+    Cohorts with the same month are added together and retention rates are
+    derived on read. Percentiles of a combined report are estimated from the
+    merged histogram.
+    """
+    import numpy as np
+
+    reports = list(reports)
+    sizes: dict = {}
+    active_by_month: dict = {}
+    for report in reports:
+        for row in report.cohorts:
+            month = row["month"]
+            sizes[month] = sizes.get(month, 0) + row["size"]
+            active_by_month[month] = active_by_month.get(month, 0) + np.asarray(row["active"], dtype=np.int64)
+
+    rows = []
+    for month in sorted(sizes)[-MAX_COHORTS:]:
+        size, active = sizes[month], active_by_month[month]
+        rows.append({
+            "month": month,
+            "size": size,
+            "active": active.tolist(),
+            "retention": [round(float(n) / size, 4) if size else 0.0 for n in active],
+        })
+
+    summaries = [r.ltv for r in reports if r.ltv.get("fans")]
+    if len(summaries) == 1:
+        ltv = summaries[0]
+    elif summaries:
+        counts = np.sum([s["histogram"]["counts"] for s in summaries], axis=0)
+        fans = int(counts.sum())
+        total = sum(float(s["total"]) for s in summaries)
+        cumulative = np.concatenate([[0], np.cumsum(counts)]) / fans
+        edges = np.asarray(LTV_EDGES_CENTS + [LTV_EDGES_CENTS[-1]], dtype=float)
+        ltv = {
+            "fans": fans,
+            "total": f"{total:.2f}",
+            "mean": f"{total / fans:.2f}",
+            "percentiles": {
+                f"p{p}": f"{np.interp(p / 100, cumulative, edges) / 100:.2f}" for p in (25, 50, 75, 90, 99)
+            },
+            "histogram": {"edges": LTV_EDGES_CENTS, "counts": counts.tolist()},
+        }
+    else:
+        ltv = ltv_summary(np.asarray([], dtype=np.int64))
+
+    computed = [r.computed_at for r in reports]
+    return {"cohorts": rows, "ltv": ltv, "computed_at": min(computed) if computed else None}
+
+
+# ── Entry point ───────────────────────────────────────────────────────────────
+
+def run(full: bool = False, chunk_size: int = CHUNK_SIZE) -> dict:
+    if full:
+        with transaction.atomic():
+            FanActivity.objects.all().delete()
+            CreatorCohortReport.objects.all().delete()
+            JobWatermark.objects.filter(name__in=[WATERMARK, REPORTS_WATERMARK]).delete()
+
+    from apps.tips.models import Tip
+
+    mark, _ = JobWatermark.objects.get_or_create(name=WATERMARK)
+    reports_mark, _ = JobWatermark.objects.get_or_create(name=REPORTS_WATERMARK, defaults={"value": mark.value})
+    # Chunks a dead run merged whose reports it never rebuilt
+    touched: set = set(
+        Tip.objects.filter(status=Tip.Status.COMPLETED, id__gt=reports_mark.value, id__lte=mark.value)
+        .values_list("creator_id", flat=True).distinct()
+    ) if reports_mark.value < mark.value else set()
+
+    up_to = _safe_high_watermark()
+    tips = 0
+    for last_id, chunk in stream_tips(mark.value, up_to, chunk_size):
+        with transaction.atomic():
+            if chunk is not None:
+                touched |= merge_activity(aggregate_chunk(*chunk))
+            # Same transaction as the merge: a rerun never merges this chunk again
+            mark.value = last_id
+            mark.save(update_fields=["value", "updated_at"])
+        tips += len(chunk[0]) if chunk is not None else 0
+
+    for creator_id in touched:
+        build_report(creator_id)
+
+    mark.value = max(mark.value, up_to)
+    mark.save(update_fields=["value", "updated_at"])
+    reports_mark.value = mark.value
+    reports_mark.save(update_fields=["value", "updated_at"])
+    logger.info("cohorts: %d tips, %d creators, watermark %d", tips, len(touched), mark.value)
+    return {"tips": tips, "creators": len(touched), "watermark": mark.value}
@@ -0,0 +1,30 @@
+"""
+Management command: build_cohorts
+=================================
+Fold newly completed tips into the per-fan activity table and rebuild the
+cohort-retention / fan LTV reports of every creator they touched. Only tips
+past the stored watermark are read, so nightly runs stay proportional to
+the day's volume. ``--full`` discards all state and rebuilds from the first
+tip (needed after refunds of already-counted tips).
+
+Run nightly via cron:
+  30 2 * * *  python manage.py build_cohorts
+"""
+from django.core.management.base import BaseCommand
+
+from apps.analytics.cohorts import CHUNK_SIZE, run
+
+
+class Command(BaseCommand):
+    help = "Build cohort retention and fan LTV reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Rebuild from scratch instead of incrementally.")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        result = run(full=options["full"], chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {result['tips']} tips for {result['creators']} creators "
+            f"(watermark {result['watermark']})."
+        ))
@@ -0,0 +1,22 @@
+"""
+Management command: recompute_pledge_metrics
+============================================
+Rebuild every creator's pledge counts, MRR and tier mix from the pledges
+table in one grouped query, replacing the incrementally maintained values.
+Use after bulk edits that bypass model signals (e.g. ``QuerySet.update()``
+or a deleted tier moving its pledges to "custom amount"). Monthly churn and
+billing counters are kept.
+
+  python manage.py recompute_pledge_metrics
+"""
+from django.core.management.base import BaseCommand
+
+from apps.analytics.pledges import recompute
+
+
+class Command(BaseCommand):
+    help = "Recompute pledge metrics from scratch."
+
+    def handle(self, *args, **options):
+        count = recompute()
+        self.stdout.write(self.style.SUCCESS(f"Pledge metrics recomputed for {count} creator(s)."))
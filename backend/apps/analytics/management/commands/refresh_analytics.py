@@ -0,0 +1,21 @@
+"""
+Management command: refresh_analytics
+=====================================
+Refresh the daily / monthly platform metric summaries behind
+/api/admin/analytics/. On Postgres this is REFRESH MATERIALIZED VIEW
+CONCURRENTLY, so dashboards keep reading the previous data meanwhile.
+
+Run every 15 minutes via cron:
+  */15 * * * *  python manage.py refresh_analytics
+"""
+from django.core.management.base import BaseCommand
+
+from apps.analytics.materialize import refresh
+
+
+class Command(BaseCommand):
+    help = "Refresh the platform analytics summaries."
+
+    def handle(self, *args, **options):
+        started = refresh()
+        self.stdout.write(self.style.SUCCESS(f"Analytics refreshed at {started:%Y-%m-%d %H:%M:%S}."))
@@ -0,0 +1,155 @@
+"""
+Build and refresh the platform metric summaries (see models.py).
+
+Postgres
+    ``analytics_platform_daily`` is a materialized view over tips, users
+    and pledges with one row per calendar day; ``analytics_platform_monthly``
+    rolls it up. Each has a unique index on ``bucket`` so ``refresh()`` can
+    use REFRESH MATERIALIZED VIEW CONCURRENTLY — readers keep seeing the
+    previous contents until the new ones are swapped in. The views are
+    defined in migration 0001; a change to them is a new migration.
+
+Other backends
+    The same rows are computed with the ORM and rewritten inside one
+    transaction.
+
+Pledge MRR has no history table, so a pledge counts from its
+``created_at`` day until the day after its ``updated_at`` once it is no
+longer active (cancel / pause is the last write to a pledge). Both
+implementations use running sums of those +/- deltas.
+
+Run on a schedule with ``manage.py refresh_analytics``.
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import PlatformDailyMetric, PlatformMonthlyMetric
+
+logger = logging.getLogger(__name__)
+
+REFRESHED_AT_KEY = "analytics:refreshed_at"
+
+METRIC_FIELDS = (
+    "tip_count", "tip_volume", "platform_fee", "service_fee",
+    "new_creators", "new_fans", "active_pledges", "pledge_mrr",
+)
+# Point-in-time columns: a month takes its last day's value instead of a sum
+_SNAPSHOT_FIELDS = ("active_pledges", "pledge_mrr")
+
+# Monthly is built from daily, so refresh in this order
+REFRESH_SQL = [
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY analytics_platform_daily",
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY analytics_platform_monthly",
+]
+
+
+# ── ORM fallback ──────────────────────────────────────────────────────────────
+
+def compute_daily_rows() -> list[dict]:
+    """The daily view's rows, computed in Python (non-Postgres backends)."""
+    from apps.tips.models import Pledge, Tip
+    from apps.users.models import User
+
+    zero = Decimal("0")
+    rows = defaultdict(lambda: dict.fromkeys(METRIC_FIELDS, 0))
+
+    tips = (
+        Tip.objects.filter(status=Tip.Status.COMPLETED)
+        .annotate(bucket=TruncDate("created_at"))
+        .values("bucket")
+        .annotate(
+            tip_count=Count("id"), tip_volume=Sum("amount"),
+            platform_fee=Sum("platform_fee"), service_fee=Sum("service_fee"),
+        )
+    )
+    for row in tips:
+        rows[row.pop("bucket")].update(row)
+
+    signups = (
+        User.objects.annotate(bucket=TruncDate("date_joined"))
+        .values("bucket")
+        .annotate(
+            new_creators=Count("id", filter=Q(role="creator")),
+            new_fans=Count("id", filter=Q(role="fan")),
+        )
+    )
+    for row in signups:
+        rows[row.pop("bucket")].update(row)
+
+    deltas = defaultdict(lambda: [0, zero])
+    for pledge in Pledge.objects.values("created_at", "updated_at", "status", "amount").iterator():
+        start = timezone.localdate(pledge["created_at"])
+        deltas[start][0] += 1
+        deltas[start][1] += pledge["amount"]
+        if pledge["status"] != Pledge.Status.ACTIVE:
+            end = timezone.localdate(pledge["updated_at"]) + datetime.timedelta(days=1)
+            deltas[end][0] -= 1
+            deltas[end][1] -= pledge["amount"]
+
+    today = timezone.localdate()
+    first_day = min([today, *rows, *deltas])
+    result, active, mrr = [], 0, zero
+    day = first_day
+    while day <= today:
+        active += deltas[day][0]
+        mrr += deltas[day][1]
+        row = rows.get(day, {})
+        result.append({
+            "bucket": day,
+            **{f: row.get(f) or 0 for f in METRIC_FIELDS if f not in _SNAPSHOT_FIELDS},
+            "active_pledges": active,
+            "pledge_mrr": mrr,
+        })
+        day += datetime.timedelta(days=1)
+    return result
+
+
+def roll_up_monthly(daily: list[dict]) -> list[dict]:
+    months: dict = {}
+    for row in daily:
+        bucket = row["bucket"].replace(day=1)
+        month = months.setdefault(bucket, {"bucket": bucket, **dict.fromkeys(METRIC_FIELDS, 0)})
+        for field in METRIC_FIELDS:
+            if field in _SNAPSHOT_FIELDS:
+                month[field] = row[field]  # rows are in day order — last one wins
+            else:
+                month[field] += row[field]
+    return list(months.values())
+
+
+def _rewrite_tables() -> None:
+    daily = compute_daily_rows()
+    with transaction.atomic():
+        PlatformDailyMetric.objects.all().delete()
+        PlatformDailyMetric.objects.bulk_create([PlatformDailyMetric(**r) for r in daily], batch_size=1000)
+        PlatformMonthlyMetric.objects.all().delete()
+        PlatformMonthlyMetric.objects.bulk_create([PlatformMonthlyMetric(**r) for r in roll_up_monthly(daily)])
+
+
+# ── Entry point ───────────────────────────────────────────────────────────────
+
+def refresh() -> datetime.datetime:
+    """Rebuild both summaries without blocking readers; returns the refresh time."""
+    started = timezone.now()
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            for sql in REFRESH_SQL:
+                cursor.execute(sql)
+    else:
+        _rewrite_tables()
+    cache.set(REFRESHED_AT_KEY, started, None)
+    logger.info("analytics refresh took %.2fs", (timezone.now() - started).total_seconds())
+    return started
+
+
+def refreshed_at():
+    return cache.get(REFRESHED_AT_KEY)
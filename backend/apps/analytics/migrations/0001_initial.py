@@ -0,0 +1,155 @@
+from django.db import migrations, models
+
+# The Postgres views as of this migration (refreshed by analytics/materialize.py)
+DAILY_VIEW_SQL = """
+CREATE MATERIALIZED VIEW analytics_platform_daily AS
+WITH bounds AS (
+    SELECT LEAST(
+        (SELECT MIN(date_joined)::date FROM users_user),
+        (SELECT MIN(created_at)::date FROM tips_tip),
+        (SELECT MIN(created_at)::date FROM tips_pledge),
+        CURRENT_DATE
+    ) AS first_day
+),
+days AS (
+    SELECT generate_series(first_day, CURRENT_DATE, interval '1 day')::date AS bucket FROM bounds
+),
+tips AS (
+    SELECT created_at::date AS bucket,
+           COUNT(*) AS tip_count,
+           SUM(amount) AS tip_volume,
+           SUM(platform_fee) AS platform_fee,
+           SUM(service_fee) AS service_fee
+    FROM tips_tip
+    WHERE status = 'completed'
+    GROUP BY 1
+),
+signups AS (
+    SELECT date_joined::date AS bucket,
+           COUNT(*) FILTER (WHERE role = 'creator') AS new_creators,
+           COUNT(*) FILTER (WHERE role = 'fan') AS new_fans
+    FROM users_user
+    GROUP BY 1
+),
+pledge_deltas AS (
+    SELECT bucket, SUM(d_count) AS d_count, SUM(d_mrr) AS d_mrr
+    FROM (
+        SELECT created_at::date AS bucket, 1 AS d_count, amount AS d_mrr FROM tips_pledge
+        UNION ALL
+        SELECT updated_at::date + 1, -1, -amount FROM tips_pledge WHERE status <> 'active'
+    ) deltas
+    GROUP BY bucket
+)
+SELECT d.bucket,
+       COALESCE(t.tip_count, 0)::integer AS tip_count,
+       COALESCE(t.tip_volume, 0) AS tip_volume,
+       COALESCE(t.platform_fee, 0) AS platform_fee,
+       COALESCE(t.service_fee, 0) AS service_fee,
+       COALESCE(s.new_creators, 0)::integer AS new_creators,
+       COALESCE(s.new_fans, 0)::integer AS new_fans,
+       (SUM(COALESCE(p.d_count, 0)) OVER w)::integer AS active_pledges,
+       SUM(COALESCE(p.d_mrr, 0)) OVER w AS pledge_mrr
+FROM days d
+LEFT JOIN tips t USING (bucket)
+LEFT JOIN signups s USING (bucket)
+LEFT JOIN pledge_deltas p USING (bucket)
+WINDOW w AS (ORDER BY d.bucket)
+WITH DATA
+"""
+
+MONTHLY_VIEW_SQL = """
+CREATE MATERIALIZED VIEW analytics_platform_monthly AS
+SELECT date_trunc('month', bucket)::date AS bucket,
+       SUM(tip_count)::integer AS tip_count,
+       SUM(tip_volume) AS tip_volume,
+       SUM(platform_fee) AS platform_fee,
+       SUM(service_fee) AS service_fee,
+       SUM(new_creators)::integer AS new_creators,
+       SUM(new_fans)::integer AS new_fans,
+       (array_agg(active_pledges ORDER BY bucket DESC))[1] AS active_pledges,
+       (array_agg(pledge_mrr ORDER BY bucket DESC))[1] AS pledge_mrr
+FROM analytics_platform_daily
+GROUP BY 1
+WITH DATA
+"""
+
+CREATE_SQL = [
+    DAILY_VIEW_SQL,
+    "CREATE UNIQUE INDEX analytics_platform_daily_bucket ON analytics_platform_daily (bucket)",
+    MONTHLY_VIEW_SQL,
+    "CREATE UNIQUE INDEX analytics_platform_monthly_bucket ON analytics_platform_monthly (bucket)",
+]
+
+DROP_SQL = [
+    "DROP MATERIALIZED VIEW IF EXISTS analytics_platform_monthly",
+    "DROP MATERIALIZED VIEW IF EXISTS analytics_platform_daily",
+]
+
+MODELS = ("PlatformDailyMetric", "PlatformMonthlyMetric")
+
+
+def create_relations(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for sql in CREATE_SQL:
+            schema_editor.execute(sql)
+        return
+    # Plain tables, rewritten by materialize.refresh()
+    for name in MODELS:
+        schema_editor.create_model(apps.get_model("analytics", name))
+
+
+def drop_relations(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for sql in DROP_SQL:
+            schema_editor.execute(sql)
+        return
+    for name in MODELS:
+        schema_editor.delete_model(apps.get_model("analytics", name))
+
+
+def metric_fields():
+    return [
+        ("bucket", models.DateField(primary_key=True, serialize=False)),
+        ("tip_count", models.IntegerField()),
+        ("tip_volume", models.DecimalField(decimal_places=2, max_digits=14)),
+        ("platform_fee", models.DecimalField(decimal_places=2, max_digits=14)),
+        ("service_fee", models.DecimalField(decimal_places=2, max_digits=14)),
+        ("new_creators", models.IntegerField()),
+        ("new_fans", models.IntegerField()),
+        ("active_pledges", models.IntegerField()),
+        ("pledge_mrr", models.DecimalField(decimal_places=2, max_digits=14)),
+    ]
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("tips", "0008_admin_search_indexes"),
+        ("users", "0010_admin_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformDailyMetric",
+            fields=metric_fields(),
+            options={
+                "db_table": "analytics_platform_daily",
+                "ordering": ["bucket"],
+                "abstract": False,
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PlatformMonthlyMetric",
+            fields=metric_fields(),
+            options={
+                "db_table": "analytics_platform_monthly",
+                "ordering": ["bucket"],
+                "abstract": False,
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_relations, drop_relations),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.4 on 2026-10-19 14:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('creators', '0017_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobWatermark',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CreatorCohortReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cohorts', models.JSONField(default=list)),
+                ('ltv', models.JSONField(default=dict)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('creator', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='cohort_report', to='creators.creatorprofile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FanActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fan_key', models.CharField(max_length=40)),
+                ('first_month', models.IntegerField()),
+                ('active_months', models.JSONField(default=list)),
+                ('total_cents', models.BigIntegerField(default=0)),
+                ('tip_count', models.PositiveIntegerField(default=0)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fan_activity', to='creators.creatorprofile')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='fanactivity',
+            constraint=models.UniqueConstraint(fields=('creator', 'fan_key'), name='fan_activity_creator_fan_unique'),
+        ),
+    ]
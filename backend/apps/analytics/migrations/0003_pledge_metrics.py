@@ -0,0 +1,93 @@
+# Generated by Django 5.0.4 on 2026-10-19 14:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_pledge_metrics(apps, schema_editor):
+    CreatorPledgeMetrics = apps.get_model("analytics", "CreatorPledgeMetrics")
+    PledgeTierMetrics = apps.get_model("analytics", "PledgeTierMetrics")
+    Pledge = apps.get_model("tips", "Pledge")
+
+    fields = {"active": "active_count", "paused": "paused_count", "cancelled": "cancelled_count"}
+    creators, tiers = {}, []
+    rows = (
+        Pledge.objects.order_by().values("creator_id", "tier_id", "status")
+        .annotate(n=models.Count("id"), mrr=models.Sum("amount"))
+    )
+    for row in rows:
+        metrics = creators.setdefault(row["creator_id"], CreatorPledgeMetrics(creator_id=row["creator_id"]))
+        setattr(metrics, fields[row["status"]], getattr(metrics, fields[row["status"]]) + row["n"])
+        if row["status"] == "active":
+            metrics.mrr += row["mrr"]
+            tiers.append(PledgeTierMetrics(
+                creator_id=row["creator_id"], tier_id=row["tier_id"], active_count=row["n"], mrr=row["mrr"],
+            ))
+    CreatorPledgeMetrics.objects.bulk_create(creators.values(), batch_size=1000)
+    PledgeTierMetrics.objects.bulk_create(tiers, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_cohorts'),
+        ('creators', '0017_admin_search_indexes'),
+        ('tips', '0009_pledge_first_active_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorPledgeMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('active_count', models.IntegerField(default=0)),
+                ('paused_count', models.IntegerField(default=0)),
+                ('cancelled_count', models.IntegerField(default=0)),
+                ('mrr', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('creator', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pledge_metrics', to='creators.creatorprofile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PledgeMonthlyMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('start_active', models.IntegerField(default=0)),
+                ('new', models.IntegerField(default=0)),
+                ('churned', models.IntegerField(default=0)),
+                ('reactivated', models.IntegerField(default=0)),
+                ('collected', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('charges', models.IntegerField(default=0)),
+                ('failed_charges', models.IntegerField(default=0)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pledge_monthly_metrics', to='creators.creatorprofile')),
+            ],
+            options={
+                'ordering': ['month'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PledgeTierMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('active_count', models.IntegerField(default=0)),
+                ('mrr', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('collected', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pledge_tier_metrics', to='creators.creatorprofile')),
+                ('tier', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='pledge_metrics', to='creators.supporttier')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='pledgemonthlymetrics',
+            constraint=models.UniqueConstraint(fields=('creator', 'month'), name='pledge_monthly_metrics_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='pledgetiermetrics',
+            constraint=models.UniqueConstraint(condition=models.Q(('tier__isnull', False)), fields=('creator', 'tier'), name='pledge_tier_metrics_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='pledgetiermetrics',
+            constraint=models.UniqueConstraint(condition=models.Q(('tier__isnull', True)), fields=('creator',), name='pledge_tier_metrics_custom_unique'),
+        ),
+        migrations.RunPython(backfill_pledge_metrics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,175 @@
+"""
+Platform time-series metrics.
+
+Both models are read-only summaries rebuilt by ``materialize.refresh()``:
+on Postgres they are materialized views refreshed CONCURRENTLY; on other
+backends (SQLite in tests) plain tables rewritten from the ORM. Either way
+``managed = False`` — migration 0001 creates the underlying relation.
+
+``bucket`` is the first day of the period (the day itself, or the 1st of
+the month). Pledge columns are point-in-time values at the end of the
+bucket; everything else is a sum over it.
+"""
+from django.db import models
+
+
+class PlatformMetric(models.Model):
+    bucket         = models.DateField(primary_key=True)
+    tip_count      = models.IntegerField()
+    tip_volume     = models.DecimalField(max_digits=14, decimal_places=2)
+    platform_fee   = models.DecimalField(max_digits=14, decimal_places=2)
+    service_fee    = models.DecimalField(max_digits=14, decimal_places=2)
+    new_creators   = models.IntegerField()
+    new_fans       = models.IntegerField()
+    active_pledges = models.IntegerField()
+    pledge_mrr     = models.DecimalField(max_digits=14, decimal_places=2)
+
+    class Meta:
+        abstract = True
+        ordering = ["bucket"]
+
+
+class PlatformDailyMetric(PlatformMetric):
+    class Meta(PlatformMetric.Meta):
+        managed = False
+        db_table = "analytics_platform_daily"
+
+    def __str__(self):
+        return f"Platform metrics {self.bucket}"
+
+
+class PlatformMonthlyMetric(PlatformMetric):
+    class Meta(PlatformMetric.Meta):
+        managed = False
+        db_table = "analytics_platform_monthly"
+
+    def __str__(self):
+        return f"Platform metrics {self.bucket:%Y-%m}"
+
+
+# ── Cohort retention / fan LTV (see cohorts.py) ───────────────────────────────
+
+class FanActivity(models.Model):
+    """
+    Running tipping history of one fan with one creator — the incremental
+    state behind the cohort reports. One row per (creator, fan), not per tip.
+    """
+
+    creator       = models.ForeignKey(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="fan_activity"
+    )
+    # "u:<user id>" for signed-in tippers, "e:<email hash>" for guests
+    fan_key       = models.CharField(max_length=40)
+    # Months are counted as year * 12 + (month - 1)
+    first_month   = models.IntegerField()
+    active_months = models.JSONField(default=list)
+    total_cents   = models.BigIntegerField(default=0)
+    tip_count     = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["creator", "fan_key"], name="fan_activity_creator_fan_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.fan_key} → creator {self.creator_id}"
+
+
+class CreatorCohortReport(models.Model):
+    """Compact cohort matrix and LTV distribution, rebuilt by the cohort job."""
+
+    creator     = models.OneToOneField(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="cohort_report"
+    )
+    # [{"month": "2026-01", "size": 40, "active": [40, 12, 9, ...]}, ...]
+    cohorts     = models.JSONField(default=list)
+    # {"fans", "total", "mean", "percentiles": {...}, "histogram": {"edges", "counts"}}
+    ltv         = models.JSONField(default=dict)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Cohort report — creator {self.creator_id}"
+
+
+class JobWatermark(models.Model):
+    """Highest source row id a batch job has fully processed."""
+
+    name       = models.CharField(max_length=50, primary_key=True)
+    value      = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.value}"
+
+
+# ── Pledge metrics (see pledges.py) ───────────────────────────────────────────
+
+class CreatorPledgeMetrics(models.Model):
+    """Current recurring-income position of one creator, kept by pledge signals."""
+
+    creator         = models.OneToOneField(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="pledge_metrics"
+    )
+    active_count    = models.IntegerField(default=0)
+    paused_count    = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+    mrr             = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    updated_at      = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Pledge metrics — creator {self.creator_id}: R{self.mrr}/mo"
+
+
+class PledgeTierMetrics(models.Model):
+    """Active pledges, MRR and collected revenue per SupportTier (``tier=None``: custom amounts)."""
+
+    creator      = models.ForeignKey(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="pledge_tier_metrics"
+    )
+    tier         = models.ForeignKey(
+        "creators.SupportTier", on_delete=models.CASCADE, null=True, blank=True, related_name="pledge_metrics"
+    )
+    active_count = models.IntegerField(default=0)
+    mrr          = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    collected    = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["creator", "tier"], condition=models.Q(tier__isnull=False),
+                name="pledge_tier_metrics_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["creator"], condition=models.Q(tier__isnull=True),
+                name="pledge_tier_metrics_custom_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Pledge tier metrics — creator {self.creator_id}, tier {self.tier_id}"
+
+
+class PledgeMonthlyMetrics(models.Model):
+    """Pledge events in one calendar month — the basis for churn and reactivation rates."""
+
+    creator        = models.ForeignKey(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="pledge_monthly_metrics"
+    )
+    month          = models.DateField()
+    # Active pledges when the month's first event was recorded
+    start_active   = models.IntegerField(default=0)
+    new            = models.IntegerField(default=0)
+    churned        = models.IntegerField(default=0)
+    reactivated    = models.IntegerField(default=0)
+    collected      = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    charges        = models.IntegerField(default=0)
+    failed_charges = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["month"]
+        constraints = [
+            models.UniqueConstraint(fields=["creator", "month"], name="pledge_monthly_metrics_unique"),
+        ]
+
+    def __str__(self):
+        return f"Pledge metrics — creator {self.creator_id}, {self.month:%Y-%m}"
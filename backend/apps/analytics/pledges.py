@@ -0,0 +1,274 @@
+"""
+Pledge (subscription) metrics per creator.
+
+    CreatorPledgeMetrics   active / paused / cancelled counts and MRR
+    PledgeTierMetrics      active count, MRR and collected revenue per tier
+    PledgeMonthlyMetrics   new, churned and reactivated pledges, charges and
+                           collected revenue per calendar month
+
+Write path — O(1) counter updates, no scans:
+    * ``pledge_saved`` (signals.py) diffs the pledge's status, amount and
+      tier against the values it was loaded with and applies the
+      difference. Leaving ACTIVE is churn; becoming ACTIVE again after
+      ``first_active_at`` is set is a reactivation.
+    * ``record_charge`` is called with each billing result, from
+      ``charge_pledges`` and the Paystack webhook's ``_update_pledge``.
+
+``recompute()`` rebuilds the point-in-time tables from the pledges in one
+grouped query (``manage.py recompute_pledge_metrics``). Monthly event
+counters have no source history to rebuild from and are left untouched.
+"""
+
+import logging
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import CreatorPledgeMetrics, PledgeMonthlyMetrics, PledgeTierMetrics
+
+logger = logging.getLogger(__name__)
+
+HISTORY_MONTHS = 12
+
+_STATUS_FIELDS = {"active": "active_count", "paused": "paused_count", "cancelled": "cancelled_count"}
+
+
+def snapshot(pledge) -> tuple | None:
+    """The fields the metrics depend on, as loaded / last saved."""
+    if pledge.pk is None:
+        return None
+    # ``amount`` is whatever was assigned until the row is reloaded — e.g. a str from request data
+    return (pledge.status, Decimal(str(pledge.amount)), pledge.tier_id)
+
+
+def _month(when=None):
+    return timezone.localdate(when).replace(day=1) if when else timezone.localdate().replace(day=1)
+
+
+# ── Counter helpers ───────────────────────────────────────────────────────────
+
+def _bump(model, lookup: dict, create=None, **deltas) -> None:
+    """
+    Add ``deltas`` to the row matching ``lookup``. If there is none, create
+    it from ``create()`` (default: the lookup itself) plus the deltas.
+    """
+    if not deltas:
+        return
+    rows = model.objects.filter(**lookup)
+    if rows.update(**{f: F(f) + v for f, v in deltas.items()}):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**(create() if create else lookup), **deltas)
+    except IntegrityError:
+        # Another worker created the row first
+        rows.update(**{f: F(f) + v for f, v in deltas.items()})
+
+
+def _bump_tier(creator_id, tier_id, **deltas) -> None:
+    lookup = {"creator_id": creator_id, "tier_id": tier_id} if tier_id else {
+        "creator_id": creator_id, "tier__isnull": True,
+    }
+    _bump(PledgeTierMetrics, lookup, lambda: {"creator_id": creator_id, "tier_id": tier_id}, **deltas)
+
+
+def _bump_month(creator_id, **deltas) -> None:
+    month = _month()
+
+    def create():
+        current = CreatorPledgeMetrics.objects.filter(creator_id=creator_id).values_list("active_count", flat=True)
+        return {"creator_id": creator_id, "month": month, "start_active": current.first() or 0}
+
+    _bump(PledgeMonthlyMetrics, {"creator_id": creator_id, "month": month}, create, **deltas)
+
+
+# ── Write path ────────────────────────────────────────────────────────────────
+
+def apply_change(pledge, before: tuple | None, after: tuple | None) -> None:
+    """Fold one pledge's transition ``before → after`` into the counters."""
+    if before == after:
+        return
+    creator_id = pledge.creator_id
+    was_active = before is not None and before[0] == "active"
+    is_active = after is not None and after[0] == "active"
+
+    # Month events are recorded against the counts as they stood before this change
+    if was_active and not is_active:
+        _bump_month(creator_id, churned=1)
+    elif is_active and not was_active:
+        if pledge.first_active_at:
+            _bump_month(creator_id, reactivated=1)
+        else:
+            _bump_month(creator_id, new=1)
+
+    deltas = defaultdict(int)
+    if before is not None:
+        deltas[_STATUS_FIELDS[before[0]]] -= 1
+    if after is not None:
+        deltas[_STATUS_FIELDS[after[0]]] += 1
+    mrr = (after[1] if is_active else 0) - (before[1] if was_active else 0)
+    if mrr:
+        deltas["mrr"] = mrr
+    _bump(CreatorPledgeMetrics, {"creator_id": creator_id}, **{k: v for k, v in deltas.items() if v})
+
+    if was_active:
+        _bump_tier(creator_id, before[2], active_count=-1, mrr=-before[1])
+    if is_active:
+        _bump_tier(creator_id, after[2], active_count=1, mrr=after[1])
+
+    if is_active and not pledge.first_active_at:
+        pledge.first_active_at = timezone.now()
+        type(pledge).objects.filter(pk=pledge.pk).update(first_active_at=pledge.first_active_at)
+
+
+def remove(pledge, before: tuple | None) -> None:
+    """
+    Take a deleted pledge out of the counts. Not churn — only unpaid
+    checkouts are deleted. Update-only, so a creator being deleted along
+    with its pledges never re-creates metric rows.
+    """
+    if before is None:
+        return
+    status, amount, tier_id = before
+    deltas = {_STATUS_FIELDS[status]: F(_STATUS_FIELDS[status]) - 1}
+    if status == "active":
+        deltas["mrr"] = F("mrr") - amount
+        tier = {"tier_id": tier_id} if tier_id else {"tier__isnull": True}
+        PledgeTierMetrics.objects.filter(creator_id=pledge.creator_id, **tier).update(
+            active_count=F("active_count") - 1, mrr=F("mrr") - amount
+        )
+    CreatorPledgeMetrics.objects.filter(creator_id=pledge.creator_id).update(**deltas)
+
+
+def record_charge(pledge, succeeded: bool = True) -> None:
+    """Record one billing attempt for ``pledge`` in the current month."""
+    if not succeeded:
+        _bump_month(pledge.creator_id, failed_charges=1)
+        return
+    _bump_month(pledge.creator_id, charges=1, collected=pledge.amount)
+    _bump_tier(pledge.creator_id, pledge.tier_id, collected=pledge.amount)
+
+
+# ── Full recompute ────────────────────────────────────────────────────────────
+
+def recompute() -> int:
+    """Rebuild counts, MRR and the tier mix from the pledges table; returns creators written."""
+    from apps.tips.models import Pledge
+
+    grouped = (
+        Pledge.objects.order_by()
+        .values("creator_id", "tier_id", "status")
+        .annotate(n=Count("id"), mrr=Sum("amount"))
+    )
+    creators = defaultdict(lambda: {**dict.fromkeys(_STATUS_FIELDS.values(), 0), "mrr": Decimal("0")})
+    tiers = {}
+    for row in grouped:
+        totals = creators[row["creator_id"]]
+        totals[_STATUS_FIELDS[row["status"]]] += row["n"]
+        if row["status"] == Pledge.Status.ACTIVE:
+            totals["mrr"] += row["mrr"]
+            tiers[(row["creator_id"], row["tier_id"])] = (row["n"], row["mrr"])
+
+    with transaction.atomic():
+        CreatorPledgeMetrics.objects.all().delete()
+        CreatorPledgeMetrics.objects.bulk_create(
+            [CreatorPledgeMetrics(creator_id=cid, **totals) for cid, totals in creators.items()],
+            batch_size=1000,
+        )
+        # Collected revenue is billing history — keep it, reset the point-in-time columns
+        PledgeTierMetrics.objects.update(active_count=0, mrr=0)
+        existing = {
+            (row.creator_id, row.tier_id): row
+            for row in PledgeTierMetrics.objects.filter(
+                creator_id__in={cid for cid, _ in tiers}
+            )
+        }
+        to_create, to_update = [], []
+        for (cid, tid), (n, mrr) in tiers.items():
+            row = existing.get((cid, tid))
+            if row is None:
+                to_create.append(PledgeTierMetrics(creator_id=cid, tier_id=tid, active_count=n, mrr=mrr))
+            else:
+                row.active_count, row.mrr = n, mrr
+                to_update.append(row)
+        PledgeTierMetrics.objects.bulk_create(to_create, batch_size=1000)
+        PledgeTierMetrics.objects.bulk_update(to_update, ["active_count", "mrr"], batch_size=1000)
+
+    logger.info("pledge metrics recomputed for %d creators", len(creators))
+    return len(creators)
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def _money(value) -> str:
+    return str(Decimal(value or 0).quantize(Decimal("0.01")))
+
+
+def _rate(part, whole):
+    return round(float(part) / float(whole), 4) if whole else 0.0
+
+
+def metrics_payload(creator_ids) -> dict:
+    """Pledge metrics summed over ``creator_ids`` (one creator, or an enterprise's members)."""
+    totals = CreatorPledgeMetrics.objects.filter(creator_id__in=creator_ids).aggregate(
+        active=Sum("active_count"), paused=Sum("paused_count"),
+        cancelled=Sum("cancelled_count"), mrr=Sum("mrr"),
+    )
+    active = totals["active"] or 0
+    mrr = totals["mrr"] or Decimal("0")
+
+    tiers = (
+        PledgeTierMetrics.objects.filter(creator_id__in=creator_ids)
+        .values("tier_id", "tier__name", "tier__price", "creator__slug")
+        .annotate(active=Sum("active_count"), tier_mrr=Sum("mrr"), tier_collected=Sum("collected"))
+        .order_by("-tier_mrr", "tier_id")
+    )
+
+    months = (
+        PledgeMonthlyMetrics.objects.filter(creator_id__in=creator_ids)
+        .values("month")
+        .annotate(
+            start=Sum("start_active"), new_=Sum("new"), churned_=Sum("churned"),
+            reactivated_=Sum("reactivated"), collected_=Sum("collected"),
+            charges_=Sum("charges"), failed_=Sum("failed_charges"),
+        )
+        .order_by("-month")[:HISTORY_MONTHS]
+    )
+
+    return {
+        "mrr": _money(mrr),
+        "active": active,
+        "paused": totals["paused"] or 0,
+        "cancelled": totals["cancelled"] or 0,
+        "average_pledge": _money(mrr / active if active else 0),
+        "tiers": [
+            {
+                "tier_id": row["tier_id"],
+                "name": row["tier__name"] or "Custom amount",
+                "price": _money(row["tier__price"]) if row["tier__price"] is not None else None,
+                "creator_slug": row["creator__slug"],
+                "active": row["active"],
+                "mrr": _money(row["tier_mrr"]),
+                "mrr_share": _rate(row["tier_mrr"], mrr),
+                "collected": _money(row["tier_collected"]),
+            }
+            for row in tiers
+        ],
+        "months": [
+            {
+                "month": row["month"].strftime("%Y-%m"),
+                "start_active": row["start"],
+                "new": row["new_"],
+                "churned": row["churned_"],
+                "reactivated": row["reactivated_"],
+                "churn_rate": _rate(row["churned_"], row["start"] + row["new_"]),
+                "charges": row["charges_"],
+                "failed_charges": row["failed_"],
+                "collected": _money(row["collected_"]),
+            }
+            for row in reversed(months)
+        ],
+    }
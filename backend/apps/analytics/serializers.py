@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from .models import PlatformDailyMetric
+
+
+class PlatformMetricSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PlatformDailyMetric
+        fields = [
+            "bucket", "tip_count", "tip_volume", "platform_fee", "service_fee",
+            "new_creators", "new_fans", "active_pledges", "pledge_mrr",
+        ]
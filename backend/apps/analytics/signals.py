@@ -0,0 +1,46 @@
+"""
+Keep the pledge metrics (see pledges.py) in step with pledge writes.
+
+Each Pledge remembers the status / amount / tier it was loaded with, so
+``post_save`` can apply just the difference — including saves with
+``update_fields`` from ``charge_pledges`` and the fan's pause / cancel.
+
+A pledge loaded with any of those fields deferred (``.only()`` / ``.defer()``)
+takes no snapshot at load — reading a deferred field there would reload the
+row, which builds another deferred instance, and so on.  Its state is read
+from the row just before it is written instead.
+"""
+from decimal import Decimal
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import pledges
+
+_TRACKED = {"status", "amount", "tier_id"}
+
+
+@receiver(post_init, sender="tips.Pledge")
+def remember_pledge_state(sender, instance, **kwargs):
+    if not instance.get_deferred_fields() & _TRACKED:
+        instance._metrics_state = pledges.snapshot(instance)
+
+
+@receiver(pre_save, sender="tips.Pledge")
+@receiver(pre_delete, sender="tips.Pledge")
+def load_deferred_state(sender, instance, **kwargs):
+    if instance.pk is not None and not hasattr(instance, "_metrics_state"):
+        row = sender._base_manager.filter(pk=instance.pk).values_list("status", "amount", "tier_id").first()
+        instance._metrics_state = (row[0], Decimal(str(row[1])), row[2]) if row else None
+
+
+@receiver(post_save, sender="tips.Pledge")
+def pledge_saved(sender, instance, **kwargs):
+    after = pledges.snapshot(instance)
+    pledges.apply_change(instance, getattr(instance, "_metrics_state", None), after)
+    instance._metrics_state = after
+
+
+@receiver(post_delete, sender="tips.Pledge")
+def pledge_deleted(sender, instance, **kwargs):
+    pledges.remove(instance, getattr(instance, "_metrics_state", None))
@@ -0,0 +1,49 @@
+import datetime
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.analytics.materialize import refresh
+from apps.creators.models import CreatorProfile
+from apps.tips.models import Pledge, Tip
+from apps.users.models import User
+
+
+class PlatformAnalyticsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        admin = User.objects.create_user(
+            username="analyst", email="analyst@example.com", password="pass1234", role="admin"
+        )
+        self.client.force_authenticate(admin)
+        user = User.objects.create_user(
+            username="earner", email="earner@example.com", password="pass1234", role="creator"
+        )
+        creator = CreatorProfile.objects.create(user=user, display_name="Earner", slug="earner")
+        Tip.objects.create(creator=creator, amount=100, platform_fee=5, service_fee=3, status=Tip.Status.COMPLETED)
+        Tip.objects.create(creator=creator, amount=40, status=Tip.Status.FAILED)
+        Pledge.objects.create(creator=creator, amount=50)
+        Pledge.objects.create(creator=creator, amount=20, status=Pledge.Status.CANCELLED)
+        refresh()
+
+    def test_daily_series(self):
+        res = self.client.get(reverse("admin-analytics"), {"granularity": "day"})
+        self.assertEqual(res.status_code, 200)
+        today = res.data["results"][-1]
+        self.assertEqual(today["bucket"], timezone.localdate().isoformat())
+        self.assertEqual(today["tip_count"], 1)
+        self.assertEqual(today["tip_volume"], "100.00")
+        self.assertEqual(today["platform_fee"], "5.00")
+        # The cancelled pledge stops counting the day after it was cancelled
+        self.assertEqual(today["active_pledges"], 2)
+        self.assertIsNotNone(res.data["refreshed_at"])
+
+    def test_monthly_rollup_and_validation(self):
+        res = self.client.get(reverse("admin-analytics"), {"granularity": "month"})
+        self.assertEqual(res.data["results"][-1]["tip_count"], 1)
+
+        start = (timezone.localdate() - datetime.timedelta(days=1000)).isoformat()
+        res = self.client.get(reverse("admin-analytics"), {"granularity": "day", "start": start})
+        self.assertEqual(res.status_code, 400)
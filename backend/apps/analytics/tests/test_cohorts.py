@@ -0,0 +1,76 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.analytics import cohorts
+from apps.analytics.cohorts import run
+from apps.analytics.models import CreatorCohortReport, FanActivity
+from apps.creators.models import CreatorProfile
+from apps.tips.models import Tip
+from apps.users.models import User
+
+
+class CohortReportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cohorts", email="cohorts@example.com", password="pass1234", role="creator"
+        )
+        self.creator = CreatorProfile.objects.create(user=self.user, display_name="Cohorts", slug="cohorts")
+        self.fan = User.objects.create_user(username="regular", email="regular@example.com", password="pass1234")
+        this_month = timezone.localtime().replace(day=15, hour=12)
+        last_month = (this_month - datetime.timedelta(days=30)).replace(day=15)
+        two_months_ago = (last_month - datetime.timedelta(days=30)).replace(day=15)
+        self.tip(two_months_ago, 20, tipper=self.fan)
+        self.tip(last_month, 30, tipper=self.fan)
+        self.tip(two_months_ago, 10, tipper_email="Guest@Example.com")
+
+    def tip(self, when, amount, status=Tip.Status.COMPLETED, **fan):
+        tip = Tip.objects.create(creator=self.creator, amount=amount, status=status, **fan)
+        Tip.objects.filter(pk=tip.pk).update(created_at=when)
+        return tip
+
+    def test_incremental_runs_fold_new_tips_in(self):
+        self.assertEqual(run()["tips"], 3)
+        regular = FanActivity.objects.get(creator=self.creator, fan_key=f"u:{self.fan.pk}")
+        self.assertEqual((regular.total_cents, regular.tip_count, len(regular.active_months)), (5000, 2, 2))
+
+        # A still-pending tip holds the watermark back until it settles
+        pending = self.tip(timezone.now(), 5, status=Tip.Status.PENDING, tipper_email="guest@example.com")
+        self.assertEqual(run()["tips"], 0)
+        Tip.objects.filter(pk=pending.pk).update(status=Tip.Status.COMPLETED)
+        self.assertEqual(run()["tips"], 1)
+        guest = FanActivity.objects.get(creator=self.creator, fan_key__startswith="e:")
+        self.assertEqual((guest.total_cents, guest.tip_count), (1500, 2))
+
+        self.assertEqual(run(full=True)["tips"], 4)
+        self.assertEqual(FanActivity.objects.filter(creator=self.creator).count(), 2)
+
+    def test_run_that_dies_partway_resumes_without_double_counting(self):
+        with mock.patch.object(cohorts, "build_report", side_effect=RuntimeError("worker killed")):
+            with self.assertRaises(RuntimeError):
+                run(chunk_size=1)
+        self.assertFalse(CreatorCohortReport.objects.exists())
+
+        self.assertEqual(run(chunk_size=1)["tips"], 0)
+        regular = FanActivity.objects.get(creator=self.creator, fan_key=f"u:{self.fan.pk}")
+        self.assertEqual((regular.total_cents, regular.tip_count), (5000, 2))
+        # The dead run's creators still get their report
+        self.assertEqual(CreatorCohortReport.objects.get(creator=self.creator).ltv["fans"], 2)
+
+    def test_creator_endpoint(self):
+        run()
+        client = APIClient()
+        client.force_authenticate(self.user)
+        res = client.get(reverse("my-cohorts"))
+        self.assertEqual(res.status_code, 200)
+        first = res.data["cohorts"][0]
+        self.assertEqual(first["size"], 2)
+        # Both fans are active in their first month; the regular came back a month later
+        self.assertEqual(first["active"][:2], [2, 1])
+        self.assertEqual(first["retention"][1], 0.5)
+        self.assertEqual(res.data["ltv"]["fans"], 2)
+        self.assertEqual(res.data["ltv"]["total"], "60.00")
@@ -0,0 +1,127 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.analytics.models import CreatorPledgeMetrics, PledgeMonthlyMetrics
+from apps.analytics.pledges import recompute
+from apps.creators.models import CreatorProfile, SupportTier
+from apps.tips.models import Pledge
+from apps.users.models import User
+
+
+class PledgeMetricsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="patron", email="patron@example.com", password="pass1234", role="creator"
+        )
+        self.creator = CreatorProfile.objects.create(user=self.user, display_name="Patron", slug="patron")
+        self.tier = SupportTier.objects.create(creator=self.creator, name="Gold", price=50)
+
+    def pledge(self, amount, **kwargs):
+        return Pledge.objects.create(creator=self.creator, amount=amount, **kwargs)
+
+    def metrics(self):
+        return CreatorPledgeMetrics.objects.get(creator=self.creator)
+
+    def month(self):
+        return PledgeMonthlyMetrics.objects.get(creator=self.creator)
+
+    def test_status_changes_update_counters(self):
+        gold = self.pledge(50, tier=self.tier)
+        custom = self.pledge(20)
+        self.pledge(30, status=Pledge.Status.PAUSED)
+        self.assertEqual((self.metrics().active_count, self.metrics().mrr), (2, Decimal("70")))
+
+        gold.status = Pledge.Status.PAUSED
+        gold.save(update_fields=["status"])
+        custom = Pledge.objects.get(pk=custom.pk)
+        custom.amount = 25
+        custom.save()
+        gold.status = Pledge.Status.ACTIVE
+        gold.save()
+
+        metrics = self.metrics()
+        self.assertEqual((metrics.active_count, metrics.paused_count, metrics.mrr), (2, 1, Decimal("75")))
+        month = self.month()
+        self.assertEqual((month.new, month.churned, month.reactivated), (2, 1, 1))
+
+        # Incremental state agrees with a full recompute
+        recompute()
+        self.assertEqual((self.metrics().active_count, self.metrics().mrr), (2, Decimal("75")))
+
+    @mock.patch("apps.tips.views.settings.PAYSTACK_SECRET_KEY", "")
+    def test_dev_mode_pledge_with_amount_as_json_string(self):
+        fan = User.objects.create_user(username="fan", email="fan@example.com", password="pass1234")
+        client = APIClient()
+        client.force_authenticate(fan)
+        res = client.post(reverse("my-pledges"), {"creator_slug": "patron", "amount": "50"}, format="json")
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual((self.metrics().active_count, self.metrics().mrr), (1, Decimal("50")))
+
+        res = client.post(reverse("public-subscribe"), {"creator_slug": "patron", "amount": "lots"}, format="json")
+        self.assertEqual(res.status_code, 400)
+
+    def test_charge_pledges_records_billing_results(self):
+        due = {"next_charge_date": datetime.date.today()}
+        ok = self.pledge(50, tier=self.tier, paystack_authorization_code="AUTH_ok", paystack_email="a@example.com", **due)
+        self.pledge(20, paystack_authorization_code="AUTH_bad", paystack_email="b@example.com", **due)
+
+        def charge(authorization_code, **kwargs):
+            if authorization_code == "AUTH_bad":
+                raise RuntimeError("declined")
+            return {}
+
+        with mock.patch("apps.payments.paystack.charge_authorization", side_effect=charge):
+            call_command("charge_pledges", stdout=mock.MagicMock(), stderr=mock.MagicMock())
+
+        month = self.month()
+        self.assertEqual((month.charges, month.failed_charges, month.collected), (1, 1, Decimal("50")))
+        self.assertEqual(month.churned, 1)
+        self.assertEqual(self.metrics().mrr, ok.amount)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        res = client.get(reverse("creator-pledge-metrics"))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["mrr"], "50.00")
+        gold = next(t for t in res.data["tiers"] if t["tier_id"] == self.tier.pk)
+        self.assertEqual((gold["active"], gold["collected"], gold["mrr_share"]), (1, "50.00", 1.0))
+        self.assertEqual(res.data["months"][-1]["churn_rate"], 0.5)
+
+    def test_webhook_records_a_charge_only_for_the_named_pledge(self):
+        import json
+
+        from apps.tips.models import Tip
+
+        fan = User.objects.create_user(username="fan", email="fan@example.com", password="pass1234")
+        pledge = self.pledge(50, fan=fan)
+
+        def paid(reference, **data):
+            Tip.objects.create(creator=self.creator, tipper=fan, amount=50, paystack_reference=reference)
+            body = json.dumps({"event": "charge.success", "data": {"reference": reference, **data}})
+            with mock.patch("apps.payments.views.ps.verify_webhook_signature", return_value=True):
+                APIClient().post(reverse("paystack-webhook"), body, content_type="application/json")
+
+        # A one-off tip that happens to match the pledge amount is not a charge
+        paid("ONE_OFF")
+        self.assertFalse(PledgeMonthlyMetrics.objects.filter(creator=self.creator, charges__gt=0).exists())
+
+        paid("PLEDGE", metadata={"pledge_id": pledge.pk})
+        self.assertEqual((self.month().charges, self.month().collected), (1, Decimal("50")))
+
+    def test_deferred_pledges_load_and_still_count(self):
+        pledge = self.pledge(50)
+        self.assertEqual(Pledge.objects.only("id").first(), pledge)
+
+        partial = Pledge.objects.only("id", "creator_id").get(pk=pledge.pk)
+        partial.status = Pledge.Status.PAUSED
+        partial.save(update_fields=["status"])
+        self.assertEqual((self.metrics().active_count, self.metrics().mrr), (0, Decimal("0")))
+
+        Pledge.objects.defer("amount").get(pk=pledge.pk).delete()
+        self.assertEqual(self.metrics().paused_count, 0)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import PlatformAnalyticsView
+
+urlpatterns = [
+    path("", PlatformAnalyticsView.as_view(), name="admin-analytics"),
+]
@@ -0,0 +1,66 @@
+import datetime
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.admin_portal.permissions import IsAdminUser
+
+from .materialize import refreshed_at
+from .models import PlatformDailyMetric, PlatformMonthlyMetric
+from .serializers import PlatformMetricSerializer
+
+GRANULARITIES = {
+    # granularity: (model, default span, max span)
+    "day": (PlatformDailyMetric, datetime.timedelta(days=29), datetime.timedelta(days=731)),
+    "month": (PlatformMonthlyMetric, datetime.timedelta(days=334), datetime.timedelta(days=3660)),
+}
+
+
+class PlatformAnalyticsView(APIView):
+    """
+    GET /api/admin/analytics/?granularity=day|month&start=YYYY-MM-DD&end=YYYY-MM-DD
+
+    Time series of platform volume, fee revenue, signups and pledge MRR, read
+    from the precomputed summaries (see materialize.py). Defaults to the
+    last 30 days / 12 months.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        granularity = request.query_params.get("granularity", "day")
+        if granularity not in GRANULARITIES:
+            return Response(
+                {"detail": "granularity must be 'day' or 'month'."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        model, default_span, max_span = GRANULARITIES[granularity]
+
+        try:
+            end = _parse_date(request.query_params.get("end")) or timezone.localdate()
+            start = _parse_date(request.query_params.get("start")) or end - default_span
+        except ValueError:
+            return Response({"detail": "Dates must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+        if granularity == "month":
+            start = start.replace(day=1)
+        if start > end:
+            return Response({"detail": "start must be on or before end."}, status=status.HTTP_400_BAD_REQUEST)
+        if end - start > max_span:
+            return Response(
+                {"detail": f"Range too large for granularity '{granularity}'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rows = model.objects.filter(bucket__range=(start, end))
+        return Response({
+            "granularity": granularity,
+            "start": start,
+            "end": end,
+            "refreshed_at": refreshed_at(),
+            "results": PlatformMetricSerializer(rows, many=True).data,
+        })
+
+
+def _parse_date(value):
+    return datetime.date.fromisoformat(value) if value else None
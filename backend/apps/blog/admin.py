@@ -1,13 +1,12 @@
 from django.contrib import admin
-from django_summernote.admin import SummernoteModelAdmin
 
-from core.admin_site import admin_site
+from core.admin_site import SummernoteFieldsMixin, admin_site
 
 from .models import BlogPost
 
 
 @admin.register(BlogPost, site=admin_site)
-class BlogPostAdmin(SummernoteModelAdmin):
+class BlogPostAdmin(SummernoteFieldsMixin, admin.ModelAdmin):
     summernote_fields = ("content",)
 
     list_display = ("title", "category", "author_name", "is_published", "created_at")
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(fields=["is_published", "updated_at"], name="blog_published_updated_idx"),
+        ),
+    ]
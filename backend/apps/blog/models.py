@@ -39,6 +39,10 @@ class BlogPost(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
+        indexes = [
+            # Freshness key for the public list: MAX(updated_at) over published posts
+            models.Index(fields=["is_published", "updated_at"], name="blog_published_updated_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
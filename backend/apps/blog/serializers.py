@@ -1,11 +1,15 @@
 from rest_framework import serializers
 
+from core.images import SrcsetField
+
 from .models import BlogPost
 
 
 class BlogPostListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for the blog listing page."""
 
+    cover_image_srcset = SrcsetField(source="cover_image")
+
     class Meta:
         model = BlogPost
         fields = [
@@ -15,6 +19,7 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             "category",
             "excerpt",
             "cover_image",
+            "cover_image_srcset",
             "author_name",
             "read_time",
             "created_at",
@@ -24,6 +29,8 @@ class BlogPostListSerializer(serializers.ModelSerializer):
 class BlogPostDetailSerializer(serializers.ModelSerializer):
     """Full serializer including the HTML content body."""
 
+    cover_image_srcset = SrcsetField(source="cover_image")
+
     class Meta:
         model = BlogPost
         fields = [
@@ -34,6 +41,7 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
             "excerpt",
             "content",
             "cover_image",
+            "cover_image_srcset",
             "author_name",
             "read_time",
             "created_at",
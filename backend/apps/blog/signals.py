@@ -0,0 +1,10 @@
+"""Django signals for blog posts: resize uploaded cover images (see core/images.py)."""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core import images
+
+
+@receiver(post_save, sender="blog.BlogPost")
+def generate_cover_variants(sender, instance, update_fields=None, **kwargs):
+    images.schedule(instance, "cover_image", update_fields)
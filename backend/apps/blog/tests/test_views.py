@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.blog.models import BlogPost
+
+
+class BlogRevalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        for title in ("Older", "Newer"):
+            BlogPost.objects.create(title=title, excerpt="e", content="c", is_published=True)
+
+    def test_unpublishing_moves_last_modified_forward(self):
+        url = reverse("blog-list")
+        first = self.client.get(url)
+        since = first["Last-Modified"]
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=since).status_code, 304)
+
+        # Lowers MAX(updated_at) below the date the client holds
+        BlogPost.objects.filter(title="Newer").update(is_published=False)
+        res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([p["title"] for p in res.data["results"]], ["Older"])
+        self.assertNotEqual(res["Last-Modified"], since)
+        self.assertNotEqual(res["ETag"], first["ETag"])
@@ -1,26 +1,44 @@
+from django.db.models import Count, Max
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
 
+from core.conditional import ConditionalGetMixin
+
 from .models import BlogPost
 from .serializers import BlogPostDetailSerializer, BlogPostListSerializer
 
 
-class BlogPostListView(generics.ListAPIView):
+class BlogPostListView(ConditionalGetMixin, generics.ListAPIView):
     """Public list of published blog posts, newest first."""
 
     permission_classes = [AllowAny]
     serializer_class = BlogPostListSerializer
+    cache_control = "public, max-age=300, stale-while-revalidate=86400"
 
     def get_queryset(self):
         return BlogPost.objects.filter(is_published=True)
 
+    def get_freshness(self, request, *args, **kwargs):
+        # Count catches deletes / unpublishes that lower MAX(updated_at)
+        row = self.get_queryset().aggregate(latest=Max("updated_at"), n=Count("id"))
+        return f"blog:{row['n']}:{row['latest']}", row["latest"]
+
 
-class BlogPostDetailView(generics.RetrieveAPIView):
+class BlogPostDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     """Public detail for a single published blog post (by slug)."""
 
     permission_classes = [AllowAny]
     serializer_class = BlogPostDetailSerializer
     lookup_field = "slug"
+    cache_control = "public, max-age=300, stale-while-revalidate=86400"
 
     def get_queryset(self):
         return BlogPost.objects.filter(is_published=True)
+
+    def get_freshness(self, request, *args, **kwargs):
+        updated_at = self.get_queryset().filter(slug=kwargs["slug"]).values_list(
+            "updated_at", flat=True
+        ).first()
+        if updated_at is None:
+            return None, None
+        return f"blog:{kwargs['slug']}:{updated_at}", updated_at
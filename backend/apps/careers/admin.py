@@ -1,13 +1,12 @@
 from django.contrib import admin
-from django_summernote.admin import SummernoteModelAdmin
 
-from core.admin_site import admin_site
+from core.admin_site import SummernoteFieldsMixin, admin_site
 
 from .models import JobOpening
 
 
 @admin.register(JobOpening, site=admin_site)
-class JobOpeningAdmin(SummernoteModelAdmin):
+class JobOpeningAdmin(SummernoteFieldsMixin, admin.ModelAdmin):
     summernote_fields = ("description",)
 
     list_display = ("title", "department", "location", "employment_type", "is_active", "created_at")
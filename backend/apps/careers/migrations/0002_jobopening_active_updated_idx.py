@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("careers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobopening",
+            index=models.Index(fields=["is_active", "updated_at"], name="job_active_updated_idx"),
+        ),
+    ]
@@ -41,6 +41,9 @@ class JobOpening(models.Model):
         ordering = ["department", "title"]
         verbose_name = "Job Opening"
         verbose_name_plural = "Job Openings"
+        indexes = [
+            models.Index(fields=["is_active", "updated_at"], name="job_active_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.department})"
@@ -1,15 +1,23 @@
+from django.db.models import Count, Max
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
 
+from core.conditional import ConditionalGetMixin
+
 from .models import JobOpening
 from .serializers import JobOpeningSerializer
 
 
-class JobOpeningListView(generics.ListAPIView):
+class JobOpeningListView(ConditionalGetMixin, generics.ListAPIView):
     """Public list of active job openings."""
 
     permission_classes = [AllowAny]
     serializer_class = JobOpeningSerializer
+    cache_control = "public, max-age=600, stale-while-revalidate=86400"
 
     def get_queryset(self):
         return JobOpening.objects.filter(is_active=True)
+
+    def get_freshness(self, request, *args, **kwargs):
+        row = self.get_queryset().aggregate(latest=Max("updated_at"), n=Count("id"))
+        return f"jobs:{row['n']}:{row['latest']}", row["latest"]
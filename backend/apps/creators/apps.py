@@ -6,4 +6,5 @@ class CreatorsConfig(AppConfig):
     name = "apps.creators"
 
     def ready(self):
+        import apps.creators.checks  # noqa: F401
         import apps.creators.signals  # noqa: F401
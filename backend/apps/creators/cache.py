@@ -0,0 +1,190 @@
+"""
+Read-through caching for anonymous creator page reads.
+
+Every cached entry key embeds the creator's current *version token*:
+
+    creator:<id>:<token>:<section>:<slug>:<host>:<query>
+
+Writes to anything that shows up on the public page (profile, jars, tiers,
+milestones, posts, KYC docs, completed / refunded tips) call
+``bump_creator_version`` from a signal receiver (see signals.py), which
+swaps the token. The next read builds a new key, misses, and recomputes —
+so a change is visible immediately and old entries just expire.
+
+Tokens and the slug → id map live in the shared backend so a bump in one
+worker invalidates every worker. A per-process backend (the local-memory
+default, no CACHE_URL) cannot do that — a write would only reach the worker
+that made it — so then reads are computed every time, the slug is looked up
+in the database and version ETags are off; ``check --deploy`` warns
+(creators.W001, checks.py).
+"""
+import datetime
+import logging
+import secrets
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+from core.cache import ReadThroughCache, is_shared
+from core.conditional import ConditionalGetMixin
+
+logger = logging.getLogger(__name__)
+
+# Whether the default cache is one every worker shares
+SHARED = is_shared()
+
+public_reads = ReadThroughCache(
+    "creator-public",
+    ttl=getattr(settings, "PUBLIC_CACHE_TTL", 300),
+    max_entries=getattr(settings, "PUBLIC_CACHE_LOCAL_MAX_ENTRIES", 2048),
+)
+
+
+def _shared():
+    return caches["default"]
+
+
+def _version_key(creator_id) -> str:
+    return f"creator:{creator_id}:version"
+
+
+def _slug_key(slug) -> str:
+    return f"creator:slug:{slug}"
+
+
+def creator_version(creator_id) -> str:
+    """Current version token for the creator, creating one on first use; "nocache" without a shared cache."""
+    if not SHARED:
+        return "nocache"
+    key = _version_key(creator_id)
+    try:
+        token = _shared().get(key)
+        if token is None:
+            _shared().add(key, secrets.token_hex(4), None)
+            token = _shared().get(key)
+    except Exception as exc:
+        logger.warning("creator_version: shared cache unavailable: %s", exc)
+        return "nocache"
+    return token or "nocache"
+
+
+def bump_creator_version(creator_id) -> None:
+    """
+    Invalidate every cached public read for the creator.
+
+    Bumps immediately and again after the surrounding transaction commits,
+    so a reader racing the write can't cache pre-commit data under the new
+    token.
+    """
+    if not creator_id:
+        return
+
+    def _bump():
+        try:
+            _shared().set(_version_key(creator_id), secrets.token_hex(4), None)
+        except Exception as exc:
+            logger.warning("bump_creator_version(%s) failed: %s", creator_id, exc)
+
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def creator_id_for_slug(slug) -> int | None:
+    """Resolve slug → creator id through the shared cache (unknown slugs are not cached)."""
+    from .models import CreatorProfile
+
+    if not SHARED:
+        return CreatorProfile.objects.filter(slug=slug).values_list("id", flat=True).first()
+    key = _slug_key(slug)
+    try:
+        creator_id = _shared().get(key)
+    except Exception:
+        creator_id = None
+    if creator_id is not None:
+        return creator_id
+
+    creator_id = CreatorProfile.objects.filter(slug=slug).values_list("id", flat=True).first()
+    if creator_id is not None:
+        try:
+            _shared().set(key, creator_id, public_reads.ttl)
+        except Exception:
+            pass
+    return creator_id
+
+
+def read_through(key: str, compute):
+    """``public_reads.get_or_compute``; just ``compute()`` when invalidation cannot reach every worker."""
+    if not SHARED:
+        return compute()
+    return public_reads.get_or_compute(key, compute)
+
+
+def creator_cache_key(creator_id, section: str, slug: str, request=None, *extra) -> str:
+    parts = [f"creator:{creator_id}:{creator_version(creator_id)}", section, slug]
+    if request is not None:
+        # Paginated / absolute URLs depend on host and query string
+        parts += [request.get_host(), request.GET.urlencode()]
+    parts += [str(e) for e in extra]
+    return ":".join(parts)
+
+
+def _key_extras(view, kwargs) -> list:
+    extra = [f"{k}={v}" for k, v in sorted(kwargs.items()) if k != "slug"]
+    if view.month_sensitive:
+        # Month totals roll over without any write
+        extra.append(datetime.date.today().strftime("%Y-%m"))
+    return extra
+
+
+class CachedPublicReadMixin:
+    """
+    Serve a public DRF GET view for ``<slug>`` through ``public_reads``.
+
+    Only 200 responses are cached; anything else (404 for an inactive
+    creator or unknown jar) is recomputed on every request.
+    """
+
+    cache_section: str = ""
+    month_sensitive = False
+
+    def get(self, request, *args, **kwargs):
+        slug = kwargs["slug"]
+        creator_id = creator_id_for_slug(slug)
+        if creator_id is None:
+            return super().get(request, *args, **kwargs)
+
+        uncached = {}
+
+        def compute():
+            response = super(CachedPublicReadMixin, self).get(request, *args, **kwargs)
+            if response.status_code != 200:
+                uncached["response"] = response
+                return None
+            return response.data
+
+        key = creator_cache_key(creator_id, self.cache_section, slug, request, *_key_extras(self, kwargs))
+        data = read_through(key, compute)
+        if data is None:
+            return uncached.get("response") or super().get(request, *args, **kwargs)
+        return Response(data)
+
+
+class CreatorConditionalGetMixin(ConditionalGetMixin):
+    """
+    Conditional GET keyed on the creator's version token: revalidating a
+    public creator read costs two shared-cache lookups and no SQL.
+    """
+
+    cache_control = "public, max-age=30, stale-while-revalidate=300"
+    month_sensitive = False
+
+    def get_freshness(self, request, *args, **kwargs):
+        creator_id = creator_id_for_slug(kwargs["slug"])
+        if creator_id is None:
+            return None, None
+        version = creator_version(creator_id)
+        if version == "nocache":
+            return None, None
+        return ":".join([str(creator_id), version, kwargs["slug"], *_key_extras(self, kwargs)]), None
@@ -0,0 +1,15 @@
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def public_cache_is_shared(app_configs, **kwargs):
+    from . import cache
+
+    if cache.SHARED:
+        return []
+    return [Warning(
+        "The default cache is per-process, so public creator reads are not cached "
+        "and carry no version ETag: every read is computed from the database.",
+        hint="Set CACHE_URL to a cache all workers share, e.g. redis://redis:6379/1.",
+        id="creators.W001",
+    )]
@@ -0,0 +1,191 @@
+"""
+Fan home feed — recent posts from every creator a fan supports.
+
+    supported creators   one UNION query over the fan's tip streaks,
+                         activated pledges and completed tips
+    per-creator lists    the newest FEED_POSTS_PER_CREATOR published posts of
+                         each creator, cached under ``feed:posts:<id>``;
+                         fetched with one ``get_many`` and, for misses, one
+                         windowed query; deleted on any post write
+    merge                each list is newest-first, so a page is a heap
+                         k-way merge (``heapq.merge``) over per-creator
+                         cursors positioned just past the page cursor
+
+A page therefore costs two queries plus one cache round trip regardless of
+how many creators the fan follows, and O(k + page_size · log k) merging.
+The feed reaches back FEED_POSTS_PER_CREATOR posts per creator; older posts
+stay available on the creator's own page.
+"""
+
+import base64
+import bisect
+import heapq
+import itertools
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.dateparse import parse_datetime
+
+from core import images
+
+from .models import CreatorPost
+
+logger = logging.getLogger(__name__)
+
+POSTS_PER_CREATOR = getattr(settings, "FEED_POSTS_PER_CREATOR", 50)
+CACHE_SECONDS = getattr(settings, "FEED_CACHE_SECONDS", 600)
+
+_POST_FIELDS = (
+    "id", "creator_id", "title", "body", "post_type", "video_url", "media_file", "created_at",
+    "creator__slug", "creator__display_name",
+)
+
+
+# ── Supported creators ────────────────────────────────────────────────────────
+
+def supported_creator_ids(user) -> set:
+    """Active creators ``user`` has tipped (streaks / tips) or pledged to, in one query."""
+    from apps.tips.models import Pledge, Tip, TipStreak
+
+    active = Q(creator__is_active=True)
+    fan = Q(fan=user)
+    if user.email:
+        # Guest streaks recorded before the fan signed up
+        fan |= Q(fan_email=user.email.lower())
+    streaks = TipStreak.objects.filter(active, fan)
+    pledges = Pledge.objects.filter(active, fan=user, first_active_at__isnull=False)
+    tips = Tip.objects.filter(active, tipper=user, status=Tip.Status.COMPLETED)
+    ids = (
+        streaks.order_by().values_list("creator_id", flat=True)
+        .union(pledges.order_by().values_list("creator_id", flat=True))
+        .union(tips.order_by().values_list("creator_id", flat=True))
+    )
+    return set(ids)
+
+
+# ── Per-creator recent posts ──────────────────────────────────────────────────
+
+def _key(creator_id) -> str:
+    return f"feed:posts:{creator_id}"
+
+
+def invalidate_creator_posts(creator_id) -> None:
+    """Drop the cached list now and again after commit (a racing reader may re-cache old rows)."""
+    def _delete():
+        try:
+            cache.delete(_key(creator_id))
+        except Exception as exc:
+            logger.warning("feed: invalidate %s failed: %s", creator_id, exc)
+
+    _delete()
+    transaction.on_commit(_delete)
+
+
+def _load(creator_ids) -> dict:
+    rows = (
+        CreatorPost.objects.filter(creator_id__in=creator_ids, is_published=True)
+        .annotate(position=Window(
+            RowNumber(), partition_by=F("creator_id"), order_by=(F("created_at").desc(), F("id").desc()),
+        ))
+        .filter(position__lte=POSTS_PER_CREATOR)
+        .order_by("creator_id", "-created_at", "-id")
+        .values(*_POST_FIELDS)
+    )
+    lists = {cid: [] for cid in creator_ids}
+    for row in rows:
+        lists[row["creator_id"]].append(row)
+    return lists
+
+
+def recent_posts(creator_ids) -> dict:
+    """``{creator_id: [post, ...]}`` newest first, from the cache where possible."""
+    keys = {_key(cid): cid for cid in creator_ids}
+    try:
+        cached = cache.get_many(list(keys))
+    except Exception as exc:
+        logger.warning("feed: cache read failed: %s", exc)
+        cached = {}
+    lists = {keys[k]: v for k, v in cached.items()}
+
+    missing = [cid for cid in creator_ids if cid not in lists]
+    if missing:
+        loaded = _load(missing)
+        lists.update(loaded)
+        try:
+            cache.set_many({_key(cid): posts for cid, posts in loaded.items()}, CACHE_SECONDS)
+        except Exception as exc:
+            logger.warning("feed: cache write failed: %s", exc)
+    return lists
+
+
+# ── Merge and paging ──────────────────────────────────────────────────────────
+
+def encode_cursor(post: dict) -> str:
+    raw = f"{post['created_at'].isoformat()}|{post['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    """``(created_at, id)`` of the last post on the previous page; ValueError if malformed."""
+    try:
+        when, post_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        created_at = parse_datetime(when)
+        if created_at is None:
+            raise ValueError
+        return created_at, int(post_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def _sort_key(post):
+    return (post["created_at"], post["id"])
+
+
+def merge_page(lists, page_size: int, after=None) -> list:
+    """The ``page_size`` newest posts across ``lists`` that come strictly after ``after``."""
+    cursors = []
+    for posts in lists:
+        if not posts:
+            continue
+        start = 0
+        if after is not None:
+            # Lists are newest first; negate into ascending order for bisect
+            start = bisect.bisect_right(posts, (-after[0].timestamp(), -after[1]),
+                                        key=lambda p: (-p["created_at"].timestamp(), -p["id"]))
+        if start < len(posts):
+            cursors.append(itertools.islice(posts, start, None))
+    return list(itertools.islice(heapq.merge(*cursors, key=_sort_key, reverse=True), page_size))
+
+
+def feed_page(user, page_size: int, cursor: str | None = None) -> tuple[list, str | None]:
+    """``(posts, next_cursor)`` for one page of ``user``'s feed."""
+    after = decode_cursor(cursor) if cursor else None
+    creator_ids = sorted(supported_creator_ids(user))
+    if not creator_ids:
+        return [], None
+    page = merge_page(recent_posts(creator_ids).values(), page_size, after)
+    next_cursor = encode_cursor(page[-1]) if len(page) == page_size else None
+    return page, next_cursor
+
+
+def serialize_post(post: dict, request=None) -> dict:
+    media = post["media_file"]
+    media_url = default_storage.url(media) if media else None
+    if media_url and request is not None:
+        media_url = request.build_absolute_uri(media_url)
+    return {
+        "id": post["id"],
+        "title": post["title"],
+        "body": post["body"],
+        "post_type": post["post_type"],
+        "video_url": post["video_url"],
+        "media_url": media_url,
+        "media_srcset": images.srcset(media, request) if post["post_type"] == CreatorPost.PostType.IMAGE else None,
+        "created_at": post["created_at"],
+        "creator": {"slug": post["creator__slug"], "display_name": post["creator__display_name"]},
+    }
@@ -0,0 +1,28 @@
+"""
+Management command: build_recommendations
+=========================================
+Rebuild the "fans of X also support Y" neighbour lists from completed tips
+and pledges (see apps/creators/recommendations.py). Reads tips in chunks and
+computes the similarity product block by block, so memory stays bounded on
+large tip tables.
+
+Run nightly via cron:
+  15 3 * * *  python manage.py build_recommendations
+"""
+from django.core.management.base import BaseCommand
+
+from apps.creators.recommendations import CHUNK_SIZE, build_similarities
+
+
+class Command(BaseCommand):
+    help = "Rebuild co-tipping creator recommendations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        result = build_similarities(options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['creators']} creators have recommendations "
+            f"({result['pairs']} fan/creator pairs, {result['fans']} fans)."
+        ))
@@ -0,0 +1,40 @@
+"""
+Management command: rebuild_creator_search
+==========================================
+Recompute the discovery columns on CreatorProfile from source data:
+the completed-tip counters and (on Postgres) the full-text search vector.
+
+Signals keep these current; run this after bulk imports, raw SQL fixes or
+to repair drift:
+  python manage.py rebuild_creator_search
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+
+from apps.creators.models import CreatorProfile
+from apps.creators.search import creator_search_vector
+from apps.tips.models import Tip
+
+
+class Command(BaseCommand):
+    help = "Rebuild creator search vectors and completed-tip counters."
+
+    def handle(self, *args, **options):
+        totals = {
+            row["creator_id"]: row
+            for row in Tip.objects.filter(status=Tip.Status.COMPLETED)
+            .values("creator_id")
+            .annotate(total=Sum("amount"), n=Count("id"))
+        }
+
+        with transaction.atomic():
+            CreatorProfile.objects.update(completed_tip_total=0, completed_tip_count=0)
+            for creator_id, row in totals.items():
+                CreatorProfile.objects.filter(pk=creator_id).update(
+                    completed_tip_total=row["total"], completed_tip_count=row["n"]
+                )
+            if connection.vendor == "postgresql":
+                CreatorProfile.objects.update(search_vector=creator_search_vector())
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search data ({len(totals)} creators with tips)."))
@@ -0,0 +1,32 @@
+"""
+Management command: refresh_rankings
+====================================
+Rebuild every creator leaderboard (all-time, month, week, trending — overall
+and per category) and publish it to the rankings cache, so public reads
+never pay for a rebuild.
+
+Run every minute via cron:
+  * * * * *  python manage.py refresh_rankings
+"""
+from django.core.management.base import BaseCommand
+
+from apps.creators.models import CreatorProfile
+from apps.creators.rankings import BOARDS, refresh_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Rebuild and cache all creator leaderboards."
+
+    def handle(self, *args, **options):
+        categories = [""] + sorted(
+            CreatorProfile.objects.filter(is_active=True)
+            .exclude(category="")
+            .values_list("category", flat=True)
+            .distinct()
+        )
+        for category in categories:
+            for board in BOARDS:
+                refresh_leaderboard(board, category)
+        self.stdout.write(self.style.SUCCESS(
+            f"Refreshed {len(BOARDS) * len(categories)} leaderboards ({len(categories) - 1} categories)."
+        ))
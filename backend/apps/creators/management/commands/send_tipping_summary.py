@@ -17,6 +17,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from apps.creators.models import CreatorNotification, CreatorProfile
+from apps.creators.notifications import notify
 from apps.support.emails import send_tipping_summary_email
 from apps.tips.models import Tip
 
@@ -83,9 +84,9 @@ class Command(BaseCommand):
             send_tipping_summary_email(creator, period_label, tips)
 
             # In-app summary notification
-            CreatorNotification.objects.create(
-                creator=creator,
-                notification_type=CreatorNotification.Type.SUMMARY,
+            notify(
+                creator.pk,
+                CreatorNotification.Type.SUMMARY,
                 title=f"Tips summary — R{total:.2f} in {len(tips)} tip(s)",
                 message=f"You received {len(tips)} tip(s) totalling R{total:.2f} in the last {hours} hours.",
             )
@@ -0,0 +1,79 @@
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+from core.operations import PostgresRunSQL
+
+# Postgres-only: the trigram extension, GIN indexes and the tsvector backfill.
+# SQLite (tests) keeps the plain columns and search.py falls back to LIKE.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('simple', coalesce(display_name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(tagline, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(category, '')), 'B') ||
+    setweight(to_tsvector('simple', replace(coalesce(platforms, ''), ',', ' ')), 'C')
+"""
+
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS creator_search_vector_gin "
+    "ON creators_creatorprofile USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS creator_display_name_trgm "
+    "ON creators_creatorprofile USING gin (display_name gin_trgm_ops)",
+    f"UPDATE creators_creatorprofile SET search_vector = {SEARCH_VECTOR_SQL}",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS creator_display_name_trgm",
+    "DROP INDEX IF EXISTS creator_search_vector_gin",
+]
+
+
+def backfill_tip_counters(apps, schema_editor):
+    CreatorProfile = apps.get_model("creators", "CreatorProfile")
+    Tip = apps.get_model("tips", "Tip")
+    totals = (
+        Tip.objects.filter(status="completed")
+        .values("creator_id")
+        .annotate(total=models.Sum("amount"), n=models.Count("id"))
+    )
+    for row in totals.iterator():
+        CreatorProfile.objects.filter(pk=row["creator_id"]).update(
+            completed_tip_total=row["total"], completed_tip_count=row["n"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("creators", "0014_creatorprofile_paystack_split_code"),
+        ("tips", "0007_pledge_tipstreak"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="creatorprofile",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="creatorprofile",
+            name="completed_tip_total",
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="creatorprofile",
+            name="completed_tip_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="creatorprofile",
+            index=models.Index(
+                fields=["is_active", "-completed_tip_total", "-id"], name="creator_discovery_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creatorprofile",
+            index=models.Index(fields=["category", "is_active"], name="creator_category_idx"),
+        ),
+        migrations.RunPython(backfill_tip_counters, migrations.RunPython.noop),
+        PostgresRunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
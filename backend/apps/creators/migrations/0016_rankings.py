@@ -0,0 +1,94 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_period_totals(apps, schema_editor):
+    import datetime
+
+    CreatorPeriodTotal = apps.get_model("creators", "CreatorPeriodTotal")
+    Tip = apps.get_model("tips", "Tip")
+
+    today = datetime.date.today()
+    starts = {
+        "week": today - datetime.timedelta(days=today.weekday()),
+        "month": today.replace(day=1),
+    }
+    for period, start in starts.items():
+        rows = (
+            Tip.objects.filter(status="completed", created_at__date__gte=start)
+            .values("creator_id")
+            .annotate(total=models.Sum("amount"), n=models.Count("id"))
+        )
+        CreatorPeriodTotal.objects.bulk_create(
+            [
+                CreatorPeriodTotal(
+                    creator_id=row["creator_id"], period=period, period_start=start,
+                    total=row["total"], tip_count=row["n"],
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("creators", "0015_creatorprofile_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="creatorprofile",
+            name="trending_score",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="creatorprofile",
+            name="trending_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RemoveIndex(
+            model_name="creatorprofile",
+            name="creator_category_idx",
+        ),
+        migrations.AddIndex(
+            model_name="creatorprofile",
+            index=models.Index(
+                fields=["category", "is_active", "-completed_tip_total"], name="creator_category_rank_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="creatorprofile",
+            index=models.Index(fields=["is_active", "trending_at"], name="creator_trending_idx"),
+        ),
+        migrations.CreateModel(
+            name="CreatorPeriodTotal",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("period", models.CharField(choices=[("week", "Week"), ("month", "Month")], max_length=5)),
+                ("period_start", models.DateField()),
+                ("total", models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ("tip_count", models.PositiveIntegerField(default=0)),
+                (
+                    "creator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="period_totals",
+                        to="creators.creatorprofile",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["period", "period_start", "-total"], name="creator_period_rank_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("creator", "period", "period_start"), name="creator_period_total_unique"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_period_totals, migrations.RunPython.noop),
+    ]
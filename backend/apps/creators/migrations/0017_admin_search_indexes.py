@@ -0,0 +1,29 @@
+from django.db import migrations
+
+from core.operations import PostgresRunSQL
+
+# Indexes behind the admin portal search (apps/admin_portal/search.py).
+# Django compiles icontains / iexact to UPPER(col::text) LIKE / =, so the
+# trigram and b-tree indexes are on that expression. Postgres only.
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS creator_slug_trgm ON creators_creatorprofile USING gin (UPPER(slug::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS creator_display_name_upper_trgm "
+    "ON creators_creatorprofile USING gin (UPPER(display_name::text) gin_trgm_ops)",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS creator_display_name_upper_trgm",
+    "DROP INDEX IF EXISTS creator_slug_trgm",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("creators", "0016_rankings"),
+    ]
+
+    operations = [
+        PostgresRunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
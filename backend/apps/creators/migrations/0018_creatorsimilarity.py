@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-19 14:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0017_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('co_fans', models.PositiveIntegerField()),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='creators.creatorprofile')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='creators.creatorprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['creator', '-score'], name='creator_similarity_rank_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='creatorsimilarity',
+            constraint=models.UniqueConstraint(fields=('creator', 'similar'), name='creator_similarity_unique'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-19 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0018_creatorsimilarity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='creatorpost',
+            index=models.Index(fields=['creator', 'is_published', '-created_at'], name='creator_post_recent_idx'),
+        ),
+    ]
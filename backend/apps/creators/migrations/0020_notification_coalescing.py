@@ -0,0 +1,93 @@
+import datetime
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_read_state(apps, schema_editor):
+    CreatorNotification = apps.get_model("creators", "CreatorNotification")
+    CreatorNotificationState = apps.get_model("creators", "CreatorNotificationState")
+    CreatorNotification.objects.update(updated_at=models.F("created_at"))
+
+    # The read mark sits just before each creator's oldest unread notification
+    # (or at the newest one when everything was read)
+    rows = (
+        CreatorNotification.objects.order_by().values("creator_id")
+        .annotate(
+            latest=models.Max("created_at"),
+            oldest_unread=models.Min("created_at", filter=models.Q(is_read=False)),
+        )
+    )
+    states = []
+    for row in rows:
+        if row["oldest_unread"] is None:
+            read_through = row["latest"]
+        else:
+            read_through = row["oldest_unread"] - datetime.timedelta(microseconds=1)
+        states.append(CreatorNotificationState(
+            creator_id=row["creator_id"], read_through=read_through, unread_count=0,
+        ))
+    CreatorNotificationState.objects.bulk_create(states, batch_size=1000)
+    for state in CreatorNotificationState.objects.all().iterator():
+        state.unread_count = CreatorNotification.objects.filter(
+            creator_id=state.creator_id, created_at__gt=state.read_through,
+        ).count()
+        state.save(update_fields=["unread_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("creators", "0019_creatorpost_recent_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CreatorNotificationState",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("unread_count", models.PositiveIntegerField(default=0)),
+                ("read_through", models.DateTimeField(blank=True, null=True)),
+                ("creator", models.OneToOneField(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name="notification_state",
+                    to="creators.creatorprofile",
+                )),
+            ],
+        ),
+        migrations.AlterModelOptions(
+            name="creatornotification",
+            options={"ordering": ["-updated_at", "-id"]},
+        ),
+        migrations.AddField(
+            model_name="creatornotification",
+            name="amount",
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name="creatornotification",
+            name="count",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="creatornotification",
+            name="updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_read_state, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="creatornotification",
+            name="is_read",
+        ),
+        migrations.AddIndex(
+            model_name="creatornotification",
+            index=models.Index(fields=["creator", "-updated_at", "-id"], name="creator_notification_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creatornotification",
+            index=models.Index(
+                fields=["creator", "notification_type", "-created_at"], name="creator_notification_type_idx"
+            ),
+        ),
+    ]
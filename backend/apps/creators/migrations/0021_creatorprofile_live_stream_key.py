@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-19 16:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0020_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='live_stream_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=32),
+        ),
+    ]
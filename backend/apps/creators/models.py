@@ -1,8 +1,13 @@
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
+from core.models import LoadDeferredTogetherMixin
 
-class CreatorProfile(models.Model):
+
+class CreatorProfile(LoadDeferredTogetherMixin, models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -38,6 +43,18 @@ class CreatorProfile(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # ── Discovery (see search.py) ─────────────────────────────────────
+    # Maintained by signals: the vector on profile save (Postgres only),
+    # the counters on tip_completed / tip_refunded.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    completed_tip_total = models.DecimalField(max_digits=12, decimal_places=2, default=0, editable=False)
+    completed_tip_count = models.PositiveIntegerField(default=0, editable=False)
+    # Exponentially decayed tip count as of trending_at (see rankings.py)
+    trending_score = models.FloatField(default=0, editable=False)
+    trending_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Bound into live stream URLs (tips/live.py); replacing it revokes them
+    live_stream_key = models.CharField(max_length=32, blank=True, default="", editable=False)
+
     # ── Banking details ───────────────────────────────────────────────
     bank_name = models.CharField(max_length=100, blank=True)
     bank_account_holder = models.CharField(max_length=200, blank=True)
@@ -61,11 +78,31 @@ class CreatorProfile(models.Model):
     )
     kyc_decline_reason = models.TextField(blank=True, default="")
 
+    class Meta:
+        indexes = [
+            # Browse / "top creators" ordering for the discovery endpoint
+            models.Index(
+                fields=["is_active", "-completed_tip_total", "-id"],
+                name="creator_discovery_idx",
+            ),
+            models.Index(
+                fields=["category", "is_active", "-completed_tip_total"],
+                name="creator_category_rank_idx",
+            ),
+            models.Index(fields=["is_active", "trending_at"], name="creator_trending_idx"),
+        ]
+        # GIN indexes on search_vector / display_name trigrams are created
+        # in migration 0015 (Postgres only).
+
     def __str__(self):
         return self.display_name
 
     @property
     def total_tips(self):
+        # Prefer the value annotated by the query (see CreatorPageView) over a fresh aggregate
+        annotated = self.__dict__.get("completed_total")
+        if annotated is not None:
+            return annotated
         return self.tips.filter(status="completed").aggregate(
             total=models.Sum("amount")
         )["total"] or 0
@@ -89,6 +126,10 @@ class CreatorPost(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Per-creator newest-first reads: public post list and the fan feed
+            models.Index(fields=["creator", "is_published", "-created_at"], name="creator_post_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.creator.display_name} — {self.title}"
@@ -208,14 +249,34 @@ class Jar(models.Model):
 
     @property
     def total_raised(self):
+        annotated = self.__dict__.get("raised_total")
+        if annotated is not None:
+            return annotated
         return self.jar_tips.filter(status="completed").aggregate(
             total=models.Sum("amount")
         )["total"] or 0
 
     @property
     def tip_count(self):
+        annotated = self.__dict__.get("completed_tip_count")
+        if annotated is not None:
+            return annotated
         return self.jar_tips.filter(status="completed").count()
 
+    @classmethod
+    def with_totals(cls, qs=None):
+        """Annotate ``raised_total`` / ``completed_tip_count`` so the properties skip their queries."""
+        completed = models.Q(jar_tips__status="completed")
+        qs = cls.objects.all() if qs is None else qs
+        return qs.annotate(
+            raised_total=Coalesce(
+                models.Sum("jar_tips__amount", filter=completed),
+                models.Value(0),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            ),
+            completed_tip_count=models.Count("jar_tips", filter=completed),
+        )
+
 
 class CreatorKycDocument(models.Model):
     """KYC identity document uploaded by a creator for verification."""
@@ -261,13 +322,87 @@ class CreatorNotification(models.Model):
 
     creator           = models.ForeignKey(CreatorProfile, on_delete=models.CASCADE, related_name="notifications")
     notification_type = models.CharField(max_length=20, choices=Type.choices)
+    # Title / message of the latest event merged into this row (see notifications.py)
     title             = models.CharField(max_length=200)
     message           = models.TextField()
-    is_read           = models.BooleanField(default=False)
+    count             = models.PositiveIntegerField(default=1)
+    amount            = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
     created_at        = models.DateTimeField(auto_now_add=True)
+    updated_at        = models.DateTimeField(default=timezone.now)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-updated_at", "-id"]
+        indexes = [
+            models.Index(fields=["creator", "-updated_at", "-id"], name="creator_notification_feed_idx"),
+            models.Index(fields=["creator", "notification_type", "-created_at"], name="creator_notification_type_idx"),
+        ]
 
     def __str__(self):
         return f"{self.creator.display_name} — {self.notification_type}"
+
+
+class CreatorNotificationState(models.Model):
+    """
+    Per-creator inbox state: notifications updated after ``read_through`` are
+    unread, and ``unread_count`` is kept in step on every write.
+    """
+
+    creator      = models.OneToOneField(
+        CreatorProfile, on_delete=models.CASCADE, related_name="notification_state"
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+    read_through = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.creator_id}: {self.unread_count} unread"
+
+
+class CreatorPeriodTotal(models.Model):
+    """Completed tips per creator per calendar week / month — feeds the leaderboards."""
+
+    class Period(models.TextChoices):
+        WEEK  = "week",  "Week"
+        MONTH = "month", "Month"
+
+    creator      = models.ForeignKey(CreatorProfile, on_delete=models.CASCADE, related_name="period_totals")
+    period       = models.CharField(max_length=5, choices=Period.choices)
+    period_start = models.DateField()
+    total        = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tip_count    = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["creator", "period", "period_start"], name="creator_period_total_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["period", "period_start", "-total"], name="creator_period_rank_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.creator.display_name} — {self.period} {self.period_start}: R{self.total}"
+
+
+class CreatorSimilarity(models.Model):
+    """
+    "Fans of ``creator`` also support ``similar``" — the top-K neighbours per
+    creator, rebuilt in batch by recommendations.build_similarities().
+    """
+
+    creator = models.ForeignKey(CreatorProfile, on_delete=models.CASCADE, related_name="similarities")
+    similar = models.ForeignKey(CreatorProfile, on_delete=models.CASCADE, related_name="+")
+    # Cosine similarity of the two creators' fan sets
+    score   = models.FloatField()
+    co_fans = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["creator", "similar"], name="creator_similarity_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["creator", "-score"], name="creator_similarity_rank_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.creator_id} ~ {self.similar_id} ({self.score:.3f})"
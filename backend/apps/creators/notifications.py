@@ -0,0 +1,112 @@
+"""
+Creator in-app notifications.
+
+Write path — ``notify()``, O(1) per event:
+
+    lock the creator's CreatorNotificationState row
+    ├─ coalesced type (tip received) and a row of that type was started
+    │  within NOTIFICATIONS_COALESCE_SECONDS?
+    │      └─► UPDATE it: count + 1, amount + x, latest title / message,
+    │          updated_at = now   ("12 new tips totalling R640.00")
+    └─ otherwise INSERT a new row
+    unread_count + 1 unless the row was already unread
+
+Rows therefore grow with distinct bursts, not with tip volume.
+
+Read state is a high-water mark: a row is unread while its ``updated_at``
+is later than ``state.read_through``. "Mark all read" moves the mark and
+zeroes the counter — two column writes, however many rows there are. The
+list is keyset-paginated on ``(-updated_at, -id)``, one index range scan
+per page.
+"""
+
+import datetime
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CreatorNotification, CreatorNotificationState
+
+logger = logging.getLogger(__name__)
+
+COALESCE_SECONDS = getattr(settings, "NOTIFICATIONS_COALESCE_SECONDS", 3600)
+COALESCED_TYPES = {CreatorNotification.Type.TIP_RECEIVED}
+
+
+def _is_unread(notification, read_through) -> bool:
+    return read_through is None or notification.updated_at > read_through
+
+
+def notify(creator_id, notification_type, title: str, message: str, amount=None) -> CreatorNotification:
+    """Record one event, merging it into a recent row of the same type where allowed."""
+    now = timezone.now()
+    with transaction.atomic():
+        state, _ = CreatorNotificationState.objects.select_for_update().get_or_create(creator_id=creator_id)
+        row = None
+        if notification_type in COALESCED_TYPES:
+            row = (
+                CreatorNotification.objects.filter(
+                    creator_id=creator_id, notification_type=notification_type,
+                    created_at__gte=now - datetime.timedelta(seconds=COALESCE_SECONDS),
+                )
+                .order_by("-created_at")
+                .first()
+            )
+        if row is None:
+            row = CreatorNotification.objects.create(
+                creator_id=creator_id, notification_type=notification_type,
+                title=title, message=message, amount=amount, updated_at=now,
+            )
+            was_unread = False
+        else:
+            was_unread = _is_unread(row, state.read_through)
+            row.count += 1
+            if amount is not None:
+                row.amount = (row.amount or Decimal("0")) + amount
+            row.title, row.message, row.updated_at = title, message, now
+            row.save(update_fields=["count", "amount", "title", "message", "updated_at"])
+        if not was_unread:
+            state.unread_count += 1
+            state.save(update_fields=["unread_count"])
+    return row
+
+
+def read_state(creator_id) -> tuple[int, object]:
+    """``(unread_count, read_through)`` for a creator, one indexed lookup."""
+    row = (
+        CreatorNotificationState.objects.filter(creator_id=creator_id)
+        .values_list("unread_count", "read_through")
+        .first()
+    )
+    return row or (0, None)
+
+
+def mark_all_read(creator_id) -> int:
+    """Move the read mark to now; returns how many notifications were unread."""
+    with transaction.atomic():
+        state, _ = CreatorNotificationState.objects.select_for_update().get_or_create(creator_id=creator_id)
+        unread = state.unread_count
+        state.unread_count, state.read_through = 0, timezone.now()
+        state.save(update_fields=["unread_count", "read_through"])
+    return unread
+
+
+def serialize(notification, read_through) -> dict:
+    title, message = notification.title, notification.message
+    if notification.count > 1 and notification.notification_type == CreatorNotification.Type.TIP_RECEIVED:
+        title = f"{notification.count} new tips totalling R{notification.amount or 0:.2f}"
+        message = f"Latest: {notification.message}"
+    return {
+        "id": notification.id,
+        "type": notification.notification_type,
+        "title": title,
+        "message": message,
+        "count": notification.count,
+        "amount": str(notification.amount) if notification.amount is not None else None,
+        "is_read": not _is_unread(notification, read_through),
+        "created_at": notification.created_at,
+        "updated_at": notification.updated_at,
+    }
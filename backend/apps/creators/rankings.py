@@ -0,0 +1,186 @@
+"""
+Creator leaderboards and trending.
+
+Write path (tip_completed / tip_refunded, see signals.py) — O(1) per tip:
+    all-time   CreatorProfile.completed_tip_total       (search.py counters)
+    week/month CreatorPeriodTotal row for the period the tip landed in
+    trending   CreatorProfile.trending_score, an exponentially decayed tip
+               count: score = score · 2^(-Δt / half-life) + 1
+
+Read path: each board is a compact top-N list of dicts cached in
+``rankings_cache``; a hit is one cache lookup. Boards are rebuilt from the
+indexed counters (a LIMIT N range scan, or a small candidate set for
+trending) when the entry expires after RANKINGS_REFRESH_SECONDS, or ahead
+of time by ``manage.py refresh_rankings`` on cron. A tip therefore shows up
+on every board within one refresh interval.
+"""
+import datetime
+import heapq
+import math
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.cache import ReadThroughCache
+
+from .models import CreatorPeriodTotal, CreatorProfile
+
+BOARDS = ("all_time", "month", "week", "trending")
+
+LEADERBOARD_SIZE = getattr(settings, "LEADERBOARD_SIZE", 100)
+TRENDING_HALF_LIFE = datetime.timedelta(hours=getattr(settings, "TRENDING_HALF_LIFE_HOURS", 24))
+# Creators idle for this many half-lives have decayed below 1/1000 of a tip
+TRENDING_WINDOW = TRENDING_HALF_LIFE * 10
+
+rankings_cache = ReadThroughCache(
+    "rankings",
+    ttl=getattr(settings, "RANKINGS_REFRESH_SECONDS", 60),
+    max_entries=256,
+)
+
+CARD_FIELDS = ("id", "slug", "display_name", "category", "user__username", "user__avatar")
+
+
+# ── Periods ───────────────────────────────────────────────────────────────────
+
+def period_starts(when=None) -> dict:
+    """``{"week": monday, "month": first-of-month}`` for ``when`` (default: now)."""
+    day = timezone.localdate(when) if when else timezone.localdate()
+    return {
+        CreatorPeriodTotal.Period.WEEK: day - datetime.timedelta(days=day.weekday()),
+        CreatorPeriodTotal.Period.MONTH: day.replace(day=1),
+    }
+
+
+# ── Write path ────────────────────────────────────────────────────────────────
+
+def _bump_period_totals(tip, sign: int) -> None:
+    amount = tip.amount * sign
+    for period, start in period_starts(tip.created_at).items():
+        rows = CreatorPeriodTotal.objects.filter(creator_id=tip.creator_id, period=period, period_start=start)
+        if sign < 0:
+            rows.filter(tip_count__gt=0).update(total=F("total") + amount, tip_count=F("tip_count") - 1)
+            continue
+        if rows.update(total=F("total") + amount, tip_count=F("tip_count") + 1):
+            continue
+        try:
+            with transaction.atomic():
+                CreatorPeriodTotal.objects.create(
+                    creator_id=tip.creator_id, period=period, period_start=start,
+                    total=tip.amount, tip_count=1,
+                )
+        except IntegrityError:
+            # Another worker created the row first
+            rows.update(total=F("total") + amount, tip_count=F("tip_count") + 1)
+
+
+def decayed(score: float, since, now) -> float:
+    if not score or since is None:
+        return 0.0
+    elapsed = (now - since) / TRENDING_HALF_LIFE
+    return score * math.pow(0.5, max(elapsed, 0.0))
+
+
+def record_completed_tip(tip) -> None:
+    _bump_period_totals(tip, 1)
+    now = timezone.now()
+    with transaction.atomic():
+        row = (
+            CreatorProfile.objects.select_for_update()
+            .filter(pk=tip.creator_id)
+            .values("trending_score", "trending_at")
+            .first()
+        )
+        if row is None:
+            return
+        CreatorProfile.objects.filter(pk=tip.creator_id).update(
+            trending_score=decayed(row["trending_score"], row["trending_at"], now) + 1.0,
+            trending_at=now,
+        )
+
+
+def record_refunded_tip(tip) -> None:
+    # Trending is left alone — a refunded tip's weight decays away on its own
+    _bump_period_totals(tip, -1)
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def creator_card(row: dict, rank: int, **extra) -> dict:
+    avatar = row["user__avatar"]
+    return {
+        "rank": rank,
+        "creator_id": row["id"],
+        "slug": row["slug"],
+        "display_name": row["display_name"],
+        "username": row["user__username"],
+        "avatar": default_storage.url(avatar) if avatar else None,
+        "category": row["category"],
+        **extra,
+    }
+
+
+def build_leaderboard(board: str, category: str = "") -> list:
+    """Rebuild one board from the counters (bypasses the cache)."""
+    creators = CreatorProfile.objects.filter(is_active=True)
+    if category:
+        creators = creators.filter(category=category)
+
+    if board == "all_time":
+        rows = creators.order_by("-completed_tip_total", "-id").values(
+            *CARD_FIELDS, "completed_tip_total", "completed_tip_count"
+        )[:LEADERBOARD_SIZE]
+        return [
+            creator_card(row, i, total=str(row["completed_tip_total"]), tip_count=row["completed_tip_count"])
+            for i, row in enumerate(rows, 1)
+            if row["completed_tip_count"]
+        ]
+
+    if board in (CreatorPeriodTotal.Period.WEEK, CreatorPeriodTotal.Period.MONTH):
+        totals = CreatorPeriodTotal.objects.filter(
+            period=board, period_start=period_starts()[board], tip_count__gt=0,
+            creator__in=creators,
+        )
+        rows = totals.order_by("-total", "-creator_id").values(
+            *(f"creator__{f}" for f in CARD_FIELDS), "total", "tip_count"
+        )[:LEADERBOARD_SIZE]
+        return [
+            creator_card(
+                {f: row[f"creator__{f}"] for f in CARD_FIELDS}, i,
+                total=str(row["total"]), tip_count=row["tip_count"],
+            )
+            for i, row in enumerate(rows, 1)
+        ]
+
+    if board == "trending":
+        now = timezone.now()
+        candidates = creators.filter(trending_at__gte=now - TRENDING_WINDOW).values(
+            *CARD_FIELDS, "trending_score", "trending_at"
+        )
+        scored = (
+            (decayed(row["trending_score"], row["trending_at"], now), row["id"], row)
+            for row in candidates.iterator()
+        )
+        top = heapq.nlargest(LEADERBOARD_SIZE, scored, key=lambda item: item[:2])
+        return [creator_card(row, i, score=round(score, 4)) for i, (score, _, row) in enumerate(top, 1)]
+
+    raise ValueError(f"unknown leaderboard {board!r}")
+
+
+def _key(board: str, category: str) -> str:
+    # Period boards roll over at midnight / month start without a write
+    return ":".join(["leaderboard", board, category, str(period_starts().get(board, ""))])
+
+
+def leaderboard(board: str, category: str = "") -> list:
+    """Cached top-N for ``board`` (optionally within one category)."""
+    return rankings_cache.get_or_compute(_key(board, category), lambda: build_leaderboard(board, category))
+
+
+def refresh_leaderboard(board: str, category: str = "") -> list:
+    data = build_leaderboard(board, category)
+    rankings_cache.set(_key(board, category), data)
+    return data
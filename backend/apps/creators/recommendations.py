@@ -0,0 +1,263 @@
+"""
+Co-tipping recommendations — "fans of X also support Y".
+
+Batch (``manage.py build_recommendations``, nightly):
+
+    completed tips + activated pledges
+        ──chunks of CHUNK_SIZE──► distinct (fan, creator) pairs
+        ──► X: sparse binary fans × creators matrix (CSC)
+        ──► for each block of creator columns B:
+                C = X[:, B]ᵀ · X               co-fan counts, |B| × creators
+                drop pairs with < MIN_CO_FANS, cosine-normalise
+                keep the TOP_K neighbours of every creator in B
+        ──► CreatorSimilarity rows
+
+Memory stays bounded: tips are read in id-keyset chunks and reduced to
+distinct pairs straight away, the pair buffer is re-deduplicated whenever it
+outgrows PAIR_BUFFER, fans who touched more than MAX_CREATORS_PER_FAN
+creators are dropped (they add noise and blow up the product), and the
+product is only ever materialised for BLOCK_CELLS worth of creator pairs.
+
+Read path: ``similar_creators()`` (public creator page) is one indexed range
+scan; ``recommended_for()`` sums the neighbours of the creators a fan already
+supports. Both are cached in ``recommendations_cache``, keyed by the build
+id so a new batch is picked up immediately. numpy and scipy are imported
+inside the batch functions only, so web workers never load them.
+"""
+
+import hashlib
+import logging
+import uuid
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from core.cache import ReadThroughCache
+
+from .feed import supported_creator_ids
+from .models import CreatorProfile, CreatorSimilarity
+from .rankings import CARD_FIELDS, creator_card, leaderboard
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOP_K = getattr(settings, "RECOMMENDATIONS_TOP_K", 20)
+MIN_CO_FANS = getattr(settings, "RECOMMENDATIONS_MIN_CO_FANS", 2)
+CHUNK_SIZE = 100_000
+PAIR_BUFFER = 5_000_000
+MAX_CREATORS_PER_FAN = 500
+BLOCK_CELLS = 20_000_000
+
+BUILD_KEY = "recommendations:build"
+
+recommendations_cache = ReadThroughCache(
+    "recommendations",
+    ttl=getattr(settings, "RECOMMENDATIONS_CACHE_SECONDS", 3600),
+    local_ttl=300,
+    max_entries=4096,
+)
+
+# ── Interactions ──────────────────────────────────────────────────────────────
+
+def fan_id(user_id, email) -> int | None:
+    """Stable int64 per fan: the user id, or a hash of a guest's email (high bit set)."""
+    if user_id:
+        return int(user_id)
+    if email:
+        digest = hashlib.blake2b(email.strip().lower().encode(), digest_size=8).digest()
+        return (int.from_bytes(digest, "big") & ((1 << 62) - 1)) | (1 << 62)
+    return None
+
+
+def _distinct_pairs(pairs: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    return np.unique(pairs, axis=0) if len(pairs) else pairs
+
+
+def _chunks(queryset, chunk_size):
+    """Yield ``(fan, creator)`` int64 arrays from ``(id, user_id, email, creator_id)`` rows."""
+    import numpy as np
+
+    last = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last).order_by("id")[:chunk_size])
+        if not rows:
+            return
+        last = rows[-1][0]
+        pairs = [(fan_id(user_id, email), creator_id) for _, user_id, email, creator_id in rows]
+        pairs = [p for p in pairs if p[0] is not None]
+        if pairs:
+            yield _distinct_pairs(np.asarray(pairs, dtype=np.int64))
+
+
+def interaction_pairs(chunk_size: int = CHUNK_SIZE) -> "np.ndarray":
+    """Distinct ``(fan, creator)`` pairs from completed tips and pledges that were ever paid."""
+    import numpy as np
+
+    from apps.tips.models import Pledge, Tip
+
+    sources = (
+        Tip.objects.filter(status=Tip.Status.COMPLETED)
+        .values_list("id", "tipper_id", "tipper_email", "creator_id"),
+        Pledge.objects.filter(first_active_at__isnull=False)
+        .values_list("id", "fan_id", "fan_email", "creator_id"),
+    )
+    buffer, buffered = [], 0
+    for queryset in sources:
+        for pairs in _chunks(queryset, chunk_size):
+            buffer.append(pairs)
+            buffered += len(pairs)
+            if buffered > PAIR_BUFFER:
+                buffer = [_distinct_pairs(np.concatenate(buffer))]
+                buffered = len(buffer[0])
+    return _distinct_pairs(np.concatenate(buffer)) if buffer else np.empty((0, 2), dtype=np.int64)
+
+
+def interaction_matrix(pairs: "np.ndarray"):
+    """
+    ``(X, creator_ids, fan_counts)``: the binary fans × creators CSC matrix,
+    the creator id of each column and each creator's total number of fans.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    fans, fan_idx = np.unique(pairs[:, 0], return_inverse=True)
+    creator_ids, creator_idx = np.unique(pairs[:, 1], return_inverse=True)
+    X = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.float32), (fan_idx.ravel(), creator_idx.ravel())),
+        shape=(len(fans), len(creator_ids)),
+    )
+    # Counted before pruning, so cosine still penalises creators with many one-off fans
+    fan_counts = np.bincount(creator_idx.ravel(), minlength=len(creator_ids)).astype(np.float64)
+    # Fans of a single creator co-occur with nobody; very broad fans are noise
+    per_fan = np.diff(X.indptr)
+    X = X[(per_fan > 1) & (per_fan <= MAX_CREATORS_PER_FAN)]
+    return X.tocsc(), creator_ids, fan_counts
+
+
+# ── Similarities ──────────────────────────────────────────────────────────────
+
+def top_neighbours(X, creator_ids, fan_counts, top_k: int = TOP_K, min_co_fans: int = MIN_CO_FANS):
+    """Yield ``(creator_id, [(similar_id, score, co_fans), ...])`` for every creator with neighbours."""
+    import numpy as np
+
+    n = X.shape[1]
+    block = max(1, BLOCK_CELLS // max(n, 1))
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        co = (X[:, start:stop].T @ X).tocsr()
+        rows = np.repeat(np.arange(stop - start), np.diff(co.indptr))
+        # Drop each creator's pairing with itself and pairs with too few shared fans
+        co.data[(co.data < min_co_fans) | (co.indices == start + rows)] = 0
+        co.eliminate_zeros()
+
+        rows = np.repeat(np.arange(stop - start), np.diff(co.indptr))
+        scores = co.data / np.sqrt(fan_counts[start + rows] * fan_counts[co.indices])
+        for r in range(stop - start):
+            lo, hi = co.indptr[r], co.indptr[r + 1]
+            if lo == hi:
+                continue
+            row_scores = scores[lo:hi]
+            best = np.argpartition(-row_scores, top_k)[:top_k] if hi - lo > top_k else np.arange(hi - lo)
+            best = best[np.argsort(-row_scores[best], kind="stable")]
+            yield int(creator_ids[start + r]), [
+                (int(creator_ids[co.indices[lo + i]]), float(row_scores[i]), int(co.data[lo + i]))
+                for i in best
+            ]
+
+
+def build_similarities(chunk_size: int = CHUNK_SIZE) -> dict:
+    """Rebuild every creator's neighbour list; returns counts for logging."""
+    pairs = interaction_pairs(chunk_size)
+    X, creator_ids, fan_counts = interaction_matrix(pairs)
+
+    written, rows = set(), []
+
+    def flush():
+        with transaction.atomic():
+            CreatorSimilarity.objects.filter(creator_id__in={r.creator_id for r in rows}).delete()
+            CreatorSimilarity.objects.bulk_create(rows, batch_size=1000)
+        rows.clear()
+
+    for creator_id, neighbours in top_neighbours(X, creator_ids, fan_counts):
+        written.add(creator_id)
+        rows.extend(
+            CreatorSimilarity(creator_id=creator_id, similar_id=sid, score=score, co_fans=co)
+            for sid, score, co in neighbours
+        )
+        if len(rows) >= 5000:
+            flush()
+    if rows:
+        flush()
+    # Creators that lost all their neighbours
+    stale = list(set(CreatorSimilarity.objects.values_list("creator_id", flat=True).distinct()) - written)
+    for i in range(0, len(stale), 500):
+        CreatorSimilarity.objects.filter(creator_id__in=stale[i:i + 500]).delete()
+
+    cache.set(BUILD_KEY, uuid.uuid4().hex, None)
+    logger.info("recommendations: %d pairs, %d fans, %d creators with neighbours",
+                len(pairs), X.shape[0], len(written))
+    return {"pairs": len(pairs), "fans": X.shape[0], "creators": len(written)}
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def _build_id() -> str:
+    return cache.get(BUILD_KEY) or "initial"
+
+
+def _cards(ids_scores: list) -> list:
+    """Cards for active creators, in the given ``[(creator_id, score), ...]`` order."""
+    profiles = {
+        row["id"]: row
+        for row in CreatorProfile.objects.filter(id__in=[cid for cid, _ in ids_scores], is_active=True)
+        .values(*CARD_FIELDS)
+    }
+    cards = []
+    for creator_id, score in ids_scores:
+        if creator_id in profiles:
+            cards.append(creator_card(profiles[creator_id], len(cards) + 1, score=round(score, 4)))
+    return cards
+
+
+def similar_creators(creator_id: int, limit: int = TOP_K) -> list:
+    def compute():
+        rows = (
+            CreatorSimilarity.objects.filter(creator_id=creator_id)
+            .order_by("-score")
+            .values_list("similar_id", "score")[:TOP_K]
+        )
+        return _cards(list(rows))
+
+    return recommendations_cache.get_or_compute(f"similar:{_build_id()}:{creator_id}", compute)[:limit]
+
+
+def recommended_for(user, limit: int = TOP_K) -> list:
+    """Creators similar to the ones ``user`` supports; trending creators when there is no history yet."""
+
+    def compute():
+        supported = supported_creator_ids(user)
+        if supported:
+            rows = (
+                CreatorSimilarity.objects.filter(creator_id__in=supported)
+                .exclude(similar_id__in=supported)
+                .values("similar_id")
+                .annotate(total=Sum("score"), via=Count("creator_id"))
+                .order_by("-total", "-via", "similar_id")
+                .values_list("similar_id", "total")[:TOP_K]
+            )
+            cards = _cards(list(rows))
+            if cards:
+                return cards
+        return [
+            {**card, "rank": i}
+            for i, card in enumerate((c for c in leaderboard("trending") if c["creator_id"] not in supported), 1)
+        ][:TOP_K]
+
+    return recommendations_cache.get_or_compute(f"fan:{_build_id()}:{user.pk}", compute)[:limit]
@@ -5,6 +5,8 @@ from django.utils.text import slugify
 from rest_framework import serializers
 
 from apps.tips.models import Tip
+from core import images
+from core.images import SrcsetField
 
 from .models import (
     CommissionRequest,
@@ -18,6 +20,18 @@ from .models import (
 )
 
 
+def creator_month_total(creator_id) -> float:
+    """Completed tip total for the creator in the current calendar month."""
+    today = datetime.date.today()
+    total = Tip.objects.filter(
+        creator_id=creator_id,
+        status=Tip.Status.COMPLETED,
+        created_at__year=today.year,
+        created_at__month=today.month,
+    ).aggregate(t=Sum("amount"))["t"] or 0
+    return float(total)
+
+
 class CreatorPostPublicSerializer(serializers.ModelSerializer):
     """Metadata only — safe for the public tip page."""
 
@@ -30,6 +44,7 @@ class CreatorPostSerializer(serializers.ModelSerializer):
     """Full content — returned only to verified tippers."""
 
     media_url = serializers.SerializerMethodField()
+    media_srcset = serializers.SerializerMethodField()
 
     def get_media_url(self, obj):
         request = self.context.get("request")
@@ -37,9 +52,14 @@ class CreatorPostSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.media_file.url)
         return None
 
+    def get_media_srcset(self, obj):
+        if obj.post_type != CreatorPost.PostType.IMAGE or not obj.media_file:
+            return None
+        return images.srcset(obj.media_file.name, self.context.get("request"))
+
     class Meta:
         model  = CreatorPost
-        fields = ["id", "title", "body", "post_type", "video_url", "media_url",
+        fields = ["id", "title", "body", "post_type", "video_url", "media_url", "media_srcset",
                   "is_published", "created_at"]
 
 
@@ -65,10 +85,34 @@ class KycDocumentSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "status", "decline_reason", "uploaded_at", "reviewed_at", "file_url", "doc_type_display")
 
 
+class CreatorSearchResultSerializer(serializers.ModelSerializer):
+    """Public card for discovery results — no banking / KYC fields."""
+
+    username = serializers.CharField(source="user.username", read_only=True)
+    avatar = serializers.ImageField(source="user.avatar", read_only=True)
+    avatar_srcset = SrcsetField(source="user.avatar")
+    cover_image_srcset = SrcsetField(source="cover_image")
+    total_tips = serializers.DecimalField(
+        source="completed_tip_total", max_digits=12, decimal_places=2, read_only=True
+    )
+    tip_count = serializers.IntegerField(source="completed_tip_count", read_only=True)
+
+    class Meta:
+        model = CreatorProfile
+        fields = (
+            "id", "username", "avatar", "avatar_srcset", "display_name", "slug", "tagline",
+            "cover_image", "cover_image_srcset", "category", "platforms", "audience_size", "age_group", "audience_gender",
+            "total_tips", "tip_count",
+        )
+        read_only_fields = fields
+
+
 class CreatorProfileSerializer(serializers.ModelSerializer):
     total_tips = serializers.ReadOnlyField()
     username = serializers.CharField(source="user.username", read_only=True)
     avatar = serializers.ImageField(source="user.avatar", read_only=True)
+    avatar_srcset = SrcsetField(source="user.avatar")
+    cover_image_srcset = SrcsetField(source="cover_image")
     has_bank_connected = serializers.SerializerMethodField()
     bank_account_number_masked = serializers.SerializerMethodField()
     kyc_documents = KycDocumentSerializer(many=True, read_only=True)
@@ -76,8 +120,8 @@ class CreatorProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = CreatorProfile
         fields = (
-            "id", "username", "avatar", "display_name", "slug",
-            "tagline", "cover_image", "tip_goal", "total_tips",
+            "id", "username", "avatar", "avatar_srcset", "display_name", "slug",
+            "tagline", "cover_image", "cover_image_srcset", "tip_goal", "total_tips",
             "thank_you_message",
             "category", "platforms", "audience_size", "age_group", "audience_gender",
             "is_active", "created_at",
@@ -192,14 +236,12 @@ class MilestoneGoalSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "current_month_total", "progress_pct", "is_achieved", "achieved_at", "created_at")
 
     def get_current_month_total(self, obj):
-        today = datetime.date.today()
-        total = Tip.objects.filter(
-            creator=obj.creator,
-            status=Tip.Status.COMPLETED,
-            created_at__year=today.year,
-            created_at__month=today.month,
-        ).aggregate(t=Sum("amount"))["t"] or 0
-        return float(total)
+        # One aggregate per creator per serialization, shared by every milestone
+        # and by get_progress_pct. Callers may pre-seed context["month_totals"].
+        month_totals = self.context.setdefault("month_totals", {})
+        if obj.creator_id not in month_totals:
+            month_totals[obj.creator_id] = creator_month_total(obj.creator_id)
+        return month_totals[obj.creator_id]
 
     def get_progress_pct(self, obj):
         total = self.get_current_month_total(obj)
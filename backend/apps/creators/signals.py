@@ -6,12 +6,28 @@ first-jar notification/email on first jar creation.
 
 Tip-related events (first tip, R1 000 milestone) are fired from
 payments/views.py after charge.success webhook processing.
+
+Also invalidates the public-read cache (see cache.py) whenever something
+shown on a creator's public page changes, and keeps the discovery search
+vector and tip counters (see search.py), the leaderboard counters
+(see rankings.py) and the fan feed's per-creator post lists (see feed.py)
+current, schedules supporter emails for new posts and reached milestones
+(see support/fanout.py), and resizes uploaded avatars, covers and image
+posts (see core/images.py).
 """
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.tips.signals import tip_completed, tip_refunded
+from core import images
+
+from .cache import bump_creator_version
+from .feed import invalidate_creator_posts
+from .search import update_search_vector
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,10 +38,11 @@ def on_creator_profile_created(sender, instance, created, **kwargs):
     from apps.support.emails import send_creator_welcome
 
     from .models import CreatorNotification
+    from .notifications import notify
 
-    CreatorNotification.objects.create(
-        creator=instance,
-        notification_type=CreatorNotification.Type.WELCOME,
+    notify(
+        instance.pk,
+        CreatorNotification.Type.WELCOME,
         title="Welcome to TippingJar! 🎉",
         message=(
             "Your creator page is live. Share it with your fans to start receiving tips. "
@@ -47,10 +64,11 @@ def on_jar_created(sender, instance, created, **kwargs):
     from apps.support.emails import send_first_jar_email
 
     from .models import CreatorNotification
+    from .notifications import notify
 
-    CreatorNotification.objects.create(
-        creator=creator,
-        notification_type=CreatorNotification.Type.FIRST_JAR,
+    notify(
+        creator.pk,
+        CreatorNotification.Type.FIRST_JAR,
         title=f"First jar '{instance.name}' created! 🫙",
         message=(
             f"Your '{instance.name}' jar is live. Share your page so fans can "
@@ -58,3 +76,144 @@ def on_jar_created(sender, instance, created, **kwargs):
         ),
     )
     send_first_jar_email(creator, instance)
+
+
+# ── Public-read cache invalidation ────────────────────────────────────────────
+
+@receiver(post_save, sender="creators.CreatorProfile")
+@receiver(post_delete, sender="creators.CreatorProfile")
+def invalidate_on_profile_write(sender, instance, **kwargs):
+    bump_creator_version(instance.pk)
+
+
+@receiver(post_save, sender="creators.Jar")
+@receiver(post_delete, sender="creators.Jar")
+@receiver(post_save, sender="creators.SupportTier")
+@receiver(post_delete, sender="creators.SupportTier")
+@receiver(post_save, sender="creators.MilestoneGoal")
+@receiver(post_delete, sender="creators.MilestoneGoal")
+@receiver(post_save, sender="creators.CreatorPost")
+@receiver(post_delete, sender="creators.CreatorPost")
+@receiver(post_save, sender="creators.CreatorKycDocument")
+@receiver(post_delete, sender="creators.CreatorKycDocument")
+def invalidate_on_page_content_write(sender, instance, **kwargs):
+    bump_creator_version(instance.creator_id)
+
+
+@receiver(post_save, sender="creators.CreatorPost")
+@receiver(post_delete, sender="creators.CreatorPost")
+def invalidate_feed_posts(sender, instance, **kwargs):
+    invalidate_creator_posts(instance.creator_id)
+
+
+@receiver(post_save, sender="creators.CreatorProfile")
+def invalidate_feed_on_profile_write(sender, instance, created=False, **kwargs):
+    # Feed items carry the creator's display name
+    if not created:
+        invalidate_creator_posts(instance.pk)
+
+
+# ── Supporter fan-out ─────────────────────────────────────────────────────────
+
+@receiver(post_save, sender="creators.CreatorPost")
+def fan_out_published_post(sender, instance, update_fields=None, **kwargs):
+    if not instance.is_published or (update_fields and "is_published" not in update_fields):
+        return
+    from apps.support.fanout import schedule
+    from apps.support.models import FanoutJob
+
+    # One job per post, so edits and re-publishing never email twice
+    schedule(instance.creator_id, FanoutJob.Kind.NEW_POST, instance.pk)
+
+
+@receiver(post_save, sender="creators.MilestoneGoal")
+def fan_out_achieved_milestone(sender, instance, update_fields=None, **kwargs):
+    if not instance.is_achieved or (update_fields and "is_achieved" not in update_fields):
+        return
+    from apps.support.fanout import schedule
+    from apps.support.models import FanoutJob
+
+    schedule(instance.creator_id, FanoutJob.Kind.MILESTONE, instance.pk)
+
+
+@receiver(post_save, sender="users.User")
+def invalidate_on_user_write(sender, instance, update_fields=None, **kwargs):
+    # username / avatar are rendered on the public profile; logins only touch last_login
+    if update_fields and set(update_fields) <= {"last_login", "password"}:
+        return
+    from .models import CreatorProfile
+
+    creator_id = CreatorProfile.objects.filter(user_id=instance.pk).values_list("id", flat=True).first()
+    bump_creator_version(creator_id)
+
+
+@receiver(tip_completed)
+@receiver(tip_refunded)
+def invalidate_on_tip_change(sender, tip, **kwargs):
+    bump_creator_version(tip.creator_id)
+
+
+# ── Discovery search ──────────────────────────────────────────────────────────
+
+_SEARCHABLE_FIELDS = {"display_name", "tagline", "category", "platforms"}
+
+
+@receiver(post_save, sender="creators.CreatorProfile")
+def refresh_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not _SEARCHABLE_FIELDS & set(update_fields):
+        return
+    update_search_vector(instance.pk)
+
+
+@receiver(tip_completed)
+def count_completed_tip(sender, tip, **kwargs):
+    from .models import CreatorProfile
+
+    CreatorProfile.objects.filter(pk=tip.creator_id).update(
+        completed_tip_total=F("completed_tip_total") + tip.amount,
+        completed_tip_count=F("completed_tip_count") + 1,
+    )
+
+
+@receiver(tip_refunded)
+def uncount_refunded_tip(sender, tip, **kwargs):
+    from .models import CreatorProfile
+
+    CreatorProfile.objects.filter(pk=tip.creator_id, completed_tip_count__gt=0).update(
+        completed_tip_total=F("completed_tip_total") - tip.amount,
+        completed_tip_count=F("completed_tip_count") - 1,
+    )
+
+
+# ── Leaderboards / trending ───────────────────────────────────────────────────
+
+@receiver(tip_completed)
+def rank_completed_tip(sender, tip, **kwargs):
+    from .rankings import record_completed_tip
+
+    record_completed_tip(tip)
+
+
+@receiver(tip_refunded)
+def rank_refunded_tip(sender, tip, **kwargs):
+    from .rankings import record_refunded_tip
+
+    record_refunded_tip(tip)
+
+
+# ── Image variants (core/images.py) ───────────────────────────────────────────
+
+@receiver(post_save, sender="users.User")
+def generate_avatar_variants(sender, instance, update_fields=None, **kwargs):
+    images.schedule(instance, "avatar", update_fields)
+
+
+@receiver(post_save, sender="creators.CreatorProfile")
+def generate_cover_variants(sender, instance, update_fields=None, **kwargs):
+    images.schedule(instance, "cover_image", update_fields)
+
+
+@receiver(post_save, sender="creators.CreatorPost")
+def generate_post_media_variants(sender, instance, update_fields=None, **kwargs):
+    if instance.post_type == instance.PostType.IMAGE:
+        images.schedule(instance, "media_file", update_fields)
@@ -1,4 +1,6 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
@@ -29,3 +31,399 @@ class CreatorTests(TestCase):
     def test_unknown_creator_404(self):
         res = self.client.get(reverse("creator-detail", kwargs={"slug": "nobody"}))
         self.assertEqual(res.status_code, 404)
+
+
+class CreatorPageTests(TestCase):
+    def setUp(self):
+        from apps.creators.models import Jar, MilestoneGoal, SupportTier
+        from apps.tips.models import Tip
+
+        self.client = APIClient()
+        user = User.objects.create_user(
+            username="paged", email="paged@example.com", password="pass1234", role="creator"
+        )
+        self.profile = CreatorProfile.objects.create(user=user, display_name="Paged", slug="paged")
+        for i in range(3):
+            jar = Jar.objects.create(creator=self.profile, name=f"Jar {i}", slug=f"jar-{i}", goal=100)
+            Tip.objects.create(creator=self.profile, jar=jar, amount=10, status=Tip.Status.COMPLETED)
+            SupportTier.objects.create(creator=self.profile, name=f"Tier {i}", price=20 + i)
+            MilestoneGoal.objects.create(creator=self.profile, title=f"M {i}", target_amount=60)
+
+    def test_page_bundles_sections_in_bounded_queries(self):
+        url = reverse("creator-page", kwargs={"slug": "paged"})
+        # slug → id resolution + the seven page queries
+        with self.assertNumQueries(8):
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(float(res.data["creator"]["total_tips"]), 30.0)
+        self.assertEqual(len(res.data["jars"]), 3)
+        self.assertEqual(res.data["jars"][0]["tip_count"], 1)
+        self.assertEqual(len(res.data["tiers"]), 3)
+        self.assertEqual(res.data["milestones"][0]["current_month_total"], 30.0)
+        self.assertEqual(res.data["milestones"][0]["progress_pct"], 50.0)
+        self.assertEqual(len(res.data["recent_tips"]), 3)
+
+    def test_page_etag_revalidates(self):
+        url = reverse("creator-page", kwargs={"slug": "paged"})
+        res = self.client.get(url)
+        etag = res["ETag"]
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+
+    def test_page_unknown_slug_404(self):
+        res = self.client.get(reverse("creator-page", kwargs={"slug": "nobody"}))
+        self.assertEqual(res.status_code, 404)
+
+
+class PublicReadCacheTests(TestCase):
+    def setUp(self):
+        from apps.creators import cache
+        from apps.creators.models import SupportTier
+
+        # Tests run on locmem; behave as with the shared cache production uses
+        shared = mock.patch.object(cache, "SHARED", True)
+        shared.start()
+        self.addCleanup(shared.stop)
+        self.client = APIClient()
+        user = User.objects.create_user(
+            username="cached", email="cached@example.com", password="pass1234", role="creator"
+        )
+        self.profile = CreatorProfile.objects.create(user=user, display_name="Cached", slug="cached")
+        self.tier = SupportTier.objects.create(creator=self.profile, name="Bronze", price=20)
+
+    def test_repeat_reads_are_served_from_cache(self):
+        url = reverse("creator-tiers", kwargs={"slug": "cached"})
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            res = self.client.get(url)
+        self.assertEqual(res.data["results"][0]["name"], "Bronze")
+
+    def test_per_process_cache_is_bypassed(self):
+        from django.core import checks
+
+        from apps.creators import cache
+
+        url = reverse("creator-tiers", kwargs={"slug": "cached"})
+        with mock.patch.object(cache, "SHARED", False):
+            self.client.get(url)
+            # Another worker's write would never reach this one's cache: read the database every time
+            SupportTier = type(self.tier)
+            SupportTier.objects.filter(pk=self.tier.pk).update(name="Silver")
+            res = self.client.get(url)
+            self.assertEqual(res.data["results"][0]["name"], "Silver")
+            self.assertNotIn("ETag", res)
+            ids = [m.id for m in checks.run_checks(tags=[checks.Tags.caches], include_deployment_checks=True)]
+        self.assertIn("creators.W001", ids)
+
+    def test_write_invalidates_cached_read(self):
+        url = reverse("creator-tiers", kwargs={"slug": "cached"})
+        self.client.get(url)
+        self.tier.name = "Silver"
+        self.tier.save()
+        res = self.client.get(url)
+        self.assertEqual(res.data["results"][0]["name"], "Silver")
+
+    def test_tip_completion_invalidates_profile(self):
+        from apps.tips.models import Tip
+        from apps.tips.signals import tip_completed
+
+        url = reverse("creator-detail", kwargs={"slug": "cached"})
+        self.assertEqual(float(self.client.get(url).data["total_tips"]), 0)
+        tip = Tip.objects.create(creator=self.profile, amount=25, status=Tip.Status.COMPLETED)
+        tip_completed.send(sender=Tip, tip=tip)
+        self.assertEqual(float(self.client.get(url).data["total_tips"]), 25)
+
+    def test_refund_webhook_only_reverses_completed_tips(self):
+        import json
+        from unittest import mock
+
+        from apps.tips.models import Tip
+        from apps.tips.signals import tip_completed
+
+        def refund(reference):
+            with mock.patch("apps.payments.views.ps.verify_webhook_signature", return_value=True):
+                body = json.dumps({"event": "refund.processed", "data": {"reference": reference}})
+                self.client.post(reverse("paystack-webhook"), body, content_type="application/json")
+
+        url = reverse("creator-detail", kwargs={"slug": "cached"})
+        tip = Tip.objects.create(creator=self.profile, amount=25, status=Tip.Status.COMPLETED, paystack_reference="R1")
+        tip_completed.send(sender=Tip, tip=tip)
+        pending = Tip.objects.create(creator=self.profile, amount=40, paystack_reference="R2")
+
+        refund("R2")
+        pending.refresh_from_db()
+        self.assertEqual(pending.status, Tip.Status.PENDING)
+        self.assertEqual(float(self.client.get(url).data["total_tips"]), 25)
+
+        refund("R1")
+        refund("R1")  # Paystack retries webhooks
+        tip.refresh_from_db()
+        self.assertEqual(tip.status, Tip.Status.REFUNDED)
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.completed_tip_count, self.profile.completed_tip_total), (0, 0))
+
+    @override_settings(STRIPE_SECRET_KEY="sk_test")
+    def test_stripe_webhook_counts_a_tip_once(self):
+        from apps.tips.models import Tip
+
+        event = {"type": "payment_intent.succeeded", "data": {"object": {"id": "pi_1"}}}
+        tip = Tip.objects.create(creator=self.profile, amount=25, stripe_payment_intent_id="pi_1")
+        refunded = Tip.objects.create(
+            creator=self.profile, amount=40, stripe_payment_intent_id="pi_1", status=Tip.Status.REFUNDED
+        )
+        with mock.patch("stripe.Webhook.construct_event", return_value=event):
+            for _ in range(2):  # Stripe retries webhooks
+                self.client.post(reverse("stripe-webhook"), "{}", content_type="application/json")
+
+        tip.refresh_from_db()
+        refunded.refresh_from_db()
+        self.assertEqual((tip.status, refunded.status), (Tip.Status.COMPLETED, Tip.Status.REFUNDED))
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.completed_tip_count, self.profile.completed_tip_total), (1, 25))
+
+    def test_revalidation_returns_304_until_write(self):
+        url = reverse("creator-tiers", kwargs={"slug": "cached"})
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+
+        self.tier.name = "Gold"
+        self.tier.save()
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+
+
+class CreatorSearchTests(TestCase):
+    def setUp(self):
+        from apps.tips.models import Tip
+        from apps.tips.signals import tip_completed
+
+        self.client = APIClient()
+        for i, (name, category) in enumerate([
+            ("Thandi Beats", "music"), ("Thabo Cooks", "food"), ("Beatrix Art", "art"),
+        ]):
+            user = User.objects.create_user(
+                username=f"search{i}", email=f"search{i}@example.com", password="pass1234", role="creator"
+            )
+            CreatorProfile.objects.create(
+                user=user, display_name=name, slug=f"search-{i}", category=category, platforms="youtube,tiktok"
+            )
+        thabo = CreatorProfile.objects.get(slug="search-1")
+        tip = Tip.objects.create(creator=thabo, amount=500, status=Tip.Status.COMPLETED)
+        tip_completed.send(sender=Tip, tip=tip)
+
+    def test_query_and_filters(self):
+        res = self.client.get(reverse("creator-search"), {"q": "beat"})
+        self.assertEqual([r["slug"] for r in res.data["results"]], ["search-2", "search-0"])
+
+        res = self.client.get(reverse("creator-search"), {"q": "beat", "category": "Music"})
+        self.assertEqual([r["slug"] for r in res.data["results"]], ["search-0"])
+
+    def test_browse_orders_by_earnings_with_cursor(self):
+        res = self.client.get(reverse("creator-search"), {"page_size": 2})
+        self.assertEqual(res.data["results"][0]["slug"], "search-1")
+        self.assertEqual(float(res.data["results"][0]["total_tips"]), 500)
+        self.assertIsNotNone(res.data["next"])
+        first = {r["slug"] for r in res.data["results"]}
+        second = {r["slug"] for r in self.client.get(res.data["next"]).data["results"]}
+        self.assertFalse(first & second)
+
+
+class LeaderboardTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+
+        from apps.creators.rankings import rankings_cache
+        from apps.tips.models import Tip
+        from apps.tips.signals import tip_completed
+
+        cache.clear()
+        rankings_cache.local.clear()
+        self.client = APIClient()
+        for i, amount in enumerate([50, 300]):
+            user = User.objects.create_user(
+                username=f"ranked{i}", email=f"ranked{i}@example.com", password="pass1234", role="creator"
+            )
+            creator = CreatorProfile.objects.create(
+                user=user, display_name=f"Ranked {i}", slug=f"ranked-{i}", category="music"
+            )
+            tip = Tip.objects.create(creator=creator, amount=amount, status=Tip.Status.COMPLETED)
+            tip_completed.send(sender=Tip, tip=tip)
+
+    def test_boards_rank_by_completed_tips(self):
+        for board in ("all_time", "month", "week"):
+            res = self.client.get(reverse("creator-leaderboard", kwargs={"board": board}), {"category": "music"})
+            self.assertEqual([r["slug"] for r in res.data["results"]], ["ranked-1", "ranked-0"], board)
+        self.assertEqual(res.data["results"][0]["total"], "300.00")
+
+        res = self.client.get(reverse("creator-leaderboard", kwargs={"board": "trending"}))
+        self.assertEqual({r["slug"] for r in res.data["results"]}, {"ranked-0", "ranked-1"})
+        self.assertAlmostEqual(res.data["results"][0]["score"], 1.0, places=2)
+
+    def test_reads_are_cached(self):
+        url = reverse("creator-leaderboard", kwargs={"board": "all_time"})
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_unknown_board(self):
+        res = self.client.get(reverse("creator-leaderboard", kwargs={"board": "yearly"}))
+        self.assertEqual(res.status_code, 404)
+
+
+class RecommendationTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+
+        from apps.creators.recommendations import recommendations_cache
+        from apps.tips.models import Tip
+
+        cache.clear()
+        recommendations_cache.local.clear()
+        self.client = APIClient()
+        creators = {}
+        for name in ("alpha", "beta", "gamma"):
+            user = User.objects.create_user(
+                username=name, email=f"{name}@example.com", password="pass1234", role="creator"
+            )
+            creators[name] = CreatorProfile.objects.create(user=user, display_name=name.title(), slug=name)
+        self.fans = [
+            User.objects.create_user(username=f"fan{i}", email=f"fan{i}@example.com", password="pass1234")
+            for i in range(4)
+        ]
+        supports = {0: ("alpha", "beta"), 1: ("alpha", "beta"), 2: ("alpha", "gamma"), 3: ("alpha",)}
+        for i, names in supports.items():
+            for name in names:
+                Tip.objects.create(
+                    creator=creators[name], tipper=self.fans[i], amount=10, status=Tip.Status.COMPLETED
+                )
+        # Guests are matched across tips by email
+        for name in ("beta", "gamma"):
+            Tip.objects.create(
+                creator=creators[name], tipper_email="guest@example.com", amount=5, status=Tip.Status.COMPLETED
+            )
+
+    def test_similar_and_recommended(self):
+        from apps.creators.recommendations import build_similarities
+
+        result = build_similarities(chunk_size=3)
+        self.assertEqual(result["creators"], 2)  # alpha ↔ beta; single shared fans are pruned
+
+        res = self.client.get(reverse("creator-similar", kwargs={"slug": "alpha"}))
+        self.assertEqual([r["slug"] for r in res.data["results"]], ["beta"])
+        # Cosine: 2 shared fans, alpha has 4 fans and beta 3
+        self.assertAlmostEqual(res.data["results"][0]["score"], 2 / (4 * 3) ** 0.5, places=3)
+
+        self.client.force_authenticate(self.fans[3])
+        res = self.client.get(reverse("creator-recommendations"))
+        self.assertEqual([r["slug"] for r in res.data["results"]], ["beta"])
+
+
+class FanFeedTests(TestCase):
+    def setUp(self):
+        import datetime
+
+        from django.core.cache import cache
+        from django.utils import timezone
+
+        from apps.creators.models import CreatorPost
+        from apps.tips.models import Pledge, Tip
+
+        cache.clear()
+        self.client = APIClient()
+        self.fan = User.objects.create_user(username="reader", email="reader@example.com", password="pass1234")
+        self.creators = []
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f"poster{i}", email=f"poster{i}@example.com", password="pass1234", role="creator"
+            )
+            self.creators.append(CreatorProfile.objects.create(user=user, display_name=f"Poster {i}", slug=f"poster-{i}"))
+        Tip.objects.create(creator=self.creators[0], tipper=self.fan, amount=10, status=Tip.Status.COMPLETED)
+        Pledge.objects.create(creator=self.creators[1], fan=self.fan, amount=20)
+        # creators[2] is not supported by the fan
+
+        now = timezone.now()
+        for i, creator in enumerate(self.creators):
+            for n in range(3):
+                post = CreatorPost.objects.create(creator=creator, title=f"{creator.slug} #{n}")
+                CreatorPost.objects.filter(pk=post.pk).update(
+                    created_at=now - datetime.timedelta(hours=n * 3 + i)
+                )
+        cache.clear()
+        self.client.force_authenticate(self.fan)
+
+    def test_pages_merge_supported_creators_newest_first(self):
+        url = reverse("fan-feed")
+        res = self.client.get(url, {"page_size": 4})
+        self.assertEqual(
+            [p["title"] for p in res.data["results"]],
+            ["poster-0 #0", "poster-1 #0", "poster-0 #1", "poster-1 #1"],
+        )
+        res = self.client.get(res.data["next"])
+        self.assertEqual([p["title"] for p in res.data["results"]], ["poster-0 #2", "poster-1 #2"])
+        self.assertIsNone(res.data["next"])
+
+    def test_cached_lists_are_invalidated_on_post_write(self):
+        from apps.creators.models import CreatorPost
+
+        url = reverse("fan-feed")
+        self.client.get(url)
+        with self.assertNumQueries(1):  # supported creators only — post lists come from the cache
+            self.client.get(url)
+        CreatorPost.objects.create(creator=self.creators[1], title="fresh")
+        res = self.client.get(url, {"page_size": 1})
+        self.assertEqual(res.data["results"][0]["title"], "fresh")
+
+    def test_bad_cursor(self):
+        res = self.client.get(reverse("fan-feed"), {"cursor": "nope"})
+        self.assertEqual(res.status_code, 400)
+
+
+class NotificationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        user = User.objects.create_user(username="notified", email="n@example.com", password="pass1234", role="creator")
+        # Creating the profile sends the welcome notification
+        self.profile = CreatorProfile.objects.create(user=user, display_name="Notified", slug="notified")
+        self.client.force_authenticate(user)
+
+    def _tip(self, amount):
+        from decimal import Decimal
+
+        from apps.creators.models import CreatorNotification
+        from apps.creators.notifications import notify
+
+        notify(self.profile.pk, CreatorNotification.Type.TIP_RECEIVED,
+               title=f"New tip — R{amount}", message=f"Fan sent you R{amount}.", amount=Decimal(amount))
+
+    def test_tip_bursts_coalesce_and_read_mark_resets_unread(self):
+        from apps.creators.models import CreatorNotification
+
+        for amount in ("10", "20", "30"):
+            self._tip(amount)
+        self.assertEqual(CreatorNotification.objects.filter(creator=self.profile).count(), 2)
+
+        res = self.client.get(reverse("my-notifications"))
+        self.assertEqual(res["X-Unread-Count"], "2")
+        tips = res.data[0]
+        self.assertEqual(tips["title"], "3 new tips totalling R60.00")
+        self.assertEqual((tips["count"], tips["is_read"]), (3, False))
+        self.assertEqual(res.data[1]["type"], "welcome")
+
+        res = self.client.get(reverse("my-notifications"), {"page_size": 1})
+        self.assertEqual(len(res.data), 1)
+        self.assertIn('rel="next"', res["Link"])
+
+        res = self.client.post(reverse("my-notifications-read"))
+        self.assertEqual(res.data["detail"], "2 notification(s) marked as read.")
+        self.assertEqual(self.client.get(reverse("my-notifications-unread")).data["unread"], 0)
+        self.assertTrue(all(n["is_read"] for n in self.client.get(reverse("my-notifications")).data))
+
+        # A new tip in the same window re-opens the merged row
+        self._tip("5")
+        self.assertEqual(self.client.get(reverse("my-notifications-unread")).data["unread"], 1)
+        res = self.client.get(reverse("my-notifications"))
+        self.assertEqual(res.data[0]["title"], "4 new tips totalling R65.00")
+        self.assertEqual([n["is_read"] for n in res.data], [False, True])
@@ -0,0 +1,100 @@
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.admin_portal.management.commands.regenerate_images import originals
+from apps.blog.models import BlogPost
+from apps.creators.models import CreatorPost, CreatorProfile
+from apps.users.models import User
+from apps.users.serializers import UserSerializer
+from core import images
+
+
+def image_file(size, mode="RGB", fmt="JPEG") -> ContentFile:
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 40, 40, 128)[: len(mode)]).save(buffer, fmt)
+    return ContentFile(buffer.getvalue())
+
+
+class ImageVariantTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+        self.client = APIClient()
+
+    def test_generate_writes_width_bounded_variants_next_to_the_original(self):
+        name = default_storage.save("covers/beach.jpg", image_file((2400, 1200)))
+        self.assertEqual(images.generate(name), {"hero": 1600, "card": 640, "thumb": 200})
+        with default_storage.open("covers/beach.thumb.webp") as fh, Image.open(fh) as thumb:
+            self.assertEqual((thumb.format, thumb.size), ("WEBP", (200, 100)))
+        self.assertTrue(default_storage.exists("covers/beach.hero.jpg"))
+
+    def test_small_transparent_image_is_not_upscaled_and_jpeg_is_flattened(self):
+        name = default_storage.save("avatars/me.png", image_file((120, 60), "RGBA", "PNG"))
+        self.assertEqual(images.generate(name), {"hero": 120, "card": 120, "thumb": 120})
+        with default_storage.open("avatars/me.card.jpg") as fh, Image.open(fh) as card:
+            self.assertEqual(card.mode, "RGB")
+        with default_storage.open("avatars/me.card.webp") as fh, Image.open(fh) as card:
+            self.assertEqual(card.mode, "RGBA")
+
+    def test_srcset_points_at_the_lazy_endpoint_until_variants_exist(self):
+        name = default_storage.save("covers/beach.jpg", image_file((1000, 500)))
+        self.assertIn("/api/images/card.webp/covers/beach.jpg 640w", images.srcset(name)["webp"])
+
+        images.generate(name)
+        srcset = images.srcset(name)
+        self.assertEqual(
+            srcset["jpg"],
+            "/media/covers/beach.thumb.jpg 200w, /media/covers/beach.card.jpg 640w, /media/covers/beach.hero.jpg 1000w",
+        )
+        self.assertIsNone(images.srcset(""))
+
+    def test_lazy_endpoint_generates_missing_variant_and_redirects(self):
+        default_storage.save("posts/photo.jpg", image_file((800, 800)))
+        res = self.client.get("/api/images/thumb.webp/posts/photo.jpg")
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(res["Location"], "/media/posts/photo.thumb.webp")
+        self.assertTrue(default_storage.exists("posts/photo.thumb.webp"))
+
+        for path in ("/api/images/thumb.webp/posts/missing.jpg",
+                     "/api/images/huge.webp/posts/photo.jpg",
+                     "/api/images/thumb.webp/posts/../secret.jpg",
+                     "/api/images/thumb.webp/kyc/passport.jpg"):
+            self.assertEqual(self.client.get(path).status_code, 404, path)
+
+    def test_upload_schedules_generation_once(self):
+        post = BlogPost(title="Hello", excerpt="x", content="y")
+        post.cover_image.save("hero.jpg", image_file((300, 200)), save=False)
+        with mock.patch.object(images, "_submit") as submit, self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        submit.assert_called_once_with(post.cover_image.name)
+
+        images.generate(post.cover_image.name)
+        with mock.patch.object(images, "_submit") as submit, self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        submit.assert_not_called()
+
+    def test_serializers_expose_srcset_and_regeneration_lists_originals(self):
+        user = User.objects.create_user(username="pic", email="pic@example.com", password="pass1234")
+        self.assertIsNone(UserSerializer(user).data["avatar_srcset"])
+        user.avatar.save("me.jpg", image_file((300, 300)))
+        self.assertIn("webp", UserSerializer(user).data["avatar_srcset"])
+
+        profile = CreatorProfile.objects.create(user=user, display_name="Pic", slug="pic")
+        CreatorPost.objects.create(creator=profile, title="Text", media_file="posts/notes.pdf",
+                                   post_type=CreatorPost.PostType.FILE)
+        CreatorPost.objects.create(creator=profile, title="Photo", media_file="posts/photo.jpg",
+                                   post_type=CreatorPost.PostType.IMAGE)
+        self.assertEqual(originals(), sorted([user.avatar.name, "posts/photo.jpg"]))
@@ -5,8 +5,14 @@ from .views import (
     AdminKycDeclineView,
     CreatorDetailView,
     CreatorIncomingPledgesView,
+    CreatorLeaderboardView,
     CreatorListView,
+    CreatorPageView,
+    CreatorPledgeMetricsView,
+    CreatorSearchView,
+    FanFeedView,
     MarkNotificationsReadView,
+    MyCohortReportView,
     MyCommissionRequestDetailView,
     MyCommissionRequestListView,
     MyCommissionSlotView,
@@ -29,15 +35,24 @@ from .views import (
     PublicMilestoneListView,
     PublicPostListView,
     PublicTierListView,
+    RecommendedCreatorsView,
+    SimilarCreatorsView,
+    UnreadNotificationCountView,
     ValidateBankAccountView,
 )
 
 urlpatterns = [
     path("", CreatorListView.as_view(), name="creator-list"),
+    path("search/", CreatorSearchView.as_view(), name="creator-search"),
+    path("leaderboards/<str:board>/", CreatorLeaderboardView.as_view(), name="creator-leaderboard"),
+    path("feed/", FanFeedView.as_view(), name="fan-feed"),
+    path("recommended/", RecommendedCreatorsView.as_view(), name="creator-recommendations"),
     path("me/", MyCreatorProfileView.as_view(), name="my-creator-profile"),
     path("me/stats/", MyDashboardStatsView.as_view(), name="my-dashboard-stats"),
+    path("me/cohorts/", MyCohortReportView.as_view(), name="my-cohorts"),
     path("me/notifications/", MyNotificationsView.as_view(), name="my-notifications"),
     path("me/notifications/read/", MarkNotificationsReadView.as_view(), name="my-notifications-read"),
+    path("me/notifications/unread/", UnreadNotificationCountView.as_view(), name="my-notifications-unread"),
     path("me/jars/", MyJarListCreateView.as_view(), name="my-jar-list"),
     path("me/jars/<int:pk>/", MyJarDetailView.as_view(), name="my-jar-detail"),
     path("me/posts/", MyPostListCreateView.as_view(), name="my-post-list"),
@@ -54,11 +69,14 @@ urlpatterns = [
     path("admin/<int:pk>/kyc/approve/", AdminKycApproveView.as_view(), name="admin-kyc-approve"),
     path("admin/<int:pk>/kyc/decline/", AdminKycDeclineView.as_view(), name="admin-kyc-decline"),
     path("me/pledges/", CreatorIncomingPledgesView.as_view(), name="creator-pledges"),
+    path("me/pledges/metrics/", CreatorPledgeMetricsView.as_view(), name="creator-pledge-metrics"),
+    path("<slug:slug>/page/", CreatorPageView.as_view(), name="creator-page"),
     path("<slug:slug>/jars/", PublicCreatorJarsView.as_view(), name="creator-jars"),
     path("<slug:slug>/jars/<slug:jar_slug>/", PublicJarDetailView.as_view(), name="creator-jar-detail"),
     path("<slug:slug>/posts/", PublicPostListView.as_view(), name="creator-posts"),
     path("<slug:slug>/posts/access/", PostAccessView.as_view(), name="creator-posts-access"),
     path("<slug:slug>/tiers/", PublicTierListView.as_view(), name="creator-tiers"),
+    path("<slug:slug>/similar/", SimilarCreatorsView.as_view(), name="creator-similar"),
     path("<slug:slug>/milestones/", PublicMilestoneListView.as_view(), name="creator-milestones"),
     path("<slug:slug>/commission-requests/", PublicCommissionRequestCreateView.as_view(), name="creator-commission-requests"),
     path("<slug:slug>/", CreatorDetailView.as_view(), name="creator-detail"),
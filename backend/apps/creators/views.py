@@ -1,35 +1,65 @@
 import datetime
+import hashlib
+import json
 import logging
 
 from django.conf import settings
-from django.db.models import Sum
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import DecimalField, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.analytics.cohorts import report_payload
+from apps.analytics.pledges import metrics_payload
 from apps.payments import paystack as ps
+from apps.payments import paystack_async as aps
 from apps.support.emails import send_banking_confirmed
 from apps.tips.models import Tip
-
+from apps.tips.serializers import TipSerializer
+from apps.users.principal import creator_profile_or_404
+from core import uploads
+from core.async_views import AsyncAPIView
+from core.conditional import apply_validators
+from core.pagination import HeaderKeysetPagination, KeysetPagination
+from core.ratelimit import limit
+
+from . import notifications
+from .cache import (
+    CachedPublicReadMixin,
+    CreatorConditionalGetMixin,
+    creator_cache_key,
+    creator_id_for_slug,
+    read_through,
+)
+from .feed import feed_page, serialize_post
 from .models import (
     CommissionRequest,
     CommissionSlot,
     CreatorKycDocument,
+    CreatorNotification,
     CreatorPost,
     CreatorProfile,
     Jar,
     MilestoneGoal,
     SupportTier,
 )
+from .rankings import BOARDS, LEADERBOARD_SIZE, leaderboard
+from .recommendations import TOP_K, recommended_for, similar_creators
+from .search import FILTER_LOOKUPS, search_creators
 from .serializers import (
     CommissionRequestSerializer,
     CommissionSlotSerializer,
     CreatorPostPublicSerializer,
     CreatorPostSerializer,
     CreatorProfileSerializer,
+    CreatorSearchResultSerializer,
     JarSerializer,
     KycDocumentSerializer,
     MilestoneGoalSerializer,
@@ -87,7 +117,7 @@ def _maybe_create_paystack_subaccount(profile: CreatorProfile) -> None:
         logger.warning("Paystack subaccount creation failed for %s: %s", profile.slug, exc)
 
 
-class ValidateBankAccountView(APIView):
+class ValidateBankAccountView(AsyncAPIView):
     """
     POST /api/creators/me/banking/validate/
 
@@ -100,7 +130,7 @@ class ValidateBankAccountView(APIView):
 
     permission_classes = [permissions.IsAuthenticated]
 
-    def post(self, request):
+    async def post(self, request):
         account_number = request.data.get("account_number", "").strip()
         bank_code = request.data.get("bank_code", "").strip()
 
@@ -115,7 +145,7 @@ class ValidateBankAccountView(APIView):
             return Response({"account_name": "Dev Mode Account", "account_number": account_number})
 
         try:
-            data = ps.resolve_account(account_number, bank_code)
+            data = await aps.resolve_account(account_number, bank_code)
         except RuntimeError:
             # Paystack's resolve endpoint only supports NGN/GHS/KES/USD regions.
             # For SA (ZAR) banks, skip client-side validation — the subaccount
@@ -135,13 +165,232 @@ class CreatorListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
 
-class CreatorDetailView(generics.RetrieveAPIView):
+class CreatorSearchPagination(KeysetPagination):
+    page_size = 20
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get("q", "").strip():
+            return ("-score", "-id")
+        return ("-completed_tip_total", "-id")
+
+
+class CreatorSearchView(generics.ListAPIView):
+    """
+    GET /api/creators/search/?q=&category=&platform=&audience_size=&age_group=&audience_gender=
+
+    Ranked, keyset-paginated creator discovery (see search.py).
+    """
+
+    serializer_class = CreatorSearchResultSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = CreatorSearchPagination
+
+    def get_queryset(self):
+        params = self.request.query_params
+        return search_creators(params.get("q", ""), **{name: params.get(name) for name in FILTER_LOOKUPS})
+
+
+class CreatorLeaderboardView(APIView):
+    """
+    GET /api/creators/leaderboards/<board>/?category=&limit=
+
+    board: all_time | month | week | trending. Served from the precomputed
+    top-N lists in rankings.py (refreshed at most once a minute).
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, board):
+        if board not in BOARDS:
+            return Response({"detail": f"Unknown leaderboard. Use one of: {', '.join(BOARDS)}."},
+                            status=status.HTTP_404_NOT_FOUND)
+        category = request.query_params.get("category", "").strip()
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), LEADERBOARD_SIZE))
+        except ValueError:
+            limit = 20
+        results = leaderboard(board, category)[:limit]
+        response = Response({"board": board, "category": category, "results": results})
+        response["Cache-Control"] = "public, max-age=30"
+        return response
+
+
+def _limit(request, default=10, maximum=TOP_K, param="limit") -> int:
+    try:
+        return max(1, min(int(request.query_params.get(param, default)), maximum))
+    except ValueError:
+        return default
+
+
+class SimilarCreatorsView(APIView):
+    """
+    GET /api/creators/<slug>/similar/?limit=
+
+    "Fans of this creator also support…" — precomputed neighbours from
+    recommendations.py (rebuilt nightly).
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, slug):
+        creator_id = creator_id_for_slug(slug)
+        if creator_id is None:
+            return Response({"detail": "Creator not found."}, status=status.HTTP_404_NOT_FOUND)
+        response = Response({"results": similar_creators(creator_id, _limit(request))})
+        response["Cache-Control"] = "public, max-age=300"
+        return response
+
+
+class RecommendedCreatorsView(APIView):
+    """GET /api/creators/recommended/?limit= — creators the signed-in fan may like."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"results": recommended_for(request.user, _limit(request))})
+
+
+class FanFeedView(APIView):
+    """
+    GET /api/creators/feed/?cursor=&page_size=
+
+    Newest posts from every creator the signed-in fan has tipped or pledged
+    to, merged across creators (see feed.py). Follow ``next`` for older posts.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    page_size = 20
+    max_page_size = 100
+
+    def get(self, request):
+        page_size = _limit(request, self.page_size, self.max_page_size, param="page_size")
+        try:
+            posts, next_cursor = feed_page(request.user, page_size, request.query_params.get("cursor"))
+        except ValueError:
+            return Response({"detail": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+        next_url = None
+        if next_cursor:
+            next_url = request.build_absolute_uri(
+                f"{request.path}?cursor={next_cursor}&page_size={page_size}"
+            )
+        return Response({
+            "next": next_url,
+            "results": [serialize_post(post, request) for post in posts],
+        })
+
+
+class CreatorDetailView(CreatorConditionalGetMixin, CachedPublicReadMixin, generics.RetrieveAPIView):
+    cache_section = "detail"
     queryset = CreatorProfile.objects.filter(is_active=True)
     serializer_class = CreatorProfileSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "slug"
 
 
+class CreatorPageView(APIView):
+    """
+    GET /api/creators/<slug>/page/
+
+    Everything the public creator page renders, in one response and a fixed
+    number of queries regardless of how many jars / tiers / posts exist:
+
+        1. profile + user, with all-time and this-month tip totals annotated
+        2. KYC documents         (prefetch — same shape as CreatorDetailView)
+        3. active jars           (prefetch, totals annotated per jar)
+        4. active support tiers  (prefetch)
+        5. active milestones     (prefetch; share the month total from 1)
+        6. published post teasers (latest PAGE_SIZE)
+        7. recent completed tips  (latest PAGE_SIZE)
+
+    The payload is served through the public-read cache (cache.py), so a
+    repeat view costs no queries until the creator's content changes. The
+    body carries a strong ETag (hash of the payload) and a short public
+    Cache-Control so browsers and CDNs can revalidate with If-None-Match.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    cache_control = "public, max-age=30, stale-while-revalidate=300"
+
+    def get(self, request, slug):
+        creator_id = creator_id_for_slug(slug)
+        if creator_id is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        def compute():
+            payload = creator_page_payload(slug, request)
+            if payload is None:
+                return None
+            body = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True)
+            return payload, '"%s"' % hashlib.sha256(body.encode()).hexdigest()[:40]
+
+        month = datetime.date.today().strftime("%Y-%m")
+        cached = read_through(creator_cache_key(creator_id, "page", slug, request, month), compute)
+        if cached is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        payload, etag = cached
+
+        response = get_conditional_response(request, etag=etag) or Response(payload)
+        return apply_validators(response, etag=etag, cache_control=self.cache_control)
+
+
+def creator_page_payload(slug, request) -> dict | None:
+    """Build the CreatorPageView payload; returns None for an unknown / inactive slug."""
+    page_size = settings.REST_FRAMEWORK.get("PAGE_SIZE", 20)
+    today = datetime.date.today()
+    completed = Q(tips__status=Tip.Status.COMPLETED)
+    money = DecimalField(max_digits=12, decimal_places=2)
+
+    creator = (
+        CreatorProfile.objects.filter(slug=slug, is_active=True)
+        .select_related("user")
+        .annotate(
+            completed_total=Coalesce(Sum("tips__amount", filter=completed), Value(0), output_field=money),
+            month_total=Coalesce(
+                Sum(
+                    "tips__amount",
+                    filter=completed & Q(tips__created_at__year=today.year, tips__created_at__month=today.month),
+                ),
+                Value(0),
+                output_field=money,
+            ),
+        )
+        .prefetch_related(
+            "kyc_documents",
+            Prefetch("jars", queryset=Jar.with_totals(Jar.objects.filter(is_active=True)), to_attr="active_jars"),
+            Prefetch("support_tiers", queryset=SupportTier.objects.filter(is_active=True), to_attr="active_tiers"),
+            Prefetch("milestones", queryset=MilestoneGoal.objects.filter(is_active=True), to_attr="active_milestones"),
+        )
+        .first()
+    )
+    if creator is None:
+        return None
+
+    posts = CreatorPost.objects.filter(creator=creator, is_published=True)[:page_size]
+    tips = (
+        Tip.objects.filter(creator=creator, status=Tip.Status.COMPLETED)
+        .select_related("jar")
+        .order_by("-created_at")[:page_size]
+    )
+    # Related objects below all point back at this creator — reuse it rather than re-fetch
+    for jar in creator.active_jars:
+        jar.creator = creator
+    tips = list(tips)
+    for tip in tips:
+        tip.creator = creator
+
+    ctx = {"request": request, "month_totals": {creator.id: float(creator.month_total)}}
+    return {
+        "creator": CreatorProfileSerializer(creator, context=ctx).data,
+        "jars": JarSerializer(creator.active_jars, many=True, context=ctx).data,
+        "tiers": SupportTierSerializer(creator.active_tiers, many=True, context=ctx).data,
+        "milestones": MilestoneGoalSerializer(creator.active_milestones, many=True, context=ctx).data,
+        "posts": CreatorPostPublicSerializer(posts, many=True, context=ctx).data,
+        "recent_tips": TipSerializer(tips, many=True, context=ctx).data,
+        "current_month_total": float(creator.month_total),
+    }
+
+
 class MyCreatorProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = CreatorProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -168,9 +417,8 @@ class MyDashboardStatsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        try:
-            profile = CreatorProfile.objects.get(user=request.user)
-        except CreatorProfile.DoesNotExist:
+        profile = request.creator_profile
+        if not profile:
             return Response(
                 {"detail": "Creator profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -228,6 +476,23 @@ class MyDashboardStatsView(APIView):
         )
 
 
+class MyCohortReportView(APIView):
+    """
+    GET /api/creators/me/cohorts/
+
+    Monthly fan cohorts (how many first-time fans came back 1…12 months
+    later) and the fan lifetime-value distribution, as of the last
+    ``build_cohorts`` run.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        profile = creator_profile_or_404(request)
+        reports = [profile.cohort_report] if hasattr(profile, "cohort_report") else []
+        return Response(report_payload(reports))
+
+
 # ── Jar views ─────────────────────────────────────────────────────────────────
 
 class MyJarListCreateView(generics.ListCreateAPIView):
@@ -237,15 +502,13 @@ class MyJarListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return Jar.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return Jar.objects.none()
+        return Jar.objects.filter(creator=profile)
 
     def perform_create(self, serializer):
-        profile = CreatorProfile.objects.get(user=self.request.user)
-        serializer.save(creator=profile)
+        serializer.save(creator=self.request.creator_profile)
 
 
 class MyJarDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -255,33 +518,38 @@ class MyJarDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return Jar.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return Jar.objects.none()
+        return Jar.objects.filter(creator=profile)
 
 
-class PublicCreatorJarsView(generics.ListAPIView):
+class PublicCreatorJarsView(CreatorConditionalGetMixin, CachedPublicReadMixin, generics.ListAPIView):
     """Public: list active jars for a creator by slug."""
 
+    cache_section = "jars"
+
     serializer_class = JarSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
         slug = self.kwargs["slug"]
-        return Jar.objects.filter(creator__slug=slug, is_active=True)
+        return Jar.with_totals(
+            Jar.objects.filter(creator__slug=slug, is_active=True).select_related("creator")
+        )
 
 
-class PublicJarDetailView(generics.RetrieveAPIView):
+class PublicJarDetailView(CreatorConditionalGetMixin, CachedPublicReadMixin, generics.RetrieveAPIView):
     """Public: get a single jar by creator slug + jar slug."""
 
+    cache_section = "jar"
+
     serializer_class = JarSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_object(self):
         return get_object_or_404(
-            Jar,
+            Jar.with_totals().select_related("creator"),
             creator__slug=self.kwargs["slug"],
             slug=self.kwargs["jar_slug"],
             is_active=True,
@@ -298,15 +566,20 @@ class MyPostListCreateView(generics.ListCreateAPIView):
     serializer_class = CreatorPostSerializer
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return CreatorPost.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return CreatorPost.objects.none()
+        return CreatorPost.objects.filter(creator=profile)
 
     def perform_create(self, serializer):
-        profile = CreatorProfile.objects.get(user=self.request.user)
-        serializer.save(creator=profile)
+        extra = {}
+        upload_id = self.request.data.get("upload_id")
+        if upload_id and not serializer.validated_data.get("media_file"):
+            # A finished resumable upload (core/uploads.py) stands in for the multipart file
+            extra["media_file"] = uploads.claim(self.request, "post-media", upload_id)
+            if not extra["media_file"]:
+                raise ValidationError({"upload_id": "Not a completed upload."})
+        serializer.save(creator=self.request.creator_profile, **extra)
 
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
@@ -322,11 +595,10 @@ class MyPostDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CreatorPostSerializer
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return CreatorPost.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return CreatorPost.objects.none()
+        return CreatorPost.objects.filter(creator=profile)
 
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
@@ -334,7 +606,7 @@ class MyPostDetailView(generics.RetrieveUpdateDestroyAPIView):
         return ctx
 
 
-class PublicPostListView(generics.ListAPIView):
+class PublicPostListView(CreatorConditionalGetMixin, generics.ListAPIView):
     """Public: list published post teasers (title + type only) for a creator."""
 
     serializer_class = CreatorPostPublicSerializer
@@ -351,6 +623,8 @@ class PostAccessView(APIView):
     """POST {email} → 200 with full posts if the email has a completed tip, else 403."""
 
     permission_classes = [permissions.AllowAny]
+    # Each call answers "has this email tipped?": keep enumeration slow
+    throttle_classes = [limit("post-access:ip", "ip", "30/h"), limit("post-access:email", "email", "10/h")]
 
     def post(self, request, slug):
         email = request.data.get("email", "").strip().lower()
@@ -378,9 +652,11 @@ class PostAccessView(APIView):
 
 # ── Support Tier views ────────────────────────────────────────────────────────
 
-class PublicTierListView(generics.ListAPIView):
+class PublicTierListView(CreatorConditionalGetMixin, CachedPublicReadMixin, generics.ListAPIView):
     """Public: list active support tiers for a creator."""
 
+    cache_section = "tiers"
+
     serializer_class = SupportTierSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -397,15 +673,13 @@ class MyTierListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return SupportTier.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return SupportTier.objects.none()
+        return SupportTier.objects.filter(creator=profile)
 
     def perform_create(self, serializer):
-        profile = CreatorProfile.objects.get(user=self.request.user)
-        serializer.save(creator=profile)
+        serializer.save(creator=self.request.creator_profile)
 
 
 class MyTierDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -415,18 +689,20 @@ class MyTierDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return SupportTier.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return SupportTier.objects.none()
+        return SupportTier.objects.filter(creator=profile)
 
 
 # ── Milestone views ───────────────────────────────────────────────────────────
 
-class PublicMilestoneListView(generics.ListAPIView):
+class PublicMilestoneListView(CreatorConditionalGetMixin, CachedPublicReadMixin, generics.ListAPIView):
     """Public: list active milestones for a creator (includes current_month_total)."""
 
+    cache_section = "milestones"
+    month_sensitive = True
+
     serializer_class = MilestoneGoalSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -443,15 +719,13 @@ class MyMilestoneListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return MilestoneGoal.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return MilestoneGoal.objects.none()
+        return MilestoneGoal.objects.filter(creator=profile)
 
     def perform_create(self, serializer):
-        profile = CreatorProfile.objects.get(user=self.request.user)
-        serializer.save(creator=profile)
+        serializer.save(creator=self.request.creator_profile)
 
 
 class MyMilestoneDetailView(generics.RetrieveUpdateAPIView):
@@ -461,11 +735,10 @@ class MyMilestoneDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return MilestoneGoal.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return MilestoneGoal.objects.none()
+        return MilestoneGoal.objects.filter(creator=profile)
 
 
 # ── Commission views ──────────────────────────────────────────────────────────
@@ -476,7 +749,7 @@ class MyCommissionSlotView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def _get_profile(self):
-        return get_object_or_404(CreatorProfile, user=self.request.user)
+        return creator_profile_or_404(self.request)
 
     def get(self, request):
         profile = self._get_profile()
@@ -499,11 +772,10 @@ class MyCommissionRequestListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return CommissionRequest.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return CommissionRequest.objects.none()
+        return CommissionRequest.objects.filter(creator=profile)
 
 
 class MyCommissionRequestDetailView(generics.UpdateAPIView):
@@ -513,11 +785,10 @@ class MyCommissionRequestDetailView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return CommissionRequest.objects.filter(creator=profile)
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return CommissionRequest.objects.none()
+        return CommissionRequest.objects.filter(creator=profile)
 
 
 class PublicCommissionRequestCreateView(APIView):
@@ -547,13 +818,13 @@ class PublicCommissionRequestCreateView(APIView):
 # ── KYC document views ────────────────────────────────────────────────────────
 
 class MyKycDocumentListCreateView(APIView):
-    """Creator: list own KYC documents or upload a new one."""
+    """Creator: list own KYC documents or upload a new one (multipart ``file`` or a resumable ``upload_id``)."""
 
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def _get_profile(self):
-        return get_object_or_404(CreatorProfile, user=self.request.user)
+        return creator_profile_or_404(self.request)
 
     def get(self, request):
         profile = self._get_profile()
@@ -563,15 +834,19 @@ class MyKycDocumentListCreateView(APIView):
     def post(self, request):
         profile = self._get_profile()
         doc_type = request.data.get("doc_type")
-        file = request.FILES.get("file")
 
-        if not doc_type or not file:
-            return Response({"detail": "doc_type and file are required."}, status=status.HTTP_400_BAD_REQUEST)
+        if not doc_type or not (request.FILES.get("file") or request.data.get("upload_id")):
+            return Response({"detail": "doc_type and file (or upload_id) are required."}, status=status.HTTP_400_BAD_REQUEST)
 
         valid_types = [c[0] for c in CreatorKycDocument.DocType.choices]
         if doc_type not in valid_types:
             return Response({"detail": f"Invalid doc_type. Choose from: {valid_types}"}, status=status.HTTP_400_BAD_REQUEST)
 
+        # A finished resumable upload (core/uploads.py) stands in for the multipart file
+        file = request.FILES.get("file") or uploads.claim(request, "kyc", request.data.get("upload_id"))
+        if not file:
+            return Response({"detail": "upload_id is not a completed upload."}, status=status.HTTP_400_BAD_REQUEST)
+
         # Replace existing doc of same type (re-upload resets to pending)
         profile.kyc_documents.filter(doc_type=doc_type).delete()
         doc = CreatorKycDocument.objects.create(
@@ -636,32 +911,44 @@ class AdminKycDeclineView(APIView):
 
 # ── Creator notifications ─────────────────────────────────────────────────────
 
-class MyNotificationsView(APIView):
+class NotificationPagination(HeaderKeysetPagination):
+    """Body stays the bare list the dashboard expects; older pages via ``Link: rel="next"``."""
+
+    ordering = ("-updated_at", "-id")
+
+
+class MyNotificationsView(generics.ListAPIView):
     """
-    GET  /api/creators/me/notifications/         — list last 50 notifications
+    GET  /api/creators/me/notifications/         — newest notifications, bursts merged
     POST /api/creators/me/notifications/read/    — mark all as read
+
+    The unread count is returned in the ``X-Unread-Count`` header
+    (and by GET /api/creators/me/notifications/unread/).
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationPagination
 
-    def get(self, request):
-        try:
-            creator = CreatorProfile.objects.get(user=request.user)
-        except CreatorProfile.DoesNotExist:
+    def list(self, request, *args, **kwargs):
+        if not request.creator_profile:
             return Response([])
-        notifications = creator.notifications.all()[:50]
-        data = [
-            {
-                "id": n.id,
-                "type": n.notification_type,
-                "title": n.title,
-                "message": n.message,
-                "is_read": n.is_read,
-                "created_at": n.created_at,
-            }
-            for n in notifications
-        ]
-        return Response(data)
+        creator_id = request.creator_profile.pk
+        unread, read_through = notifications.read_state(creator_id)
+        page = self.paginate_queryset(CreatorNotification.objects.filter(creator_id=creator_id))
+        response = self.get_paginated_response([notifications.serialize(n, read_through) for n in page])
+        response["X-Unread-Count"] = str(unread)
+        return response
+
+
+class UnreadNotificationCountView(APIView):
+    """GET /api/creators/me/notifications/unread/ — ``{"unread": n}``, one row read."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        creator = request.creator_profile
+        unread = notifications.read_state(creator.pk)[0] if creator else 0
+        return Response({"unread": unread})
 
 
 class MarkNotificationsReadView(APIView):
@@ -670,11 +957,10 @@ class MarkNotificationsReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        try:
-            creator = CreatorProfile.objects.get(user=request.user)
-        except CreatorProfile.DoesNotExist:
+        creator = request.creator_profile
+        if not creator:
             return Response({"detail": "No creator profile."}, status=status.HTTP_404_NOT_FOUND)
-        updated = creator.notifications.filter(is_read=False).update(is_read=True)
+        updated = notifications.mark_all_read(creator.pk)
         return Response({"detail": f"{updated} notification(s) marked as read."})
 
 
@@ -691,9 +977,22 @@ class CreatorIncomingPledgesView(generics.ListAPIView):
 
     def get_queryset(self):
         from apps.tips.models import Pledge
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return Pledge.objects.filter(creator=profile).select_related("fan", "tier")
-        except CreatorProfile.DoesNotExist:
-            from apps.tips.models import Pledge
+        profile = self.request.creator_profile
+        if not profile:
             return Pledge.objects.none()
+        return Pledge.objects.filter(creator=profile).select_related("fan", "tier")
+
+
+class CreatorPledgeMetricsView(APIView):
+    """
+    GET /api/creators/me/pledges/metrics/
+
+    MRR, active / paused / cancelled pledges, revenue per tier and the last
+    12 months of new, churned and reactivated pledges.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        profile = creator_profile_or_404(request)
+        return Response(metrics_payload([profile.pk]))
@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from apps.users import principal
 from core.admin_site import admin_site
 
 from .models import (
@@ -61,11 +62,14 @@ class EnterpriseAdmin(admin.ModelAdmin):
             approval_status=Enterprise.ApprovalStatus.APPROVED,
             rejection_reason="",
         )
+        # update() sends no post_save: refresh the admins' cached principals here
+        principal.invalidate(*queryset.values_list("admin_id", flat=True))
         self.message_user(request, f"{updated} enterprise(s) approved.")
 
     @admin.action(description="Reject selected enterprises (clears rejection reason — set manually)")
     def reject_enterprises(self, request, queryset):
         updated = queryset.update(approval_status=Enterprise.ApprovalStatus.REJECTED)
+        principal.invalidate(*queryset.values_list("admin_id", flat=True))
         self.message_user(request, f"{updated} enterprise(s) rejected.")
 
 
@@ -1,6 +1,8 @@
 from django.utils.text import slugify
 from rest_framework import serializers
 
+from core.images import SrcsetField
+
 from .models import (
     Enterprise,
     EnterpriseDocument,
@@ -15,6 +17,7 @@ class EnterpriseMembershipSerializer(serializers.ModelSerializer):
     creator_slug = serializers.CharField(source="creator.slug", read_only=True)
     display_name = serializers.CharField(source="creator.display_name", read_only=True)
     avatar = serializers.ImageField(source="creator.user.avatar", read_only=True)
+    avatar_srcset = SrcsetField(source="creator.user.avatar")
     tagline = serializers.CharField(source="creator.tagline", read_only=True)
     total_tips = serializers.ReadOnlyField(source="creator.total_tips")
 
@@ -22,7 +25,7 @@ class EnterpriseMembershipSerializer(serializers.ModelSerializer):
         model = EnterpriseMembership
         fields = (
             "id", "creator_id", "creator_slug", "display_name",
-            "avatar", "tagline", "total_tips", "joined_at", "is_active",
+            "avatar", "avatar_srcset", "tagline", "total_tips", "joined_at", "is_active",
         )
         read_only_fields = ("id", "joined_at")
 
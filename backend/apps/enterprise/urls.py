@@ -3,9 +3,11 @@ from django.urls import path
 from .views import (
     AdminEnterpriseApproveView,
     AdminEnterpriseRejectView,
+    EnterpriseCohortReportView,
     EnterpriseDocumentUploadView,
     EnterpriseMemberDetailView,
     EnterpriseMemberListView,
+    EnterprisePledgeMetricsView,
     EnterpriseStatsView,
     FundDistributionDetailView,
     FundDistributionItemUpdateView,
@@ -23,6 +25,8 @@ urlpatterns = [
     path("me/members/<int:pk>/",             EnterpriseMemberDetailView.as_view(),       name="enterprise-member-detail"),
     # Aggregate stats
     path("me/stats/",                        EnterpriseStatsView.as_view(),              name="enterprise-stats"),
+    path("me/cohorts/",                      EnterpriseCohortReportView.as_view(),       name="enterprise-cohorts"),
+    path("me/pledge-metrics/",               EnterprisePledgeMetricsView.as_view(),      name="enterprise-pledge-metrics"),
     # Fund distributions
     path("me/distributions/",               FundDistributionListCreateView.as_view(),   name="enterprise-distributions"),
     path("me/distributions/<int:pk>/",      FundDistributionDetailView.as_view(),       name="enterprise-distribution-detail"),
@@ -3,12 +3,16 @@ from decimal import Decimal
 from django.db.models import Count, Sum
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
-from rest_framework.parsers import MultiPartParser
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.analytics.cohorts import report_payload
+from apps.analytics.models import CreatorCohortReport
+from apps.analytics.pledges import metrics_payload
 from apps.creators.models import CreatorProfile
 from apps.tips.models import Tip
+from core import uploads
 
 from .models import (
     Enterprise,
@@ -32,6 +36,8 @@ class IsEnterpriseAdmin(permissions.BasePermission):
     """Allows access only to users who own an approved Enterprise account."""
 
     def has_permission(self, request, view):
+        if "enterprise_approved" in vars(request.user):  # JWT user: from the cached principal, no query
+            return request.user.enterprise_approved
         return (
             request.user.is_authenticated
             and hasattr(request.user, "enterprise")
@@ -178,6 +184,32 @@ class EnterpriseStatsView(APIView):
         })
 
 
+class EnterpriseCohortReportView(APIView):
+    """Fan cohort retention and LTV summed across all managed creators."""
+
+    permission_classes = [IsEnterpriseAdmin]
+
+    def get(self, request):
+        creator_ids = _get_enterprise(request).memberships.filter(is_active=True).values_list(
+            "creator_id", flat=True
+        )
+        # A fan who tips two member creators is counted once per creator
+        reports = CreatorCohortReport.objects.filter(creator_id__in=creator_ids)
+        return Response(report_payload(reports))
+
+
+class EnterprisePledgeMetricsView(APIView):
+    """Pledge MRR, churn and tier mix summed across all managed creators."""
+
+    permission_classes = [IsEnterpriseAdmin]
+
+    def get(self, request):
+        creator_ids = list(
+            _get_enterprise(request).memberships.filter(is_active=True).values_list("creator_id", flat=True)
+        )
+        return Response(metrics_payload(creator_ids))
+
+
 # ── Fund distributions ─────────────────────────────────────────────────────────
 
 class FundDistributionListCreateView(APIView):
@@ -274,7 +306,7 @@ class EnterpriseDocumentUploadView(APIView):
     """Upload a compliance document for the authenticated enterprise."""
 
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def post(self, request):
         try:
@@ -283,14 +315,15 @@ class EnterpriseDocumentUploadView(APIView):
             return Response({"detail": "No enterprise account found."}, status=status.HTTP_404_NOT_FOUND)
 
         doc_type = request.data.get("doc_type", "").strip()
-        file_obj = request.FILES.get("file")
 
         if not doc_type:
             return Response({"detail": "doc_type is required."}, status=status.HTTP_400_BAD_REQUEST)
         if doc_type not in [c[0] for c in EnterpriseDocument.DocType.choices]:
             return Response({"detail": f"Invalid doc_type: {doc_type}."}, status=status.HTTP_400_BAD_REQUEST)
+        # A finished resumable upload (core/uploads.py) stands in for the multipart file
+        file_obj = request.FILES.get("file") or uploads.claim(request, "enterprise-document", request.data.get("upload_id"))
         if not file_obj:
-            return Response({"detail": "file is required."}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({"detail": "file or a completed upload_id is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Replace existing document of same type
         EnterpriseDocument.objects.filter(enterprise=enterprise, doc_type=doc_type).delete()
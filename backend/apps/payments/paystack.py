@@ -24,7 +24,7 @@ import uuid
 import requests
 from django.conf import settings
 
-_BASE = "https://api.paystack.co"
+_BASE = getattr(settings, "PAYSTACK_API_URL", "https://api.paystack.co")
 
 
 def _headers() -> dict:
@@ -126,7 +126,7 @@ def resolve_account(account_number: str, bank_code: str) -> dict:
 
 # ── Transaction ───────────────────────────────────────────────────────────────
 
-def initialize_transaction(
+def transaction_payload(
     email: str,
     amount_zar: float,
     reference: str,
@@ -136,12 +136,10 @@ def initialize_transaction(
     metadata: dict | None = None,
 ) -> dict:
     """
-    Initialize a Paystack payment transaction.
+    Request body for ``/transaction/initialize`` (shared with paystack_async).
 
     Prefer split_code (SPL_xxxx) over subaccount_code when both are set —
     the split already encodes the creator subaccount plus the platform share.
-
-    Returns dict with keys: authorization_url, access_code, reference.
     """
     amount_kobo = int(round(amount_zar * 100))
 
@@ -166,6 +164,26 @@ def initialize_transaction(
     if metadata:
         payload["metadata"] = metadata
 
+    return payload
+
+
+def initialize_transaction(
+    email: str,
+    amount_zar: float,
+    reference: str,
+    subaccount_code: str | None = None,
+    split_code: str | None = None,
+    callback_url: str | None = None,
+    metadata: dict | None = None,
+) -> dict:
+    """
+    Initialize a Paystack payment transaction.
+
+    Returns dict with keys: authorization_url, access_code, reference.
+    """
+    payload = transaction_payload(
+        email, amount_zar, reference, subaccount_code, split_code, callback_url, metadata
+    )
     resp = requests.post(
         f"{_BASE}/transaction/initialize",
         json=payload,
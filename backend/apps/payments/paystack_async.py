@@ -0,0 +1,118 @@
+"""
+Async Paystack calls for the checkout views.
+
+Under ASGI (``core/asgi.py``) a checkout view awaits Paystack instead of
+holding a worker for up to 15 s, so one slow upstream no longer stalls the
+backend: hundreds of checkouts can be waiting on Paystack while the same
+process keeps serving everything else.
+
+    under ASGI    one httpx.AsyncClient per worker's event loop (core/asgi.py
+                  calls ``share_clients``): keep-alive pool,
+                  PAYSTACK_MAX_CONNECTIONS open sockets at most (requests
+                  beyond that queue for a free connection)
+    under WSGI    every async view runs on a fresh loop, so a pool would
+                  never be reused: each call opens a client and closes it
+    either way    same 15 s timeout and error contract as paystack.py: any
+                  failure raises RuntimeError with Paystack's message
+
+Request bodies come from ``paystack.transaction_payload`` so the sync and
+async paths cannot drift. Management commands and the webhook keep using the
+sync module.
+"""
+
+import asyncio
+import contextlib
+import weakref
+
+from django.conf import settings
+
+from . import paystack as ps
+
+MAX_CONNECTIONS = getattr(settings, "PAYSTACK_MAX_CONNECTIONS", 100)
+TIMEOUT_SECONDS = 15
+
+# Keyed by loop: a client's pool belongs to the loop it was created on. Only
+# filled once ``share_clients`` is called, i.e. for long-lived loops
+_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_shared = False
+
+
+def share_clients() -> None:
+    """Keep one pooled client per event loop; for processes whose loops live as long as they do."""
+    global _shared
+    _shared = True
+
+
+async def close_clients() -> None:
+    """Close the running loop's pooled client, if it has one."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _new_client():
+    import httpx
+
+    return httpx.AsyncClient(
+        base_url=ps._BASE,
+        timeout=TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS // 2),
+    )
+
+
+@contextlib.asynccontextmanager
+async def _client():
+    if not _shared:
+        async with _new_client() as client:
+            yield client
+        return
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = _new_client()
+    yield client
+
+
+async def _request(method: str, path: str, error: str, **kwargs) -> dict:
+    import httpx
+
+    try:
+        async with _client() as client:
+            resp = await client.request(method, path, headers=ps._headers(), **kwargs)
+        data = resp.json()
+    except (httpx.HTTPError, ValueError) as exc:
+        raise RuntimeError(error) from exc
+    if not data.get("status"):
+        raise RuntimeError(data.get("message", error))
+    return data["data"]
+
+
+async def initialize_transaction(
+    email: str,
+    amount_zar: float,
+    reference: str,
+    subaccount_code: str | None = None,
+    split_code: str | None = None,
+    callback_url: str | None = None,
+    metadata: dict | None = None,
+) -> dict:
+    """Async ``paystack.initialize_transaction``."""
+    payload = ps.transaction_payload(
+        email, amount_zar, reference, subaccount_code, split_code, callback_url, metadata
+    )
+    return await _request(
+        "POST", "/transaction/initialize", "Paystack transaction initialization failed.", json=payload,
+    )
+
+
+async def verify_transaction(reference: str) -> dict:
+    """Async ``paystack.verify_transaction``."""
+    return await _request("GET", f"/transaction/verify/{reference}", "Paystack verification failed.")
+
+
+async def resolve_account(account_number: str, bank_code: str) -> dict:
+    """Async ``paystack.resolve_account``."""
+    return await _request(
+        "GET", "/bank/resolve", "Could not verify account. Check the number and bank.",
+        params={"account_number": account_number, "bank_code": bank_code},
+    )
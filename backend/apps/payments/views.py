@@ -6,6 +6,7 @@ from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 
 from apps.creators.models import CreatorNotification
+from apps.creators.notifications import notify
 from apps.payments import paystack as ps
 from apps.support.emails import (
     send_first_thousand_email,
@@ -13,7 +14,10 @@ from apps.support.emails import (
     send_tip_received_to_creator,
     send_tip_thank_you,
 )
+from apps.tips import risk
 from apps.tips.models import Tip
+from apps.tips.signals import tip_completed, tip_refunded
+from core import logs
 
 
 def _update_streak(tip: Tip) -> None:
@@ -96,16 +100,35 @@ def _check_milestones(tip: Tip) -> None:
             milestone.save(update_fields=["is_achieved", "achieved_at"])
 
 
-def _update_pledge(tip: Tip) -> None:
+def _pledge_id(metadata) -> int | None:
+    """``pledge_id`` from a Paystack transaction's metadata (a dict, or JSON text)."""
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except ValueError:
+            return None
+    try:
+        return int(metadata.get("pledge_id")) if isinstance(metadata, dict) else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _update_pledge(tip: Tip, metadata=None) -> None:
     """After a completed tip, set next_charge_date on active pledges for this fan+creator."""
+    from apps.analytics.pledges import record_charge
     from apps.tips.models import Pledge
 
     fan = tip.tipper
     if not fan:
         return
-    Pledge.objects.filter(
-        fan=fan, creator=tip.creator, status=Pledge.Status.ACTIVE
-    ).update(
+    pledges = Pledge.objects.filter(fan=fan, creator=tip.creator, status=Pledge.Status.ACTIVE)
+    # Only a checkout that names its pledge is that pledge's charge; a one-off
+    # tip of the same amount is not
+    pledge_id = _pledge_id(metadata)
+    if pledge_id is not None:
+        for pledge in pledges.filter(pk=pledge_id):
+            record_charge(pledge)
+    pledges.update(
         next_charge_date=datetime.date.today() + datetime.timedelta(days=30)
     )
 
@@ -122,14 +145,16 @@ def _fire_tip_notifications(tip: Tip) -> None:
     # Always: email + in-app tip-received notification
     tipper = tip.tipper_name or "Anonymous"
     send_tip_received_to_creator(tip)
-    CreatorNotification.objects.create(
-        creator=creator,
-        notification_type=CreatorNotification.Type.TIP_RECEIVED,
+    # Merged with other tips in the same burst (see creators/notifications.py)
+    notify(
+        creator.pk,
+        CreatorNotification.Type.TIP_RECEIVED,
         title=f"New tip — R{tip.amount:.2f} from {tipper}",
         message=(
             f"{tipper} sent you R{tip.amount:.2f}."
             + (f" Message: \"{tip.message[:120]}\"" if tip.message else "")
         ),
+        amount=tip.amount,
     )
 
     completed_tips = creator.tips.filter(status="completed")
@@ -137,9 +162,9 @@ def _fire_tip_notifications(tip: Tip) -> None:
 
     # First tip ever
     if completed_count == 1:
-        CreatorNotification.objects.create(
-            creator=creator,
-            notification_type=CreatorNotification.Type.FIRST_TIP,
+        notify(
+            creator.pk,
+            CreatorNotification.Type.FIRST_TIP,
             title="You got your first tip! 🎉",
             message=f"Congratulations! {tipper} just sent you your first tip of R{tip.amount:.2f}.",
         )
@@ -154,9 +179,9 @@ def _fire_tip_notifications(tip: Tip) -> None:
             notification_type=CreatorNotification.Type.FIRST_THOUSAND
         ).exists()
         if not already_notified:
-            CreatorNotification.objects.create(
-                creator=creator,
-                notification_type=CreatorNotification.Type.FIRST_THOUSAND,
+            notify(
+                creator.pk,
+                CreatorNotification.Type.FIRST_THOUSAND,
                 title="You've earned R1 000! 💰",
                 message="You just crossed R1 000 in total tips. Amazing milestone — keep going!",
             )
@@ -173,7 +198,7 @@ def paystack_webhook(request):
 
     Key events handled:
         charge.success   → Tip completed; stores auth code, updates streak, checks milestones
-        charge.failed    → Tip failed
+        charge.failed    → Tip failed; counted by the card-testing check (tips/risk.py)
         refund.processed → Tip refunded
     """
     payload = request.body
@@ -203,22 +228,29 @@ def paystack_webhook(request):
         if rows:
             tip = Tip.objects.filter(paystack_reference=reference).first()
             if tip:
+                logs.bind(creator_id=tip.creator_id)
+                tip_completed.send(sender=Tip, tip=tip)
                 send_tip_thank_you(tip)
                 _update_streak(tip)
                 _check_milestones(tip)
-                _update_pledge(tip)
+                _update_pledge(tip, data.get("metadata"))
                 _fire_tip_notifications(tip)
 
     elif event_type == "charge.failed":
         # Only mark failed if still pending — never downgrade a completed tip
-        Tip.objects.filter(paystack_reference=reference, status=Tip.Status.PENDING).update(
+        rows = Tip.objects.filter(paystack_reference=reference, status=Tip.Status.PENDING).update(
             status=Tip.Status.FAILED
         )
+        if rows:
+            risk.record_failure(reference)
 
     elif event_type == "refund.processed":
-        Tip.objects.filter(paystack_reference=reference).update(
-            status=Tip.Status.REFUNDED
-        )
+        # Only a completed tip can be refunded — a pending or failed one was never
+        # counted, so tip_refunded must not take it off the creator's totals
+        for tip in Tip.objects.filter(paystack_reference=reference, status=Tip.Status.COMPLETED):
+            rows = Tip.objects.filter(pk=tip.pk, status=Tip.Status.COMPLETED).update(status=Tip.Status.REFUNDED)
+            if rows:
+                tip_refunded.send(sender=Tip, tip=tip)
 
     return HttpResponse(status=200)
 
@@ -248,9 +280,14 @@ def stripe_webhook(request):
 
     if event["type"] == "payment_intent.succeeded":
         intent = event["data"]["object"]
-        Tip.objects.filter(stripe_payment_intent_id=intent["id"]).update(
-            status=Tip.Status.COMPLETED
-        )
+        for tip in Tip.objects.filter(stripe_payment_intent_id=intent["id"]):
+            # Only the delivery that actually flips the row counts the tip (see VerifyTipView._apply_status)
+            rows = Tip.objects.filter(
+                pk=tip.pk, status__in=[Tip.Status.PENDING, Tip.Status.FAILED]
+            ).update(status=Tip.Status.COMPLETED)
+            if rows:
+                tip.status = Tip.Status.COMPLETED
+                tip_completed.send(sender=Tip, tip=tip)
     elif event["type"] == "payment_intent.payment_failed":
         intent = event["data"]["object"]
         Tip.objects.filter(stripe_payment_intent_id=intent["id"]).update(
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("platform", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="platformuser",
+            index=models.Index(fields=["platform", "-created_at", "-id"], name="platform_user_recent_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="platformuser",
+            index=models.Index(fields=["platform", "external_id"], name="platform_user_external_idx"),
+        ),
+    ]
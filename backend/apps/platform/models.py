@@ -102,6 +102,12 @@ class PlatformUser(models.Model):
     class Meta:
         unique_together = [("platform", "user")]
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination of a platform's users (newest first)
+            models.Index(fields=["platform", "-created_at", "-id"], name="platform_user_recent_idx"),
+            # Lookup by the integrator's own ID
+            models.Index(fields=["platform", "external_id"], name="platform_user_external_idx"),
+        ]
 
     def __str__(self):
         return f"{self.platform.name} → {self.user.email}"
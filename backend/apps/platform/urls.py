@@ -8,6 +8,7 @@ from .views import (
     PlatformCreatorListView,
     PlatformDocumentUploadView,
     PlatformTipView,
+    PlatformUserBulkUpsertView,
     PlatformUserListCreateView,
 )
 
@@ -18,6 +19,7 @@ urlpatterns = [
     # Platform key authenticated
     path("me/",                           MyPlatformView.as_view(),               name="platform-me"),
     path("users/",                        PlatformUserListCreateView.as_view(),   name="platform-users"),
+    path("users/bulk/",                   PlatformUserBulkUpsertView.as_view(),   name="platform-users-bulk"),
     path("creators/",                     PlatformCreatorListView.as_view(),      name="platform-creators"),
     path("tips/",                         PlatformTipView.as_view(),              name="platform-tips"),
     # Admin
@@ -1,15 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status
-from rest_framework.parsers import MultiPartParser
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.creators.models import CreatorProfile
 from apps.creators.serializers import CreatorProfileSerializer
+from core import uploads
+from core.pagination import HeaderKeysetPagination
 
 from .models import Platform, PlatformDocument, PlatformUser
 from .serializers import PlatformDocumentSerializer, PlatformSerializer, PlatformUserSerializer
 
+# Upper bound on rows accepted by a single bulk-link request
+BULK_USERS_MAX = 5000
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def _get_platform_from_auth(request) -> Platform:
@@ -47,20 +55,21 @@ class PlatformDocumentUploadView(APIView):
     """POST /api/platform/apply/<pk>/documents/ — upload doc for pending application."""
 
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def post(self, request, pk):
         platform = get_object_or_404(Platform, pk=pk, owner=request.user)
 
         doc_type = request.data.get("doc_type", "").strip()
-        file_obj = request.FILES.get("file")
 
         if not doc_type:
             return Response({"detail": "doc_type is required."}, status=status.HTTP_400_BAD_REQUEST)
         if doc_type not in [c[0] for c in PlatformDocument.DocType.choices]:
             return Response({"detail": f"Invalid doc_type: {doc_type}."}, status=status.HTTP_400_BAD_REQUEST)
+        # A finished resumable upload (core/uploads.py) stands in for the multipart file
+        file_obj = request.FILES.get("file") or uploads.claim(request, "platform-document", request.data.get("upload_id"))
         if not file_obj:
-            return Response({"detail": "file is required."}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({"detail": "file or a completed upload_id is required."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Replace existing document of same type
         PlatformDocument.objects.filter(platform=platform, doc_type=doc_type).delete()
@@ -83,9 +92,20 @@ class MyPlatformView(APIView):
         return Response(PlatformSerializer(platform, context={"request": request}).data)
 
 
+class PlatformUserPagination(HeaderKeysetPagination):
+    """
+    Newest-first cursor over (platform, -created_at, -id) — see platform_user_recent_idx.
+    Integrations expect a bare list; further pages via ``Link: rel="next"``.
+    """
+
+    page_size = 100
+    max_page_size = 1000
+
+
 class PlatformUserListCreateView(APIView):
     """
-    GET /api/platform/users/ — list end-users on this platform.
+    GET /api/platform/users/ — list end-users on this platform (cursor in the Link header).
+                               ?external_id=<id> looks up a single mapping.
     POST /api/platform/users/ — register a user on this platform.
     """
 
@@ -93,8 +113,13 @@ class PlatformUserListCreateView(APIView):
         if not isinstance(request.auth, Platform):
             return Response({"detail": "Platform key required."}, status=status.HTTP_403_FORBIDDEN)
         platform = _get_platform_from_auth(request)
-        qs = platform.platform_users.select_related("user").order_by("-created_at")
-        return Response(PlatformUserSerializer(qs, many=True).data)
+        qs = platform.platform_users.select_related("user")
+        external_id = request.query_params.get("external_id", "").strip()
+        if external_id:
+            qs = qs.filter(external_id=external_id)
+        paginator = PlatformUserPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response(PlatformUserSerializer(page, many=True).data)
 
     def post(self, request):
         if not isinstance(request.auth, Platform):
@@ -105,7 +130,6 @@ class PlatformUserListCreateView(APIView):
         email = request.data.get("email", "").strip()
         external_id = request.data.get("external_id", "").strip()
 
-        from django.contrib.auth import get_user_model
         User = get_user_model()
 
         # Lookup by user_id or email
@@ -134,13 +158,131 @@ class PlatformUserListCreateView(APIView):
         )
 
 
+class PlatformUserBulkUpsertView(APIView):
+    """
+    POST /api/platform/users/bulk/ — link many users to this platform in one call.
+
+    Request body:
+        { "users": [ {"user_id": 12, "external_id": "abc"},
+                     {"email": "fan@example.com", "external_id": "def"}, ... ] }
+
+    All rows are resolved with a single ``IN`` query and written with one
+    upsert on (platform, user). Each input row gets a result in ``results``
+    (same order) with status ``created``, ``updated``, ``unchanged``,
+    ``not_found``, ``duplicate`` or ``invalid``.
+    """
+
+    def post(self, request):
+        if not isinstance(request.auth, Platform):
+            return Response({"detail": "Platform key required."}, status=status.HTTP_403_FORBIDDEN)
+        platform = _get_platform_from_auth(request)
+
+        rows = request.data.get("users")
+        if not isinstance(rows, list) or not rows:
+            return Response({"detail": "users must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > BULK_USERS_MAX:
+            return Response(
+                {"detail": f"At most {BULK_USERS_MAX} users per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results: list[dict | None] = [None] * len(rows)
+        wanted = {}  # row index → ("id" | "email", key, external_id)
+        ids, emails = set(), set()
+
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                results[i] = {"index": i, "status": "invalid", "detail": "Each row must be an object."}
+                continue
+            user_id = row.get("user_id")
+            email = str(row.get("email") or "").strip()
+            external_id = str(row.get("external_id") or "").strip()
+            if len(external_id) > 200:
+                results[i] = {"index": i, "status": "invalid", "detail": "external_id is too long."}
+            elif user_id not in (None, ""):
+                try:
+                    user_id = int(user_id)
+                except (TypeError, ValueError):
+                    results[i] = {"index": i, "status": "invalid", "detail": "user_id must be an integer."}
+                    continue
+                ids.add(user_id)
+                wanted[i] = ("id", user_id, external_id)
+            elif email:
+                emails.add(email)
+                wanted[i] = ("email", email, external_id)
+            else:
+                results[i] = {"index": i, "status": "invalid", "detail": "user_id or email is required."}
+
+        # ── Resolve every referenced user in one query ────────────────
+        User = get_user_model()
+        known_ids, id_by_email = set(), {}
+        if ids or emails:
+            for uid, uemail in User.objects.filter(
+                Q(pk__in=ids) | Q(email__in=emails)
+            ).values_list("id", "email"):
+                known_ids.add(uid)
+                id_by_email[uemail] = uid
+
+        # Last row wins when the same user appears more than once
+        latest = {}  # user_id → row index
+        for i, (kind, key, _) in wanted.items():
+            uid = (key if key in known_ids else None) if kind == "id" else id_by_email.get(key)
+            if uid is None:
+                results[i] = {"index": i, "status": "not_found", "detail": "No user with that id or email."}
+                continue
+            if uid in latest:
+                prev = latest[uid]
+                results[prev] = {
+                    "index": prev, "status": "duplicate", "user_id": uid,
+                    "detail": "Superseded by a later row for the same user.",
+                }
+            latest[uid] = i
+
+        existing = set(
+            PlatformUser.objects.filter(platform=platform, user_id__in=latest)
+            .values_list("user_id", flat=True)
+        )
+
+        # Like the single-user endpoint, a blank external_id never clears an existing one
+        to_write = []
+        for uid, i in latest.items():
+            external_id = wanted[i][2]
+            if uid in existing and not external_id:
+                results[i] = {"index": i, "status": "unchanged", "user_id": uid}
+                continue
+            to_write.append((i, PlatformUser(platform=platform, user_id=uid, external_id=external_id)))
+
+        with transaction.atomic():
+            PlatformUser.objects.bulk_create(
+                [obj for _, obj in to_write],
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["platform", "user"],
+                update_fields=["external_id"],
+            )
+
+        for i, obj in to_write:
+            results[i] = {
+                "index": i,
+                "status": "updated" if obj.user_id in existing else "created",
+                "id": obj.pk,
+                "user_id": obj.user_id,
+                "external_id": obj.external_id,
+            }
+
+        summary = {}
+        for r in results:
+            summary[r["status"]] = summary.get(r["status"], 0) + 1
+        return Response({"summary": summary, "results": results})
+
+
 class PlatformCreatorListView(APIView):
     """GET /api/platform/creators/ — public creator list (no platform scoping needed)."""
 
     permission_classes = [permissions.AllowAny]
 
     def get(self, request):
-        qs = CreatorProfile.objects.filter(is_active=True).select_related("user").order_by("-total_tips")[:50]
+        qs = CreatorProfile.objects.filter(is_active=True).select_related("user").order_by("-completed_tip_total", "-id")[:50]
         return Response(CreatorProfileSerializer(qs, many=True, context={"request": request}).data)
 
 
@@ -3,7 +3,7 @@ from django.contrib import admin
 from core.admin_site import admin_site
 
 from .emails import send_dispute_status_update
-from .models import ContactMessage, Dispute
+from .models import ContactMessage, Dispute, EmailSuppression, FanoutJob, OutboundSms
 
 
 @admin.register(ContactMessage, site=admin_site)
@@ -49,3 +49,27 @@ class DisputeAdmin(admin.ModelAdmin):
     @admin.action(description="Mark as Closed")
     def mark_closed(self, request, queryset):
         queryset.update(status=Dispute.Status.CLOSED)
+
+
+@admin.register(EmailSuppression, site=admin_site)
+class EmailSuppressionAdmin(admin.ModelAdmin):
+    list_display  = ("email", "creator", "reason", "created_at")
+    list_filter   = ("reason",)
+    search_fields = ("email",)
+    raw_id_fields = ("creator",)
+
+
+@admin.register(FanoutJob, site=admin_site)
+class FanoutJobAdmin(admin.ModelAdmin):
+    list_display    = ("kind", "object_id", "creator", "status", "enqueued", "suppressed", "created_at", "finished_at")
+    list_filter     = ("status", "kind")
+    raw_id_fields   = ("creator",)
+    readonly_fields = ("cursor", "enqueued", "suppressed", "locked_until", "error", "created_at", "finished_at")
+
+
+@admin.register(OutboundSms, site=admin_site)
+class OutboundSmsAdmin(admin.ModelAdmin):
+    list_display    = ("to_number", "status", "attempts", "created_at", "sent_at")
+    list_filter     = ("status",)
+    search_fields   = ("to_number",)
+    readonly_fields = ("attempts", "last_error", "created_at", "sent_at")
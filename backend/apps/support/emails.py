@@ -9,6 +9,7 @@ import logging
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.utils.html import escape
 
 logger = logging.getLogger(__name__)
 
@@ -816,3 +817,48 @@ def send_dispute_status_update(dispute):
     )
     msg.attach_alternative(html, "text/html")
     msg.send(fail_silently=True)
+
+
+# ─── Supporter fan-out (queued, see fanout.py) ────────────────────────────────
+
+UNSUBSCRIBE_PLACEHOLDER = "%%UNSUBSCRIBE_URL%%"
+
+
+def fanout_content(creator, kind: str, obj) -> tuple[str, str, str]:
+    """
+    ``(subject, text, html)`` for a new-post or milestone update sent to a
+    creator's supporters. Rendered once per job; the per-recipient
+    unsubscribe link replaces UNSUBSCRIBE_PLACEHOLDER.
+    """
+    page_url = f"{_BASE_URL}/creator/{creator.slug}"
+    if kind == "milestone":
+        subject = f"🎯 {creator.display_name} reached a goal: {obj.title}"
+        headline = f"{creator.display_name} just reached “{obj.title}”"
+        blurb = obj.description or "Thanks to supporters like you, this goal is done."
+        cta = "See what's next →"
+    else:
+        subject = f"📝 New from {creator.display_name}: {obj.title}"
+        headline = obj.title
+        blurb = (obj.body[:280] + ("…" if len(obj.body) > 280 else "")) if obj.body else ""
+        cta = "Read the post →"
+
+    # Titles, bodies and names are creator-written: escape them in the HTML part
+    name = escape(creator.display_name)
+    inner = f"""
+<p style="color:#7A9088;font-size:13px;margin:0 0 6px;">{name}</p>
+<h2 style="color:#E2E8F0;margin:0 0 16px;font-size:21px;">{escape(headline)}</h2>
+<p style="font-size:15px;line-height:1.7;color:#E2E8F0;margin:0 0 20px;">{escape(blurb)}</p>
+{_btn(cta, page_url)}
+<p style="font-size:12px;color:#4A6358;margin:28px 0 0;">
+  You're receiving this because you support {name} on TippingJar.
+  <a href="{UNSUBSCRIBE_PLACEHOLDER}" style="color:#4A6358;">Unsubscribe</a>
+</p>
+"""
+    text = (
+        f"{headline}\n\n"
+        f"{blurb}\n\n"
+        f"{page_url}\n\n"
+        f"— The TippingJar Team\n\n"
+        f"Unsubscribe from {creator.display_name}'s updates: {UNSUBSCRIBE_PLACEHOLDER}"
+    )
+    return subject, text, _creator_email_wrapper(inner)
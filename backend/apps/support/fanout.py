@@ -0,0 +1,247 @@
+"""
+Supporter fan-out — "new post" / "milestone reached" emails to everyone who
+tipped or pledges to a creator.
+
+    event (post published, milestone achieved)
+        └─► schedule()     FanoutJob row, one per event; a daemon thread is
+                           started after commit — the request returns at once
+    process(job)
+        claim the job      conditional UPDATE with a lease (locked_until), so
+                           the thread and ``manage.py run_fanout`` never race
+        snapshot, once     one UNION query: completed tippers' and active
+                           pledgers' emails, lower-cased, DISTINCT — streamed
+                           into FanoutRecipient rows for this job
+        loop per page:
+            audience page  ``email > cursor`` on the job's snapshot, walking
+                           its (job, email) unique index, FANOUT_BATCH_SIZE rows
+            suppressions   one ``email IN (page)`` lookup on the indexed
+                           EmailSuppression table (global + this creator)
+            enqueue        bulk INSERT into OutboundEmail, advance the cursor
+                           and counters, renew the lease — one transaction
+
+The normalised email mixes a tip's own column with the tipper's account
+email, so no index can serve ``> cursor`` on the live tables and paging
+them re-sorts the whole audience every page. The UNION is scanned once per
+job instead; after that every page costs three indexed statements whatever
+the audience size, and memory is bounded by the page, so a 500k-supporter
+creator is ~500 short pages. The snapshot is dropped when the job is done.
+A run stops after FANOUT_MAX_SECONDS and a crashed run loses at most one page of
+progress; either way the next ``run_fanout`` resumes from the stored cursor.
+Delivery itself is throttled separately by outbox.py.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.core import signing
+from django.db import connections, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce, Lower, NullIf
+from django.utils import timezone
+
+from .emails import _ANON_EMAIL, UNSUBSCRIBE_PLACEHOLDER, _no_reply, fanout_content
+from .models import EmailSuppression, FanoutJob, FanoutRecipient, OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = getattr(settings, "FANOUT_BATCH_SIZE", 1000)
+MAX_SECONDS = getattr(settings, "FANOUT_MAX_SECONDS", 300)
+LEASE_SECONDS = 120
+
+UNSUBSCRIBE_SALT = "support.unsubscribe"
+
+
+# ── Unsubscribe tokens ────────────────────────────────────────────────────────
+
+def unsubscribe_token(email: str, creator_id: int | None) -> str:
+    return signing.dumps({"e": email, "c": creator_id}, salt=UNSUBSCRIBE_SALT, compress=True)
+
+
+def read_unsubscribe_token(token: str) -> tuple[str, int | None]:
+    """``(email, creator_id)``; raises ``signing.BadSignature`` for tampered tokens."""
+    data = signing.loads(token, salt=UNSUBSCRIBE_SALT)
+    return data["e"], data["c"]
+
+
+def unsubscribe_url(email: str, creator_id: int | None) -> str:
+    site = getattr(settings, "SITE_URL", "https://tippingjar.co.za").rstrip("/")
+    return f"{site}/api/support/unsubscribe/{unsubscribe_token(email, creator_id)}/"
+
+
+# ── Audience ──────────────────────────────────────────────────────────────────
+
+def audience(creator_id: int):
+    """Distinct normalised supporter emails of a creator, unordered: completed tippers and active pledgers."""
+    from apps.tips.models import Pledge, Tip
+
+    tips = (
+        Tip.objects.filter(creator_id=creator_id, status=Tip.Status.COMPLETED)
+        .annotate(addr=Lower(Coalesce(NullIf("tipper_email", Value("")), "tipper__email")))
+        .filter(addr__gt="").exclude(addr=_ANON_EMAIL)
+        .order_by().values_list("addr", flat=True)
+    )
+    pledges = (
+        Pledge.objects.filter(creator_id=creator_id, status=Pledge.Status.ACTIVE)
+        .annotate(addr=Lower(Coalesce(NullIf("fan_email", Value("")), "fan__email")))
+        .filter(addr__gt="")
+        .order_by().values_list("addr", flat=True)
+    )
+    # UNION (not UNION ALL) deduplicates across both sources
+    return tips.union(pledges)
+
+
+def snapshot_audience(job, batch_size: int = BATCH_SIZE) -> int:
+    """Copy the job's audience into FanoutRecipient in one pass; safe to repeat after a crash."""
+    rows = []
+    n = 0
+
+    def store():
+        FanoutRecipient.objects.bulk_create(rows, ignore_conflicts=True)
+        FanoutJob.objects.filter(pk=job.pk).update(locked_until=_lease())
+        rows.clear()
+
+    for email in audience(job.creator_id).iterator(chunk_size=batch_size):
+        rows.append(FanoutRecipient(job_id=job.pk, email=email))
+        n += 1
+        if len(rows) >= batch_size:
+            store()
+    store()
+    FanoutJob.objects.filter(pk=job.pk).update(audience_ready=True)
+    return n
+
+
+def audience_page(job_id: int, after: str = "", limit: int = BATCH_SIZE) -> list:
+    """The next ``limit`` emails of a job's audience snapshot after ``after``."""
+    return list(
+        FanoutRecipient.objects.filter(job_id=job_id, email__gt=after)
+        .order_by("email").values_list("email", flat=True)[:limit]
+    )
+
+
+def suppressed(creator_id: int, emails) -> set:
+    return set(
+        EmailSuppression.objects.filter(email__in=emails)
+        .filter(Q(creator__isnull=True) | Q(creator_id=creator_id))
+        .values_list("email", flat=True)
+    )
+
+
+# ── Jobs ──────────────────────────────────────────────────────────────────────
+
+def _source(job):
+    from apps.creators.models import CreatorPost, MilestoneGoal
+
+    model = MilestoneGoal if job.kind == FanoutJob.Kind.MILESTONE else CreatorPost
+    return model.objects.filter(pk=job.object_id).first()
+
+
+def _lease():
+    return timezone.now() + timezone.timedelta(seconds=LEASE_SECONDS)
+
+
+def _claim(job_id) -> bool:
+    now = timezone.now()
+    return bool(
+        FanoutJob.objects.filter(pk=job_id)
+        .filter(Q(status=FanoutJob.Status.PENDING)
+                | Q(status=FanoutJob.Status.RUNNING, locked_until__lt=now))
+        .update(status=FanoutJob.Status.RUNNING, locked_until=_lease())
+    )
+
+
+def _finish(job, status, error="") -> None:
+    FanoutJob.objects.filter(pk=job.pk).update(
+        status=status, locked_until=None, finished_at=timezone.now(), error=error,
+    )
+    if status == FanoutJob.Status.DONE:
+        FanoutRecipient.objects.filter(job_id=job.pk).delete()
+
+
+def process(job_id, max_seconds: float = MAX_SECONDS, batch_size: int = BATCH_SIZE) -> str:
+    """Enqueue the next pages of one job; returns the job's status afterwards."""
+    if not _claim(job_id):
+        return FanoutJob.objects.filter(pk=job_id).values_list("status", flat=True).first() or "missing"
+    job = FanoutJob.objects.select_related("creator").get(pk=job_id)
+    obj = _source(job)
+    if obj is None:
+        # Post or milestone deleted before its announcement went out
+        _finish(job, FanoutJob.Status.DONE)
+        return FanoutJob.Status.DONE
+
+    try:
+        subject, text, html = fanout_content(job.creator, job.kind, obj)
+        from_email = _no_reply()
+        deadline = timezone.now() + timezone.timedelta(seconds=max_seconds)
+        if not job.audience_ready:
+            snapshot_audience(job, batch_size)
+        cursor = job.cursor
+        while True:
+            page = audience_page(job.pk, cursor, batch_size)
+            if not page:
+                _finish(job, FanoutJob.Status.DONE)
+                logger.info("fanout: job %s done", job.pk)
+                return FanoutJob.Status.DONE
+            skip = suppressed(job.creator_id, page)
+            rows = []
+            for email in page:
+                if email in skip:
+                    continue
+                url = unsubscribe_url(email, job.creator_id)
+                rows.append(OutboundEmail(
+                    to_email=email, from_email=from_email, subject=subject, job_id=job.pk,
+                    body=text.replace(UNSUBSCRIBE_PLACEHOLDER, url),
+                    html=html.replace(UNSUBSCRIBE_PLACEHOLDER, url),
+                    headers={"List-Unsubscribe": f"<{url}>",
+                             "List-Unsubscribe-Post": "List-Unsubscribe=One-Click"},
+                ))
+            cursor = page[-1]
+            with transaction.atomic():
+                OutboundEmail.objects.bulk_create(rows, batch_size=500)
+                FanoutJob.objects.filter(pk=job.pk).update(
+                    cursor=cursor, enqueued=F("enqueued") + len(rows),
+                    suppressed=F("suppressed") + len(page) - len(rows), locked_until=_lease(),
+                )
+            if timezone.now() >= deadline:
+                # Hand back; the next run resumes from the cursor
+                FanoutJob.objects.filter(pk=job.pk).update(status=FanoutJob.Status.PENDING, locked_until=None)
+                return FanoutJob.Status.PENDING
+    except Exception as exc:
+        logger.exception("fanout: job %s failed: %s", job.pk, exc)
+        _finish(job, FanoutJob.Status.FAILED, str(exc)[:1000])
+        return FanoutJob.Status.FAILED
+
+
+def _run_in_background(job_id) -> None:
+    def run():
+        try:
+            process(job_id)
+        except Exception as exc:
+            logger.exception("fanout: background run of job %s failed: %s", job_id, exc)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def schedule(creator_id: int, kind: str, object_id: int) -> FanoutJob | None:
+    """Record the event once and start enqueueing after the surrounding transaction commits."""
+    job, created = FanoutJob.objects.get_or_create(
+        kind=kind, object_id=object_id, defaults={"creator_id": creator_id},
+    )
+    if not created:
+        return None
+    transaction.on_commit(lambda: _run_in_background(job.pk))
+    return job
+
+
+def pending_jobs():
+    """Jobs waiting for (or abandoned mid-) fan-out, oldest first."""
+    return (
+        FanoutJob.objects.filter(
+            Q(status=FanoutJob.Status.PENDING)
+            | Q(status=FanoutJob.Status.RUNNING, locked_until__lt=timezone.now())
+        )
+        .order_by("created_at")
+        .values_list("id", flat=True)
+    )
@@ -0,0 +1,20 @@
+"""
+Management command: purge_rate_limits
+=====================================
+Delete expired RateLimitCounter rows. Only needed with
+RATE_LIMIT_BACKEND=database; cache-backed counters expire by themselves.
+
+Run hourly via cron:
+  0 * * * *  python manage.py purge_rate_limits
+"""
+from django.core.management.base import BaseCommand
+
+from core.ratelimit import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete expired rate-limit counters."
+
+    def handle(self, *args, **options):
+        n = purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {n} expired rate-limit counter(s)."))
@@ -0,0 +1,23 @@
+"""
+Management command: purge_uploads
+=================================
+Delete expired resumable-upload sessions (core/uploads.py) together with
+their stored chunks and any assembled file that was never attached, and
+assemble sessions whose assembler died with its worker.
+
+Run hourly via cron:
+  30 * * * *  python manage.py purge_uploads
+"""
+from django.core.management.base import BaseCommand
+
+from core.uploads import purge_expired, reassemble_stale
+
+
+class Command(BaseCommand):
+    help = "Delete expired upload sessions and their chunks; finish stalled assemblies."
+
+    def handle(self, *args, **options):
+        n = purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {n} expired upload session(s)."))
+        n = reassemble_stale()
+        self.stdout.write(self.style.SUCCESS(f"Assembled {n} stalled upload session(s)."))
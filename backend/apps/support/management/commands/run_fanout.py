@@ -0,0 +1,30 @@
+"""
+Management command: run_fanout
+==============================
+Enqueue supporter emails for pending fan-out jobs (new posts, milestones).
+Jobs are normally started in the background when the event happens; this
+picks up any that were interrupted, hit their time budget or whose worker
+died, resuming each from its stored cursor.
+
+Run every few minutes via cron:
+  */5 * * * *  python manage.py run_fanout
+"""
+from django.core.management.base import BaseCommand
+
+from apps.support.fanout import BATCH_SIZE, MAX_SECONDS, pending_jobs, process
+
+
+class Command(BaseCommand):
+    help = "Resume pending supporter fan-out jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS, help="Time budget per job.")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        results = {}
+        for job_id in list(pending_jobs()):
+            status = process(job_id, max_seconds=options["max_seconds"], batch_size=options["batch_size"])
+            results[status] = results.get(status, 0) + 1
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(results.items())) or "nothing to do"
+        self.stdout.write(self.style.SUCCESS(f"Fan-out: {summary}."))
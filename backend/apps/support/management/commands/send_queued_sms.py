@@ -0,0 +1,26 @@
+"""
+Management command: send_queued_sms
+===================================
+Send queued bulk SMS (OutboundSms) as multi-recipient SMSPortal calls,
+throttled to SMS_SEND_RATE recipients per second. Failed batches are
+retried on later runs up to three attempts.
+
+Run every minute via cron (the time budget keeps runs from overlapping):
+  * * * * *  python manage.py send_queued_sms --max-seconds 55
+"""
+from django.core.management.base import BaseCommand
+
+from apps.support.sms_outbox import BATCH_SIZE, SEND_RATE, drain
+
+
+class Command(BaseCommand):
+    help = "Send queued bulk SMS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-seconds", type=float, default=None, help="Stop after this long.")
+        parser.add_argument("--rate", type=float, default=SEND_RATE, help="Recipients per second (0 = unthrottled).")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        n = drain(max_seconds=options["max_seconds"], rate=options["rate"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Attempted {n} queued SMS."))
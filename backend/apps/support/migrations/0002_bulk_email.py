@@ -0,0 +1,86 @@
+# Generated by Django 5.0.4 on 2026-10-19 14:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0019_creatorpost_recent_idx'),
+        ('support', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FanoutJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('new_post', 'New post'), ('milestone', 'Milestone reached')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('cursor', models.CharField(blank=True, default='', max_length=254)),
+                ('enqueued', models.PositiveIntegerField(default=0)),
+                ('suppressed', models.PositiveIntegerField(default=0)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fanout_jobs', to='creators.creatorprofile')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to_email', models.EmailField(max_length=254)),
+                ('from_email', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('html', models.TextField(blank=True)),
+                ('headers', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='emails', to='support.fanoutjob')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EmailSuppression',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('reason', models.CharField(choices=[('unsubscribed', 'Unsubscribed'), ('bounced', 'Bounced'), ('complaint', 'Spam complaint')], default='unsubscribed', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='email_suppressions', to='creators.creatorprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['email'], name='email_suppression_email_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='emailsuppression',
+            constraint=models.UniqueConstraint(condition=models.Q(('creator__isnull', False)), fields=('email', 'creator'), name='email_suppression_creator_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='emailsuppression',
+            constraint=models.UniqueConstraint(condition=models.Q(('creator__isnull', True)), fields=('email',), name='email_suppression_global_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='fanoutjob',
+            index=models.Index(fields=['status', 'created_at'], name='fanout_job_status_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='fanoutjob',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='fanout_job_event_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='outboundemail',
+            index=models.Index(fields=['status', 'id'], name='outbound_email_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-19 15:33
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('support', '0004_rate_limit_counter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('purpose', models.CharField(choices=[('kyc', 'Creator KYC document'), ('enterprise-document', 'Enterprise document'), ('platform-document', 'Platform document'), ('post-media', 'Post media')], max_length=20)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField()),
+                ('sha256', models.CharField(blank=True, max_length=64)),
+                ('offset', models.BigIntegerField(default=0)),
+                ('parts', models.JSONField(blank=True, default=list)),
+                ('file', models.CharField(blank=True, help_text='Storage name of the assembled file.', max_length=255)),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('assembling', 'Assembling'), ('complete', 'Complete'), ('attached', 'Attached')], default='uploading', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-19 15:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('support', '0006_upload_session_assembling'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fanoutjob',
+            name='audience_ready',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='FanoutRecipient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.CharField(max_length=254)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='support.fanoutjob')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='fanoutrecipient',
+            constraint=models.UniqueConstraint(fields=('job', 'email'), name='fanout_recipient_unique'),
+        ),
+    ]
@@ -83,3 +83,200 @@ class Dispute(models.Model):
     def tracking_url(self):
         site = getattr(settings, "SITE_URL", "https://tippingjar.co.za")
         return f"{site}/dispute/{self.token}"
+
+
+# ── Bulk email (see outbox.py / fanout.py) ────────────────────────────────────
+
+class EmailSuppression(models.Model):
+    """
+    Addresses that must not receive bulk mail. ``creator`` set: unsubscribed
+    from that creator's updates only; empty: from all bulk mail.
+    """
+
+    class Reason(models.TextChoices):
+        UNSUBSCRIBED = "unsubscribed", "Unsubscribed"
+        BOUNCED      = "bounced",      "Bounced"
+        COMPLAINT    = "complaint",    "Spam complaint"
+
+    email      = models.EmailField()  # always stored lower-cased
+    creator    = models.ForeignKey(
+        "creators.CreatorProfile", on_delete=models.CASCADE,
+        null=True, blank=True, related_name="email_suppressions",
+    )
+    reason     = models.CharField(max_length=20, choices=Reason.choices, default=Reason.UNSUBSCRIBED)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email", "creator"], condition=models.Q(creator__isnull=False),
+                name="email_suppression_creator_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["email"], condition=models.Q(creator__isnull=True),
+                name="email_suppression_global_unique",
+            ),
+        ]
+        indexes = [models.Index(fields=["email"], name="email_suppression_email_idx")]
+
+    def __str__(self):
+        scope = f"creator {self.creator_id}" if self.creator_id else "all"
+        return f"{self.email} suppressed ({scope})"
+
+
+class FanoutJob(models.Model):
+    """One event (new post, milestone reached) being fanned out to a creator's supporters."""
+
+    class Kind(models.TextChoices):
+        NEW_POST  = "new_post",  "New post"
+        MILESTONE = "milestone", "Milestone reached"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE    = "done",    "Done"
+        FAILED  = "failed",  "Failed"
+
+    creator      = models.ForeignKey(
+        "creators.CreatorProfile", on_delete=models.CASCADE, related_name="fanout_jobs"
+    )
+    kind         = models.CharField(max_length=20, choices=Kind.choices)
+    object_id    = models.PositiveBigIntegerField()
+    status       = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    # Last audience email enqueued — the keyset cursor a resumed run continues from
+    cursor       = models.CharField(max_length=254, blank=True, default="")
+    # Set once the audience has been copied into FanoutRecipient
+    audience_ready = models.BooleanField(default=False)
+    enqueued     = models.PositiveIntegerField(default=0)
+    suppressed   = models.PositiveIntegerField(default=0)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    error        = models.TextField(blank=True)
+    created_at   = models.DateTimeField(auto_now_add=True)
+    finished_at  = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="fanout_job_event_unique"),
+        ]
+        indexes = [models.Index(fields=["status", "created_at"], name="fanout_job_status_idx")]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id} → creator {self.creator_id} [{self.status}]"
+
+
+class FanoutRecipient(models.Model):
+    """One normalised supporter email of a FanoutJob, snapshotted when the job starts."""
+
+    job   = models.ForeignKey(FanoutJob, on_delete=models.CASCADE, related_name="recipients")
+    email = models.CharField(max_length=254)
+
+    class Meta:
+        # Also the index the job's keyset pages walk: job = ? AND email > cursor ORDER BY email
+        constraints = [models.UniqueConstraint(fields=["job", "email"], name="fanout_recipient_unique")]
+
+    def __str__(self):
+        return f"{self.email} (job {self.job_id})"
+
+
+class OutboundEmail(models.Model):
+    """Queued bulk email, delivered in throttled batches by ``manage.py send_queued_emails``."""
+
+    class Status(models.TextChoices):
+        QUEUED  = "queued",  "Queued"
+        SENDING = "sending", "Sending"
+        SENT    = "sent",    "Sent"
+        FAILED  = "failed",  "Failed"
+
+    to_email   = models.EmailField()
+    from_email = models.EmailField()
+    subject    = models.CharField(max_length=255)
+    body       = models.TextField()
+    html       = models.TextField(blank=True)
+    headers    = models.JSONField(default=dict, blank=True)
+    job        = models.ForeignKey(
+        FanoutJob, on_delete=models.SET_NULL, null=True, blank=True, related_name="emails"
+    )
+    status     = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    attempts   = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at    = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "id"], name="outbound_email_queue_idx")]
+
+    def __str__(self):
+        return f"{self.to_email}: {self.subject} [{self.status}]"
+
+
+class OutboundSms(models.Model):
+    """Queued bulk SMS, sent as multi-recipient batches by ``manage.py send_queued_sms``."""
+
+    class Status(models.TextChoices):
+        QUEUED  = "queued",  "Queued"
+        SENDING = "sending", "Sending"
+        SENT    = "sent",    "Sent"
+        FAILED  = "failed",  "Failed"
+
+    to_number  = models.CharField(max_length=20)
+    message    = models.TextField()
+    status     = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    attempts   = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at    = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "id"], name="outbound_sms_queue_idx")]
+
+    def __str__(self):
+        return f"{self.to_number} [{self.status}]"
+
+
+class RateLimitCounter(models.Model):
+    """One fixed-window hit counter of core/ratelimit.py when RATE_LIMIT_BACKEND is "database"."""
+
+    key        = models.CharField(max_length=120, unique=True)
+    count      = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key} = {self.count}"
+
+
+class UploadSession(models.Model):
+    """A resumable chunked upload (core/uploads.py), attached to a document or post once complete."""
+
+    class Purpose(models.TextChoices):
+        KYC                 = "kyc",                 "Creator KYC document"
+        ENTERPRISE_DOCUMENT = "enterprise-document", "Enterprise document"
+        PLATFORM_DOCUMENT   = "platform-document",   "Platform document"
+        POST_MEDIA          = "post-media",          "Post media"
+
+    class Status(models.TextChoices):
+        UPLOADING  = "uploading",  "Uploading"
+        ASSEMBLING = "assembling", "Assembling"
+        COMPLETE   = "complete",   "Complete"
+        ATTACHED   = "attached",   "Attached"
+        FAILED     = "failed",     "Failed checksum"
+
+    id         = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user       = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="upload_sessions")
+    purpose    = models.CharField(max_length=20, choices=Purpose.choices)
+    filename   = models.CharField(max_length=255)
+    size       = models.BigIntegerField()
+    # Whole-file SHA-256: expected (hex, optional) until complete, then the computed digest
+    sha256     = models.CharField(max_length=64, blank=True)
+    offset     = models.BigIntegerField(default=0)
+    # Storage names of the received chunks, in order
+    parts      = models.JSONField(default=list, blank=True)
+    file       = models.CharField(max_length=255, blank=True, help_text="Storage name of the assembled file.")
+    status     = models.CharField(max_length=10, choices=Status.choices, default=Status.UPLOADING)
+    # Last sign of life from the assembler; a stale one means its worker died
+    assembling_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size}) [{self.status}]"
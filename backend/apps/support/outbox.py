@@ -0,0 +1,125 @@
+"""
+Queued bulk email.
+
+Bulk mail (fan-out notifications, see fanout.py) is never sent from a
+request. It is written to ``OutboundEmail`` and delivered by
+``manage.py send_queued_emails``:
+
+    OutboundEmail (queued)
+        ──claim EMAIL_SEND_BATCH rows (conditional UPDATE → sending)──►
+    one SMTP connection, ``send_messages`` per batch
+        ──► sent  /  queued again (attempts < MAX_ATTEMPTS)  /  failed
+
+Throughput is capped at EMAIL_SEND_RATE messages per second so the relay
+is never flooded, however large the backlog. Claims are conditional
+updates, so several senders may run side by side; rows stuck in
+``sending`` by a crashed sender are re-queued after STALE_SECONDS.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = getattr(settings, "EMAIL_SEND_BATCH", 100)
+SEND_RATE = getattr(settings, "EMAIL_SEND_RATE", 20)
+MAX_ATTEMPTS = 3
+STALE_SECONDS = 15 * 60
+
+
+def _claim(limit: int) -> list:
+    ids = list(
+        OutboundEmail.objects.filter(status=OutboundEmail.Status.QUEUED)
+        .order_by("id").values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+    claimed = timezone.now()
+    OutboundEmail.objects.filter(id__in=ids, status=OutboundEmail.Status.QUEUED).update(
+        status=OutboundEmail.Status.SENDING, attempts=F("attempts") + 1, sent_at=claimed,
+    )
+    # Only the rows this sender flipped (sent_at doubles as the claim stamp until delivery)
+    return list(OutboundEmail.objects.filter(
+        id__in=ids, status=OutboundEmail.Status.SENDING, sent_at=claimed,
+    ))
+
+
+def _message(row, connection) -> EmailMultiAlternatives:
+    msg = EmailMultiAlternatives(
+        subject=row.subject, body=row.body, from_email=row.from_email,
+        to=[row.to_email], headers=row.headers or None, connection=connection,
+    )
+    if row.html:
+        msg.attach_alternative(row.html, "text/html")
+    return msg
+
+
+def requeue_stale() -> int:
+    """Put rows abandoned in ``sending`` by a crashed sender back in the queue."""
+    cutoff = timezone.now() - timezone.timedelta(seconds=STALE_SECONDS)
+    return OutboundEmail.objects.filter(
+        status=OutboundEmail.Status.SENDING, sent_at__lt=cutoff,
+    ).update(status=OutboundEmail.Status.QUEUED, sent_at=None)
+
+
+def deliver_batch(limit: int = BATCH_SIZE, connection=None) -> int:
+    """Send up to ``limit`` queued emails over one connection; returns how many were attempted."""
+    rows = _claim(limit)
+    if not rows:
+        return 0
+    connection = connection or get_connection()
+    sent, failed = [], []
+    try:
+        connection.open()
+        for row in rows:
+            try:
+                # One message at a time so a rejected address does not fail the batch
+                if connection.send_messages([_message(row, connection)]):
+                    sent.append(row.id)
+                else:
+                    failed.append((row, "not accepted"))
+            except Exception as exc:
+                failed.append((row, str(exc)))
+    except Exception as exc:
+        # Connection-level failure: everything not yet sent is retried
+        done = set(sent) | {row.id for row, _ in failed}
+        failed.extend((row, str(exc)) for row in rows if row.id not in done)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    if sent:
+        OutboundEmail.objects.filter(id__in=sent).update(
+            status=OutboundEmail.Status.SENT, sent_at=timezone.now(), last_error="",
+        )
+    for row, error in failed:
+        status = OutboundEmail.Status.FAILED if row.attempts >= MAX_ATTEMPTS else OutboundEmail.Status.QUEUED
+        OutboundEmail.objects.filter(id=row.id).update(status=status, sent_at=None, last_error=error[:500])
+    if failed:
+        logger.warning("outbox: %d of %d emails failed", len(failed), len(rows))
+    return len(rows)
+
+
+def drain(max_seconds: float | None = None, rate: float = SEND_RATE, batch_size: int = BATCH_SIZE) -> int:
+    """Deliver the queue at no more than ``rate`` messages per second; returns messages attempted."""
+    requeue_stale()
+    started = time.monotonic()
+    total = 0
+    while max_seconds is None or time.monotonic() - started < max_seconds:
+        batch_started = time.monotonic()
+        n = deliver_batch(batch_size)
+        if not n:
+            break
+        total += n
+        if rate:
+            time.sleep(max(0.0, n / rate - (time.monotonic() - batch_started)))
+    return total
@@ -3,12 +3,32 @@ SMSPortal integration helpers.
 
 Sending pattern:
     GET {SMS_PORTAL_ENDPOINT}?Type=sendparam&username=...&password=...&numto=...&data1=...
+    (``numto`` takes a comma-separated list: one call, one message, many recipients)
 
 Credits check:
     GET {SMS_PORTAL_ENDPOINT}?Type=credits&username=...&password=...
+
+Two lanes share one keep-alive ``requests.Session``:
+
+    priority  ``send_otp_via_sms``  inline, SMS_OTP_TIMEOUT seconds end to end
+              (one retry on a dropped connection if the budget allows) — a
+              login never waits 30 s on a slow gateway
+    batch     ``sms_outbox.enqueue``  bulk/admin messages, queued in
+              OutboundSms and sent by ``send_batch`` — SMS_SEND_BATCH
+              recipients of the same text per call
+
+Every successful send updates the locally tracked credit balance
+(core/stats.py ``record_sms_spend``), so the admin dashboard never calls
+SMSPortal to show it; ``refresh_platform_stats`` reconciles it against
+``Type=credits`` every SMS_CREDITS_TTL.
+
+Point SMS_PORTAL_ENDPOINT at a local stub to exercise all of this offline.
 """
 
 import logging
+import math
+import re
+import time
 
 import requests
 from django.conf import settings
@@ -19,59 +39,138 @@ _ENDPOINT = lambda: getattr(settings, "SMS_PORTAL_ENDPOINT", "https://api.smspor
 _USER = lambda: getattr(settings, "SMS_PORTAL_USERNAME", "")
 _PASS = lambda: getattr(settings, "SMS_PORTAL_PASSWORD", "")
 
+OTP_TIMEOUT = getattr(settings, "SMS_OTP_TIMEOUT", 5)
+BATCH_TIMEOUT = 30
+
+_pool: requests.Session | None = None
+
+# "CreditBalance: 1234.56" (pipe format) or <current_credits>1234.56</current_credits> (XML)
+_BALANCE_RE = re.compile(r"(?:Credit\s*Balance\s*:|<current_credits>)\s*(-?[\d.]+)", re.IGNORECASE)
+
+
+def segments(message: str) -> int:
+    """Credits one recipient costs: 160 GSM characters, or 153 per part when concatenated."""
+    return 1 if len(message) <= 160 else math.ceil(len(message) / 153)
+
+
+def _configured() -> bool:
+    return bool(_ENDPOINT() and _USER() and _PASS())
+
+
+def _session() -> requests.Session:
+    # Built on first send rather than at import: most processes never send an SMS
+    global _pool
+    if _pool is None:
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+        _pool = session
+    return _pool
+
+
+def _get(params: dict, timeout) -> str:
+    response = _session().get(
+        _ENDPOINT(), params={"username": _USER(), "password": _PASS(), **params}, timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.text.strip()
+
+
+def _accepted(body: str) -> bool:
+    # SMSPortal returns a pipe-delimited string; check for error code 0 = success
+    return "ErrCode: 0" in body or body.startswith("0|") or "OK" in body.upper()
+
+
+def _reported_balance(body: str) -> float | None:
+    match = _BALANCE_RE.search(body)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+def _send(numbers: list[str], message: str, timeout) -> dict:
+    body = _get({"Type": "sendparam", "numto": ",".join(numbers), "data1": message}, timeout)
+    logger.info("SMSPortal response for %d recipient(s): %s", len(numbers), body[:80])
+    if not _accepted(body):
+        return {"success": False, "error": body}
 
-def send_sms(phone_number: str, message: str) -> dict:
+    from core.stats import record_sms_spend
+
+    record_sms_spend(segments(message) * len(numbers), _reported_balance(body))
+    return {"success": True, "response": body}
+
+
+def send_sms(phone_number: str, message: str, timeout: float = BATCH_TIMEOUT) -> dict:
     """
     Send a single SMS via SMSPortal.
 
     Args:
         phone_number: Recipient number in international format, e.g. "+27821234567".
         message:      Plain-text SMS body (max ~160 chars for single segment).
+        timeout:      Seconds to wait for SMSPortal.
 
     Returns:
         dict with keys ``success`` (bool) and ``response`` (str) or ``error`` (str).
     """
-    endpoint = _ENDPOINT()
-    username = _USER()
-    password = _PASS()
-
-    if not endpoint or not username or not password:
+    if not _configured():
         logger.warning("SMS Portal not configured — skipping SMS to %s", phone_number[:6])
         return {"success": False, "error": "SMS Portal not configured."}
 
-    params = {
-        "Type": "sendparam",
-        "username": username,
-        "password": password,
-        "numto": phone_number,
-        "data1": message,
-    }
-
     try:
-        response = requests.get(endpoint, params=params, timeout=30)
-        response.raise_for_status()
-        body = response.text.strip()
-        logger.info("SMSPortal response for %s: %s", phone_number[:6], body[:80])
-
-        # SMSPortal returns a pipe-delimited string; check for error code 0 = success
-        success = "ErrCode: 0" in body or body.startswith("0|") or "OK" in body.upper()
-        if success:
-            return {"success": True, "response": body}
-        return {"success": False, "error": body}
-
+        return _send([phone_number], message, timeout)
     except requests.RequestException as exc:
         logger.error("SMSPortal send_sms error: %s", exc)
         return {"success": False, "error": str(exc)}
 
 
+def send_batch(phone_numbers: list[str], message: str) -> dict:
+    """
+    Send one message to many recipients in a single SMSPortal call.
+
+    Returns the same dict as :func:`send_sms`; the batch succeeds or fails as a whole.
+    """
+    if not _configured():
+        return {"success": False, "error": "SMS Portal not configured."}
+    try:
+        return _send(phone_numbers, message, BATCH_TIMEOUT)
+    except requests.RequestException as exc:
+        logger.error("SMSPortal send_batch error (%d recipients): %s", len(phone_numbers), exc)
+        return {"success": False, "error": str(exc)}
+
+
 def send_otp_via_sms(phone_number: str, otp: str) -> dict:
     """
-    Send a 6-digit OTP via SMS.
+    Send a 6-digit OTP via SMS on the priority lane.
 
-    Returns same dict as :func:`send_sms`.
+    Returns same dict as :func:`send_sms`. Gives up after SMS_OTP_TIMEOUT
+    seconds in total so the OTP views can fall back quickly.
     """
     message = f"Your TippingJar verification code is: {otp}. Valid for 10 minutes. Do not share this code."
-    return send_sms(phone_number, message)
+    if not _configured():
+        logger.warning("SMS Portal not configured — skipping SMS to %s", phone_number[:6])
+        return {"success": False, "error": "SMS Portal not configured."}
+
+    deadline = time.monotonic() + OTP_TIMEOUT
+    error = None
+    for _ in range(2):
+        remaining = deadline - time.monotonic()
+        if error is not None and remaining < 1:
+            break
+        try:
+            return _send([phone_number], message, timeout=remaining)
+        except requests.ConnectionError as exc:
+            # A pooled connection the gateway already closed fails fast; retry once on a fresh one
+            error = exc
+        except requests.RequestException as exc:
+            error = exc
+            break
+    logger.error("SMSPortal OTP send error: %s", error)
+    return {"success": False, "error": str(error)}
 
 
 def get_sms_credits() -> dict:
@@ -81,34 +180,23 @@ def get_sms_credits() -> dict:
     Returns:
         dict with ``success`` (bool), ``credits`` (float or None), ``raw`` (str).
     """
-    endpoint = _ENDPOINT()
-    username = _USER()
-    password = _PASS()
-
-    if not endpoint or not username or not password:
+    if not _configured():
         return {"success": False, "credits": None, "raw": "Not configured"}
 
-    params = {
-        "Type": "credits",
-        "username": username,
-        "password": password,
-    }
-
     try:
-        response = requests.get(endpoint, params=params, timeout=15)
-        response.raise_for_status()
-        body = response.text.strip()
+        body = _get({"Type": "credits"}, 15)
         logger.info("SMSPortal credits response: %s", body[:120])
 
         # Typical response: "ErrCode: 0 | ErrDescription: OK | CreditBalance: 1234.56"
-        credits = None
-        for part in body.split("|"):
-            part = part.strip()
-            if "CreditBalance" in part or "Credit" in part:
-                try:
-                    credits = float(part.split(":")[-1].strip())
-                except ValueError:
-                    pass
+        credits = _reported_balance(body)
+        if credits is None:
+            for part in body.split("|"):
+                part = part.strip()
+                if "Credit" in part:
+                    try:
+                        credits = float(part.split(":")[-1].strip())
+                    except ValueError:
+                        pass
 
         return {"success": True, "credits": credits, "raw": body}
 
@@ -0,0 +1,128 @@
+"""
+Queued bulk SMS.
+
+Admin and other bulk messages go through the batch lane of sms.py: they are
+written to ``OutboundSms`` and sent by ``manage.py send_queued_sms`` (or a
+background drain kicked off when they are enqueued):
+
+    OutboundSms (queued)
+        ──claim SMS_SEND_BATCH rows (conditional UPDATE → sending)──►
+    group by message text
+        ──► one ``sms.send_batch`` call per group (numto=a,b,c…)
+        ──► sent  /  queued again (attempts < MAX_ATTEMPTS)  /  failed
+
+Calls are capped at SMS_SEND_RATE recipients per second. Claims are
+conditional updates, so a cron drain and a background drain may overlap;
+rows stuck in ``sending`` are re-queued after STALE_SECONDS. OTPs never
+come through here — they take the priority lane (``send_otp_via_sms``).
+"""
+
+import datetime
+import logging
+import threading
+import time
+from itertools import groupby
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import sms
+from .models import OutboundSms
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = getattr(settings, "SMS_SEND_BATCH", 100)
+SEND_RATE = getattr(settings, "SMS_SEND_RATE", 50)
+MAX_ATTEMPTS = 3
+STALE_SECONDS = 15 * 60
+# A background drain stops here and leaves the rest to cron
+DRAIN_MAX_SECONDS = 300
+
+
+def enqueue(phone_numbers, message: str) -> int:
+    """Queue ``message`` for each number and start a drain once the transaction commits."""
+    rows = [OutboundSms(to_number=number, message=message) for number in dict.fromkeys(phone_numbers) if number]
+    OutboundSms.objects.bulk_create(rows, batch_size=1000)
+    if rows:
+        transaction.on_commit(_drain_in_background)
+    return len(rows)
+
+
+def _drain_in_background() -> None:
+    def run():
+        try:
+            drain(max_seconds=DRAIN_MAX_SECONDS)
+        except Exception as exc:
+            logger.exception("sms_outbox: background drain failed: %s", exc)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def _claim(limit: int) -> list:
+    ids = list(
+        OutboundSms.objects.filter(status=OutboundSms.Status.QUEUED)
+        .order_by("id").values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+    claimed = timezone.now()
+    OutboundSms.objects.filter(id__in=ids, status=OutboundSms.Status.QUEUED).update(
+        status=OutboundSms.Status.SENDING, attempts=F("attempts") + 1, sent_at=claimed,
+    )
+    # Only the rows this sender flipped (sent_at doubles as the claim stamp until delivery)
+    return list(OutboundSms.objects.filter(
+        id__in=ids, status=OutboundSms.Status.SENDING, sent_at=claimed,
+    ).order_by("message", "id"))
+
+
+def requeue_stale() -> int:
+    """Put rows abandoned in ``sending`` by a crashed sender back in the queue."""
+    cutoff = timezone.now() - datetime.timedelta(seconds=STALE_SECONDS)
+    return OutboundSms.objects.filter(
+        status=OutboundSms.Status.SENDING, sent_at__lt=cutoff,
+    ).update(status=OutboundSms.Status.QUEUED, sent_at=None)
+
+
+def deliver_batch(limit: int = BATCH_SIZE) -> int:
+    """Send up to ``limit`` queued SMS, one gateway call per distinct text; returns how many were attempted."""
+    rows = _claim(limit)
+    failed = 0
+    for message, group in groupby(rows, key=lambda row: row.message):
+        group = list(group)
+        result = sms.send_batch([row.to_number for row in group], message)
+        if result["success"]:
+            OutboundSms.objects.filter(id__in=[row.id for row in group]).update(
+                status=OutboundSms.Status.SENT, sent_at=timezone.now(), last_error="",
+            )
+            continue
+        failed += len(group)
+        error = result.get("error", "")[:500]
+        OutboundSms.objects.filter(id__in=[row.id for row in group if row.attempts < MAX_ATTEMPTS]).update(
+            status=OutboundSms.Status.QUEUED, sent_at=None, last_error=error,
+        )
+        OutboundSms.objects.filter(id__in=[row.id for row in group if row.attempts >= MAX_ATTEMPTS]).update(
+            status=OutboundSms.Status.FAILED, sent_at=None, last_error=error,
+        )
+    if failed:
+        logger.warning("sms_outbox: %d of %d messages failed", failed, len(rows))
+    return len(rows)
+
+
+def drain(max_seconds: float | None = None, rate: float = SEND_RATE, batch_size: int = BATCH_SIZE) -> int:
+    """Send the queue at no more than ``rate`` recipients per second; returns messages attempted."""
+    requeue_stale()
+    started = time.monotonic()
+    total = 0
+    while max_seconds is None or time.monotonic() - started < max_seconds:
+        batch_started = time.monotonic()
+        n = deliver_batch(batch_size)
+        if not n:
+            break
+        total += n
+        if rate:
+            time.sleep(max(0.0, n / rate - (time.monotonic() - batch_started)))
+    return total
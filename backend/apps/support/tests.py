@@ -1,2 +1,378 @@
+import datetime
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.creators.models import CreatorPost, CreatorProfile
+from apps.support import sms, sms_outbox
+from apps.support.emails import fanout_content
+from apps.support.fanout import process
+from apps.support.models import (
+    ContactMessage,
+    EmailSuppression,
+    FanoutJob,
+    OutboundEmail,
+    OutboundSms,
+    RateLimitCounter,
+    UploadSession,
+)
+from apps.support.outbox import drain
+from apps.tips.models import Pledge, Tip
+from apps.users.models import User
+from core import ratelimit, uploads
+from core.stats import SMS_CREDITS_KEY, get_sms_credits_cached, refresh_sms_credits
+
+
+class FanoutTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="writer", email="writer@example.com", password="pass1234", role="creator")
+        self.creator = CreatorProfile.objects.create(user=user, display_name="Writer", slug="writer")
+        other = User.objects.create_user(username="other", email="other@example.com", password="pass1234", role="creator")
+        self.other = CreatorProfile.objects.create(user=other, display_name="Other", slug="other")
+
+        fan = User.objects.create_user(username="fan", email="Ann@Example.com", password="pass1234")
+        completed = Tip.Status.COMPLETED
+        Tip.objects.create(creator=self.creator, tipper=fan, amount=10, status=completed)
+        Tip.objects.create(creator=self.creator, tipper_email="bob@example.com", amount=10, status=completed)
+        Tip.objects.create(creator=self.creator, tipper_email="BOB@example.com", amount=5, status=completed)
+        Tip.objects.create(creator=self.creator, tipper_email="anonymous@tippingjar.co.za", amount=5, status=completed)
+        Tip.objects.create(creator=self.creator, tipper_email="pending@example.com", amount=5)
+        Tip.objects.create(creator=self.creator, tipper_email="cat@example.com", amount=5, status=completed)
+        Tip.objects.create(creator=self.creator, tipper_email="dan@example.com", amount=5, status=completed)
+        Tip.objects.create(creator=self.other, tipper_email="eve@example.com", amount=5, status=completed)
+        Pledge.objects.create(creator=self.creator, fan=fan, amount=20)
+        Pledge.objects.create(creator=self.creator, fan_email="fay@example.com", amount=20)
+        Pledge.objects.create(creator=self.creator, fan_email="gus@example.com", amount=20, status=Pledge.Status.CANCELLED)
+
+        EmailSuppression.objects.create(email="cat@example.com")
+        EmailSuppression.objects.create(email="dan@example.com", creator=self.other)
+        mail.outbox = []
+
+    def test_post_fans_out_to_distinct_unsuppressed_supporters(self):
+        post = CreatorPost.objects.create(creator=self.creator, title="Studio diary")
+        job = FanoutJob.objects.get(kind=FanoutJob.Kind.NEW_POST, object_id=post.pk)
+        # Saving again never schedules a second job
+        post.save()
+        self.assertEqual(FanoutJob.objects.count(), 1)
+
+        # A zero time budget stops after one page; the next run resumes from the cursor
+        self.assertEqual(process(job.pk, max_seconds=0, batch_size=2), FanoutJob.Status.PENDING)
+        # The audience was snapshotted once; later supporters are not in this job
+        self.assertEqual(job.recipients.count(), 5)
+        Tip.objects.create(creator=self.creator, tipper_email="zed@example.com", amount=5, status=Tip.Status.COMPLETED)
+        self.assertEqual(process(job.pk, batch_size=2), FanoutJob.Status.DONE)
+        self.assertFalse(job.recipients.exists())
+
+        job.refresh_from_db()
+        recipients = sorted(OutboundEmail.objects.values_list("to_email", flat=True))
+        self.assertEqual(recipients, ["ann@example.com", "bob@example.com", "dan@example.com", "fay@example.com"])
+        self.assertEqual((job.enqueued, job.suppressed), (4, 1))
+        self.assertEqual(process(job.pk), FanoutJob.Status.DONE)
+        self.assertEqual(OutboundEmail.objects.count(), 4)
+
+    def test_queue_delivery_and_unsubscribe(self):
+        post = CreatorPost.objects.create(creator=self.creator, title="Studio diary")
+        process(FanoutJob.objects.get(object_id=post.pk).pk)
+
+        self.assertEqual(drain(rate=0, batch_size=3), 4)
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists())
+        self.assertEqual(len(mail.outbox), 4)
+        message = next(m for m in mail.outbox if m.to == ["bob@example.com"])
+        url = message.extra_headers["List-Unsubscribe"].strip("<>")
+        path = url[url.index("/api/"):]
+
+        # Following the link (or a scanner prefetching it) only asks
+        res = self.client.get(path)
+        self.assertEqual(res.status_code, 200)
+        self.assertContains(res, '<form method="post">')
+        self.assertFalse(EmailSuppression.objects.filter(email="bob@example.com").exists())
+
+        res = self.client.post(path)
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(EmailSuppression.objects.filter(email="bob@example.com", creator=self.creator).exists())
+        self.assertEqual(self.client.post(path).status_code, 200)
+        self.assertEqual(self.client.get(path[:-5] + "xxxx/").status_code, 400)
+
+        second = CreatorPost.objects.create(creator=self.creator, title="Another")
+        process(FanoutJob.objects.get(object_id=second.pk).pk)
+        self.assertFalse(OutboundEmail.objects.filter(job__object_id=second.pk, to_email="bob@example.com").exists())
+
+
+    def test_creator_text_is_escaped_in_the_html_part(self):
+        self.creator.display_name = "Writer <b>"
+        post = CreatorPost(creator=self.creator, title="<script>alert(1)</script>", body="Tom & Jerry")
+        subject, text, html = fanout_content(self.creator, "post", post)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", html)
+        self.assertIn("Tom &amp; Jerry", html)
+        self.assertIn("support Writer &lt;b&gt; on", html)
+        self.assertNotIn("<script>", html)
+        self.assertIn("<script>alert(1)</script>", text)
+
+class _SmsPortalStub(BaseHTTPRequestHandler):
+    """Local SMSPortal: records each call, replies with ``reply`` after ``delay`` seconds."""
+
+    calls: list = []
+    reply = "ErrCode: 0 | ErrDescription: OK"
+    delay = 0.0
+
+    def do_GET(self):
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        type(self).calls.append(params)
+        time.sleep(self.delay)
+        body = ("ErrCode: 0 | CreditBalance: 90" if params["Type"] == "credits" else self.reply).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SmsTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _SmsPortalStub)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.settings = override_settings(
+            SMS_PORTAL_ENDPOINT=f"http://127.0.0.1:{cls.server.server_port}/http5.aspx",
+            SMS_PORTAL_USERNAME="user", SMS_PORTAL_PASSWORD="secret",
+        )
+        cls.settings.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _SmsPortalStub.calls = []
+        _SmsPortalStub.reply, _SmsPortalStub.delay = "ErrCode: 0 | ErrDescription: OK", 0.0
+        cache.clear()
+
+    def test_bulk_messages_batch_per_text_and_debit_local_balance(self):
+        cache.set(SMS_CREDITS_KEY, {"success": True, "credits": 100.0, "raw": "", "fetched_at": None})
+        self.assertEqual(sms_outbox.enqueue(["+27820000001", "+27820000002", "+27820000001", ""], "Hello"), 2)
+        sms_outbox.enqueue(["+27820000003"], "x" * 200)
+
+        self.assertEqual(sms_outbox.drain(rate=0), 3)
+        sends = sorted(_SmsPortalStub.calls, key=lambda c: c["data1"])
+        self.assertEqual([c["numto"] for c in sends], ["+27820000001,+27820000002", "+27820000003"])
+        self.assertFalse(OutboundSms.objects.exclude(status=OutboundSms.Status.SENT).exists())
+
+        # 2 recipients x 1 segment + 1 recipient x 2 segments, without asking SMSPortal
+        self.assertEqual(get_sms_credits_cached()["credits"], 96.0)
+        self.assertEqual(len(_SmsPortalStub.calls), 2)
+        # Reconciliation takes SMSPortal's figure and clears the ledger
+        refresh_sms_credits()
+        self.assertEqual(get_sms_credits_cached()["credits"], 90.0)
+
+    def test_failed_batch_is_retried_then_failed(self):
+        _SmsPortalStub.reply = "ErrCode: 5 | ErrDescription: Insufficient credits"
+        sms_outbox.enqueue(["+27820000001"], "Hello")
+        sms_outbox.drain(rate=0)
+        row = OutboundSms.objects.get()
+        self.assertEqual((row.status, row.attempts), (OutboundSms.Status.FAILED, sms_outbox.MAX_ATTEMPTS))
+        self.assertIn("Insufficient", row.last_error)
+
+    def test_otp_lane_gives_up_within_its_budget(self):
+        self.assertTrue(sms.send_otp_via_sms("+27820000001", "123456")["success"])
+        _SmsPortalStub.delay = 2.0
+        started = time.monotonic()
+        with mock.patch.object(sms, "OTP_TIMEOUT", 0.3):
+            result = sms.send_otp_via_sms("+27820000001", "123456")
+        self.assertFalse(result["success"])
+        self.assertLess(time.monotonic() - started, 1.5)
+
+
+class RateLimitTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _contact(self, email, **extra):
+        body = {"name": "A", "email": email, "subject": "general", "message": "Hello"}
+        return self.client.post(reverse("contact"), body, content_type="application/json", **extra)
+
+    def _limited_by_email(self):
+        for _ in range(3):
+            self.assertEqual(self._contact("spam@example.com").status_code, 201)
+        res = self._contact("Spam@Example.com")
+        self.assertEqual(res.status_code, 429)
+        self.assertGreater(int(res["Retry-After"]), 0)
+        # Other identities are unaffected, and the rejection was not counted against the sender
+        self.assertEqual(self._contact("someone@example.com").status_code, 201)
+        self.assertEqual(ContactMessage.objects.count(), 4)
+
+    def test_cache_backend_limits_per_email_and_counts_rejections(self):
+        self._limited_by_email()
+        counts = ratelimit.fired_counts()
+        self.assertEqual(counts["contact:email"]["last_hour"], 1)
+        self.assertEqual(counts["contact:ip"]["last_24h"], 0)
+
+    @override_settings(RATE_LIMIT_BACKEND="database")
+    def test_database_backend(self):
+        self._limited_by_email()
+        counts = RateLimitCounter.objects.filter(key__startswith="ratelimit:contact:email:").values_list("count", flat=True)
+        self.assertEqual(sorted(counts), [1, 3])
+        rows = RateLimitCounter.objects.count()
+        RateLimitCounter.objects.update(expires_at=timezone.now())
+        self.assertEqual(ratelimit.purge_expired(), rows)
+
+    @override_settings(RATE_LIMITS={"contact:ip": "2/h"})
+    def test_rate_override_and_ip_key(self):
+        self.assertEqual(self._contact("a@example.com").status_code, 201)
+        self.assertEqual(self._contact("b@example.com").status_code, 201)
+        self.assertEqual(self._contact("c@example.com").status_code, 429)
+        self.assertEqual(self._contact("c@example.com", REMOTE_ADDR="10.0.0.2").status_code, 201)
+
+    def test_sliding_window_and_retry_after(self):
+        # 10/min, 30 s into the window: half of the previous window still counts
+        self.assertEqual(ratelimit.retry_after(10, 60, 30, current=10, previous=0), 36)
+        self.assertEqual(ratelimit.retry_after(10, 60, 30, current=4, previous=12), 5)
+        self.assertEqual(ratelimit.parse_rate("5/h"), (5, 3600))
+        with self.assertRaises(ValueError):
+            ratelimit.limit("contact:ip", "email", "5/h")
+
+
+class ResumableUploadTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="uploader", email="up@example.com", password="pass1234", role="creator",
+        )
+        self.profile = CreatorProfile.objects.create(user=self.user, display_name="Up", slug="up")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.data = b"0123456789" * 3
+        # Assemble inline rather than on the background pool
+        submit = mock.patch.object(uploads, "_submit", uploads.assemble)
+        submit.start()
+        self.addCleanup(submit.stop)
+
+    def _start(self, purpose="post-media", **extra):
+        res = self.client.post(
+            reverse("upload-create"),
+            {"purpose": purpose, "filename": "../clip.mp4", "size": len(self.data), **extra},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 201)
+        return res.json()["id"]
+
+    def _append(self, upload_id, offset, chunk, **headers):
+        return self.client.patch(
+            reverse("upload-detail", args=[upload_id]), chunk,
+            content_type="application/octet-stream", headers={"Upload-Offset": str(offset), **headers},
+        )
+
+    def _upload(self, upload_id):
+        for offset in range(0, len(self.data), 12):
+            chunk = self.data[offset:offset + 12]
+            checksum = f"sha256 {hashlib.sha256(chunk).hexdigest()}"
+            self.assertEqual(self._append(upload_id, offset, chunk, **{"Upload-Checksum": checksum}).status_code, 200)
+        return self.client.post(reverse("upload-complete", args=[upload_id]))
+
+    def test_chunks_resume_complete_and_attach_to_a_post_once(self):
+        upload_id = self._start(sha256=hashlib.sha256(self.data).hexdigest())
+        self.assertEqual(self._append(upload_id, 0, self.data[:12]).json()["offset"], 12)
+        # A retried chunk at a stale offset is refused with where to resume
+        res = self._append(upload_id, 0, self.data[:12])
+        self.assertEqual((res.status_code, res.json()["offset"]), (409, 12))
+        self.assertEqual(self.client.get(reverse("upload-detail", args=[upload_id])).json()["offset"], 12)
+
+        self.assertEqual(self._append(upload_id, 12, self.data[12:]).status_code, 200)
+        res = self.client.post(reverse("upload-complete", args=[upload_id]))
+        self.assertEqual(res.json()["status"], "complete")
+        self.assertEqual(default_storage.listdir(f"uploads/{upload_id}")[1], [])
+
+        res = self.client.post(
+            reverse("my-post-list"), {"title": "Clip", "post_type": "video", "upload_id": upload_id},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 201)
+        post = CreatorPost.objects.get(title="Clip")
+        self.assertTrue(post.media_file.name.startswith("posts/clip"))
+        with post.media_file.open("rb") as fh:
+            self.assertEqual(fh.read(), self.data)
+
+        res = self.client.post(
+            reverse("my-post-list"), {"title": "Again", "upload_id": upload_id}, format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+
+    def test_bad_chunks_and_whole_file_checksum_are_rejected(self):
+        upload_id = self._start(sha256="0" * 64)
+        res = self._append(upload_id, 0, self.data[:12], **{"Upload-Checksum": "sha256 " + "0" * 64})
+        self.assertEqual((res.status_code, res.json()["offset"]), (400, 0))
+        with mock.patch.object(uploads, "CHUNK_BYTES", 8):
+            self.assertEqual(self._append(upload_id, 0, self.data[:12]).status_code, 413)
+
+        res = self._upload(upload_id)
+        self.assertEqual((res.status_code, res.json()["status"]), (202, "failed"))
+        self.assertEqual(default_storage.listdir(f"uploads/{upload_id}")[1], [])
+        res = self.client.post(reverse("upload-complete", args=[upload_id]))
+        self.assertEqual(res.status_code, 400)
+
+    def test_kyc_document_from_upload_and_expired_sessions_purged(self):
+        upload_id = self._start("kyc")
+        res = self.client.post(reverse("my-kyc-docs"), {"doc_type": "national_id", "upload_id": upload_id},
+                               format="json")
+        self.assertEqual(res.status_code, 400)  # not complete yet
+        self.assertEqual(self._upload(upload_id).status_code, 202)
+        res = self.client.post(reverse("my-kyc-docs"), {"doc_type": "national_id", "upload_id": upload_id},
+                               format="json")
+        self.assertEqual(res.status_code, 201)
+        self.assertTrue(self.profile.kyc_documents.get().file.name.startswith("kyc/"))
+
+        abandoned = self._start()
+        self._append(abandoned, 0, self.data[:12])
+        UploadSession.objects.update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+        self.assertEqual(uploads.purge_expired(), 2)
+        self.assertEqual(default_storage.listdir(f"uploads/{abandoned}")[1], [])
+        self.assertTrue(default_storage.exists(self.profile.kyc_documents.get().file.name))
+
+    def test_assembly_left_by_a_dead_worker_is_started_again(self):
+        upload_id = self._start()
+        with mock.patch.object(uploads, "_submit") as submit:
+            res = self._upload(upload_id)
+            self.assertEqual((res.status_code, res.json()["status"]), (202, "assembling"))
+            # Retried while the assembler is alive: nothing new is started
+            res = self.client.post(reverse("upload-complete", args=[upload_id]))
+            self.assertEqual((res.status_code, res.json()["status"]), (202, "assembling"))
+        submit.assert_called_once()
+        self.assertEqual(uploads.reassemble_stale(), 0)
+
+        # The worker was killed mid-file: once silent long enough, a retry takes over
+        stale = timezone.now() - datetime.timedelta(minutes=uploads.STALE_MINUTES + 1)
+        UploadSession.objects.update(assembling_at=stale)
+        res = self.client.post(reverse("upload-complete", args=[upload_id]))
+        self.assertEqual((res.status_code, res.json()["status"]), (202, "complete"))
+        self.assertEqual(res.json()["sha256"], hashlib.sha256(self.data).hexdigest())
+
+        # ... and so does purge_uploads when the client never comes back
+        other = self._start()
+        with mock.patch.object(uploads, "_submit"):
+            self._upload(other)
+        UploadSession.objects.filter(pk=other).update(assembling_at=stale)
+        self.assertEqual(uploads.reassemble_stale(), 1)
+        self.assertEqual(UploadSession.objects.get(pk=other).status, UploadSession.Status.COMPLETE)
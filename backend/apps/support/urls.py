@@ -6,6 +6,7 @@ from .views import (
     DisputeCreateView,
     DisputeDetailView,
     EnterpriseDisputeListView,
+    UnsubscribeView,
 )
 
 urlpatterns = [
@@ -14,4 +15,5 @@ urlpatterns = [
     path("disputes/my/",              CreatorDisputeListView.as_view(),   name="dispute-my"),
     path("disputes/enterprise/",      EnterpriseDisputeListView.as_view(),name="dispute-enterprise"),
     path("disputes/<uuid:token>/",    DisputeDetailView.as_view(),        name="dispute-detail"),
+    path("unsubscribe/<str:token>/",  UnsubscribeView.as_view(),          name="unsubscribe"),
 ]
@@ -1,12 +1,19 @@
 import datetime
 
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
 from django.utils import timezone
+from django.utils.html import format_html
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.ratelimit import limit
+
 from .emails import send_contact_confirmation, send_contact_to_support, send_dispute_confirmation
-from .models import Dispute
+from .fanout import read_unsubscribe_token
+from .models import Dispute, EmailSuppression
 from .serializers import ContactSerializer, DisputeCreateSerializer, DisputeDetailSerializer
 
 
@@ -18,6 +25,7 @@ class ContactView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [limit("contact:ip", "ip", "5/h"), limit("contact:email", "email", "3/h")]
 
     def post(self, request):
         serializer = ContactSerializer(data=request.data)
@@ -44,6 +52,7 @@ class DisputeCreateView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [limit("dispute:ip", "ip", "5/h"), limit("dispute:email", "email", "3/h")]
 
     def post(self, request):
         serializer = DisputeCreateSerializer(data=request.data)
@@ -146,3 +155,55 @@ class EnterpriseDisputeListView(APIView):
         disputes = Dispute.objects.filter(tip_ref__in=refs)
         serializer = DisputeDetailSerializer(disputes, many=True)
         return Response(serializer.data)
+
+
+_UNSUBSCRIBE_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1">
+<title>Unsubscribe — TippingJar</title></head>
+<body style="background:#0A0F0D;color:#E2E8F0;font-family:Arial,sans-serif;padding:48px 16px;text-align:center;">
+{}
+</body>
+</html>"""
+
+
+def _unsubscribe_page(inner, status_code=200) -> HttpResponse:
+    return HttpResponse(format_html(_UNSUBSCRIBE_PAGE, inner), status=status_code)
+
+
+class UnsubscribeView(APIView):
+    """
+    GET/POST /api/support/unsubscribe/<token>/
+    Link from supporter update emails. GET only shows a confirmation page —
+    mail scanners and link previews follow links — whose button POSTs back;
+    POST (that form, or the RFC 8058 one-click request) adds the address to
+    the suppression list for that creator. No auth, the signed token is the
+    credential.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def get(self, request, token):
+        try:
+            email, _ = read_unsubscribe_token(token)
+        except signing.BadSignature:
+            return _unsubscribe_page("Invalid unsubscribe link.", status.HTTP_400_BAD_REQUEST)
+        return _unsubscribe_page(format_html(
+            '<p>Stop supporter updates to <strong>{}</strong>?</p>'
+            '<form method="post"><button type="submit" style="background:#00C896;color:#fff;border:0;'
+            'padding:12px 28px;border-radius:36px;font-weight:700;cursor:pointer;">Unsubscribe</button></form>',
+            email,
+        ))
+
+    def post(self, request, token):
+        try:
+            email, creator_id = read_unsubscribe_token(token)
+        except signing.BadSignature:
+            return _unsubscribe_page("Invalid unsubscribe link.", status.HTTP_400_BAD_REQUEST)
+        try:
+            with transaction.atomic():
+                EmailSuppression.objects.create(email=email.lower(), creator_id=creator_id)
+        except IntegrityError:
+            pass  # already unsubscribed
+        return _unsubscribe_page(format_html("<p>You've been unsubscribed, <strong>{}</strong>.</p>", email))
@@ -2,7 +2,7 @@ from django.contrib import admin
 
 from core.admin_site import admin_site
 
-from .models import Tip
+from .models import RiskFlag, Tip
 
 
 @admin.register(Tip, site=admin_site)
@@ -16,3 +16,23 @@ class TipAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related("creator", "tipper", "jar")
+
+
+@admin.register(RiskFlag, site=admin_site)
+class RiskFlagAdmin(admin.ModelAdmin):
+    """Checkouts the card-testing check challenged or blocked (tips/risk.py)."""
+
+    list_display = ("created_at", "verdict", "creator", "amount", "tipper_email", "ip", "reviewed")
+    list_filter = ("reviewed", "verdict", "created_at")
+    search_fields = ("tipper_email", "ip", "creator__display_name")
+    readonly_fields = ("verdict", "reasons", "creator", "amount", "tipper_email", "ip", "user_agent", "created_at")
+    date_hierarchy = "created_at"
+    actions = ["mark_reviewed"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("creator")
+
+    @admin.action(description="Mark selected as reviewed")
+    def mark_reviewed(self, request, queryset):
+        updated = queryset.update(reviewed=True)
+        self.message_user(request, f"{updated} flag(s) marked as reviewed.")
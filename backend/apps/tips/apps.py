@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TipsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tips"
+
+    def ready(self):
+        import apps.tips.live  # noqa: F401
@@ -0,0 +1,288 @@
+"""
+Live tip stream — Server-Sent Events for creator dashboards and stream
+overlays (OBS browser sources).
+
+    tip_completed ──on commit──► publish(event)
+                                   │ PostgreSQL: pg_notify("tip_live", event)
+                                   │ otherwise:  broker.dispatch(event)  (same process only)
+                                   ▼
+    every ASGI process:  listener thread (LISTEN tip_live)
+                                   ▼
+                         broker.dispatch(event)
+                           ├─► recent events ring buffer per creator (replay)
+                           └─► asyncio.Queue of each open stream of that creator
+                                   ▼
+    GET /api/tips/live/<token>/   async generator: replay after Last-Event-ID,
+                                  then events as they arrive, ": ping" every
+                                  LIVE_HEARTBEAT_SECONDS
+
+An idle stream is one suspended coroutine and an empty queue — no thread,
+no database connection, no polling — so thousands of overlays cost a few KB
+each. The stream is only served by the ASGI app (``core/asgi.py``); under
+WSGI every open stream would pin a worker, so the view refuses it there.
+
+Event ids are publish timestamps in microseconds, so they agree across
+processes and a reconnecting client resumes with the standard
+``Last-Event-ID`` header (or ``?last_event_id=`` for clients that cannot
+set headers). Only the last LIVE_REPLAY_EVENTS events per creator are kept
+for replay; older history is in ``MyTipsView``.
+
+Overlay URLs leak (on stream, in screenshots), so the token is bound to the
+creator's ``live_stream_key``. ``rotate_stream_key`` replaces it: old URLs
+stop connecting, and a revoke event closes the streams already open on
+them in every process, freeing their connection slots.
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import select
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+
+from django.conf import settings
+from django.core import signing
+from django.db import connection, connections, transaction
+from django.dispatch import receiver
+
+from .signals import tip_completed
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "tip_live"
+TOKEN_SALT = "tips.live"
+MAX_CONNECTIONS_PER_CREATOR = getattr(settings, "LIVE_MAX_CONNECTIONS_PER_CREATOR", 20)
+HEARTBEAT_SECONDS = getattr(settings, "LIVE_HEARTBEAT_SECONDS", 15)
+REPLAY_EVENTS = getattr(settings, "LIVE_REPLAY_EVENTS", 50)
+QUEUE_SIZE = 100
+MAX_REPLAY_CREATORS = 4096
+
+
+class StreamLimitExceeded(Exception):
+    """The creator already has MAX_CONNECTIONS_PER_CREATOR open streams."""
+
+
+# ── Tokens ────────────────────────────────────────────────────────────────────
+
+def _stream_key(creator_id: int) -> str:
+    from apps.creators.models import CreatorProfile
+
+    key = secrets.token_hex(16)
+    # Only the first caller's key sticks
+    CreatorProfile.objects.filter(pk=creator_id, live_stream_key="").update(live_stream_key=key)
+    return CreatorProfile.objects.filter(pk=creator_id).values_list("live_stream_key", flat=True).get()
+
+
+def stream_token(creator) -> str:
+    """Credential embedded in the overlay URL (EventSource cannot send auth headers)."""
+    key = creator.live_stream_key or _stream_key(creator.pk)
+    return signing.dumps({"c": creator.pk, "k": key}, salt=TOKEN_SALT)
+
+
+def read_stream_token(token: str) -> tuple[int, str]:
+    """
+    ``(creator id, stream key)`` from ``token``; raises ``signing.BadSignature``
+    if it was tampered with or its key has been rotated away.
+    """
+    from apps.creators.models import CreatorProfile
+
+    data = signing.loads(token, salt=TOKEN_SALT)
+    creator_id, key = int(data["c"]), data.get("k", "")
+    if not key or not CreatorProfile.objects.filter(pk=creator_id, live_stream_key=key).exists():
+        raise signing.BadSignature("Revoked stream token.")
+    return creator_id, key
+
+
+def rotate_stream_key(creator_id: int) -> str:
+    """Revoke every stream URL of the creator and close the streams open on them; returns the new key."""
+    from apps.creators.models import CreatorProfile
+
+    key = secrets.token_hex(16)
+    CreatorProfile.objects.filter(pk=creator_id).update(live_stream_key=key)
+    event = {"id": time.time_ns() // 1000, "creator_id": creator_id, "revoke": key}
+    transaction.on_commit(lambda: publish(event))
+    return key
+
+
+# ── Broker ────────────────────────────────────────────────────────────────────
+
+class Subscription:
+    def __init__(self, creator_id: int, loop, key: str = ""):
+        self.creator_id = creator_id
+        self.key = key
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    def deliver(self, event: dict) -> None:
+        """Called from any thread."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A stalled client loses events rather than memory; it can resume by id
+            logger.warning("live: dropping event for slow stream of creator %s", self.creator_id)
+
+
+class LiveBroker:
+    """In-process pub/sub of live tip events, keyed by creator."""
+
+    def __init__(self, max_per_creator: int = MAX_CONNECTIONS_PER_CREATOR, replay: int = REPLAY_EVENTS):
+        self.max_per_creator = max_per_creator
+        self.replay = replay
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._recent = OrderedDict()
+        self._listener = None
+
+    def subscribe(self, creator_id: int, last_event_id: int | None = None, key: str = ""):
+        """``(subscription, missed events)``; must be called on the stream's event loop."""
+        sub = Subscription(creator_id, asyncio.get_running_loop(), key)
+        with self._lock:
+            subs = self._subscribers[creator_id]
+            if len(subs) >= self.max_per_creator:
+                raise StreamLimitExceeded(creator_id)
+            subs.add(sub)
+            missed = []
+            if last_event_id is not None:
+                missed = [e for e in self._recent.get(creator_id, ()) if e["id"] > last_event_id]
+        return sub, missed
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.creator_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[sub.creator_id]
+
+    def connection_count(self, creator_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(creator_id, ()))
+
+    def dispatch(self, event: dict) -> None:
+        creator_id = event["creator_id"]
+        if "revoke" in event:
+            # Not replayed: only streams opened with an older key are closed
+            with self._lock:
+                subs = [s for s in self._subscribers.get(creator_id, ()) if s.key != event["revoke"]]
+            for sub in subs:
+                sub.deliver(event)
+            return
+        with self._lock:
+            recent = self._recent.get(creator_id)
+            if recent is None:
+                recent = self._recent[creator_id] = deque(maxlen=self.replay)
+                if len(self._recent) > MAX_REPLAY_CREATORS:
+                    self._recent.popitem(last=False)
+            else:
+                self._recent.move_to_end(creator_id)
+            recent.append(event)
+            subs = list(self._subscribers.get(creator_id, ()))
+        for sub in subs:
+            sub.deliver(event)
+
+    # Cross-process fan-out ────────────────────────────────────────────────────
+
+    def ensure_listener(self) -> None:
+        """Start the LISTEN thread once per process (PostgreSQL only)."""
+        if connection.vendor != "postgresql":
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="tip-live-listener", daemon=True)
+        self._listener.start()
+
+    def _listen(self):
+        wrapper = connections["default"]
+        while True:
+            conn = None
+            try:
+                conn = wrapper.get_new_connection(wrapper.get_connection_params())
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                while True:
+                    if select.select([conn], [], [], 60) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.dispatch(json.loads(conn.notifies.pop(0).payload))
+            except Exception as exc:
+                logger.warning("live: listener lost its connection, reconnecting: %s", exc)
+                time.sleep(2)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+broker = LiveBroker()
+
+
+# ── Publishing ────────────────────────────────────────────────────────────────
+
+def tip_event(tip) -> dict:
+    return {
+        "id": time.time_ns() // 1000,
+        "creator_id": tip.creator_id,
+        "tip_id": tip.pk,
+        "amount": str(tip.amount),
+        "tipper_name": tip.tipper_name or "Anonymous",
+        "message": (tip.message or "")[:280],
+        "jar_id": tip.jar_id,
+    }
+
+
+def publish(event: dict) -> None:
+    if connection.vendor == "postgresql":
+        # Delivered to every listening process, this one included
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, json.dumps(event)])
+    else:
+        broker.dispatch(event)
+
+
+@receiver(tip_completed)
+def publish_completed_tip(sender, tip, **kwargs):
+    event = tip_event(tip)
+
+    def send():
+        try:
+            publish(event)
+        except Exception as exc:
+            logger.warning("live: publish for tip %s failed: %s", tip.pk, exc)
+
+    transaction.on_commit(send)
+
+
+# ── Stream ────────────────────────────────────────────────────────────────────
+
+def format_event(event: dict) -> str:
+    data = {k: v for k, v in event.items() if k != "creator_id"}
+    return f"id: {event['id']}\nevent: tip\ndata: {json.dumps(data)}\n\n"
+
+
+async def event_stream(sub: Subscription, missed: list, heartbeat: float = HEARTBEAT_SECONDS):
+    """SSE body for one subscription; unsubscribes when the client goes away."""
+    try:
+        yield "retry: 3000\n: connected\n\n"
+        for event in missed:
+            yield format_event(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if "revoke" in event:
+                return
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(sub)
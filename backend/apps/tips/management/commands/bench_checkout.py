@@ -0,0 +1,129 @@
+"""
+Management command: bench_checkout
+==================================
+Concurrent checkout throughput as Paystack latency rises, sync vs async.
+
+A local stand-in for Paystack answers ``/transaction/initialize`` after a
+configurable delay. For each delay the command pushes ``--requests``
+checkouts through:
+
+  sync    ``paystack.initialize_transaction`` on ``--workers`` threads —
+          what the gunicorn sync workers did: each call pins a worker
+  async   POST /api/tips/initiate/ through the ASGI handler, ``--concurrency``
+          in flight — ``InitiateTipView`` awaiting ``paystack_async``
+
+and prints requests per second. The sync column falls roughly as
+workers / latency; the async column stays flat until the Paystack
+connection pool (PAYSTACK_MAX_CONNECTIONS) or the database is the limit.
+
+Creates pending tips for ``--creator`` and deletes them afterwards. Run
+against a development database:
+
+  python manage.py bench_checkout --creator some-slug --latency 0.05 0.5 2
+"""
+import asyncio
+import concurrent.futures
+import json
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, override_settings
+
+from apps.creators.models import CreatorProfile
+from apps.payments import paystack as ps
+from apps.payments import paystack_async as aps
+from apps.tips.models import Tip
+
+_REPLY = json.dumps({
+    "status": True,
+    "data": {"authorization_url": "https://checkout.invalid/x", "access_code": "x", "reference": "x"},
+}).encode()
+
+
+async def _fake_paystack(latency: float):
+    """Keep-alive HTTP/1.1 server that answers every request with _REPLY after ``latency``."""
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(_REPLY)}\r\n\r\n".encode() + _REPLY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+class Command(BaseCommand):
+    help = "Benchmark checkout throughput against a slow Paystack, sync vs async."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--creator", required=True, help="Slug of an active creator to tip.")
+        parser.add_argument("--latency", type=float, nargs="+", default=[0.05, 0.5, 1.0, 2.0])
+        parser.add_argument("--requests", type=int, default=60)
+        parser.add_argument("--workers", type=int, default=3, help="Sync workers to compare against.")
+        parser.add_argument("--concurrency", type=int, default=60)
+
+    def handle(self, *args, **options):
+        if not CreatorProfile.objects.filter(slug=options["creator"], is_active=True).exists():
+            raise CommandError(f"No active creator '{options['creator']}'.")
+        self.stdout.write(f"{'latency':>8}  {'sync req/s':>10}  {'async req/s':>11}")
+        for latency in options["latency"]:
+            sync_rate, async_rate = asyncio.run(self._round(latency, options))
+            self.stdout.write(f"{latency:>7.2f}s  {sync_rate:>10.1f}  {async_rate:>11.1f}")
+
+    async def _round(self, latency, options):
+        server = await _fake_paystack(latency)
+        port = server.sockets[0].getsockname()[1]
+        base, ps._BASE = ps._BASE, f"http://127.0.0.1:{port}"
+        # Pool like an ASGI worker does; a fresh client picks up the stand-in's URL
+        aps.share_clients()
+        await aps.close_clients()
+        try:
+            return await self._sync(options), await self._async(options)
+        finally:
+            await aps.close_clients()
+            ps._BASE = base
+            server.close()
+
+    async def _sync(self, options):
+        def call(i):
+            return ps.initialize_transaction(email="bench@example.com", amount_zar=10.0, reference=f"BENCH-{i}")
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(options["workers"]) as pool:
+            await asyncio.gather(*(loop.run_in_executor(pool, call, i) for i in range(options["requests"])))
+        return options["requests"] / (time.perf_counter() - started)
+
+    async def _async(self, options):
+        client = AsyncClient()
+        gate = asyncio.Semaphore(options["concurrency"])
+        body = {"creator_slug": options["creator"], "amount": "10.00", "tipper_email": "bench@example.com"}
+        tip_ids = []
+
+        async def checkout():
+            async with gate:
+                res = await client.post("/api/tips/initiate/", body, content_type="application/json")
+                tip_ids.append(json.loads(res.content).get("tip_id"))
+
+        with override_settings(PAYSTACK_SECRET_KEY="sk_bench", ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            started = time.perf_counter()
+            await asyncio.gather(*(checkout() for _ in range(options["requests"])))
+            elapsed = time.perf_counter() - started
+        await Tip.objects.filter(id__in=[t for t in tip_ids if t]).adelete()
+        return options["requests"] / elapsed
@@ -16,8 +16,10 @@ from decimal import Decimal
 
 from django.core.management.base import BaseCommand
 
+from apps.analytics.pledges import record_charge
 from apps.payments import paystack as ps
 from apps.tips.models import Pledge, Tip
+from apps.tips.signals import tip_completed
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,7 @@ class Command(BaseCommand):
                 )
             except RuntimeError as exc:
                 self.stderr.write(f"  Pledge {pledge.id} charge failed: {exc}")
+                record_charge(pledge, succeeded=False)
                 pledge.status = Pledge.Status.PAUSED
                 pledge.save(update_fields=["status"])
                 continue
@@ -71,6 +74,8 @@ class Command(BaseCommand):
                 service_fee=Decimal(str(fees["service_fee"])),
                 creator_net=Decimal(str(fees["creator_net"])),
             )
+            tip_completed.send(sender=Tip, tip=tip)
+            record_charge(pledge)
 
             # Advance next charge date
             pledge.next_charge_date = today + datetime.timedelta(days=30)
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from core.operations import PostgresRunSQL
+
+# Indexes behind the admin portal search (apps/admin_portal/search.py).
+# Django compiles icontains / iexact to UPPER(col::text) LIKE / =, so the
+# trigram and b-tree indexes are on that expression. Postgres only.
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS tip_tipper_email_trgm ON tips_tip USING gin (UPPER(tipper_email::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS tip_tipper_name_trgm ON tips_tip USING gin (UPPER(tipper_name::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS tip_tipper_email_upper ON tips_tip USING btree (UPPER(tipper_email::text))",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS tip_tipper_email_upper",
+    "DROP INDEX IF EXISTS tip_tipper_name_trgm",
+    "DROP INDEX IF EXISTS tip_tipper_email_trgm",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tips", "0007_pledge_tipstreak"),
+    ]
+
+    operations = [
+        PostgresRunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+def backfill_first_active_at(apps, schema_editor):
+    Pledge = apps.get_model("tips", "Pledge")
+    # Active and cancelled pledges were active once; paused ones only if they were ever charged
+    Pledge.objects.filter(status__in=["active", "cancelled"]).update(first_active_at=models.F("created_at"))
+    Pledge.objects.filter(status="paused", next_charge_date__isnull=False).update(
+        first_active_at=models.F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tips", "0008_admin_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pledge",
+            name="first_active_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_first_active_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.4 on 2026-10-19 15:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0020_notification_coalescing'),
+        ('tips', '0009_pledge_first_active_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RiskFlag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verdict', models.CharField(choices=[('challenge', 'Challenged'), ('block', 'Blocked')], max_length=10)),
+                ('reasons', models.JSONField(default=list)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=8)),
+                ('tipper_email', models.EmailField(blank=True, default='', max_length=254)),
+                ('ip', models.CharField(blank=True, max_length=100)),
+                ('user_agent', models.CharField(blank=True, max_length=300)),
+                ('reviewed', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='pledge',
+            name='unique_fan_creator_pledge',
+        ),
+        migrations.RemoveConstraint(
+            model_name='tipstreak',
+            name='unique_fan_creator_streak',
+        ),
+        migrations.RemoveConstraint(
+            model_name='tipstreak',
+            name='unique_fan_email_creator_streak',
+        ),
+        migrations.AddField(
+            model_name='riskflag',
+            name='creator',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='risk_flags', to='creators.creatorprofile'),
+        ),
+        migrations.AddIndex(
+            model_name='riskflag',
+            index=models.Index(fields=['reviewed', '-created_at'], name='risk_flag_review_idx'),
+        ),
+    ]
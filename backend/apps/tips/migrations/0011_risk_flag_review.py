@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-19 15:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tips', '0010_risk_flag'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='riskflag',
+            name='verdict',
+            field=models.CharField(choices=[('review', 'Flagged for review'), ('challenge', 'Challenged'), ('block', 'Blocked')], max_length=10),
+        ),
+    ]
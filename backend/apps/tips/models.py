@@ -78,6 +78,8 @@ class Pledge(models.Model):
     paystack_authorization_code = models.CharField(max_length=200, blank=True)
     paystack_email = models.EmailField(blank=True)
     next_charge_date = models.DateField(null=True, blank=True)
+    # First time the pledge became ACTIVE — later activations count as reactivations
+    first_active_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -113,3 +115,33 @@ class TipStreak(models.Model):
 
     def __str__(self):
         return f"{self.fan_email} streak {self.current_streak}mo → {self.creator}"
+
+
+class RiskFlag(models.Model):
+    """A checkout the card-testing check (risk.py) flagged, challenged or blocked, for admin review."""
+
+    class Verdict(models.TextChoices):
+        REVIEW = "review", "Flagged for review"
+        CHALLENGE = "challenge", "Challenged"
+        BLOCK = "block", "Blocked"
+
+    verdict = models.CharField(max_length=10, choices=Verdict.choices)
+    reasons = models.JSONField(default=list)
+    creator = models.ForeignKey(
+        "creators.CreatorProfile",
+        on_delete=models.CASCADE,
+        related_name="risk_flags",
+    )
+    amount = models.DecimalField(max_digits=8, decimal_places=2)
+    tipper_email = models.EmailField(blank=True, default="")
+    ip = models.CharField(max_length=100, blank=True)
+    user_agent = models.CharField(max_length=300, blank=True)
+    reviewed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["reviewed", "-created_at"], name="risk_flag_review_idx")]
+
+    def __str__(self):
+        return f"{self.get_verdict_display()} R{self.amount} → {self.creator}"
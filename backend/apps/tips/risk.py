@@ -0,0 +1,245 @@
+"""
+Card-testing checks on tip checkout.
+
+Someone holding stolen card numbers tests them with many small tips, and
+each attempt costs a Paystack fee whether it clears or not. Every
+InitiateTipView call is scored before a Tip row or a Paystack call exists:
+
+    identities   personal   tipper email; device when the client sends an
+                            X-Device-Fingerprint header
+                 shared     ip, device without that header (a hash of
+                            User-Agent + Accept-Language), creator — many
+                            honest fans share these (CGNAT, venue Wi-Fi, a
+                            popular creator's live stream)
+    velocity     small tips (≤ RISK_SMALL_TIP_AMOUNT) per identity over the
+                 last VELOCITY_SECONDS, sliding window
+    failures     failed ÷ started checkouts per identity over the last
+                 FAILURE_SECONDS; ``record_failure`` is called when the
+                 webhook or VerifyTipView sees a charge fail or get abandoned
+
+    client       without an X-Device-Fingerprint header, the ip and the
+                 User-Agent device *together* stand in for the client: a
+                 script that leaves out the email, or changes it every
+                 time, still comes from one address and one browser. Its
+                 level is the lower of the two
+
+    verdict      block       a personal hard threshold is crossed, a
+                             personal soft and a shared hard one, or the
+                             client is past twice the hard limits  → 403, no tip
+                 challenge   a personal soft threshold is crossed, or the
+                             client's hard one                     → 403 + challenge
+                             token; allowed when resent as ``risk_challenge``
+                 review      only shared thresholds are crossed    → allowed,
+                             flagged once per identity and window
+                 allow
+
+No CAPTCHA provider is configured, so the challenge is a time-lock: a
+signed token bound to the device, accepted once, and only after
+RISK_CHALLENGE_DELAY seconds. A person confirming once hardly notices; a
+script gets one attempt per token and keeps feeding the block thresholds.
+Challenges are only issued with RISK_CHALLENGES on — every client must
+resend ``risk_challenge`` first; until then a challenge verdict is allowed
+and flagged. Blocks, challenges and reviews are written to RiskFlag.
+
+Counters are plain cache keys on the RATE_LIMIT_CACHE alias (see
+core/ratelimit.py), never database rows: an allowed check is one
+``get_many`` plus one ``incr`` per identity.
+"""
+
+import hashlib
+import time
+import uuid
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+ALLOW, REVIEW, CHALLENGE, BLOCK = "allow", "review", "challenge", "block"
+
+SMALL_TIP_AMOUNT = Decimal(str(getattr(settings, "RISK_SMALL_TIP_AMOUNT", 20)))
+CHALLENGES = getattr(settings, "RISK_CHALLENGES", False)
+CHALLENGE_DELAY = getattr(settings, "RISK_CHALLENGE_DELAY", 5)
+CHALLENGE_MAX_AGE = 10 * 60
+VELOCITY_SECONDS = 10 * 60
+FAILURE_SECONDS = 60 * 60
+# How long a started checkout can still report a failure
+_REFERENCE_SECONDS = 24 * 60 * 60
+_SALT = "tips.risk.challenge"
+
+# identity → small tips per VELOCITY_SECONDS past its soft / hard threshold (None: never); for
+# shared identities these only flag for review or back up a personal signal
+VELOCITY_LIMITS = {"ip": (8, 20), "device": (8, 20), "email": (8, 16), "creator": (40, None)}
+# Failed ÷ started checkouts before a challenge / a block, once an identity has started this many
+FAILURE_MIN_ATTEMPTS = 4
+FAILURE_RATIOS = (0.5, 0.8)
+FAILURE_IDENTITIES = ("ip", "device", "email")
+
+
+class Assessment(NamedTuple):
+    verdict: str
+    reasons: list
+    identities: dict
+    personal: tuple
+    ip: str
+    user_agent: str
+
+
+def _cache():
+    return caches[getattr(settings, "RATE_LIMIT_CACHE", "default")]
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:24]
+
+
+def _window(now: float, period: int) -> tuple[int, float]:
+    """The current fixed window and the share of the previous one still inside the sliding window."""
+    window = int(now // period)
+    return window, 1 - (now - window * period) / period
+
+
+def _key(counter: str, kind: str, ident: str, window: int) -> str:
+    return f"risk:{counter}:{kind}:{ident}:{window}"
+
+
+def _incr(cache, key: str, ttl: int) -> int:
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, ttl):
+            return 1
+        return cache.incr(key)
+
+
+def identities(request, creator_id, email: str) -> tuple[dict, tuple, str, str]:
+    """``({kind: digest}, personal kinds, ip, user agent)`` for a checkout request."""
+    ip = BaseThrottle().get_ident(request) or ""
+    user_agent = request.headers.get("User-Agent", "")
+    device = request.headers.get("X-Device-Fingerprint", "").strip()[:200]
+    personal = ("email", "device") if device else ("email",)
+    if not device:
+        device = f"ua:{user_agent}|{request.headers.get('Accept-Language', '')}"
+    idents = {"ip": _digest(ip), "device": _digest(device), "creator": str(creator_id)}
+    if email:
+        idents["email"] = _digest(email.strip().lower())
+    return idents, personal, ip, user_agent
+
+
+def assess(request, creator_id, amount, email: str = "") -> Assessment:
+    """Score one checkout attempt; counts it towards the velocity of small tips."""
+    idents, personal, ip, user_agent = identities(request, creator_id, email)
+    cache, now = _cache(), time.time()
+    v_window, v_weight = _window(now, VELOCITY_SECONDS)
+    f_window, f_weight = _window(now, FAILURE_SECONDS)
+    small = amount <= SMALL_TIP_AMOUNT
+
+    velocity = [kind for kind in VELOCITY_LIMITS if kind in idents] if small else []
+    failures = [kind for kind in FAILURE_IDENTITIES if kind in idents]
+    counts = cache.get_many(
+        [_key("small", kind, idents[kind], v_window - 1) for kind in velocity]
+        + [_key(counter, kind, idents[kind], window)
+           for kind in failures
+           for counter in ("started", "failed")
+           for window in (f_window, f_window - 1)]
+    )
+
+    def sliding(counter, kind, window, weight, current=None):
+        if current is None:
+            current = counts.get(_key(counter, kind, idents[kind], window), 0)
+        return current + counts.get(_key(counter, kind, idents[kind], window - 1), 0) * weight
+
+    # kind → 1 (soft threshold crossed), 2 (hard) or 3 (more than twice the hard one)
+    levels, reasons = {}, []
+    for kind in velocity:
+        current = _incr(cache, _key("small", kind, idents[kind], v_window), 2 * VELOCITY_SECONDS)
+        n = sliding("small", kind, v_window, v_weight, current)
+        soft, hard = VELOCITY_LIMITS[kind]
+        level = 0 if n <= soft else 1 if hard is None or n <= hard else 2 if n <= 2 * hard else 3
+        if level:
+            levels[kind] = level
+            reasons.append(f"{kind}: {n:.0f} small tips in {VELOCITY_SECONDS // 60} min")
+    for kind in failures:
+        started = sliding("started", kind, f_window, f_weight)
+        if started < FAILURE_MIN_ATTEMPTS:
+            continue
+        ratio = sliding("failed", kind, f_window, f_weight) / started
+        level = 2 if ratio >= FAILURE_RATIOS[1] else 1 if ratio >= FAILURE_RATIOS[0] else 0
+        if level:
+            levels[kind] = max(level, levels.get(kind, 0))
+            reasons.append(f"{kind}: {ratio:.0%} of {started:.0f} checkouts failed")
+
+    own = max((level for kind, level in levels.items() if kind in personal), default=0)
+    shared = [kind for kind in levels if kind not in personal]
+    client = min(levels.get("ip", 0), levels.get("device", 0)) if "device" not in personal else 0
+    if own >= 2 or (own == 1 and any(levels[kind] >= 2 for kind in shared)) or client == 3:
+        verdict = BLOCK
+    elif own == 1 or client == 2:
+        verdict = CHALLENGE
+    elif shared and any(
+        # Shared identities alone never stop a tip; flag each once per window for review
+        [cache.add(_key("flagged", kind, idents[kind], v_window), 1, VELOCITY_SECONDS) for kind in shared]
+    ):
+        verdict = REVIEW
+    else:
+        verdict = ALLOW
+    return Assessment(verdict, reasons, idents, personal, ip, user_agent)
+
+
+# ── Challenge ─────────────────────────────────────────────────────────────────
+
+def challenge(assessment: Assessment) -> dict:
+    """A challenge for the client to send back as ``risk_challenge`` after ``retry_after`` seconds."""
+    token = signing.dumps(
+        {"device": assessment.identities["device"], "nonce": uuid.uuid4().hex, "issued": time.time()},
+        salt=_SALT,
+    )
+    return {"challenge": token, "retry_after": CHALLENGE_DELAY}
+
+
+def solved(token, assessment: Assessment) -> bool:
+    """True once per valid token from the same device, no sooner than RISK_CHALLENGE_DELAY after issue."""
+    if not token:
+        return False
+    try:
+        data = signing.loads(token, salt=_SALT, max_age=CHALLENGE_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    if data["device"] != assessment.identities["device"] or time.time() - data["issued"] < CHALLENGE_DELAY:
+        return False
+    return _cache().add(f"risk:challenge-used:{data['nonce']}", 1, CHALLENGE_MAX_AGE)
+
+
+def flag(assessment: Assessment, creator, amount, email: str = ""):
+    from .models import RiskFlag
+
+    return RiskFlag.objects.create(
+        verdict=assessment.verdict, reasons=assessment.reasons, creator=creator, amount=amount,
+        tipper_email=email, ip=assessment.ip[:100], user_agent=assessment.user_agent[:300],
+    )
+
+
+# ── Outcomes ──────────────────────────────────────────────────────────────────
+
+def record_start(reference: str, assessment: Assessment) -> None:
+    """Count a checkout handed to Paystack and remember who started it for ``record_failure``."""
+    cache = _cache()
+    window, _ = _window(time.time(), FAILURE_SECONDS)
+    idents = {kind: assessment.identities[kind] for kind in FAILURE_IDENTITIES if kind in assessment.identities}
+    for kind, ident in idents.items():
+        _incr(cache, _key("started", kind, ident, window), 2 * FAILURE_SECONDS)
+    cache.set(f"risk:reference:{reference}", idents, _REFERENCE_SECONDS)
+
+
+def record_failure(reference: str) -> None:
+    """A started checkout failed or was abandoned: count it against everyone who started it, once."""
+    cache = _cache()
+    idents = cache.get(f"risk:reference:{reference}")
+    if not idents:
+        return
+    cache.delete(f"risk:reference:{reference}")
+    window, _ = _window(time.time(), FAILURE_SECONDS)
+    for kind, ident in idents.items():
+        _incr(cache, _key("failed", kind, ident, window), 2 * FAILURE_SECONDS)
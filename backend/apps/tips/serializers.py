@@ -36,6 +36,8 @@ class CreateTipSerializer(serializers.Serializer):
     tipper_name = serializers.CharField(max_length=100, required=False, default="Anonymous")
     tipper_email = serializers.EmailField(required=False, allow_blank=True, default="")
     jar_id = serializers.IntegerField(required=False, allow_null=True)
+    # Token from a "challenge" response of the card-testing check (risk.py)
+    risk_challenge = serializers.CharField(required=False, allow_blank=True, max_length=500)
 
 
 class PledgeSerializer(serializers.ModelSerializer):
@@ -0,0 +1,17 @@
+"""
+Tip lifecycle signals.
+
+Tip status changes mostly happen through ``QuerySet.update()`` (so the
+webhook and VerifyTipView can flip PENDING → COMPLETED atomically), which
+bypasses ``post_save``. Every code path that completes or refunds a tip
+sends one of these signals explicitly instead:
+
+    tip_completed  — sent once per tip when it becomes COMPLETED
+    tip_refunded   — sent when a tip is marked REFUNDED
+
+Both are sent with ``sender=Tip`` and ``tip=<Tip instance>``.
+"""
+from django.dispatch import Signal
+
+tip_completed = Signal()
+tip_refunded = Signal()
@@ -0,0 +1,106 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.creators.models import CreatorProfile
+from apps.tips import risk
+from apps.tips.models import RiskFlag, Tip
+from apps.users.models import User
+
+
+class CardTestingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient(HTTP_X_DEVICE_FINGERPRINT="device-1")
+        user = User.objects.create_user(username="creator", email="c@example.com", password="pass1234")
+        self.creator = CreatorProfile.objects.create(user=user, display_name="Creator", slug="creator-slug")
+
+    def _tip(self, amount="5.00", **extra):
+        body = {"creator_slug": "creator-slug", "amount": amount, **extra}
+        return self.client.post(reverse("initiate-tip"), body, format="json")
+
+    @mock.patch.object(risk, "CHALLENGES", True)
+    @mock.patch.dict(risk.VELOCITY_LIMITS, {"ip": (2, 6), "device": (2, 6), "creator": (50, None)})
+    def test_small_tip_velocity_is_challenged_then_blocked(self):
+        self.assertEqual([self._tip().status_code for _ in range(2)], [201, 201])
+        self.assertEqual(self._tip("500.00").status_code, 201)  # large tips don't count
+
+        res = self._tip()
+        self.assertEqual(res.status_code, 403)
+        token = res.data["challenge"]
+        self.assertEqual(self._tip(risk_challenge=token).status_code, 403)  # answered too soon
+        with mock.patch.object(risk, "CHALLENGE_DELAY", 0):
+            self.assertEqual(self._tip(risk_challenge=token).status_code, 201)
+            self.assertEqual(self._tip(risk_challenge=token).status_code, 403)  # single use
+
+        res = self._tip(risk_challenge=token)
+        self.assertEqual(res.status_code, 403)
+        self.assertNotIn("challenge", res.data)
+        self.assertEqual(Tip.objects.count(), 4)
+        self.assertEqual(
+            list(RiskFlag.objects.order_by("id").values_list("verdict", flat=True)),
+            ["challenge", "challenge", "challenge", "block"],
+        )
+
+    @mock.patch.object(risk, "CHALLENGES", True)
+    @mock.patch.dict(risk.VELOCITY_LIMITS, {"ip": (2, 4), "device": (2, 4), "creator": (50, None)})
+    def test_burst_without_email_or_fingerprint_is_challenged_then_blocked(self):
+        # One script, one address and browser, no email and no X-Device-Fingerprint
+        client = APIClient()
+        responses = [
+            client.post(reverse("initiate-tip"), {"creator_slug": "creator-slug", "amount": "5.00"}, format="json")
+            for _ in range(10)
+        ]
+        self.assertEqual([r.status_code for r in responses], [201] * 4 + [403] * 6)
+        self.assertEqual(["challenge" in r.data for r in responses[4:]], [True] * 4 + [False] * 2)
+        self.assertEqual(
+            list(RiskFlag.objects.order_by("id").values_list("verdict", flat=True))[-3:],
+            ["challenge", "block", "block"],
+        )
+
+    @mock.patch.dict(risk.VELOCITY_LIMITS, {"ip": (2, 6), "creator": (3, None)})
+    def test_shared_identities_only_flag_for_review(self):
+        # Many fans behind one address (no device fingerprint) tipping a busy creator
+        client = APIClient()
+        codes = [
+            client.post(reverse("initiate-tip"),
+                        {"creator_slug": "creator-slug", "amount": "5.00", "tipper_email": f"fan{n}@example.com"},
+                        format="json").status_code
+            for n in range(10)
+        ]
+        self.assertEqual(codes, [201] * 10)
+        self.assertEqual(Tip.objects.count(), 10)
+        flags = RiskFlag.objects.values_list("verdict", flat=True)
+        self.assertEqual(list(flags), ["review"] * 3)  # once each for creator, ip and the header-less device
+
+    @mock.patch.dict(risk.VELOCITY_LIMITS, {"device": (2, 6)})
+    def test_challenge_verdict_is_allowed_and_flagged_until_challenges_are_enabled(self):
+        self.assertEqual([self._tip().status_code for _ in range(4)], [201] * 4)
+        self.assertEqual(list(RiskFlag.objects.values_list("verdict", flat=True)), ["challenge", "challenge"])
+
+    def test_failed_checkouts_raise_the_verdict(self):
+        request = RequestFactory().post("/", HTTP_X_DEVICE_FINGERPRINT="device-2")
+        for n in range(4):
+            assessment = risk.assess(request, self.creator.id, 100, "fan@example.com")
+            self.assertEqual(assessment.verdict, risk.ALLOW)
+            risk.record_start(f"ref-{n}", assessment)
+        risk.record_failure("ref-0")
+        risk.record_failure("ref-1")
+        risk.record_failure("ref-1")  # counted once
+        self.assertEqual(risk.assess(request, self.creator.id, 100, "fan@example.com").verdict, risk.CHALLENGE)
+        risk.record_failure("ref-2")
+        risk.record_failure("ref-3")
+        assessment = risk.assess(request, self.creator.id, 100, "other@example.com")
+        self.assertEqual(assessment.verdict, risk.BLOCK)
+        self.assertIn("ip: 100% of 4 checkouts failed", assessment.reasons)
+
+    def test_check_is_cheap(self):
+        request = RequestFactory().post("/")
+        started = time.perf_counter()
+        for _ in range(200):
+            risk.assess(request, self.creator.id, 5, "fan@example.com")
+        self.assertLess((time.perf_counter() - started) / 200, 0.001)
@@ -1,14 +1,20 @@
-from django.test import TestCase
+import logging
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
 from apps.creators.models import CreatorProfile
 from apps.tips.models import Tip
 from apps.users.models import User
+from core.logs import NonBlockingQueueHandler
 
 
 class TipTests(TestCase):
     def setUp(self):
+        cache.clear()  # rate-limit and card-testing counters
         self.client = APIClient()
         self.user = User.objects.create_user(
             username="creator", email="c@example.com", password="pass1234"
@@ -47,3 +53,224 @@ class TipTests(TestCase):
         self.assertTrue(
             Tip.objects.filter(id=res.data["tip_id"], status=Tip.Status.COMPLETED).exists()
         )
+
+    def test_tip_request_is_logged_with_request_and_creator_ids(self):
+        handler = NonBlockingQueueHandler(maxsize=100, sample_at=0.8, sample_every=10)
+        requests_logger = logging.getLogger("core.requests")
+        requests_logger.addHandler(handler)
+        try:
+            res = self.client.post(
+                reverse("initiate-tip"), {"creator_slug": "creator-slug", "amount": "5.00"},
+                format="json", HTTP_X_REQUEST_ID="edge-42",
+            )
+        finally:
+            requests_logger.removeHandler(handler)
+        self.assertEqual(res["X-Request-ID"], "edge-42")
+        record = handler.queue.get_nowait()
+        self.assertEqual(
+            (record.request_id, record.view, record.creator_id, record.status),
+            ("edge-42", "initiate-tip", self.profile.id, 201),
+        )
+        self.assertGreaterEqual(record.duration_ms, 0)
+
+    def test_full_log_queue_sheds_records_without_blocking(self):
+        handler = NonBlockingQueueHandler(maxsize=10, sample_at=0.5, sample_every=4)
+        logger = logging.getLogger("apps.tips.tests.flood")
+        logger.addHandler(handler)
+        logger.propagate = False
+        try:
+            for i in range(100):
+                logger.info("line %d", i)
+            logger.error("still counted")
+        finally:
+            logger.removeHandler(handler)
+        counts = handler.take_counts()
+        self.assertEqual(handler.queue.qsize(), 10)
+        self.assertEqual(counts["dropped"]["ERROR"], 1)
+        self.assertEqual(sum(counts["sampled"].values()) + counts["dropped"].get("INFO", 0), 90)
+        self.assertEqual(handler.take_counts(), {"dropped": {}, "sampled": {}})
+
+    @override_settings(PAYSTACK_SECRET_KEY="sk_test")
+    def test_checkouts_await_paystack_concurrently(self):
+        import asyncio
+        import time
+
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncClient
+
+        async def slow_initialize(**kwargs):
+            await asyncio.sleep(0.3)
+            return {"authorization_url": f"https://paystack.test/{kwargs['reference']}", "access_code": "x"}
+
+        body = {"creator_slug": "creator-slug", "amount": "5.00", "tipper_email": "fan@example.com"}
+
+        async def checkouts(n):
+            client = AsyncClient()
+            return await asyncio.gather(*(
+                client.post(reverse("initiate-tip"), body, content_type="application/json") for _ in range(n)
+            ))
+
+        with mock.patch("apps.payments.paystack_async.initialize_transaction", side_effect=slow_initialize):
+            started = time.monotonic()
+            responses = async_to_sync(checkouts)(5)
+            elapsed = time.monotonic() - started
+        self.assertEqual([r.status_code for r in responses], [201] * 5)
+        # Five 0.3 s Paystack calls overlap instead of queueing
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(Tip.objects.filter(status=Tip.Status.PENDING).count(), 5)
+
+        with mock.patch("apps.payments.paystack_async.initialize_transaction",
+                        side_effect=RuntimeError("Paystack is down")):
+            res = self.client.post(reverse("initiate-tip"), body, format="json")
+        self.assertEqual(res.status_code, 502)
+        self.assertEqual(Tip.objects.count(), 5)
+
+    @override_settings(PAYSTACK_SECRET_KEY="sk_test")
+    def test_public_pledge_checkout_is_async(self):
+        from apps.tips.models import Pledge
+
+        paystack = mock.AsyncMock(return_value={"authorization_url": "https://paystack.test/p"})
+        with mock.patch("apps.payments.paystack_async.initialize_transaction", paystack):
+            res = self.client.post(
+                reverse("public-subscribe"),
+                {"creator_slug": "creator-slug", "amount": "50.00", "fan_email": "sub@example.com"},
+                format="json",
+            )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.data["authorization_url"], "https://paystack.test/p")
+        self.assertEqual(paystack.await_args.kwargs["email"], "sub@example.com")
+        self.assertEqual(Pledge.objects.get(pk=res.data["pledge_id"]).status, Pledge.Status.PAUSED)
+
+    def test_paystack_clients_are_closed_per_call_unless_shared(self):
+        import asyncio
+
+        import httpx
+
+        from apps.payments import paystack_async as aps
+
+        made = []
+
+        def new_client():
+            reply = {"status": True, "data": {"reference": "R"}}
+            made.append(httpx.AsyncClient(
+                base_url="https://paystack.test",
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json=reply)),
+            ))
+            return made[-1]
+
+        async def verify_twice():
+            await aps.verify_transaction("R")
+            await aps.verify_transaction("R")
+            return len(aps._clients)
+
+        with mock.patch.object(aps, "_new_client", new_client):
+            # A fresh loop per request, as under WSGI: nothing outlives the call
+            self.assertEqual(asyncio.run(verify_twice()), 0)
+            self.assertEqual([c.is_closed for c in made], [True, True])
+
+            made.clear()
+            with mock.patch.object(aps, "_shared", True):
+                self.assertEqual(asyncio.run(verify_twice()), 1)
+            self.assertEqual(len(made), 1)
+
+
+class LiveTipStreamTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        user = User.objects.create_user(username="streamer", email="s@example.com", password="pass1234")
+        self.profile = CreatorProfile.objects.create(user=user, display_name="Streamer", slug="streamer")
+        self.client.force_authenticate(user)
+
+    def _stream_path(self):
+        res = self.client.get(reverse("live-tip-token"))
+        self.assertEqual(res.status_code, 200)
+        return reverse("live-tip-stream", kwargs={"token": res.data["token"]})
+
+    def test_completed_tips_stream_with_replay_and_connection_cap(self):
+        import asyncio
+
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncClient
+
+        from apps.tips import live
+        from apps.tips.signals import tip_completed
+
+        path = self._stream_path()
+        # Not served under WSGI
+        self.assertEqual(self.client.get(path).status_code, 503)
+
+        tip = Tip.objects.create(creator=self.profile, tipper_name="Early", amount=5, status=Tip.Status.COMPLETED)
+        with self.captureOnCommitCallbacks(execute=True):
+            tip_completed.send(sender=Tip, tip=tip)
+
+        async def scenario():
+            client = AsyncClient()
+            self.assertEqual((await client.get("/api/tips/live/forged/")).status_code, 403)
+
+            res = await client.get(path, headers={"Last-Event-ID": "0"})
+            self.assertEqual(res["Content-Type"], "text/event-stream")
+            stream = aiter(res.streaming_content)
+            self.assertIn(b"retry: 3000", await anext(stream))
+            replayed = (await anext(stream)).decode()
+            self.assertIn('"tipper_name": "Early"', replayed)
+
+            live.broker.max_per_creator = 1
+            try:
+                self.assertEqual((await client.get(path)).status_code, 429)
+            finally:
+                live.broker.max_per_creator = live.MAX_CONNECTIONS_PER_CREATOR
+
+            late = Tip(pk=999, creator_id=self.profile.pk, tipper_name="Late", amount=7)
+            live.broker.dispatch(live.tip_event(late))
+            pushed = (await asyncio.wait_for(anext(stream), 2)).decode()
+            self.assertTrue(pushed.startswith("id: "))
+            self.assertIn('"tip_id": 999', pushed)
+
+            # A client disconnect cancels the pending read; the stream unsubscribes
+            pending = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.01)
+            pending.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await pending
+            self.assertEqual(live.broker.connection_count(self.profile.pk), 0)
+
+        # The test's thread runs the database calls, inside its transaction
+        async_to_sync(scenario)()
+
+    def test_rotating_the_stream_key_revokes_old_urls_and_closes_their_streams(self):
+        import asyncio
+
+        from asgiref.sync import async_to_sync, sync_to_async
+        from django.test import AsyncClient
+
+        from apps.tips import live
+
+        old = self._stream_path()
+        self.assertEqual(self._stream_path(), old)  # stable until rotated
+
+        def rotate():
+            with self.captureOnCommitCallbacks(execute=True):
+                return self.client.post(reverse("live-tip-token"))
+
+        async def scenario():
+            client = AsyncClient()
+            res = await client.get(old)
+            stream = aiter(res.streaming_content)
+            await anext(stream)
+            self.assertEqual(live.broker.connection_count(self.profile.pk), 1)
+
+            rotated = await sync_to_async(rotate)()
+            self.assertEqual(rotated.status_code, 200)
+            # The stream on the leaked URL ends and gives its slot back
+            with self.assertRaises(StopAsyncIteration):
+                await asyncio.wait_for(anext(stream), 2)
+            self.assertEqual(live.broker.connection_count(self.profile.pk), 0)
+
+            self.assertEqual((await client.get(old)).status_code, 403)
+            new = reverse("live-tip-stream", kwargs={"token": rotated.data["token"]})
+            res = await client.get(new)
+            self.assertEqual(res["Content-Type"], "text/event-stream")
+            await res.streaming_content.aclose()
+
+        # The test's thread runs the database calls, inside its transaction
+        async_to_sync(scenario)()
@@ -4,18 +4,22 @@ from .views import (
     CreatorTipsView,
     FanTipsView,
     InitiateTipView,
+    LiveStreamTokenView,
     MyPledgeDetailView,
     MyPledgeListCreateView,
     MyStreakListView,
     MyTipsView,
     PublicPledgeCreateView,
     VerifyTipView,
+    live_tip_stream,
 )
 
 urlpatterns = [
     path("initiate/",                InitiateTipView.as_view(),        name="initiate-tip"),
     path("verify/<str:reference>/",  VerifyTipView.as_view(),          name="verify-tip"),
     path("me/",                      MyTipsView.as_view(),             name="my-tips"),
+    path("me/live/",                 LiveStreamTokenView.as_view(),    name="live-tip-token"),
+    path("live/<str:token>/",        live_tip_stream,                  name="live-tip-stream"),
     path("sent/",                    FanTipsView.as_view(),            name="fan-tips-sent"),
     path("subscribe/",               PublicPledgeCreateView.as_view(), name="public-subscribe"),
     path("pledges/",                 MyPledgeListCreateView.as_view(), name="my-pledges"),
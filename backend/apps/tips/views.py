@@ -1,18 +1,29 @@
 import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core import signing
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.creators.models import CreatorProfile, Jar
 from apps.payments import paystack as ps
+from apps.payments import paystack_async as aps
 from apps.support.emails import send_tip_received_to_creator, send_tip_thank_you
+from apps.users.principal import creator_profile_or_404
+from core import logs
+from core.async_views import AsyncAPIView
+from core.ratelimit import limit
 
+from . import live, risk
 from .models import Pledge, Tip, TipStreak
 from .serializers import CreateTipSerializer, PledgeSerializer, TipSerializer, TipStreakSerializer
+from .signals import tip_completed
 
 
 class CreatorTipsView(generics.ListAPIView):
@@ -23,7 +34,9 @@ class CreatorTipsView(generics.ListAPIView):
 
     def get_queryset(self):
         slug = self.kwargs["slug"]
-        return Tip.objects.filter(creator__slug=slug, status=Tip.Status.COMPLETED)
+        return Tip.objects.filter(
+            creator__slug=slug, status=Tip.Status.COMPLETED
+        ).select_related("creator", "jar")
 
 
 class MyTipsView(generics.ListAPIView):
@@ -33,11 +46,10 @@ class MyTipsView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        try:
-            profile = CreatorProfile.objects.get(user=self.request.user)
-            return profile.tips.filter(status=Tip.Status.COMPLETED).order_by("-created_at")
-        except CreatorProfile.DoesNotExist:
+        profile = self.request.creator_profile
+        if not profile:
             return Tip.objects.none()
+        return profile.tips.filter(status=Tip.Status.COMPLETED).order_by("-created_at")
 
 
 class FanTipsView(generics.ListAPIView):
@@ -52,7 +64,7 @@ class FanTipsView(generics.ListAPIView):
         ).order_by("-created_at")
 
 
-class InitiateTipView(APIView):
+class InitiateTipView(AsyncAPIView):
     """
     Initiate a tip payment.
 
@@ -63,11 +75,69 @@ class InitiateTipView(APIView):
         - 3% platform fee  → TippingJar master account
         - 3% service fee   → deducted from creator's subaccount share by Paystack
         - Creator receives: ~94% of the tip amount
+
+    Async: the Paystack call is awaited, the ORM work around it runs in
+    ``_create_tip`` through sync_to_async (see core/async_views.py).
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [
+        limit("tip:ip", "ip", "30/m"),
+        limit("tip:email", "email", "10/m"),
+        limit("tip:api-key", "api_key", "300/m"),
+        limit("tip:creator", "creator", "300/m"),
+    ]
 
-    def post(self, request):
+    async def post(self, request):
+        created = await sync_to_async(self._create_tip)(request)
+        if isinstance(created, Response):
+            return created
+        tip, creator, jar, tipper_email = created
+
+        callback_url = f"{settings.SITE_URL}/payment/callback?ref={tip.paystack_reference}"
+
+        try:
+            tx = await aps.initialize_transaction(
+                email=tipper_email,
+                amount_zar=float(tip.amount),
+                reference=tip.paystack_reference,
+                split_code=creator.paystack_split_code or None,
+                subaccount_code=creator.paystack_subaccount_code or None,
+                callback_url=callback_url,
+                metadata={
+                    "tip_id": tip.id,
+                    "creator_slug": creator.slug,
+                    "tipper_name": tip.tipper_name,
+                    "jar_id": jar.id if jar else None,
+                },
+            )
+        except RuntimeError as exc:
+            # Clean up the pending tip if Paystack fails
+            await sync_to_async(tip.delete)()
+            return Response(
+                {"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY
+            )
+
+        return Response(
+            {
+                "tip_id": tip.id,
+                "reference": tip.paystack_reference,
+                "authorization_url": tx["authorization_url"],
+                "access_code": tx.get("access_code", ""),
+                "amount": str(tip.amount),
+                "platform_fee": str(tip.platform_fee),
+                "service_fee": str(tip.service_fee),
+                "creator_net": str(tip.creator_net),
+                "creator_name": creator.display_name,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    def _create_tip(self, request):
+        """
+        Validate and create the tip. Returns a finished Response (errors,
+        dev mode) or ``(pending tip, creator, jar, tipper_email)``.
+        """
         serializer = CreateTipSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
@@ -81,6 +151,7 @@ class InitiateTipView(APIView):
             return Response(
                 {"detail": "Creator not found."}, status=status.HTTP_404_NOT_FOUND
             )
+        logs.bind(creator_id=creator.id)
 
         # ── Resolve optional jar ──────────────────────────────────────
         jar = None
@@ -93,6 +164,25 @@ class InitiateTipView(APIView):
                     {"detail": "Jar not found."}, status=status.HTTP_404_NOT_FOUND
                 )
 
+        # ── Card-testing check (risk.py) ──────────────────────────────
+        assessment = risk.assess(request, creator.id, data["amount"], data["tipper_email"])
+        if assessment.verdict == risk.REVIEW or (assessment.verdict == risk.CHALLENGE and not risk.CHALLENGES):
+            # Allowed; recorded for review only
+            risk.flag(assessment, creator, data["amount"], data["tipper_email"])
+        elif assessment.verdict == risk.BLOCK or (
+            assessment.verdict == risk.CHALLENGE and not risk.solved(data.get("risk_challenge"), assessment)
+        ):
+            risk.flag(assessment, creator, data["amount"], data["tipper_email"])
+            if assessment.verdict == risk.BLOCK:
+                return Response(
+                    {"detail": "This payment can't be processed right now."},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+            return Response(
+                {"detail": "Please confirm this payment and try again.", **risk.challenge(assessment)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
         amount = float(data["amount"])
         fees = ps.calculate_fees(amount)
 
@@ -111,6 +201,7 @@ class InitiateTipView(APIView):
                 service_fee=Decimal(str(fees["service_fee"])),
                 creator_net=Decimal(str(fees["creator_net"])),
             )
+            tip_completed.send(sender=Tip, tip=tip)
             send_tip_thank_you(tip)
             return Response(
                 {
@@ -143,66 +234,29 @@ class InitiateTipView(APIView):
             creator_net=Decimal(str(fees["creator_net"])),
         )
 
-        reference = ps.generate_reference(tip.id)
-        tip.paystack_reference = reference
+        tip.paystack_reference = ps.generate_reference(tip.id)
         tip.save(update_fields=["paystack_reference"])
-
-        callback_url = f"{settings.SITE_URL}/payment/callback?ref={reference}"
-
-        try:
-            tx = ps.initialize_transaction(
-                email=tipper_email,
-                amount_zar=amount,
-                reference=reference,
-                split_code=creator.paystack_split_code or None,
-                subaccount_code=creator.paystack_subaccount_code or None,
-                callback_url=callback_url,
-                metadata={
-                    "tip_id": tip.id,
-                    "creator_slug": creator.slug,
-                    "tipper_name": tip.tipper_name,
-                    "jar_id": jar.id if jar else None,
-                },
-            )
-        except RuntimeError as exc:
-            # Clean up the pending tip if Paystack fails
-            tip.delete()
-            return Response(
-                {"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY
-            )
-
-        return Response(
-            {
-                "tip_id": tip.id,
-                "reference": reference,
-                "authorization_url": tx["authorization_url"],
-                "access_code": tx.get("access_code", ""),
-                "amount": str(tip.amount),
-                "platform_fee": str(tip.platform_fee),
-                "service_fee": str(tip.service_fee),
-                "creator_net": str(tip.creator_net),
-                "creator_name": creator.display_name,
-            },
-            status=status.HTTP_201_CREATED,
-        )
+        risk.record_start(tip.paystack_reference, assessment)
+        return tip, creator, jar, tipper_email
 
 
-class VerifyTipView(APIView):
+class VerifyTipView(AsyncAPIView):
     """
     Verify a tip's payment status via Paystack.
 
     GET /api/tips/verify/<reference>/
 
-    - Checks Paystack's verify endpoint
+    - Checks Paystack's verify endpoint (awaited)
     - Updates tip status if payment succeeded or failed
     - Returns current tip status
     """
 
     permission_classes = [permissions.AllowAny]
 
-    def get(self, request, reference):
-        tip = get_object_or_404(Tip, paystack_reference=reference)
-
+    async def get(self, request, reference):
+        tip = await sync_to_async(get_object_or_404)(
+            Tip.objects.select_related("creator"), paystack_reference=reference
+        )
         creator_slug = tip.creator.slug
 
         # Already resolved — no need to call Paystack again
@@ -222,44 +276,79 @@ class VerifyTipView(APIView):
             return Response({"status": tip.status, "tip_id": tip.id, "creator_slug": creator_slug})
 
         try:
-            tx_data = ps.verify_transaction(reference)
+            tx_data = await aps.verify_transaction(reference)
         except RuntimeError as exc:
             return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
 
         paystack_status = tx_data.get("status", "")
+        await sync_to_async(self._apply_status)(tip, paystack_status)
 
+        return Response({
+            "status": tip.status,
+            "tip_id": tip.id,
+            "amount": str(tip.amount),
+            "creator_net": str(tip.creator_net),
+            "creator_slug": creator_slug,
+            "paystack_status": paystack_status,
+        })
+
+    def _apply_status(self, tip, paystack_status):
         if paystack_status == "success":
             # Mark completed if pending OR if previously marked failed (race condition recovery).
             # Avoids double-email with webhook by only sending if the row actually changed.
             rows = Tip.objects.filter(
                 pk=tip.pk, status__in=[Tip.Status.PENDING, Tip.Status.FAILED]
             ).update(status=Tip.Status.COMPLETED)
+            tip.refresh_from_db()
             if rows:
-                tip.refresh_from_db()
+                tip_completed.send(sender=Tip, tip=tip)
                 send_tip_thank_you(tip)
                 send_tip_received_to_creator(tip)
-            else:
-                tip.refresh_from_db()
         elif paystack_status in ("failed", "abandoned"):
             # Never downgrade a tip that the webhook already marked as completed
-            Tip.objects.filter(pk=tip.pk, status=Tip.Status.PENDING).update(
+            rows = Tip.objects.filter(pk=tip.pk, status=Tip.Status.PENDING).update(
                 status=Tip.Status.FAILED
             )
+            if rows:
+                risk.record_failure(tip.paystack_reference)
             tip.refresh_from_db()
 
-        return Response({
-            "status": tip.status,
-            "tip_id": tip.id,
-            "amount": str(tip.amount),
-            "creator_net": str(tip.creator_net),
-            "creator_slug": creator_slug,
-            "paystack_status": paystack_status,
-        })
-
 
 # ── Pledge views ──────────────────────────────────────────────────────────────
 
-class MyPledgeListCreateView(generics.ListCreateAPIView):
+def _pledge_amount(value) -> Decimal | None:
+    """The requested monthly amount as a Decimal; ``None`` unless it is a positive number that fits the column."""
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        return None
+    return amount if amount.is_finite() and Decimal("0") < amount < Decimal("1e8") else None
+
+
+async def _pledge_checkout(pledge) -> Response:
+    """Initialise the first Paystack charge of a new PAUSED pledge (awaited)."""
+    reference = ps.generate_reference(pledge.id)
+    callback_url = f"{settings.SITE_URL}/payment/callback?ref={reference}&pledge=1"
+    try:
+        tx = await aps.initialize_transaction(
+            email=pledge.fan_email,
+            amount_zar=float(pledge.amount),
+            reference=reference,
+            callback_url=callback_url,
+            metadata={"pledge_id": pledge.id, "creator_slug": pledge.creator.slug},
+        )
+    except RuntimeError as exc:
+        await sync_to_async(pledge.delete)()
+        return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
+
+    return Response({
+        "pledge_id": pledge.id,
+        "authorization_url": tx["authorization_url"],
+        "reference": reference,
+    }, status=status.HTTP_201_CREATED)
+
+
+class MyPledgeListCreateView(AsyncAPIView, generics.ListCreateAPIView):
     """Fan: list own pledges (GET) or create a new pledge (POST)."""
 
     serializer_class = PledgeSerializer
@@ -268,7 +357,17 @@ class MyPledgeListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Pledge.objects.filter(fan=self.request.user)
 
-    def post(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(self.list)(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        created = await sync_to_async(self._create_pledge)(request)
+        if isinstance(created, Response):
+            return created
+        return await _pledge_checkout(created)
+
+    def _create_pledge(self, request):
+        """A finished Response (errors, dev mode) or the new PAUSED pledge."""
         creator_slug = request.data.get("creator_slug")
         if not creator_slug:
             return Response({"detail": "creator_slug required."}, status=status.HTTP_400_BAD_REQUEST)
@@ -277,6 +376,7 @@ class MyPledgeListCreateView(generics.ListCreateAPIView):
             creator = CreatorProfile.objects.get(slug=creator_slug, is_active=True)
         except CreatorProfile.DoesNotExist:
             return Response({"detail": "Creator not found."}, status=status.HTTP_404_NOT_FOUND)
+        logs.bind(creator_id=creator.id)
 
         amount = request.data.get("amount")
         tier_id = request.data.get("tier_id")
@@ -295,6 +395,9 @@ class MyPledgeListCreateView(generics.ListCreateAPIView):
 
         if not amount:
             return Response({"detail": "amount required."}, status=status.HTTP_400_BAD_REQUEST)
+        amount = _pledge_amount(amount)
+        if amount is None:
+            return Response({"detail": "amount must be a positive number."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Dev mode — create immediately as ACTIVE
         if not settings.PAYSTACK_SECRET_KEY:
@@ -310,8 +413,8 @@ class MyPledgeListCreateView(generics.ListCreateAPIView):
             )
             return Response(PledgeSerializer(pledge).data, status=status.HTTP_201_CREATED)
 
-        # Production — initiate Paystack transaction for first charge
-        pledge = Pledge.objects.create(
+        # Production — paused until the first charge succeeds (see _pledge_checkout)
+        return Pledge.objects.create(
             fan=request.user,
             fan_email=fan_email,
             fan_name=fan_name,
@@ -321,28 +424,9 @@ class MyPledgeListCreateView(generics.ListCreateAPIView):
             status=Pledge.Status.PAUSED,
             paystack_email=fan_email,
         )
-        reference = ps.generate_reference(pledge.id)
-        callback_url = f"{settings.SITE_URL}/payment/callback?ref={reference}&pledge=1"
-        try:
-            tx = ps.initialize_transaction(
-                email=fan_email,
-                amount_zar=float(amount),
-                reference=reference,
-                callback_url=callback_url,
-                metadata={"pledge_id": pledge.id, "creator_slug": creator.slug},
-            )
-        except RuntimeError as exc:
-            pledge.delete()
-            return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
-
-        return Response({
-            "pledge_id": pledge.id,
-            "authorization_url": tx["authorization_url"],
-            "reference": reference,
-        }, status=status.HTTP_201_CREATED)
 
 
-class PublicPledgeCreateView(APIView):
+class PublicPledgeCreateView(AsyncAPIView):
     """
     POST /api/tips/subscribe/
     Anonymous OR authenticated fans subscribe to a creator tier.
@@ -350,8 +434,16 @@ class PublicPledgeCreateView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [limit("pledge:ip", "ip", "10/m"), limit("pledge:email", "email", "5/m")]
 
-    def post(self, request):
+    async def post(self, request):
+        created = await sync_to_async(self._create_pledge)(request)
+        if isinstance(created, Response):
+            return created
+        return await _pledge_checkout(created)
+
+    def _create_pledge(self, request):
+        """A finished Response (errors, dev mode) or the new PAUSED pledge."""
         from apps.creators.models import SupportTier  # noqa: PLC0415
 
         creator_slug = request.data.get("creator_slug")
@@ -362,6 +454,7 @@ class PublicPledgeCreateView(APIView):
             creator = CreatorProfile.objects.get(slug=creator_slug, is_active=True)
         except CreatorProfile.DoesNotExist:
             return Response({"detail": "Creator not found."}, status=status.HTTP_404_NOT_FOUND)
+        logs.bind(creator_id=creator.id)
 
         fan = request.user if request.user.is_authenticated else None
         fan_email = request.data.get("fan_email", "") or (fan.email if fan else "")
@@ -384,6 +477,9 @@ class PublicPledgeCreateView(APIView):
 
         if not amount:
             return Response({"detail": "amount required."}, status=status.HTTP_400_BAD_REQUEST)
+        amount = _pledge_amount(amount)
+        if amount is None:
+            return Response({"detail": "amount must be a positive number."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Dev mode — create pledge immediately as ACTIVE
         if not settings.PAYSTACK_SECRET_KEY:
@@ -399,8 +495,8 @@ class PublicPledgeCreateView(APIView):
             )
             return Response(PledgeSerializer(pledge).data, status=status.HTTP_201_CREATED)
 
-        # Production — initiate Paystack transaction for first charge
-        pledge = Pledge.objects.create(
+        # Production — paused until the first charge succeeds (see _pledge_checkout)
+        return Pledge.objects.create(
             fan=fan,
             fan_email=fan_email,
             fan_name=fan_name,
@@ -410,25 +506,6 @@ class PublicPledgeCreateView(APIView):
             status=Pledge.Status.PAUSED,
             paystack_email=fan_email,
         )
-        reference = ps.generate_reference(pledge.id)
-        callback_url = f"{settings.SITE_URL}/payment/callback?ref={reference}&pledge=1"
-        try:
-            tx = ps.initialize_transaction(
-                email=fan_email,
-                amount_zar=float(amount),
-                reference=reference,
-                callback_url=callback_url,
-                metadata={"pledge_id": pledge.id, "creator_slug": creator.slug},
-            )
-        except RuntimeError as exc:
-            pledge.delete()
-            return Response({"detail": str(exc)}, status=status.HTTP_502_BAD_GATEWAY)
-
-        return Response({
-            "pledge_id": pledge.id,
-            "authorization_url": tx["authorization_url"],
-            "reference": reference,
-        }, status=status.HTTP_201_CREATED)
 
 
 class MyPledgeDetailView(generics.UpdateAPIView):
@@ -449,3 +526,64 @@ class MyStreakListView(generics.ListAPIView):
 
     def get_queryset(self):
         return TipStreak.objects.filter(fan=self.request.user).select_related("creator")
+
+
+class LiveStreamTokenView(APIView):
+    """
+    GET  /api/tips/me/live/
+    The creator's live tip stream URL, for the dashboard or an OBS browser source.
+    POST /api/tips/me/live/
+    Revoke that URL (e.g. after it leaked on stream) and return a new one.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        creator = creator_profile_or_404(request)
+        return self._url(request, creator, live.stream_token(creator))
+
+    def post(self, request):
+        creator = creator_profile_or_404(request)
+        creator.live_stream_key = live.rotate_stream_key(creator.pk)
+        return self._url(request, creator, live.stream_token(creator))
+
+    def _url(self, request, creator, token):
+        return Response({
+            "token": token,
+            "url": request.build_absolute_uri(reverse("live-tip-stream", kwargs={"token": token})),
+            "open_connections": live.broker.connection_count(creator.pk),
+            "max_connections": live.broker.max_per_creator,
+        })
+
+
+async def live_tip_stream(request, token):
+    """
+    GET /api/tips/live/<token>/
+    Server-Sent Events stream of the creator's completed tips (see live.py).
+    Served by the ASGI app only.
+    """
+    if "wsgi.input" in request.META:
+        return JsonResponse(
+            {"detail": "The live stream is served by the ASGI app (core.asgi)."}, status=503,
+        )
+    try:
+        creator_id, key = await sync_to_async(live.read_stream_token)(token)
+    except signing.BadSignature:
+        return JsonResponse({"detail": "Invalid stream token."}, status=403)
+
+    last_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        last_id = int(last_id) if last_id else None
+    except ValueError:
+        last_id = None
+
+    live.broker.ensure_listener()
+    try:
+        sub, missed = live.broker.subscribe(creator_id, last_id, key)
+    except live.StreamLimitExceeded:
+        return JsonResponse({"detail": "Too many open live streams for this creator."}, status=429)
+
+    response = StreamingHttpResponse(live.event_stream(sub, missed), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # let nginx pass events straight through
+    return response
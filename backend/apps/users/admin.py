@@ -23,21 +23,13 @@ class CustomUserAdmin(UserAdmin):
 
     @admin.action(description="📱 Send SMS notification to selected users")
     def send_sms_notification(self, request, queryset):
-        from apps.support.sms import send_sms
+        from apps.support.sms_outbox import enqueue
         message = "Hello from TippingJar! This is a notification from our team. Visit tippingjar.co.za for more info."
-        sent, skipped = 0, 0
-        for user in queryset:
-            if user.phone_number:
-                result = send_sms(user.phone_number, message)
-                if result["success"]:
-                    sent += 1
-                else:
-                    skipped += 1
-            else:
-                skipped += 1
+        numbers = list(queryset.exclude(phone_number="").values_list("phone_number", flat=True))
+        queued = enqueue(numbers, message)
         self.message_user(
             request,
-            f"SMS sent: {sent} | Skipped (no phone / error): {skipped}",
+            f"SMS queued: {queued} | Skipped (no phone): {queryset.count() - len(numbers)}",
         )
 
 
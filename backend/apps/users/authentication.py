@@ -2,6 +2,9 @@ import hashlib
 
 from django.utils import timezone
 from rest_framework import authentication, exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 
 
 class ApiKeyAuthentication(authentication.BaseAuthentication):
@@ -58,3 +61,31 @@ class ApiKeyAuthentication(authentication.BaseAuthentication):
 
     def authenticate_header(self, request):
         return 'Bearer realm="TippingJar API"'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    simplejwt's JWTAuthentication, resolving the token's user through the
+    cached principal (apps/users/principal.py) instead of a query per request.
+
+    Only the user id claim is read from the token; role, active flag and
+    enterprise approval come from the principal, which is invalidated as soon
+    as any of them change.
+    """
+
+    def get_user(self, validated_token):
+        if jwt_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        from . import principal  # noqa: PLC0415
+
+        data = principal.get(user_id)
+        if data is None:
+            raise exceptions.AuthenticationFailed("User not found", code="user_not_found")
+        if not data["is_active"]:
+            raise exceptions.AuthenticationFailed("User is inactive", code="user_inactive")
+        return principal.build_user(data)
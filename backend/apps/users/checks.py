@@ -0,0 +1,15 @@
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def principal_cache_is_shared(app_configs, **kwargs):
+    from . import principal
+
+    if principal.SHARED:
+        return []
+    return [Warning(
+        "The default cache is per-process, so JWT principals are not cached: "
+        "every API request loads its user from the database.",
+        hint="Set CACHE_URL to a cache all workers share, e.g. redis://redis:6379/1.",
+        id="users.W001",
+    )]
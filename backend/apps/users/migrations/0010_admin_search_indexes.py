@@ -0,0 +1,34 @@
+from django.db import migrations
+
+from core.operations import PostgresRunSQL
+
+# Indexes behind the admin portal search (apps/admin_portal/search.py).
+# Django compiles icontains / iexact to UPPER(col::text) LIKE / =, so the
+# trigram and b-tree indexes are on that expression. Postgres only.
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS user_email_trgm ON users_user USING gin (UPPER(email::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS user_username_trgm ON users_user USING gin (UPPER(username::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS user_first_name_trgm ON users_user USING gin (UPPER(first_name::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS user_last_name_trgm ON users_user USING gin (UPPER(last_name::text) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS user_email_upper ON users_user USING btree (UPPER(email::text))",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS user_email_upper",
+    "DROP INDEX IF EXISTS user_last_name_trgm",
+    "DROP INDEX IF EXISTS user_first_name_trgm",
+    "DROP INDEX IF EXISTS user_username_trgm",
+    "DROP INDEX IF EXISTS user_email_trgm",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0009_user_gender_dob"),
+    ]
+
+    operations = [
+        PostgresRunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
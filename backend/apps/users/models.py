@@ -7,8 +7,10 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils import timezone
 
+from core.models import LoadDeferredTogetherMixin
 
-class User(AbstractUser):
+
+class User(LoadDeferredTogetherMixin, AbstractUser):
     """Extended user model — can be a fan, a creator, or both."""
 
     class Role(models.TextChoices):
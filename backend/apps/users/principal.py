@@ -0,0 +1,153 @@
+"""
+Cached request principal for JWT-authenticated API calls.
+
+A dashboard screen fires several API calls at once; each used to load the
+User row in JWTAuthentication, then the CreatorProfile (by user) in the
+view, then ``user.enterprise`` in IsEnterpriseAdmin. The principal is the
+small, rarely-changing slice of that state:
+
+    user id, username, email, role, is_active, is_staff, is_superuser
+    creator_profile_id, enterprise_id, enterprise_approved
+
+built by one query and cached for PRINCIPAL_CACHE_SECONDS:
+
+    principal:{uid}:version   random token, replaced by ``invalidate()``
+    principal:{uid}           {"version": ..., fields...}
+
+An entry is only used while its version matches the current token, and the
+token is read *before* the database, so a rebuild that races an
+invalidation is written under the old version and never served. Saving a
+User, CreatorProfile or Enterprise (signals.py) invalidates its owner; code
+that changes them with ``queryset.update()`` calls ``invalidate()`` itself.
+
+Only the token's ``user_id`` claim is trusted: role and approval come from
+the cache, so changes apply to the very next request, not at token expiry.
+
+That only holds if every worker sees the same version token. With a
+per-process cache (the locmem default) an invalidation reaches one worker
+and the others would keep serving a deactivated user for up to
+PRINCIPAL_CACHE_SECONDS, so the principal is then read from the database on
+every request — still the one query — and ``check --deploy`` warns
+(users.W001, checks.py).
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from core.cache import is_shared
+
+CACHE_SECONDS = getattr(settings, "PRINCIPAL_CACHE_SECONDS", 60)
+# Whether the default cache is one every worker shares
+SHARED = is_shared()
+USER_FIELDS = ("id", "username", "email", "role", "is_active", "is_staff", "is_superuser")
+# Versions outlive entries so an invalidation is never forgotten while an entry could still exist
+_VERSION_SECONDS = 24 * 60 * 60
+
+
+def _keys(user_id) -> tuple[str, str]:
+    return f"principal:{user_id}", f"principal:{user_id}:version"
+
+
+def invalidate(*user_ids) -> None:
+    """Make any cached principal of these users stale immediately."""
+    cache.set_many({_keys(uid)[1]: uuid.uuid4().hex for uid in user_ids if uid}, _VERSION_SECONDS)
+
+
+def _load(user_id) -> dict | None:
+    from .models import User
+
+    row = (
+        User.objects.filter(pk=user_id)
+        .values(*USER_FIELDS, "creator_profile__id", "enterprise__id", "enterprise__approval_status")
+        .first()
+    )
+    if row is None:
+        return None
+    from apps.enterprise.models import Enterprise
+
+    return {
+        **{field: row[field] for field in USER_FIELDS},
+        "creator_profile_id": row["creator_profile__id"],
+        "enterprise_id": row["enterprise__id"],
+        "enterprise_approved": row["enterprise__approval_status"] == Enterprise.ApprovalStatus.APPROVED,
+    }
+
+
+def get(user_id) -> dict | None:
+    """The principal fields of a user, from cache when current; ``None`` if the user does not exist."""
+    if not SHARED:
+        return _load(user_id)
+    data_key, version_key = _keys(user_id)
+    cached = cache.get_many([data_key, version_key])
+    version = cached.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, _VERSION_SECONDS)
+        version = cache.get(version_key)
+    data = cached.get(data_key)
+    if data is not None and data["version"] == version:
+        return data
+
+    data = _load(user_id)
+    if data is not None:
+        data["version"] = version
+        cache.set(data_key, data, CACHE_SECONDS)
+    return data
+
+
+def build_user(data: dict):
+    """
+    A User instance carrying only the principal fields.
+
+    The instance comes from ``User.from_db`` with every other column
+    deferred: the first read of one loads them all in a single query
+    (``LoadDeferredTogetherMixin``), and ``save()`` only writes loaded
+    columns, so views can use it like a normal user.
+    """
+    from .models import User
+
+    user = User.from_db(DEFAULT_DB_ALIAS, USER_FIELDS, [data[field] for field in USER_FIELDS])
+    user.load_deferred_together = True
+    user.creator_profile_id = data["creator_profile_id"]
+    user.enterprise_id = data["enterprise_id"]
+    user.enterprise_approved = data["enterprise_approved"]
+    # Known-absent reverse one-to-ones: ``hasattr(user, "enterprise")`` without a query
+    if data["creator_profile_id"] is None:
+        User.creator_profile.related.set_cached_value(user, None)
+    if data["enterprise_id"] is None:
+        User.enterprise.related.set_cached_value(user, None)
+    return user
+
+
+def creator_profile(user):
+    """
+    The user's CreatorProfile, or ``None``; ``request.creator_profile`` is built from this.
+
+    For a principal-built user this is a stub holding only ``id`` and
+    ``user_id``, so filtering by it or assigning it as a foreign key costs no
+    query; the profile's other columns load together on first read. The row
+    itself is never cached: its counters are written with F() updates.
+    """
+    from apps.creators.models import CreatorProfile
+
+    if not user.is_authenticated:
+        return None
+    if "creator_profile_id" not in vars(user):  # session or API-key user
+        return CreatorProfile.objects.filter(user=user).first()
+    if user.creator_profile_id is None:
+        return None
+    profile = CreatorProfile.from_db(DEFAULT_DB_ALIAS, ("id", "user_id"), (user.creator_profile_id, user.pk))
+    profile.load_deferred_together = True
+    CreatorProfile.user.field.set_cached_value(profile, user)
+    return profile
+
+
+def creator_profile_or_404(request):
+    """``request.creator_profile`` for creator-only endpoints; 404 when the user has none."""
+    from django.http import Http404
+
+    if not request.creator_profile:
+        raise Http404("Creator profile not found.")
+    return request.creator_profile
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core.images import SrcsetField
+
 from .models import OTP, ApiKey, User
 
 
@@ -18,10 +20,12 @@ class RegisterSerializer(serializers.ModelSerializer):
 
 
 class UserSerializer(serializers.ModelSerializer):
+    avatar_srcset = SrcsetField(source="avatar")
+
     class Meta:
         model = User
         fields = (
-            "id", "username", "email", "role", "avatar", "bio",
+            "id", "username", "email", "role", "avatar", "avatar_srcset", "bio",
             "phone_number", "otp_method", "two_fa_enabled",
             "gender", "date_of_birth", "first_name", "last_name",
         )
@@ -0,0 +1,29 @@
+"""
+Django signals keeping the cached request principal (see principal.py) current.
+
+Any save or delete of a User, of the CreatorProfile it owns or of the
+Enterprise it administers makes its cached principal stale, so role
+changes, deactivation and enterprise approval apply on the next request.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import principal
+
+
+@receiver(post_save, sender="users.User")
+@receiver(post_delete, sender="users.User")
+def on_user_changed(sender, instance, **kwargs):
+    principal.invalidate(instance.pk)
+
+
+@receiver(post_save, sender="creators.CreatorProfile")
+@receiver(post_delete, sender="creators.CreatorProfile")
+def on_creator_profile_changed(sender, instance, **kwargs):
+    principal.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender="enterprise.Enterprise")
+@receiver(post_delete, sender="enterprise.Enterprise")
+def on_enterprise_changed(sender, instance, **kwargs):
+    principal.invalidate(instance.admin_id)
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -40,3 +42,77 @@ class RegisterLoginTests(TestCase):
     def test_me_requires_auth(self):
         res = self.client.get(reverse("me"))
         self.assertEqual(res.status_code, 401)
+
+
+class CachedPrincipalTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from apps.creators.models import CreatorProfile
+        from apps.users import principal
+
+        cache.clear()
+        # Tests run on locmem; behave as with the shared cache production uses
+        shared = mock.patch.object(principal, "SHARED", True)
+        shared.start()
+        self.addCleanup(shared.stop)
+        self.user = User.objects.create_user(username="c", email="c@example.com", password="pass1234", role="creator")
+        self.profile = CreatorProfile.objects.create(user=self.user, display_name="C", slug="c")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+
+    def test_cached_principal_and_profile_cost_no_queries(self):
+        url = reverse("my-notifications-unread")
+        self.client.get(url)
+        with self.assertNumQueries(1):  # the unread counter itself
+            res = self.client.get(url)
+        self.assertEqual(res.data, {"unread": 1})  # the welcome notification
+
+    def test_deactivation_applies_to_next_request(self):
+        url = reverse("my-notifications-unread")
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+    def test_per_process_cache_reads_the_principal_from_the_database(self):
+        from django.core import checks
+
+        from apps.users import principal
+
+        url = reverse("my-notifications-unread")
+        with mock.patch.object(principal, "SHARED", False):
+            self.client.get(url)
+            with self.assertNumQueries(2):  # the principal, then the unread counter
+                self.client.get(url)
+            # An invalidation another worker's cache would never see is not needed
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+            self.assertEqual(self.client.get(url).status_code, 401)
+            ids = [m.id for m in checks.run_checks(tags=[checks.Tags.caches], include_deployment_checks=True)]
+        self.assertIn("users.W001", ids)
+
+    def test_profile_stub_loads_remaining_fields_in_one_query(self):
+        from apps.users import principal
+
+        user = principal.build_user(principal.get(self.user.pk))
+        profile = principal.creator_profile(user)
+        self.assertEqual(profile.pk, self.profile.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual((profile.display_name, profile.slug), ("C", "c"))
+        with self.assertNumQueries(1):
+            self.assertEqual((user.first_name, user.two_fa_enabled), ("", False))
+
+    def test_enterprise_approval_action_invalidates(self):
+        from django.contrib.admin.sites import AdminSite
+
+        from apps.enterprise.admin import EnterpriseAdmin
+        from apps.enterprise.models import Enterprise
+        from apps.users import principal
+
+        Enterprise.objects.create(admin=self.user, name="E", slug="e")
+        self.assertFalse(principal.get(self.user.pk)["enterprise_approved"])
+        admin = EnterpriseAdmin(Enterprise, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        admin.approve_enterprises(None, Enterprise.objects.filter(admin=self.user))
+        self.assertTrue(principal.get(self.user.pk)["enterprise_approved"])
@@ -8,12 +8,16 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.support.sms import send_otp_via_sms
+from core.ratelimit import limit
 
 logger = logging.getLogger(__name__)
 
 from .models import OTP, ApiKey, User
 from .serializers import ApiKeySerializer, RegisterSerializer, UserSerializer
 
+# Shared by both OTP senders: every call can cost an SMS
+OTP_LIMITS = [limit("otp:ip", "ip", "20/h"), limit("otp:user", "user", "6/h"), limit("otp:phone", "phone", "6/h")]
+
 
 def _send_otp_email_bg(email: str, raw_code: str) -> None:
     """Send an OTP email in a daemon thread so it never blocks the HTTP response."""
@@ -56,6 +60,7 @@ class RegistrationVerifyRequestView(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = OTP_LIMITS
 
     def post(self, request):
         user = request.user
@@ -155,6 +160,7 @@ class OtpRequestView(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = OTP_LIMITS
 
     def post(self, request):
         user = request.user
@@ -8,8 +8,6 @@ Overrides the default admin `index` to inject dashboard statistics
 import logging
 
 from django.contrib import admin
-from django.db.models import Count, Sum
-from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
@@ -20,49 +18,23 @@ class TippingJarAdminSite(admin.AdminSite):
     index_title = "Dashboard"
 
     def index(self, request, extra_context=None):
-        """Render the admin index with live dashboard stats."""
+        """Render the admin index with the dashboard stats snapshot."""
         ctx = extra_context or {}
         ctx.update(self._gather_stats())
         return super().index(request, extra_context=ctx)
 
     def _gather_stats(self) -> dict:
         try:
-            from apps.creators.models import CreatorProfile
-            from apps.support.models import ContactMessage, Dispute
-            from apps.support.sms import get_sms_credits
             from apps.tips.models import Tip
-            from apps.users.models import OTP, User
-
-            today = timezone.now().date()
-            month_start = today.replace(day=1)
-
-            # ── Tips ──────────────────────────────────────────────────────────
-            tips_qs = Tip.objects.all()
-            completed = tips_qs.filter(status="completed")
-            tips_value = completed.aggregate(v=Sum("amount"))["v"] or 0
-            tips_this_month = completed.filter(created_at__date__gte=month_start)
-            tips_month_value = tips_this_month.aggregate(v=Sum("amount"))["v"] or 0
-            tips_today_count = completed.filter(created_at__date=today).count()
-
-            # ── Users ─────────────────────────────────────────────────────────
-            users_by_role = User.objects.values("role").annotate(n=Count("id"))
-            role_map = {r["role"]: r["n"] for r in users_by_role}
-
-            # ── Support ───────────────────────────────────────────────────────
-            dispute_counts = (
-                Dispute.objects.values("status").annotate(n=Count("id"))
-            )
-            dispute_map = {d["status"]: d["n"] for d in dispute_counts}
+            from apps.users.models import User
 
-            # ── OTP stats ─────────────────────────────────────────────────────
-            otp_today = OTP.objects.filter(created_at__date=today)
-            otp_by_method = otp_today.values("method").annotate(n=Count("id"))
-            otp_method_map = {o["method"]: o["n"] for o in otp_by_method}
+            from .stats import get_platform_stats, get_sms_credits_cached
 
-            # ── SMS credits ───────────────────────────────────────────────────
-            sms_data = get_sms_credits()
+            # Counts come from the cached snapshot (core/stats.py); only the
+            # two short "recent" lists are read live.
+            snapshot = get_platform_stats()
+            sms_data = get_sms_credits_cached()
 
-            # ── Recent ────────────────────────────────────────────────────────
             recent_tips = (
                 Tip.objects.select_related("creator", "tipper")
                 .order_by("-created_at")[:8]
@@ -70,32 +42,13 @@ class TippingJarAdminSite(admin.AdminSite):
             recent_users = User.objects.order_by("-date_joined")[:8]
 
             return {
-                # Tips
-                "tips_total": completed.count(),
-                "tips_value": tips_value,
-                "tips_pending": tips_qs.filter(status="pending").count(),
-                "tips_failed": tips_qs.filter(status="failed").count(),
-                "tips_today": tips_today_count,
-                "tips_month_value": tips_month_value,
-                # Users
-                "users_total": User.objects.count(),
-                "users_fans": role_map.get("fan", 0),
-                "users_creators": role_map.get("creator", 0),
-                "users_new_month": User.objects.filter(date_joined__date__gte=month_start).count(),
-                # Creators
-                "creators_active": CreatorProfile.objects.filter(is_active=True).count(),
-                # Support
-                "contacts_pending": ContactMessage.objects.filter(is_resolved=False).count(),
-                "disputes_open": dispute_map.get("open", 0),
-                "disputes_investigating": dispute_map.get("investigating", 0),
-                "disputes_resolved": dispute_map.get("resolved", 0),
-                # OTP
-                "otp_email_today": otp_method_map.get("email", 0),
-                "otp_sms_today": otp_method_map.get("sms", 0),
+                **snapshot["stats"],
+                "stats_computed_at": snapshot["computed_at"],
                 # SMS Portal
                 "sms_credits": sms_data.get("credits"),
                 "sms_credits_raw": sms_data.get("raw", ""),
                 "sms_configured": bool(sms_data.get("success")),
+                "sms_checked_at": sms_data.get("fetched_at"),
                 # Recent activity
                 "recent_tips": recent_tips,
                 "recent_users": recent_users,
@@ -107,3 +60,22 @@ class TippingJarAdminSite(admin.AdminSite):
 
 # Singleton — replaces the default admin.site
 admin_site = TippingJarAdminSite(name="tippingjar_admin")
+
+
+class SummernoteFieldsMixin:
+    """
+    ``SummernoteModelAdmin`` for ``summernote_fields``, without importing
+    ``django_summernote.admin`` (and through its forms, Pillow) when the
+    admin is autodiscovered — every process pays for that at ``setup()``,
+    including each cron command. The widget is imported on first use.
+    """
+
+    summernote_fields: tuple = ()
+
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        if db_field.name in self.summernote_fields:
+            from django_summernote.utils import get_config
+            from django_summernote.widgets import SummernoteInplaceWidget, SummernoteWidget
+
+            kwargs["widget"] = SummernoteWidget if get_config()["iframe"] else SummernoteInplaceWidget
+        return super().formfield_for_dbfield(db_field, request, **kwargs)
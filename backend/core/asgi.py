@@ -0,0 +1,20 @@
+"""
+ASGI entry point.
+
+Serves the whole API like ``core.wsgi``, plus the endpoints that need a
+long-lived or async connection (the live tip stream, apps/tips/live.py).
+Run with uvicorn:
+
+  uvicorn core.asgi:application --host 0.0.0.0 --port 8001 --workers 2
+"""
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+application = get_asgi_application()
+
+# One loop per worker for the life of the process: pool Paystack connections on it
+from apps.payments import paystack_async  # noqa: E402
+
+paystack_async.share_clients()
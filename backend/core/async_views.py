@@ -0,0 +1,55 @@
+"""
+Async DRF views.
+
+DRF's ``APIView.dispatch`` is synchronous, so an ``async def post`` on a
+plain APIView is never awaited. ``AsyncAPIView`` keeps DRF's request
+parsing, authentication, permissions, throttling, exception handling and
+rendering — each run through ``sync_to_async`` since they may touch the
+database — and awaits the handler in between:
+
+    initialize_request / initial       sync_to_async
+    await handler(request)             I/O-bound work (e.g. Paystack) is awaited;
+                                       ORM calls inside go through sync_to_async
+    handle_exception / finalize        sync_to_async
+
+Under ASGI the awaited part holds no thread. Under WSGI Django runs the view
+on a per-request event loop, so behaviour is unchanged there.
+"""
+
+from asgiref.sync import sync_to_async
+from django.utils.decorators import classonlymethod
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """APIView whose HTTP handlers are ``async def``."""
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if not cls.view_is_async:
+            raise TypeError(f"{cls.__name__} must define async handlers.")
+        return view
+
+    async def options(self, request, *args, **kwargs):
+        return await sync_to_async(super().options)(request, *args, **kwargs)
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = await sync_to_async(self.initialize_request)(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            method = request.method.lower()
+            handler = getattr(self, method, None) if method in self.http_method_names else None
+            if handler is None:
+                self.http_method_not_allowed(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,209 @@
+"""
+Two-level read-through cache.
+
+    request ──► per-process LRU ──► shared backend (CACHES["default"]) ──► compute()
+
+The local LRU absorbs hot keys without a network round trip; the shared
+backend (Redis / memcached / database cache — see CACHE_URL) lets every
+worker reuse a value computed once. On a miss only one caller per process
+runs ``compute()`` (the rest wait for its result), and when the shared
+backend supports ``add`` a short lock key keeps other processes from
+recomputing the same value at the same time.
+
+Invalidation is by key versioning: callers bake a version token into the
+key and bump the token on write, so stale entries are never read again and
+simply age out.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def is_shared(alias: str = "default") -> bool:
+    """Whether every worker sees the same ``CACHES[alias]`` — false for local memory and the dummy cache."""
+    from django.conf import settings
+
+    return not settings.CACHES[alias]["BACKEND"].endswith((".LocMemCache", ".DummyCache"))
+
+
+class LocalLRU:
+    """Thread-safe bounded LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ReadThroughCache:
+    """
+    ``get_or_compute(key, compute)`` over a LocalLRU and a Django cache alias.
+
+    ``compute`` returning ``None`` means "do not cache" (e.g. a 404); the
+    value is passed back to the caller unchanged.
+    """
+
+    def __init__(self, name: str, ttl: int = 300, local_ttl: int | None = None,
+                 max_entries: int = 2048, alias: str = "default",
+                 lock_timeout: float = 2.0):
+        self.name = name
+        self.ttl = ttl
+        self.local_ttl = ttl if local_ttl is None else local_ttl
+        self.alias = alias
+        self.lock_timeout = lock_timeout
+        self.local = LocalLRU(max_entries)
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("local_hits", "shared_hits", "misses", "coalesced", "uncacheable", "errors"), 0
+        )
+
+    # ── Metrics ───────────────────────────────────────────────────────
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            data = dict(self._stats)
+        lookups = data["local_hits"] + data["shared_hits"] + data["misses"] + data["coalesced"]
+        data["hit_ratio"] = round(
+            (data["local_hits"] + data["shared_hits"] + data["coalesced"]) / lookups, 4
+        ) if lookups else None
+        data["local_entries"] = len(self.local)
+        data["name"] = self.name
+        return data
+
+    # ── Shared backend (failures degrade to local-only) ───────────────
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def _shared_get(self, key):
+        try:
+            return self.shared.get(key, _MISSING)
+        except Exception as exc:  # backend down must never break a read
+            self._count("errors")
+            logger.warning("%s cache: shared get failed: %s", self.name, exc)
+            return _MISSING
+
+    def _shared_set(self, key, value) -> None:
+        try:
+            self.shared.set(key, value, self.ttl)
+        except Exception as exc:
+            self._count("errors")
+            logger.warning("%s cache: shared set failed: %s", self.name, exc)
+
+    # ── Read-through ─────────────────────────────────────────────────
+
+    def get_or_compute(self, key: str, compute):
+        value = self.local.get(key)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+
+        value = self._shared_get(key)
+        if value is not _MISSING:
+            self._count("shared_hits")
+            self.local.set(key, value, self.local_ttl)
+            return value
+
+        # Coalesce concurrent misses inside this process
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+
+        if not leader:
+            event.wait(self.lock_timeout)
+            value = self.local.get(key)
+            if value is not _MISSING:
+                self._count("coalesced")
+                return value
+            # Leader failed or produced an uncacheable value — compute ourselves
+            return self._compute(key, compute)
+
+        try:
+            return self._compute_with_shared_lock(key, compute)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _compute_with_shared_lock(self, key, compute):
+        lock_key = f"{key}:lock"
+        try:
+            got_lock = self.shared.add(lock_key, 1, int(self.lock_timeout) + 1)
+        except Exception:
+            got_lock = True
+        if not got_lock:
+            # Another process is computing this key — briefly wait for its result
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = self._shared_get(key)
+                if value is not _MISSING:
+                    self._count("coalesced")
+                    self.local.set(key, value, self.local_ttl)
+                    return value
+        try:
+            return self._compute(key, compute)
+        finally:
+            if got_lock:
+                try:
+                    self.shared.delete(lock_key)
+                except Exception:
+                    pass
+
+    def set(self, key: str, value) -> None:
+        """Write-through: publish a freshly built value (e.g. from a refresh job)."""
+        self.local.set(key, value, self.local_ttl)
+        self._shared_set(key, value)
+
+    def _compute(self, key, compute):
+        self._count("misses")
+        value = compute()
+        if value is None:
+            self._count("uncacheable")
+            return None
+        self.local.set(key, value, self.local_ttl)
+        self._shared_set(key, value)
+        return value
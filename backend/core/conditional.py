@@ -0,0 +1,96 @@
+"""
+Conditional GET for DRF views.
+
+A view declares a cheap *freshness key* — typically ``MAX(updated_at)`` plus
+a row count from one indexed aggregate, or a version token — by overriding
+``get_freshness()``. The mixin turns it into ``ETag`` / ``Last-Modified``
+validators and answers ``If-None-Match`` / ``If-Modified-Since`` with a
+304 before the view touches its queryset or serializer.
+
+Last-Modified follows the ETag, not the rows: a delete or unpublish lowers
+``MAX(updated_at)``, and a client holding the newer date would be told
+nothing changed. Instead each URL remembers (in the default cache) the ETag
+it last served and when that ETag first appeared; a new ETag gets a later
+timestamp than the one it replaces.
+
+    etag unchanged  → same Last-Modified as before
+    etag changed    → max(now, previous + 1s)
+    cache evicted   → now (only costs clients a full response)
+
+    class BlogPostListView(ConditionalGetMixin, generics.ListAPIView):
+        cache_control = "public, max-age=300, stale-while-revalidate=86400"
+
+        def get_freshness(self, request, *args, **kwargs):
+            row = BlogPost.objects.filter(is_published=True).aggregate(...)
+            return f"{row['n']}", row["m"]
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+LAST_MODIFIED_TTL = getattr(settings, "CONDITIONAL_LAST_MODIFIED_TTL", 7 * 24 * 3600)
+
+
+def apply_validators(response, etag=None, last_modified=None, cache_control=None):
+    """Attach validators and Cache-Control to a 200 / 304 response."""
+    if response.status_code not in (200, 304):
+        return response
+    if etag:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    if cache_control:
+        response["Cache-Control"] = cache_control
+    return response
+
+
+def last_modified_for(resource: str, etag: str) -> int:
+    """When ``resource`` (a path + query) first served ``etag``, as a Unix timestamp."""
+    key = "conditional:modified:" + hashlib.md5(resource.encode()).hexdigest()
+    seen = cache.get(key)
+    if seen and seen[0] == etag:
+        return seen[1]
+    stamp = int(time.time())
+    if seen:
+        stamp = max(stamp, seen[1] + 1)
+    cache.set(key, (etag, stamp), LAST_MODIFIED_TTL)
+    return stamp
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs from ``get_freshness()`` without serializing."""
+
+    cache_control = "public, max-age=60, stale-while-revalidate=300"
+
+    def get_freshness(self, request, *args, **kwargs):
+        """
+        Return ``(key, last_modified)``.
+
+        ``key`` is any string that changes whenever the response body would
+        (the query string is mixed in automatically); ``last_modified`` is
+        an aware datetime or None, used only when there is no key — with a
+        key, Last-Modified is derived from it (see the module docstring).
+        Return ``(None, None)`` to opt out.
+        """
+        return None, None
+
+    def get(self, request, *args, **kwargs):
+        key, modified_at = self.get_freshness(request, *args, **kwargs)
+
+        etag = None
+        last_modified = int(modified_at.timestamp()) if modified_at else None
+        if key is not None:
+            digest = hashlib.md5(f"{key}|{request.GET.urlencode()}".encode()).hexdigest()
+            etag = f'W/"{digest}"'
+            last_modified = last_modified_for(request.get_full_path(), etag)
+
+        response = None
+        if etag or last_modified:
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return apply_validators(response, etag, last_modified, self.cache_control)
@@ -0,0 +1,233 @@
+"""
+Resized variants of uploaded images.
+
+Avatars, creator covers, blog covers and image posts are uploaded as-is —
+often multi-megabyte phone photos — and used to be served at that size.
+Each original now gets width-bounded variants in two formats, stored next
+to it:
+
+    covers/beach.jpg   →   covers/beach.thumb.webp   covers/beach.thumb.jpg
+                           covers/beach.card.webp    covers/beach.card.jpg
+                           covers/beach.hero.webp    covers/beach.hero.jpg
+
+    thumb  200 px wide      card  640 px      hero  1600 px
+    (never upscaled; EXIF orientation applied; JPEG flattened onto white)
+
+Variants are made:
+
+    on upload     post_save of a watched field (see SOURCES) → after commit,
+                  ``generate`` on a small thread pool (IMAGE_WORKERS)
+    lazily        GET /api/images/<variant>.<fmt>/<original> generates any
+                  missing variant, then redirects to it
+    in bulk       ``manage.py regenerate_images`` on a process pool
+
+``srcset(name)`` turns an original into ``{"webp": ..., "jpg": ...}``
+srcset strings; ``SrcsetField`` exposes it on serializers. Once ``generate``
+has run, a cache marker holds the real variant widths and the srcset points
+straight at storage; without it the srcset points at the lazy endpoint, so a
+variant that is missing (never generated, or generated by a worker whose
+cache this process does not share) is made on first request.
+
+Pillow is imported only when an image is actually resized, keeping it out
+of worker start-up.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import Http404, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from rest_framework import serializers
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from core.ratelimit import limit
+
+logger = logging.getLogger(__name__)
+
+# variant → maximum width in px, largest first
+VARIANTS = {"hero": 1600, "card": 640, "thumb": 200}
+# extension → (Pillow format, save options)
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+# (model, field, filter) of every image field that gets variants
+SOURCES = (
+    ("users.User", "avatar", {}),
+    ("creators.CreatorProfile", "cover_image", {}),
+    ("blog.BlogPost", "cover_image", {}),
+    ("creators.CreatorPost", "media_file", {"post_type": "image"}),
+)
+# Upload directories the lazy endpoint will read from
+PREFIXES = ("avatars/", "covers/", "blog/covers/", "posts/")
+WORKERS = getattr(settings, "IMAGE_WORKERS", 2)
+READY_SECONDS = 30 * 24 * 60 * 60
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def variant_name(name: str, variant: str, fmt: str) -> str:
+    """``covers/beach.jpg`` → ``covers/beach.card.webp``."""
+    return f"{os.path.splitext(name)[0]}.{variant}.{fmt}"
+
+
+def is_variant(name: str) -> bool:
+    root, fmt = os.path.splitext(name)
+    return fmt[1:] in FORMATS and os.path.splitext(root)[1][1:] in VARIANTS
+
+
+def _ready_key(name: str) -> str:
+    return f"images:ready:{hashlib.sha256(name.encode()).hexdigest()[:32]}"
+
+
+# ── Generation ────────────────────────────────────────────────────────────────
+
+def _flatten(image, fmt: str):
+    """``image`` in a mode the format can save: RGB(A) for WebP, RGB on white for JPEG."""
+    from PIL import Image
+
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    has_alpha = image.mode in ("RGBA", "LA")
+    if fmt == "webp":
+        return image if image.mode in ("RGB", "RGBA") else image.convert("RGBA" if has_alpha else "RGB")
+    if not has_alpha:
+        return image if image.mode == "RGB" else image.convert("RGB")
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.convert("RGBA").getchannel("A"))
+    return background
+
+
+def generate(name: str, force: bool = False) -> dict:
+    """
+    Write every missing variant of ``name`` (all of them with ``force``).
+
+    Returns ``{variant: width}`` and records it as the cache marker
+    ``srcset`` uses. Raises OSError (Pillow's UnidentifiedImageError
+    included) when the original is missing or not an image.
+    """
+    from PIL import Image, ImageOps
+
+    with default_storage.open(name, "rb") as fh, Image.open(fh) as original:
+        # JPEG decodes at 1/2, 1/4 or 1/8 scale when that still covers the largest variant
+        hero = VARIANTS["hero"]
+        original.draft("RGB", (hero, hero))
+        image = ImageOps.exif_transpose(original)
+        image.load()
+
+    widths = {}
+    for variant, width in VARIANTS.items():
+        if image.width > width:
+            # Each variant is resized from the previous, larger one
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        widths[variant] = image.width
+        for fmt, (pil_format, options) in FORMATS.items():
+            target = variant_name(name, variant, fmt)
+            if default_storage.exists(target):
+                if not force:
+                    continue
+                default_storage.delete(target)  # storages rename rather than overwrite
+            buffer = io.BytesIO()
+            _flatten(image, fmt).save(buffer, pil_format, **options)
+            default_storage.save(target, ContentFile(buffer.getvalue()))
+    cache.set(_ready_key(name), widths, READY_SECONDS)
+    return widths
+
+
+def generate_quietly(name: str, force: bool = False) -> tuple[str, dict | None, str]:
+    """``(name, widths, "")``, or ``(name, None, error)``; never raises — for pools."""
+    try:
+        return name, generate(name, force), ""
+    except Exception as exc:
+        logger.warning("images: variants of %s failed: %s", name, exc)
+        return name, None, str(exc)
+
+
+def _submit(name: str) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="images")
+    _executor.submit(generate_quietly, name)
+
+
+def schedule(instance, field: str, update_fields=None) -> None:
+    """post_save hook: generate variants of ``instance.<field>`` in the background once committed."""
+    if update_fields is not None and field not in update_fields:
+        return
+    name = getattr(instance, field).name
+    if not name or is_variant(name) or cache.get(_ready_key(name)) is not None:
+        return
+    transaction.on_commit(lambda: _submit(name))
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def srcset(name: str, request=None) -> dict | None:
+    """``{"webp": "<url> 200w, …", "jpg": …}`` for an original, or ``None`` without one."""
+    if not name:
+        return None
+    widths = cache.get(_ready_key(name))
+
+    def url(variant, fmt):
+        if widths is not None:
+            target = default_storage.url(variant_name(name, variant, fmt))
+        else:
+            target = reverse("image-variant", args=[variant, fmt, name])
+        return request.build_absolute_uri(target) if request is not None else target
+
+    sizes = widths or VARIANTS
+    return {
+        fmt: ", ".join(f"{url(variant, fmt)} {sizes[variant]}w" for variant in reversed(VARIANTS))
+        for fmt in FORMATS
+    }
+
+
+class SrcsetField(serializers.Field):
+    """Read-only ``srcset()`` of an image field: ``avatar_srcset = SrcsetField(source="avatar")``."""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return srcset(value.name if value else "", self.context.get("request"))
+
+
+class VariantView(APIView):
+    """GET /api/images/<variant>.<fmt>/<original> — make the variant if missing, then redirect to it."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = [limit("images:ip", "ip", "120/m")]
+
+    def get(self, request, variant, fmt, name):
+        from PIL import Image
+
+        if (
+            variant not in VARIANTS or fmt not in FORMATS or is_variant(name)
+            or not name.startswith(PREFIXES) or ".." in name.split("/")
+        ):
+            raise Http404
+        target = variant_name(name, variant, fmt)
+        if not default_storage.exists(target):
+            try:
+                generate(name)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                raise Http404 from None
+        response = HttpResponseRedirect(default_storage.url(target))
+        # A variant never changes under its name: a new upload gets a new name
+        patch_cache_control(response, public=True, max_age=24 * 60 * 60)
+        return response
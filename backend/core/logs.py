@@ -0,0 +1,167 @@
+"""
+Non-blocking structured logging.
+
+Request threads never write to stderr themselves. ``LOGGING`` routes the
+``apps`` and ``core`` loggers to ``queue_handler()``:
+
+    logger.info(...)                        (request thread)
+        └─► NonBlockingQueueHandler
+              attach request context, merge msg % args
+              put_nowait() on a bounded queue ──► never waits
+                  queue ≥ 80% of LOG_QUEUE_SIZE: keep 1 in LOG_SAMPLE_EVERY
+                                                 records below WARNING
+                  queue full:                    drop the record
+              (both counted per level)
+    DroppingQueueListener                    (one daemon thread)
+        └─► StreamHandler + JsonFormatter ──► stderr, one JSON object per line
+            every REPORT_SECONDS: "log records dropped" with the counters
+
+The request context (request id, view name, creator id) lives in a
+ContextVar set by ``core.middleware.RequestLogMiddleware`` and survives
+``sync_to_async``; views add fields with ``bind(creator_id=...)``. The
+middleware also logs one ``request`` line per response with its timing.
+"""
+
+import atexit
+import collections
+import contextvars
+import datetime
+import json
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default=None)
+
+CONTEXT_FIELDS = ("request_id", "view", "creator_id", "duration_ms", "status")
+REPORT_SECONDS = 10
+
+
+def begin_request(**fields) -> dict:
+    """Start a fresh context for the current request; returns it for later ``bind`` calls."""
+    context = dict(fields)
+    _context.set(context)
+    return context
+
+
+def bind(**fields) -> None:
+    """Add fields (e.g. ``creator_id``) to every record logged for the rest of this request."""
+    context = _context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def end_request() -> None:
+    _context.set(None)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, context fields, traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler over a bounded queue that sheds low-severity records instead of waiting."""
+
+    def __init__(self, maxsize: int, sample_at: float, sample_every: int):
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self.sample_from = int(maxsize * sample_at)
+        self.sample_every = max(1, sample_every)
+        self.dropped: collections.Counter = collections.Counter()
+        self.sampled: collections.Counter = collections.Counter()
+        self._seen = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the cheap part happens here; JSON and tracebacks are formatted on the listener thread
+        record.msg, record.args = record.getMessage(), None
+        context = _context.get()
+        if context:
+            for field, value in context.items():
+                if not hasattr(record, field):
+                    setattr(record, field, value)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped[record.levelname] += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and self.queue.qsize() >= self.sample_from:
+            self._seen += 1
+            if self._seen % self.sample_every:
+                self.sampled[record.levelname] += 1
+                return
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def take_counts(self) -> dict:
+        """Counters since the last call, then reset (racy increments may slip to the next report)."""
+        counts = {"dropped": dict(self.dropped), "sampled": dict(self.sampled)}
+        self.dropped.clear()
+        self.sampled.clear()
+        return counts
+
+
+class DroppingQueueListener(QueueListener):
+    """QueueListener that periodically logs how many records its handler shed."""
+
+    def __init__(self, source: NonBlockingQueueHandler, *handlers):
+        super().__init__(source.queue, *handlers, respect_handler_level=True)
+        self.source = source
+        self._reported = time.monotonic()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if time.monotonic() - self._reported >= REPORT_SECONDS:
+            self._reported = time.monotonic()
+            counts = self.source.take_counts()
+            if counts["dropped"] or counts["sampled"]:
+                report = logging.LogRecord(
+                    "core.logs", logging.WARNING, __file__, 0, "log records dropped: %s", (counts,), None,
+                )
+                super().handle(report)
+
+
+def queue_handler(maxsize: int = 10000, sample_at: float = 0.8, sample_every: int = 10, stream=None):
+    """``LOGGING`` handler factory: the queue handler plus a started listener writing JSON lines."""
+    handler = NonBlockingQueueHandler(maxsize, sample_at, sample_every)
+    target = logging.StreamHandler(stream or sys.stderr)
+    target.setFormatter(JsonFormatter())
+    listener = DroppingQueueListener(handler, target)
+    listener.start()
+    atexit.register(listener.stop)
+    handler.listener = listener
+
+    def restart_in_child():
+        # Threads do not survive fork (gunicorn --preload): give the child its own queue and listener
+        handler.queue = listener.queue = queue.Queue(handler.maxsize)
+        listener._thread = None
+        listener.start()
+
+    os.register_at_fork(after_in_child=restart_in_child)
+    return handler
+
@@ -0,0 +1,148 @@
+"""
+Project middleware.
+
+RequestLogMiddleware
+--------------------
+Gives every request an id (``X-Request-ID`` from the proxy, or a new one),
+opens the logging context (core/logs.py) so each record logged while
+handling it carries the request id, view name and whatever the view binds
+(creator id), and logs one ``request`` line with status and duration. It
+runs natively in both modes, so it never adds a thread hop under ASGI.
+
+CreatorProfileMiddleware
+------------------------
+Sets ``request.creator_profile``: the authenticated user's CreatorProfile,
+or a falsy ``None``. It is lazy and reads ``request.user`` when first used,
+so it sees the user DRF authenticated. For JWT requests the profile id
+comes from the cached principal (apps/users/principal.py), so creator
+dashboards filter by it without looking the profile up by user first.
+
+AsyncWhiteNoiseMiddleware
+-------------------------
+WhiteNoiseMiddleware 6.x is sync-only. One sync middleware in the stack
+makes Django adapt the whole chain around it, and every request —
+including the async checkout views — then passes through a thread with
+``thread_sensitive=True``: concurrent checkouts queue behind each other
+instead of awaiting Paystack side by side. This subclass serves static
+files the same way and awaits the rest of the chain under ASGI.
+"""
+
+import logging
+import re
+import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.functional import SimpleLazyObject
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import logs
+
+request_logger = logging.getLogger("core.requests")
+
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestLogMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            self.process_view = self._aprocess_view
+
+    def _begin(self, request) -> dict:
+        request_id = request.headers.get("X-Request-ID", "")
+        if not _REQUEST_ID_RE.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+        return logs.begin_request(request_id=request_id)
+
+    def _finish(self, request, response, context, started) -> None:
+        response["X-Request-ID"] = context["request_id"]
+        context["status"] = response.status_code
+        context["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        request_logger.info("%s %s", request.method, request.path)
+        logs.end_request()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started, context = time.perf_counter(), self._begin(request)
+        response = self.get_response(request)
+        self._finish(request, response, context, started)
+        return response
+
+    async def __acall__(self, request):
+        started, context = time.perf_counter(), self._begin(request)
+        response = await self.get_response(request)
+        self._finish(request, response, context, started)
+        return response
+
+    @staticmethod
+    def _bind_view(request, view_func) -> None:
+        match = request.resolver_match
+        logs.bind(view=(match and match.view_name) or getattr(view_func, "__name__", None))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self._bind_view(request, view_func)
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self._bind_view(request, view_func)
+
+
+class CreatorProfileMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _attach(request) -> None:
+        from apps.users import principal
+
+        request.creator_profile = SimpleLazyObject(lambda: principal.creator_profile(request.user))
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        self._attach(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self._attach(request)
+        return await self.get_response(request)
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def _static_file(self, request):
+        if self.autorefresh:
+            return self.find_file(request.path_info)
+        return self.files.get(request.path_info)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        static_file = self._static_file(request)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
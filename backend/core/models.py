@@ -0,0 +1,16 @@
+class LoadDeferredTogetherMixin:
+    """
+    Model mixin for instances built with most columns deferred on purpose
+    (see apps/users/principal.py). When ``load_deferred_together`` is set on
+    an instance, the first read of a deferred field loads all of them in one
+    query instead of one query per field.
+    """
+
+    load_deferred_together = False
+
+    def refresh_from_db(self, using=None, fields=None):
+        if fields is not None and self.load_deferred_together:
+            deferred = self.get_deferred_fields()
+            if deferred.issuperset(fields):
+                fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields)
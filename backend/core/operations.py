@@ -0,0 +1,26 @@
+"""
+Migration operations shared across apps.
+
+Keep this module stable: migrations import it, so changing what an
+operation does changes what old migrations do when replayed.
+"""
+
+from django.db import migrations
+
+
+class PostgresRunSQL(migrations.RunSQL):
+    """
+    ``RunSQL`` that only runs on Postgres.
+
+    For extensions and index types (pg_trgm, GIN, tsvector) that SQLite, used
+    by the test suite, has no equivalent for; there the operation is a no-op
+    in both directions.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,43 @@
+"""
+Shared pagination classes.
+
+Most list endpoints use DRF's PageNumberPagination (see REST_FRAMEWORK in
+settings). Tables that grow without bound use keyset (cursor) pagination
+instead: the cursor encodes the last row's ordering value, so every page is
+a single indexed range scan no matter how deep the client pages.
+"""
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over ``ordering`` (newest first by default).
+
+    Subclasses override ``ordering`` to match a composite index. The
+    ``?page_size=`` query param is honoured up to ``max_page_size``.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class HeaderKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for endpoints whose clients expect a bare JSON list.
+
+    The body stays a list; the next / previous page URLs go in an RFC 8288
+    ``Link`` header so existing clients keep working and new ones can page.
+    """
+
+    def get_paginated_response(self, data):
+        links = []
+        if next_url := self.get_next_link():
+            links.append(f'<{next_url}>; rel="next"')
+        if previous_url := self.get_previous_link():
+            links.append(f'<{previous_url}>; rel="prev"')
+        headers = {"Link": ", ".join(links)} if links else None
+        return Response(data, headers=headers)
@@ -0,0 +1,272 @@
+"""
+Rate limiting for public and cost-bearing endpoints.
+
+Tip checkout, pledges, OTPs, the contact and dispute forms and post access
+are anonymous or cheap to call, and each call can cost a Paystack request,
+an SMTP send or SMS credit. Views declare their limits as DRF throttles:
+
+    throttle_classes = [limit("otp:ip", "ip", "20/h"), limit("otp:user", "user", "6/h")]
+
+A scope names one counter and may be shared by several views (both OTP
+views count against "otp:*"). Each limit keys on one identity:
+
+    ip        client address (DRF ``get_ident``, honours NUM_PROXIES)
+    email     body ``email`` / ``fan_email`` / ``tipper_email``, else the user's email
+    phone     body ``phone`` / ``phone_number``, else the user's phone number
+    user      the authenticated user
+    api_key   the ApiKey or Platform the request authenticated with
+    creator   ``slug`` URL kwarg or body ``creator_slug``
+
+A request without that identity (no email, anonymous for ``user``) is not
+limited by it. Identities are hashed before they reach the store.
+
+Sliding-window counter: two fixed-window counters per key, O(1) per check:
+
+    incr current window (atomic) ──► estimate = current + previous × (share
+                                     of the previous window still in range)
+    estimate ≤ limit   allow
+    estimate > limit   undo the increment (rejections don't extend the
+                       block), 429 with Retry-After = seconds until one more
+                       request fits
+
+Counters live in the shared store picked by RATE_LIMIT_BACKEND:
+
+    "cache"      the RATE_LIMIT_CACHE alias: add + incr, atomic on locmem,
+                 Redis and Memcached (not on the database cache)
+    "database"   RateLimitCounter rows, one INSERT … ON CONFLICT DO UPDATE
+                 … RETURNING per hit; ``manage.py purge_rate_limits`` drops
+                 expired rows
+
+Rates can be overridden per scope with RATE_LIMITS. Every rejection is
+logged on ``core.ratelimit`` and counted per scope and hour in the default
+cache; ``fired_counts()`` feeds GET /api/admin/rate-limits/.
+"""
+
+import datetime
+import hashlib
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+FIRED_KEY = "ratelimit:fired"
+_FIRED_RETAIN = 25 * 60 * 60
+_PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+# scope → (identity, rate) of every declared limit
+SCOPES: dict[str, tuple[str, str]] = {}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """``"20/h"`` → ``(20, 3600)``."""
+    count, _, period = rate.partition("/")
+    if not count.isdigit() or int(count) < 1 or period[:1] not in _PERIODS:
+        raise ValueError(f"Invalid rate {rate!r}; expected e.g. '20/h'.")
+    return int(count), _PERIODS[period[0]]
+
+
+# ── Identities ────────────────────────────────────────────────────────────────
+
+def _field(request, *names) -> str:
+    data = request.data
+    if not hasattr(data, "get"):
+        return ""
+    for name in names:
+        value = data.get(name)
+        if value and isinstance(value, str):
+            return value.strip()
+    return ""
+
+
+def _ip(throttle, request, view):
+    return throttle.get_ident(request)
+
+
+def _email(throttle, request, view):
+    email = _field(request, "email", "fan_email", "tipper_email")
+    if not email and request.user.is_authenticated:
+        email = request.user.email
+    return email.lower() or None
+
+
+def _phone(throttle, request, view):
+    phone = _field(request, "phone", "phone_number")
+    if not phone and request.user.is_authenticated:
+        phone = request.user.phone_number
+    return phone.replace(" ", "") or None
+
+
+def _user(throttle, request, view):
+    return request.user.pk if request.user.is_authenticated else None
+
+
+def _api_key(throttle, request, view):
+    auth = request.auth
+    meta = getattr(auth, "_meta", None)  # ApiKey / Platform instances, not JWT tokens
+    return f"{meta.label_lower}:{auth.pk}" if meta else None
+
+
+def _creator(throttle, request, view):
+    return view.kwargs.get("slug") or _field(request, "creator_slug") or None
+
+
+IDENTITIES = {
+    "ip": _ip, "email": _email, "phone": _phone, "user": _user, "api_key": _api_key, "creator": _creator,
+}
+
+
+# ── Stores ────────────────────────────────────────────────────────────────────
+
+class CacheCounters:
+    def __init__(self, alias: str):
+        self.cache = caches[alias]
+
+    def hit(self, key: str, previous_key: str, ttl: int) -> tuple[int, int]:
+        self.cache.add(key, 0, ttl)
+        try:
+            current = self.cache.incr(key)
+        except ValueError:  # evicted between add and incr
+            self.cache.set(key, 1, ttl)
+            current = 1
+        return current, self.cache.get(previous_key, 0)
+
+    def undo(self, key: str) -> None:
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            pass
+
+
+class DatabaseCounters:
+    def hit(self, key: str, previous_key: str, ttl: int) -> tuple[int, int]:
+        from apps.support.models import RateLimitCounter
+
+        meta, quote = RateLimitCounter._meta, connection.ops.quote_name
+        table, count = quote(meta.db_table), quote("count")
+        expires_at = meta.get_field("expires_at").get_db_prep_value(
+            timezone.now() + datetime.timedelta(seconds=ttl), connection,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({quote('key')}, {count}, {quote('expires_at')}) VALUES (%s, 1, %s) "
+                f"ON CONFLICT ({quote('key')}) DO UPDATE SET {count} = {table}.{count} + 1 RETURNING {count}",
+                [key, expires_at],
+            )
+            current = cursor.fetchone()[0]
+        previous = RateLimitCounter.objects.filter(key=previous_key).values_list("count", flat=True).first()
+        return current, previous or 0
+
+    def undo(self, key: str) -> None:
+        from apps.support.models import RateLimitCounter
+
+        RateLimitCounter.objects.filter(key=key, count__gt=0).update(count=F("count") - 1)
+
+
+def purge_expired() -> int:
+    """Delete expired RateLimitCounter rows; returns how many."""
+    from apps.support.models import RateLimitCounter
+
+    return RateLimitCounter.objects.filter(expires_at__lt=timezone.now()).delete()[0]
+
+
+_stores: dict = {}
+
+
+def _store():
+    backend = getattr(settings, "RATE_LIMIT_BACKEND", "cache")
+    alias = getattr(settings, "RATE_LIMIT_CACHE", "default")
+    if (backend, alias) not in _stores:
+        _stores[backend, alias] = DatabaseCounters() if backend == "database" else CacheCounters(alias)
+    return _stores[backend, alias]
+
+
+# ── Throttle ──────────────────────────────────────────────────────────────────
+
+def retry_after(limit: int, period: int, elapsed: float, current: int, previous: int) -> int:
+    """Seconds until one more request fits, given the counts without the rejected one."""
+    if current < limit:
+        # Still inside this window, once enough of the previous one has slid out
+        wait = period * (1 - (limit - current - 1) / previous) - elapsed
+    else:
+        # The next window, once enough of this one has slid out
+        wait = period - elapsed + period * (1 - (limit - 1) / current)
+    return max(1, math.ceil(wait))
+
+
+def _fired(scope: str) -> None:
+    key = f"{FIRED_KEY}:{scope}:{int(time.time() // 3600)}"
+    cache.add(key, 0, _FIRED_RETAIN)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def fired_counts(hours: int = 24) -> dict:
+    """``{scope: {"identity", "rate", "last_hour", "last_24h"}}`` from the shared rejection counters."""
+    now = int(time.time() // 3600)
+    keys = {(scope, hour): f"{FIRED_KEY}:{scope}:{hour}" for scope in SCOPES for hour in range(now - hours + 1, now + 1)}
+    counts = cache.get_many(list(keys.values()))
+    rates = getattr(settings, "RATE_LIMITS", {})
+    return {
+        scope: {
+            "identity": identity,
+            "rate": rates.get(scope, rate),
+            "last_hour": counts.get(keys[scope, now], 0),
+            f"last_{hours}h": sum(counts.get(keys[scope, hour], 0) for hour in range(now - hours + 1, now + 1)),
+        }
+        for scope, (identity, rate) in sorted(SCOPES.items())
+    }
+
+
+class RateLimit(BaseThrottle):
+    """One sliding-window limit; declare with ``limit()`` rather than subclassing."""
+
+    scope = ""
+    identity = "ip"
+    rate = ""
+
+    def allow_request(self, request, view) -> bool:
+        if not getattr(settings, "RATE_LIMIT_ENABLED", True):
+            return True
+        ident = IDENTITIES[self.identity](self, request, view)
+        if ident is None:
+            return True
+        limit, period = parse_rate(getattr(settings, "RATE_LIMITS", {}).get(self.scope, self.rate))
+
+        now = time.time()
+        window = int(now // period)
+        digest = hashlib.sha256(str(ident).encode()).hexdigest()[:32]
+        key = f"ratelimit:{self.scope}:{digest}:"
+        store = _store()
+        current, previous = store.hit(f"{key}{window}", f"{key}{window - 1}", 2 * period)
+        elapsed = now - window * period
+        if previous * (1 - elapsed / period) + current <= limit:
+            return True
+
+        store.undo(f"{key}{window}")
+        self._wait = retry_after(limit, period, elapsed, current - 1, previous)
+        _fired(self.scope)
+        logger.info("rate limit %s hit (%s), retry after %ss", self.scope, self.identity, self._wait)
+        return False
+
+    def wait(self):
+        return getattr(self, "_wait", None)
+
+
+def limit(scope: str, identity: str, rate: str) -> type[RateLimit]:
+    """A throttle class for ``throttle_classes``: at most ``rate`` requests per ``identity`` in ``scope``."""
+    if identity not in IDENTITIES:
+        raise ValueError(f"Unknown rate-limit identity {identity!r}.")
+    parse_rate(rate)
+    if SCOPES.setdefault(scope, (identity, rate)) != (identity, rate):
+        raise ValueError(f"Rate-limit scope {scope!r} is already declared as {SCOPES[scope]}.")
+    return type(f"RateLimit[{scope}]", (RateLimit,), {"scope": scope, "identity": identity, "rate": rate})
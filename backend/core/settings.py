@@ -18,6 +18,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "rest_framework",
     "rest_framework_simplejwt",
@@ -34,16 +35,19 @@ INSTALLED_APPS = [
     "apps.blog",
     "apps.careers",
     "apps.admin_portal",
+    "apps.analytics",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestLogMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.AsyncWhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.CreatorProfileMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -67,6 +71,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "core.wsgi.application"
+ASGI_APPLICATION = "core.asgi.application"
 
 import dj_database_url
 
@@ -116,6 +121,47 @@ MEDIA_ROOT = BASE_DIR / "mediafiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# ── Cache ─────────────────────────────────────────────────────────
+# Shared backend for cross-worker caching, e.g. redis://redis:6379/1 or
+# dbcache://cache_table. Defaults to per-process local memory.
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Public creator reads (apps/creators/cache.py)
+PUBLIC_CACHE_TTL = env.int("PUBLIC_CACHE_TTL", default=300)
+PUBLIC_CACHE_LOCAL_MAX_ENTRIES = env.int("PUBLIC_CACHE_LOCAL_MAX_ENTRIES", default=2048)
+
+# Admin dashboard stats snapshot (core/stats.py)
+STATS_SNAPSHOT_REFRESH_SECONDS = env.int("STATS_SNAPSHOT_REFRESH_SECONDS", default=60)
+SMS_CREDITS_TTL = env.int("SMS_CREDITS_TTL", default=600)
+
+# Creator leaderboards (apps/creators/rankings.py)
+LEADERBOARD_SIZE = env.int("LEADERBOARD_SIZE", default=100)
+RANKINGS_REFRESH_SECONDS = env.int("RANKINGS_REFRESH_SECONDS", default=60)
+TRENDING_HALF_LIFE_HOURS = env.float("TRENDING_HALF_LIFE_HOURS", default=24)
+
+# Co-tipping recommendations (apps/creators/recommendations.py)
+RECOMMENDATIONS_TOP_K = env.int("RECOMMENDATIONS_TOP_K", default=20)
+RECOMMENDATIONS_MIN_CO_FANS = env.int("RECOMMENDATIONS_MIN_CO_FANS", default=2)
+RECOMMENDATIONS_CACHE_SECONDS = env.int("RECOMMENDATIONS_CACHE_SECONDS", default=3600)
+
+# Fan home feed (apps/creators/feed.py)
+FEED_POSTS_PER_CREATOR = env.int("FEED_POSTS_PER_CREATOR", default=50)
+FEED_CACHE_SECONDS = env.int("FEED_CACHE_SECONDS", default=600)
+
+# Creator in-app notifications (apps/creators/notifications.py)
+NOTIFICATIONS_COALESCE_SECONDS = env.int("NOTIFICATIONS_COALESCE_SECONDS", default=3600)
+
+# Supporter fan-out and queued bulk email (apps/support/fanout.py, outbox.py)
+FANOUT_BATCH_SIZE = env.int("FANOUT_BATCH_SIZE", default=1000)
+FANOUT_MAX_SECONDS = env.int("FANOUT_MAX_SECONDS", default=300)
+EMAIL_SEND_BATCH = env.int("EMAIL_SEND_BATCH", default=100)
+EMAIL_SEND_RATE = env.int("EMAIL_SEND_RATE", default=20)  # messages per second
+
+# Live tip stream, SSE over ASGI (apps/tips/live.py)
+LIVE_MAX_CONNECTIONS_PER_CREATOR = env.int("LIVE_MAX_CONNECTIONS_PER_CREATOR", default=20)
+LIVE_HEARTBEAT_SECONDS = env.int("LIVE_HEARTBEAT_SECONDS", default=15)
+LIVE_REPLAY_EVENTS = env.int("LIVE_REPLAY_EVENTS", default=50)
+
 # ── REST Framework ────────────────────────────────────────────────
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -123,15 +169,45 @@ REST_FRAMEWORK = {
         "apps.platform.authentication.PlatformKeyAuthentication",
         # API key (tj_live_sk_v1_...) checked second
         "apps.users.authentication.ApiKeyAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWT last, resolving the user through the cached principal (apps/users/principal.py)
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # Hops of X-Forwarded-For to trust for the client IP (rate limits key on it)
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=None),
 }
 
+# Per-view limits on public write endpoints (core/ratelimit.py). "cache" uses
+# the RATE_LIMIT_CACHE alias (shared only if that cache is); "database" keeps
+# the counters in Postgres. RATE_LIMITS overrides rates per scope, e.g.
+# RATE_LIMITS=otp:ip=40/h,contact:ip=10/h
+RATE_LIMIT_ENABLED = env.bool("RATE_LIMIT_ENABLED", default=True)
+RATE_LIMIT_BACKEND = env("RATE_LIMIT_BACKEND", default="cache")
+RATE_LIMIT_CACHE = env("RATE_LIMIT_CACHE", default="default")
+RATE_LIMITS = env.dict("RATE_LIMITS", default={})
+# Card-testing check on tip checkout (apps/tips/risk.py): tips up to this many
+# Rand count towards velocity; challenges are only issued with RISK_CHALLENGES
+# (turn on once every client in the field resends ``risk_challenge``) and can
+# be answered after RISK_CHALLENGE_DELAY seconds
+RISK_SMALL_TIP_AMOUNT = env.int("RISK_SMALL_TIP_AMOUNT", default=20)
+RISK_CHALLENGES = env.bool("RISK_CHALLENGES", default=False)
+RISK_CHALLENGE_DELAY = env.int("RISK_CHALLENGE_DELAY", default=5)
+
+# Image variants (core/images.py): threads per worker resizing new uploads
+IMAGE_WORKERS = env.int("IMAGE_WORKERS", default=2)
+
+# Resumable uploads (core/uploads.py): largest chunk and file accepted, how
+# long a session may take before ``manage.py purge_uploads`` drops it, and how
+# long an assembly may go without progress before it is started again
+UPLOAD_CHUNK_BYTES = env.int("UPLOAD_CHUNK_BYTES", default=8 * 1024 * 1024)
+UPLOAD_MAX_BYTES = env.int("UPLOAD_MAX_BYTES", default=2 * 1024 * 1024 * 1024)
+UPLOAD_EXPIRY_HOURS = env.int("UPLOAD_EXPIRY_HOURS", default=24)
+UPLOAD_ASSEMBLY_STALE_MINUTES = env.int("UPLOAD_ASSEMBLY_STALE_MINUTES", default=10)
+
 # ── JWT ───────────────────────────────────────────────────────────
 from datetime import timedelta
 
@@ -140,6 +216,8 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": True,
 }
+# How long a JWT user's role / profile ids are cached; saves invalidate it at once
+PRINCIPAL_CACHE_SECONDS = env.int("PRINCIPAL_CACHE_SECONDS", default=60)
 
 # ── CORS ──────────────────────────────────────────────────────────
 CORS_ALLOWED_ORIGINS = env.list(
@@ -150,6 +228,8 @@ CORS_ALLOWED_ORIGINS = env.list(
         "http://localhost:8080",
     ],
 )
+# Cursor links on list endpoints (core/pagination.py) and conditional-GET validators
+CORS_EXPOSE_HEADERS = ["Link", "ETag", "X-Request-ID"]
 
 # ── Stripe (legacy — kept for backward compat) ────────────────────
 STRIPE_SECRET_KEY = env("STRIPE_SECRET_KEY", default="")
@@ -165,6 +245,9 @@ PLATFORM_FEE_PERCENT = env.float("PLATFORM_FEE_PERCENT", default=3.0)
 SERVICE_FEE_PERCENT = env.float("SERVICE_FEE_PERCENT", default=3.0)
 # IMALI BADALA (PTY)LTD Paystack subaccount — receives 3% platform fee on every split
 PAYSTACK_PLATFORM_SUBACCOUNT_CODE = env("PAYSTACK_PLATFORM_SUBACCOUNT_CODE", default="ACCT_thnwavs7n0vb5or")
+PAYSTACK_API_URL = env("PAYSTACK_API_URL", default="https://api.paystack.co")
+# Open sockets to Paystack per ASGI worker (apps/payments/paystack_async.py)
+PAYSTACK_MAX_CONNECTIONS = env.int("PAYSTACK_MAX_CONNECTIONS", default=100)
 
 # ── Email ──────────────────────────────────────────────────────────────────────
 EMAIL_BACKEND      = env("EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend")
@@ -179,14 +262,24 @@ DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="accounts@tippingjar.co.z
 NO_REPLY_EMAIL     = env("NO_REPLY_EMAIL",     default="no-reply@tippingjar.co.za")
 SUPPORT_EMAIL      = env("SUPPORT_EMAIL",      default="support@tippingjar.co.za")
 
+# Records are queued to one background thread and written as JSON lines
+# (core/logs.py); under pressure, sub-WARNING records are sampled, then dropped
+LOG_QUEUE_SIZE = env.int("LOG_QUEUE_SIZE", default=10000)
+LOG_SAMPLE_EVERY = env.int("LOG_SAMPLE_EVERY", default=10)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "handlers": {
-        "console": {"class": "logging.StreamHandler"},
+        "queue": {
+            "()": "core.logs.queue_handler",
+            "maxsize": LOG_QUEUE_SIZE,
+            "sample_every": LOG_SAMPLE_EVERY,
+        },
     },
     "loggers": {
-        "apps": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        "apps": {"handlers": ["queue"], "level": "INFO", "propagate": False},
+        "core": {"handlers": ["queue"], "level": "INFO", "propagate": False},
     },
 }
 
@@ -194,6 +287,11 @@ LOGGING = {
 SMS_PORTAL_USERNAME = env("SMS_PORTAL_USERNAME", default="")
 SMS_PORTAL_PASSWORD = env("SMS_PORTAL_PASSWORD", default="")
 SMS_PORTAL_ENDPOINT = env("SMS_PORTAL_ENDPOINT", default="https://api.smsportal.com/api5/http5.aspx")
+# Priority lane (OTPs) gives up after this many seconds; the batch lane
+# (apps/support/sms_outbox.py) sends up to SMS_SEND_BATCH recipients per call
+SMS_OTP_TIMEOUT = env.int("SMS_OTP_TIMEOUT", default=5)
+SMS_SEND_BATCH = env.int("SMS_SEND_BATCH", default=100)
+SMS_SEND_RATE = env.int("SMS_SEND_RATE", default=50)  # recipients per second
 
 # ── Site ───────────────────────────────────────────────────────────────────────
 SITE_URL = env("SITE_URL", default="https://tippingjar.co.za")
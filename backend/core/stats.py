@@ -0,0 +1,217 @@
+"""
+Platform statistics snapshot for the admin dashboards.
+
+Both the Django admin index (core/admin_site.py) and the admin portal API
+(AdminStatsView) read ``get_platform_stats()``. It returns a snapshot kept in
+the shared cache rather than running the counts on every page load.
+
+* ``compute_platform_stats()`` issues one conditional-aggregation query per
+  table (tips, users, creators, disputes, contacts, OTPs, enterprises, blog).
+* The snapshot is refreshed on a schedule by ``manage.py
+  refresh_platform_stats`` (cron, every minute). If a read finds it older
+  than STATS_SNAPSHOT_REFRESH_SECONDS, a daemon thread refreshes it; the
+  stale copy is returned meanwhile. Only a cold cache computes inline.
+* The SMSPortal credit balance is an outbound HTTP call, so it is never
+  fetched on the request thread. Sends debit a local ledger
+  (``record_sms_spend``) and the cron reconciles it with SMSPortal every
+  SMS_CREDITS_TTL.
+"""
+
+import datetime
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "platform-stats:snapshot"
+SMS_CREDITS_KEY = "platform-stats:sms-credits"
+SMS_SPENT_KEY = "platform-stats:sms-spent"
+
+REFRESH_SECONDS = getattr(settings, "STATS_SNAPSHOT_REFRESH_SECONDS", 60)
+SMS_CREDITS_TTL = getattr(settings, "SMS_CREDITS_TTL", 600)
+# Entries outlive their refresh interval so a stalled refresher serves old data, not a cold compute
+_RETAIN_SECONDS = 24 * 60 * 60
+
+
+def _day_bounds():
+    now = timezone.localtime()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return today, today.replace(day=1)
+
+
+def compute_platform_stats() -> dict:
+    """Run every dashboard count — one aggregate query per table."""
+    from apps.blog.models import BlogPost
+    from apps.creators.models import CreatorProfile
+    from apps.enterprise.models import Enterprise
+    from apps.support.models import ContactMessage, Dispute
+    from apps.tips.models import Tip
+    from apps.users.models import OTP, User
+
+    today, month_start = _day_bounds()
+    completed = Q(status=Tip.Status.COMPLETED)
+
+    tips = Tip.objects.aggregate(
+        completed=Count("id", filter=completed),
+        volume=Sum("amount", filter=completed),
+        pending=Count("id", filter=Q(status=Tip.Status.PENDING)),
+        failed=Count("id", filter=Q(status=Tip.Status.FAILED)),
+        today=Count("id", filter=completed & Q(created_at__gte=today)),
+        month=Count("id", filter=completed & Q(created_at__gte=month_start)),
+        month_volume=Sum("amount", filter=completed & Q(created_at__gte=month_start)),
+    )
+    users = User.objects.aggregate(
+        total=Count("id"),
+        fans=Count("id", filter=Q(role="fan")),
+        creators=Count("id", filter=Q(role="creator")),
+        enterprises=Count("id", filter=Q(role="enterprise")),
+        new_month=Count("id", filter=Q(date_joined__gte=month_start)),
+    )
+    creators = CreatorProfile.objects.aggregate(
+        active=Count("id", filter=Q(is_active=True)),
+        pending_kyc=Count("id", filter=Q(kyc_status=CreatorProfile.KycStatus.PENDING)),
+    )
+    disputes = Dispute.objects.aggregate(
+        open=Count("id", filter=Q(status="open")),
+        investigating=Count("id", filter=Q(status="investigating")),
+        resolved=Count("id", filter=Q(status="resolved")),
+    )
+    otps = OTP.objects.filter(created_at__gte=today).aggregate(
+        email=Count("id", filter=Q(method="email")),
+        sms=Count("id", filter=Q(method="sms")),
+    )
+
+    return {
+        # Tips
+        "tips_total": tips["completed"],
+        "tips_value": tips["volume"] or 0,
+        "tips_pending": tips["pending"],
+        "tips_failed": tips["failed"],
+        "tips_today": tips["today"],
+        "tips_this_month": tips["month"],
+        "tips_month_value": tips["month_volume"] or 0,
+        # Users
+        "users_total": users["total"],
+        "users_fans": users["fans"],
+        "users_creators": users["creators"],
+        "users_enterprises": users["enterprises"],
+        "users_new_month": users["new_month"],
+        # Creators
+        "creators_active": creators["active"],
+        "creators_pending_kyc": creators["pending_kyc"],
+        # Support
+        "contacts_pending": ContactMessage.objects.filter(is_resolved=False).count(),
+        "disputes_open": disputes["open"],
+        "disputes_investigating": disputes["investigating"],
+        "disputes_resolved": disputes["resolved"],
+        # OTP
+        "otp_email_today": otps["email"],
+        "otp_sms_today": otps["sms"],
+        # Enterprise / content
+        "enterprises_pending": Enterprise.objects.filter(
+            approval_status=Enterprise.ApprovalStatus.PENDING
+        ).count(),
+        "blogs_published": BlogPost.objects.filter(is_published=True).count(),
+    }
+
+
+# ── Snapshot ──────────────────────────────────────────────────────────────────
+
+def refresh_platform_stats() -> dict:
+    snapshot = {"stats": compute_platform_stats(), "computed_at": timezone.now()}
+    cache.set(SNAPSHOT_KEY, snapshot, _RETAIN_SECONDS)
+    return snapshot
+
+
+def _in_background(lock_key: str, target) -> None:
+    """Run ``target`` on a daemon thread unless another worker already is."""
+    if not cache.add(f"{lock_key}:refreshing", 1, REFRESH_SECONDS):
+        return
+
+    def run():
+        try:
+            target()
+        except Exception as exc:
+            logger.exception("%s background refresh failed: %s", lock_key, exc)
+        finally:
+            cache.delete(f"{lock_key}:refreshing")
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def get_platform_stats() -> dict:
+    """
+    Current snapshot: ``{"stats": {...}, "computed_at": datetime}``.
+
+    Never blocks on a refresh unless the cache is cold.
+    """
+    snapshot = cache.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        return refresh_platform_stats()
+    age = timezone.now() - snapshot["computed_at"]
+    if age > datetime.timedelta(seconds=REFRESH_SECONDS):
+        _in_background(SNAPSHOT_KEY, refresh_platform_stats)
+    return snapshot
+
+
+# ── SMS credits ───────────────────────────────────────────────────────────────
+
+def refresh_sms_credits() -> dict:
+    """Reconcile the locally tracked balance against SMSPortal's ``Type=credits``."""
+    from apps.support.sms import get_sms_credits
+
+    # Sends recorded while the balance call is in flight stay in the ledger
+    spent = cache.get(SMS_SPENT_KEY, 0)
+    data = {**get_sms_credits(), "fetched_at": timezone.now()}
+    cache.set(SMS_CREDITS_KEY, data, _RETAIN_SECONDS)
+    if data["credits"] is not None and spent:
+        _spend(-spent)
+    return data
+
+
+def _spend(credits: int) -> None:
+    cache.add(SMS_SPENT_KEY, 0, _RETAIN_SECONDS)
+    try:
+        cache.incr(SMS_SPENT_KEY, credits)
+    except ValueError:  # evicted between add and incr
+        cache.set(SMS_SPENT_KEY, max(credits, 0), _RETAIN_SECONDS)
+
+
+def record_sms_spend(credits: int, balance: float | None = None) -> None:
+    """
+    Account for a successful send (apps/support/sms.py).
+
+    When SMSPortal reported the balance in its reply, that becomes the
+    reconciled figure; otherwise ``credits`` is added to the ledger that
+    ``get_sms_credits_cached`` subtracts from the last reconciled balance.
+    """
+    if balance is None:
+        _spend(credits)
+        return
+    cache.set(SMS_CREDITS_KEY, {
+        "success": True, "credits": balance, "raw": f"CreditBalance: {balance}", "fetched_at": timezone.now(),
+    }, _RETAIN_SECONDS)
+    cache.set(SMS_SPENT_KEY, 0, _RETAIN_SECONDS)
+
+
+def get_sms_credits_cached() -> dict:
+    """
+    SMSPortal balance tracked locally: last reconciled balance minus credits spent since.
+
+    Reconciled by ``refresh_platform_stats`` every SMS_CREDITS_TTL; a page
+    view only fetches (in the background) when nothing is cached yet.
+    """
+    data = cache.get(SMS_CREDITS_KEY)
+    if data is None:
+        _in_background(SMS_CREDITS_KEY, refresh_sms_credits)
+        return {"success": False, "credits": None, "raw": "Fetching balance…", "fetched_at": None}
+    if data["credits"] is not None:
+        data = {**data, "credits": data["credits"] - cache.get(SMS_SPENT_KEY, 0)}
+    return data
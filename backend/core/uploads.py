@@ -0,0 +1,409 @@
+"""
+Resumable chunked uploads.
+
+KYC documents, enterprise and platform documents and post media used to
+arrive as one multipart request: a large video pinned a worker for minutes
+and a dropped mobile connection started over from zero. They can now be
+sent in chunks, each its own short request:
+
+    POST   /api/uploads/                {purpose, filename, size, sha256?}
+                                        → 201 {id, offset: 0, chunk_size, expires_at}
+    PATCH  /api/uploads/<id>/           raw bytes (application/octet-stream)
+           Upload-Offset: <n>           must equal the current offset, else 409
+           Upload-Checksum: sha256 <hex>   optional, per chunk
+                                        → {offset}
+    GET    /api/uploads/<id>/           → {offset, ...} — where to resume
+    POST   /api/uploads/<id>/complete/  → 202 {status: "assembling"}; poll GET
+                                        until "complete" (or "failed")
+    DELETE /api/uploads/<id>/           abandon
+
+then the usual endpoint is called with ``upload_id`` in place of ``file``
+(``media_file`` for posts) and attaches the assembled file.
+
+Each chunk streams from the request into its own object in the default
+storage (``uploads/<id>/…``), so any worker can take the next chunk and
+nothing larger than a read buffer is held in memory. Appends are
+optimistic: the session's offset only moves with a conditional UPDATE, and
+the loser of a race deletes its chunk and gets 409. ``complete`` hands the
+session to a small thread pool, which streams the chunks, in order, into the
+file's final place (the model field's upload_to), hashing on the way; a
+whole-file SHA-256 given at start must match. Assembling a large file can
+outlast a request, so the request never waits for it.
+
+The assembler touches ``assembling_at`` at every chunk. A session whose
+assembler has been silent for UPLOAD_ASSEMBLY_STALE_MINUTES (its worker was
+restarted or killed) is assembled again — by the next ``complete`` for it,
+or by ``manage.py purge_uploads``.
+
+Sessions expire UPLOAD_EXPIRY_HOURS after they start; ``purge_uploads`` also
+deletes expired sessions with their chunks and any assembled file that was
+never attached.
+"""
+
+import datetime
+import hashlib
+import io
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.db import connections
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.ratelimit import limit
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = getattr(settings, "UPLOAD_CHUNK_BYTES", 8 * 1024 * 1024)
+MAX_BYTES = getattr(settings, "UPLOAD_MAX_BYTES", 2 * 1024 * 1024 * 1024)
+EXPIRY_HOURS = getattr(settings, "UPLOAD_EXPIRY_HOURS", 24)
+STALE_MINUTES = getattr(settings, "UPLOAD_ASSEMBLY_STALE_MINUTES", 10)
+# purpose → (model, file field) the upload is attached to
+PURPOSES = {
+    "kyc": ("creators.CreatorKycDocument", "file"),
+    "enterprise-document": ("enterprise.EnterpriseDocument", "file"),
+    "platform-document": ("platform.PlatformDocument", "file"),
+    "post-media": ("creators.CreatorPost", "media_file"),
+}
+_READ_BYTES = 64 * 1024
+_WORKERS = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class _HashingReader(io.RawIOBase):
+    """Reads ``sources`` back to back, counting and SHA-256-hashing what passes through."""
+
+    def __init__(self, sources):
+        self._sources = iter(sources)
+        self._current = None
+        self.sha256 = hashlib.sha256()
+        self.length = 0
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # Storages rewind before reading; that is a no-op until the first read
+        if offset == 0 and whence == io.SEEK_SET and self.length == 0:
+            return 0
+        raise io.UnsupportedOperation("seek")
+
+    def readinto(self, buffer):
+        while True:
+            if self._current is None:
+                self._current = next(self._sources, None)
+                if self._current is None:
+                    return 0
+            data = self._current.read(min(len(buffer), _READ_BYTES))
+            if data:
+                break
+            self._current.close()
+            self._current = None
+        buffer[:len(data)] = data
+        self.sha256.update(data)
+        self.length += len(data)
+        return len(data)
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        super().close()
+
+
+def _save(name: str, reader: _HashingReader, size: int) -> str:
+    content = File(reader, name=os.path.basename(name))
+    content.size = size
+    return default_storage.save(name, content)
+
+
+def _delete(*names) -> None:
+    for name in names:
+        if name:
+            try:
+                default_storage.delete(name)
+            except Exception as exc:  # best effort; purge_uploads retries on expiry
+                logger.warning("uploads: could not delete %s: %s", name, exc)
+
+
+def _state(session) -> dict:
+    return {
+        "id": str(session.id),
+        "purpose": session.purpose,
+        "filename": session.filename,
+        "size": session.size,
+        "offset": session.offset,
+        "status": session.status,
+        **({"sha256": session.sha256} if session.status == "complete" else {}),
+        "chunk_size": CHUNK_BYTES,
+        "expires_at": session.expires_at,
+    }
+
+
+def _session(request, pk):
+    from apps.support.models import UploadSession
+
+    return get_object_or_404(UploadSession, pk=pk, user=request.user, expires_at__gt=timezone.now())
+
+
+# ── Assembling ────────────────────────────────────────────────────────────────
+
+def assemble(pk) -> str | None:
+    """
+    Stream an ASSEMBLING session's chunks into its final file; returns the
+    new status, or ``None`` if the session is no longer assembling. A storage
+    error puts it back to UPLOADING so ``complete`` can be retried.
+    """
+    from apps.support.models import UploadSession
+
+    assembling = UploadSession.objects.filter(pk=pk, status=UploadSession.Status.ASSEMBLING)
+    session = assembling.first()
+    if session is None:
+        return None
+
+    def chunks():
+        for part in session.parts:
+            assembling.update(assembling_at=timezone.now())
+            yield default_storage.open(part, "rb")
+
+    label, field = PURPOSES[session.purpose]
+    target = apps.get_model(label)._meta.get_field(field).generate_filename(None, session.filename)
+    reader = _HashingReader(chunks())
+    try:
+        name = _save(target, reader, session.size)
+    except Exception:
+        logger.exception("uploads: assembling %s failed", pk)
+        assembling.update(status=UploadSession.Status.UPLOADING, assembling_at=None)
+        return UploadSession.Status.UPLOADING
+    digest = reader.sha256.hexdigest()
+    if reader.length != session.size or (session.sha256 and digest != session.sha256):
+        _delete(name, *session.parts)
+        assembling.update(status=UploadSession.Status.FAILED, parts=[], assembling_at=None)
+        return UploadSession.Status.FAILED
+
+    # Another assembler (this one was thought dead) may have finished first
+    if not assembling.update(file=name, sha256=digest, parts=[], status=UploadSession.Status.COMPLETE):
+        _delete(name)
+        return None
+    _delete(*session.parts)
+    return UploadSession.Status.COMPLETE
+
+
+def _assemble_quietly(pk) -> None:
+    try:
+        assemble(pk)
+    except Exception as exc:
+        logger.exception("uploads: background assembly of %s failed: %s", pk, exc)
+    finally:
+        connections.close_all()
+
+
+def _submit(pk) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="uploads")
+    _executor.submit(_assemble_quietly, pk)
+
+
+def _stale_before():
+    return timezone.now() - datetime.timedelta(minutes=STALE_MINUTES)
+
+
+def _claim(pk) -> bool:
+    """Move a session to ASSEMBLING if it is uploading, or assembling under a dead assembler."""
+    from apps.support.models import UploadSession
+
+    Status = UploadSession.Status
+    return bool(
+        UploadSession.objects.filter(
+            Q(status=Status.UPLOADING) | Q(status=Status.ASSEMBLING, assembling_at__lt=_stale_before()), pk=pk,
+        ).update(status=Status.ASSEMBLING, assembling_at=timezone.now())
+    )
+
+
+def reassemble_stale() -> int:
+    """Assemble, here and now, every live session whose assembler died; returns how many."""
+    from apps.support.models import UploadSession
+
+    stale = UploadSession.objects.filter(
+        status=UploadSession.Status.ASSEMBLING, assembling_at__lt=_stale_before(), expires_at__gt=timezone.now(),
+    ).values_list("pk", flat=True)
+    n = 0
+    for pk in list(stale):
+        if _claim(pk):
+            assemble(pk)
+            n += 1
+    return n
+
+
+# ── Attaching ─────────────────────────────────────────────────────────────────
+
+def claim(request, purpose: str, upload_id) -> str | None:
+    """
+    Storage name of the user's completed upload ``upload_id`` for ``purpose``,
+    marked attached so it is used once; ``None`` if there is no such upload.
+    Call it after the request's other fields are validated.
+    """
+    from apps.support.models import UploadSession
+
+    try:
+        upload_id = uuid.UUID(str(upload_id))
+    except ValueError:
+        return None
+    session = UploadSession.objects.filter(
+        pk=upload_id, user=request.user, purpose=purpose,
+        status=UploadSession.Status.COMPLETE, expires_at__gt=timezone.now(),
+    ).first()
+    if session is None:
+        return None
+    claimed = UploadSession.objects.filter(pk=session.pk, status=UploadSession.Status.COMPLETE).update(
+        status=UploadSession.Status.ATTACHED,
+    )
+    return session.file if claimed else None
+
+
+def purge_expired() -> int:
+    """Delete expired sessions with their chunks and unattached files; returns how many."""
+    from apps.support.models import UploadSession
+
+    expired = UploadSession.objects.filter(expires_at__lt=timezone.now())
+    for session in expired.iterator():
+        _delete(*session.parts)
+        if session.status != UploadSession.Status.ATTACHED:
+            _delete(session.file)
+    return expired.delete()[0]
+
+
+# ── Views ─────────────────────────────────────────────────────────────────────
+
+class UploadCreateView(APIView):
+    """POST /api/uploads/ — start a resumable upload."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [limit("uploads:user", "user", "60/h")]
+
+    def post(self, request):
+        from apps.support.models import UploadSession
+
+        purpose = request.data.get("purpose", "")
+        filename = os.path.basename(str(request.data.get("filename", "")).replace("\\", "/")).strip()[:100]
+        sha256 = str(request.data.get("sha256", "")).strip().lower()
+        try:
+            size = int(request.data.get("size"))
+        except (TypeError, ValueError):
+            size = 0
+
+        if purpose not in PURPOSES:
+            return Response({"detail": f"Invalid purpose. Choose from: {list(PURPOSES)}"}, status=status.HTTP_400_BAD_REQUEST)
+        if not filename:
+            return Response({"detail": "filename is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 0 < size <= MAX_BYTES:
+            return Response({"detail": f"size must be between 1 and {MAX_BYTES} bytes."}, status=status.HTTP_400_BAD_REQUEST)
+        if sha256 and (len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256)):
+            return Response({"detail": "sha256 must be a hex digest."}, status=status.HTTP_400_BAD_REQUEST)
+
+        session = UploadSession.objects.create(
+            user=request.user, purpose=purpose, filename=filename, size=size, sha256=sha256,
+            expires_at=timezone.now() + datetime.timedelta(hours=EXPIRY_HOURS),
+        )
+        return Response(_state(session), status=status.HTTP_201_CREATED)
+
+
+class UploadDetailView(APIView):
+    """GET, PATCH (append a chunk) or DELETE /api/uploads/<id>/."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        return Response(_state(_session(request, pk)))
+
+    def patch(self, request, pk):
+        from apps.support.models import UploadSession
+
+        session = _session(request, pk)
+        if session.status != UploadSession.Status.UPLOADING:
+            return Response({"detail": f"Upload is {session.status}."}, status=status.HTTP_409_CONFLICT)
+        try:
+            offset = int(request.headers.get("Upload-Offset", ""))
+            length = int(request.headers.get("Content-Length", ""))
+        except ValueError:
+            return Response({"detail": "Upload-Offset and Content-Length are required."}, status=status.HTTP_400_BAD_REQUEST)
+        if offset != session.offset:
+            return Response({"detail": "Offset mismatch.", "offset": session.offset}, status=status.HTTP_409_CONFLICT)
+        if not 0 < length <= min(CHUNK_BYTES, session.size - offset):
+            return Response(
+                {"detail": f"Chunk must be 1 to {min(CHUNK_BYTES, session.size - offset)} bytes."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        algorithm, _, expected = request.headers.get("Upload-Checksum", "").partition(" ")
+        if algorithm and algorithm.lower() != "sha256":
+            return Response({"detail": "Upload-Checksum must be 'sha256 <hex>'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Read straight from the request body (never ``request.data``) into storage
+        reader = _HashingReader([request.stream])
+        part = _save(f"uploads/{session.pk}/{offset:012d}-{uuid.uuid4().hex[:8]}", reader, length)
+        if reader.length != length:
+            _delete(part)
+            return Response({"detail": "Incomplete chunk.", "offset": session.offset}, status=status.HTTP_400_BAD_REQUEST)
+        if expected and reader.sha256.hexdigest() != expected.strip().lower():
+            _delete(part)
+            return Response({"detail": "Chunk checksum mismatch.", "offset": session.offset}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Only moves if no other chunk landed at this offset meanwhile
+        moved = UploadSession.objects.filter(pk=session.pk, offset=offset, status=UploadSession.Status.UPLOADING).update(
+            offset=offset + length, parts=[*session.parts, part],
+        )
+        if not moved:
+            _delete(part)
+            session.refresh_from_db(fields=["offset"])
+            return Response({"detail": "Offset mismatch.", "offset": session.offset}, status=status.HTTP_409_CONFLICT)
+        return Response({"id": str(session.pk), "offset": offset + length})
+
+    def delete(self, request, pk):
+        from apps.support.models import UploadSession
+
+        session = _session(request, pk)
+        if session.status == UploadSession.Status.ATTACHED:
+            return Response({"detail": "Upload is attached."}, status=status.HTTP_409_CONFLICT)
+        _delete(*session.parts, session.file)
+        session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadCompleteView(APIView):
+    """POST /api/uploads/<id>/complete/ — start assembling the chunks into the final file."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        from apps.support.models import UploadSession
+
+        session = _session(request, pk)
+        if session.status == UploadSession.Status.COMPLETE:
+            return Response(_state(session))
+        if session.offset != session.size:
+            return Response(
+                {"detail": "Upload is not finished.", "offset": session.offset}, status=status.HTTP_400_BAD_REQUEST,
+            )
+        if session.status == UploadSession.Status.FAILED:
+            return Response({"detail": "Checksum mismatch; start a new upload."}, status=status.HTTP_400_BAD_REQUEST)
+        if _claim(session.pk):
+            _submit(session.pk)
+        elif session.status != UploadSession.Status.ASSEMBLING:
+            return Response({"detail": f"Upload is {session.status}."}, status=status.HTTP_409_CONFLICT)
+        session.refresh_from_db()
+        return Response(_state(session), status=status.HTTP_202_ACCEPTED)
@@ -5,6 +5,8 @@ from rest_framework_simplejwt.views import TokenRefreshView
 
 from apps.users.jwt import TippingJarTokenView
 from core.admin_site import admin_site
+from core.images import VariantView
+from core.uploads import UploadCompleteView, UploadCreateView, UploadDetailView
 
 urlpatterns = [
     path("admin/", admin_site.urls),
@@ -21,6 +23,11 @@ urlpatterns = [
     path("api/platform/",  include("apps.platform.urls")),
     path("api/blog/",      include("apps.blog.urls")),
     path("api/careers/",   include("apps.careers.urls")),
+    path("api/admin/analytics/", include("apps.analytics.urls")),
     path("api/admin/",     include("apps.admin_portal.urls")),
+    path("api/images/<str:variant>.<str:fmt>/<path:name>", VariantView.as_view(), name="image-variant"),
+    path("api/uploads/", UploadCreateView.as_view(), name="upload-create"),
+    path("api/uploads/<uuid:pk>/", UploadDetailView.as_view(), name="upload-detail"),
+    path("api/uploads/<uuid:pk>/complete/", UploadCompleteView.as_view(), name="upload-complete"),
     path("summernote/",    include("django_summernote.urls")),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -15,8 +15,24 @@ if [ $MIGRATE_EXIT -ne 0 ]; then
     echo "WARNING: Migrations failed (exit $MIGRATE_EXIT) — starting gunicorn anyway"
 fi
 
+# SERVER=asgi runs the same app under uvicorn workers: checkout views await
+# Paystack (apps/payments/paystack_async.py) instead of pinning a worker
+if [ "$SERVER" = "asgi" ]; then
+    echo "Starting gunicorn (ASGI, uvicorn workers)..."
+    exec gunicorn core.asgi:application \
+        --config gunicorn.conf.py \
+        --bind 0.0.0.0:8000 \
+        --workers 5 \
+        --worker-class uvicorn.workers.UvicornWorker \
+        --timeout 120 \
+        --keep-alive 65 \
+        --access-logfile - \
+        --error-logfile -
+fi
+
 echo "Starting gunicorn..."
 exec gunicorn core.wsgi:application \
+    --config gunicorn.conf.py \
     --bind 0.0.0.0:8000 \
     --workers 5 \
     --threads 2 \
@@ -0,0 +1,30 @@
+"""
+Gunicorn settings shared by every profile in entrypoint.sh.
+
+GUNICORN_PRELOAD=1  load the app in the master, warm it (core/warmup.py)
+                    and fork workers from it — faster worker boot and
+                    copy-on-write sharing of imported code and caches
+GUNICORN_RELOAD=1   restart workers on code changes (development only;
+                    ignored when preloading, the master would keep old code)
+
+Measure either with ``python manage.py profile_startup``.
+"""
+import os
+
+reload = os.environ.get("GUNICORN_RELOAD") == "1"
+preload_app = os.environ.get("GUNICORN_PRELOAD") == "1" and not reload
+
+
+def when_ready(server):
+    if preload_app:
+        from core.warmup import warm
+
+        server.log.info("Pre-fork warm-up: %s", warm())
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from django.db import connections
+
+        # Never share a socket opened in the master
+        connections.close_all()
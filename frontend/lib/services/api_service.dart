@@ -572,6 +572,7 @@ class ApiService {
     String tipperEmail = '',
     String message = '',
     int? jarId,
+    String? riskChallenge,
   }) async {
     final body = <String, dynamic>{
       'creator_slug': creatorSlug,
@@ -580,6 +581,7 @@ class ApiService {
       if (tipperEmail.isNotEmpty) 'tipper_email': tipperEmail,
       'message': message,
       if (jarId != null) 'jar_id': jarId,
+      if (riskChallenge != null) 'risk_challenge': riskChallenge,
     };
     final res = await http.post(
       Uri.parse('$_baseUrl/tips/initiate/'),
@@ -589,6 +591,22 @@ class ApiService {
     if (res.statusCode == 200 || res.statusCode == 201) {
       return jsonDecode(res.body) as Map<String, dynamic>;
     }
+    // Card-testing check: wait as asked and resend the challenge token, once
+    if (res.statusCode == 403 && riskChallenge == null) {
+      final data = jsonDecode(res.body);
+      if (data is Map && data['challenge'] is String) {
+        await Future.delayed(Duration(seconds: (data['retry_after'] as num?)?.toInt() ?? 5));
+        return initiateTip(
+          creatorSlug: creatorSlug,
+          amount: amount,
+          tipperName: tipperName,
+          tipperEmail: tipperEmail,
+          message: message,
+          jarId: jarId,
+          riskChallenge: data['challenge'] as String,
+        );
+      }
+    }
     throw Exception('Failed to initiate tip: ${res.body}');
   }
 